@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Adaptive KPI sampling: Python mirror of include/adaptive_scheduler.h and a
+replay evaluation against the original fixed 10 s interval.
+
+A trace is replayed at 1 s resolution. Each policy samples it the way the
+firmware would (KPI task wakes every 2 s, sample once the scheduler interval has
+elapsed or when RSSI or the jitter-free noise floor stepped since the last sample), runs the AdvancedWiFiAI port on every sample and reports samples
+stored, scans run and how quickly labeled anomaly episodes are detected.
+"""
+
+import csv
+import json
+import random
+
+from advanced_ai_features import AdvancedWiFiAI, constrain
+from history_store import noise_floor
+from scan_cache import SCAN_CACHE_TTL_MS
+
+SAMPLE_INTERVAL_MIN_MS = 2000
+SAMPLE_INTERVAL_DEFAULT_MS = 10000
+SAMPLE_INTERVAL_MAX_MS = 60000
+STABLE_SAMPLES_BEFORE_BACKOFF = 3
+RSSI_STEP_DB = 6.0
+NOISE_STEP_DB = 10.0
+SAMPLES_AFTER_STEP = 5
+TICK_MS = SAMPLE_INTERVAL_MIN_MS   # KPI_TASK_POLL_MS, the KPI task wake-up granularity
+
+DEGRADATION_ALERTS = ('interference', 'degrading', 'unstable')
+HEALTHY_ALERTS = ('excellent', 'good')
+
+
+class AdaptiveScheduler:
+    """Same decisions as AdaptiveScheduler::next() in the firmware"""
+
+    def __init__(self):
+        self.interval_ms = SAMPLE_INTERVAL_DEFAULT_MS
+        self.stable_streak = 0
+        self.last_rssi = None
+        self.last_noise = None
+        self.fast_samples = 0
+
+    def step_detected(self, rssi, noise):
+        """Same as AdaptiveScheduler::stepDetected(): re-arms fast sampling on a KPI step"""
+        if self.last_rssi is None:
+            return False
+        if abs(rssi - self.last_rssi) < RSSI_STEP_DB and abs(noise - self.last_noise) < NOISE_STEP_DB:
+            return False
+        self.stable_streak = 0
+        self.fast_samples = SAMPLES_AFTER_STEP
+        self.interval_ms = SAMPLE_INTERVAL_MIN_MS
+        return True
+
+    def next(self, prediction, rssi=None, noise=None):
+        if rssi is not None:
+            self.last_rssi, self.last_noise = rssi, noise
+        degrading = (prediction['alert_type'] in DEGRADATION_ALERTS or
+                     prediction['trend_score'] < -0.5 or
+                     prediction['rssi_variance'] > 15.0)
+        stable = (not degrading and
+                  prediction['alert_type'] in HEALTHY_ALERTS and
+                  abs(prediction['trend_score']) < 0.3 and
+                  prediction['rssi_variance'] < 6.0 and
+                  prediction['noise_variance'] < 8.0)
+
+        if degrading:
+            self.stable_streak = 0
+            self.interval_ms = SAMPLE_INTERVAL_MIN_MS
+        elif stable:
+            self.stable_streak += 1
+            if self.stable_streak >= STABLE_SAMPLES_BEFORE_BACKOFF:
+                self.interval_ms *= 2
+            elif self.interval_ms < SAMPLE_INTERVAL_DEFAULT_MS:
+                self.interval_ms = SAMPLE_INTERVAL_DEFAULT_MS
+        else:
+            self.stable_streak = 0
+            self.interval_ms = SAMPLE_INTERVAL_DEFAULT_MS
+
+        if self.fast_samples > 0:
+            self.fast_samples -= 1
+            self.stable_streak = 0
+            self.interval_ms = SAMPLE_INTERVAL_MIN_MS
+
+        self.interval_ms = constrain(self.interval_ms, SAMPLE_INTERVAL_MIN_MS, SAMPLE_INTERVAL_MAX_MS)
+        return self.interval_ms
+
+
+class FixedScheduler:
+    """The original behaviour: one sample every kpiInterval"""
+
+    def __init__(self, interval_ms=SAMPLE_INTERVAL_DEFAULT_MS):
+        self.interval_ms = interval_ms
+
+    def next(self, prediction, rssi=None, noise=None):
+        return self.interval_ms
+
+    def step_detected(self, rssi, noise):
+        return False
+
+
+def ground_truth_trace(hours=6, seed=0, episode_every=1800, rssi_range=(-60.0, -45.0), max_aps=3):
+    """
+    1 s KPI trace with labeled anomaly episodes.
+    Returns (samples, episodes); samples are dicts keyed like history records,
+    episodes are (start, end, kind) tuples in trace seconds. The RSSI baseline
+    wanders within `rssi_range` and up to `max_aps` neighbours share the channel.
+    """
+    rng = random.Random(seed)
+    duration = int(hours * 3600)
+
+    episodes = []
+    start = rng.randint(600, episode_every)
+    while start < duration - 600:
+        length = rng.randint(60, 300)
+        episodes.append((start, start + length, rng.choice(('signal_drop', 'interference'))))
+        start += length + rng.randint(episode_every // 2, episode_every * 3 // 2)
+
+    samples = []
+    rssi_base = rssi_range[1] - 7.0
+    ap_count = min(2, max_aps)
+    episode_index = 0
+    for t in range(duration):
+        rssi_base = min(rssi_range[1], max(rssi_range[0], rssi_base + rng.gauss(0, 0.02)))
+        if rng.random() < 0.002:
+            ap_count = max(1, min(max_aps, ap_count + rng.choice((-1, 1))))
+
+        while episode_index < len(episodes) and t >= episodes[episode_index][1]:
+            episode_index += 1
+        rssi_offset = noise_offset = util_offset = 0.0
+        if episode_index < len(episodes) and t >= episodes[episode_index][0]:
+            begin, _, kind = episodes[episode_index]
+            if kind == 'signal_drop':
+                rssi_offset = -min(25.0, (t - begin) * 0.8)
+            else:
+                noise_offset = 12.0
+                util_offset = 45.0
+
+        rssi = float(round(rssi_base + rssi_offset + rng.gauss(0, 1.0)))
+        floor = noise_floor(ap_count) + noise_offset
+        noise = floor + rng.randint(0, 7)
+        channel_util = float(min(100.0, max(0.0, ap_count * 8.0 + rng.randint(0, 19) + util_offset)))
+        samples.append({'t': t, 'rssi': rssi, 'noise': noise, 'snr': rssi - noise,
+                        'channel_util': channel_util, 'noise_floor': floor})
+    return samples, episodes
+
+
+def label_episodes(samples, min_length=20):
+    """
+    Anomaly episodes for recorded traces without labels: runs of at least
+    `min_length` seconds with weak signal, low SNR or a saturated channel
+    """
+    episodes = []
+    start = None
+    last = None
+    for s in samples:
+        bad = s['rssi'] < -75 or s['snr'] < 15 or s['channel_util'] > 85
+        if bad and start is None:
+            start = s['t']
+        elif not bad and start is not None:
+            if s['t'] - start >= min_length:
+                episodes.append((start, s['t'], 'threshold'))
+            start = None
+        last = s['t']
+    if start is not None and last - start >= min_length:
+        episodes.append((start, last, 'threshold'))
+    return episodes
+
+
+def load_trace(path):
+    """
+    Recorded trace from a /history.json download or a CSV with
+    t,rssi,noise,snr,channel_util columns (plus an optional 0/1 anomaly column).
+    Timestamps are rebased to start at 0; returns (samples, episodes).
+    """
+    if path.endswith('.json'):
+        with open(path) as f:
+            rows = json.load(f)
+    else:
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+
+    samples = []
+    labels = []
+    for row in sorted(rows, key=lambda r: float(r['t'])):
+        samples.append({key: float(row[key]) for key in ('t', 'rssi', 'noise', 'snr', 'channel_util')})
+        labels.append(str(row.get('anomaly', '0')) in ('1', '1.0', 'True', 'true'))
+    if not samples:
+        return [], []
+    origin = samples[0]['t']
+    for s in samples:
+        s['t'] = int(s['t'] - origin)
+
+    if not any(labels):
+        return samples, label_episodes(samples)
+
+    episodes = []
+    start = None
+    for s, anomalous in zip(samples, labels):
+        if anomalous and start is None:
+            start = s['t']
+        elif not anomalous and start is not None:
+            episodes.append((start, s['t'], 'labeled'))
+            start = None
+    if start is not None:
+        episodes.append((start, samples[-1]['t'], 'labeled'))
+    return samples, episodes
+
+
+def replay(samples, episodes, scheduler):
+    """
+    Sample the trace with `scheduler` and measure detection.
+    An episode counts as detected at the first sample inside it whose
+    prediction is not "excellent" or "good".
+    """
+    if not samples:
+        return {'samples': 0, 'scans': 0, 'latencies': [], 'missed': len(episodes),
+                'episode_samples': 0}
+
+    # Sample-and-hold lookup: the KPI value in effect at second t
+    end = samples[-1]['t']
+    held = [None] * (end + 1)
+    index = 0
+    for t in range(end + 1):
+        while index + 1 < len(samples) and samples[index + 1]['t'] <= t:
+            index += 1
+        held[t] = samples[index]
+
+    ai = AdvancedWiFiAI()
+    sample_times = []
+    flagged = []
+    scans = 0
+    t_ms = 0
+    last_sample_ms = None
+    last_scan_ms = None
+    interval_ms = getattr(scheduler, 'interval_ms', SAMPLE_INTERVAL_DEFAULT_MS)
+    while t_ms <= end * 1000:
+        # kpiTask(): wakes every TICK_MS, sampling when due or on an RSSI/noise step. The step
+        # check sees noiseFloor(); recorded traces have no floor, only the jittered estimate
+        s = held[t_ms // 1000]
+        floor = s.get('noise_floor', s['noise'])
+        if (last_sample_ms is None or t_ms - last_sample_ms >= interval_ms
+                or scheduler.step_detected(s['rssi'], floor)):
+            last_sample_ms = t_ms
+            # saveKPI() reuses the cached scan until it is SCAN_CACHE_TTL_MS old
+            if last_scan_ms is None or t_ms - last_scan_ms >= SCAN_CACHE_TTL_MS:
+                last_scan_ms = t_ms
+                scans += 1
+            prediction = ai.predict_advanced_stability(s['rssi'], s['noise'], s['snr'], s['channel_util'])
+            interval_ms = scheduler.next(prediction, s['rssi'], floor)
+            sample_times.append(t_ms / 1000)
+            flagged.append(prediction['alert_type'] not in HEALTHY_ALERTS)
+        t_ms += TICK_MS
+
+    latencies = []
+    missed = 0
+    episode_samples = 0
+    position = 0
+    for start, stop, _ in episodes:
+        while position < len(sample_times) and sample_times[position] < start:
+            position += 1
+        detected = None
+        i = position
+        while i < len(sample_times) and sample_times[i] <= stop:
+            if flagged[i] and detected is None:
+                detected = sample_times[i]
+            episode_samples += 1
+            i += 1
+        if detected is None:
+            missed += 1
+        else:
+            latencies.append(detected - start)
+
+    return {'samples': len(sample_times), 'scans': scans,
+            'latencies': latencies, 'missed': missed, 'episode_samples': episode_samples}
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def summarize(result, duration):
+    latencies = result['latencies']
+    hours = max(duration, 1) / 3600
+    return {
+        'samples': result['samples'],
+        'scans': result['scans'],
+        'samples_per_hour': result['samples'] / hours,
+        'episode_samples': result['episode_samples'],
+        'latency_mean': sum(latencies) / len(latencies) if latencies else 0.0,
+        'latency_p95': percentile(latencies, 95),
+        'missed': result['missed'],
+    }
+
+
+def compare(samples, episodes, fixed_interval_ms=SAMPLE_INTERVAL_DEFAULT_MS):
+    duration = samples[-1]['t'] if samples else 0
+    return {
+        'fixed': summarize(replay(samples, episodes, FixedScheduler(fixed_interval_ms)), duration),
+        'adaptive': summarize(replay(samples, episodes, AdaptiveScheduler()), duration),
+        'episodes': len(episodes),
+        'duration': duration,
+    }
+
+
+def print_report(report):
+    print(f"📼 Trace: {report['duration'] / 3600:.1f} h, {report['episodes']} anomaly episodes")
+    print(f"{'policy':<10}{'samples':>9}{'scans':>8}{'per hour':>10}{'in anomaly':>12}"
+          f"{'mean det':>10}{'p95 det':>9}{'missed':>8}")
+    for policy in ('fixed', 'adaptive'):
+        r = report[policy]
+        print(f"{policy:<10}{r['samples']:>9}{r['scans']:>8}{r['samples_per_hour']:>10.0f}"
+              f"{r['episode_samples']:>12}"
+              f"{r['latency_mean']:>9.1f}s{r['latency_p95']:>8.1f}s{r['missed']:>8}")
+    fixed, adaptive = report['fixed'], report['adaptive']
+    if fixed['samples']:
+        print(f"📉 Adaptive stores {100 * (1 - adaptive['samples'] / fixed['samples']):.0f}% fewer samples; "
+              f"mean detection latency {adaptive['latency_mean'] - fixed['latency_mean']:+.1f}s, "
+              f"{adaptive['episode_samples'] / max(fixed['episode_samples'], 1):.1f}x samples during anomalies")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay KPI traces with fixed and adaptive sampling")
+    parser.add_argument('--trace', help='history.json or CSV trace (default: synthetic 1 s trace)')
+    parser.add_argument('--hours', type=float, default=6, help='length of the synthetic trace')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fixed-interval', type=int, default=SAMPLE_INTERVAL_DEFAULT_MS,
+                        help='baseline interval in ms')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args()
+
+    if args.trace:
+        samples, episodes = load_trace(args.trace)
+    else:
+        samples, episodes = ground_truth_trace(args.hours, args.seed)
+
+    report = compare(samples, episodes, args.fixed_interval)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
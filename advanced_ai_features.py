@@ -7,6 +7,250 @@ Generates C++ code for ESP32 implementation
 import numpy as np
 import pandas as pd
 
+from anomaly_detector import default_detector, threshold_rule
+
+# (alert_type, severity, message) in AlertType enum order. Severity 0 is a
+# status report, 1 a warning, 2 an alert; anything above 0 opens an episode
+# in the alert log (include/alert_log.h).
+ALERTS = (
+    ('excellent', 0, "Status: Excellent connection quality"),
+    ('good', 0, "Status: Good connection quality"),
+    ('poor', 1, "Warning: Poor connection quality - Multiple issues detected"),
+    ('weak_signal', 2, "Alert: Weak signal strength - Move closer to router"),
+    ('degrading', 1, "Warning: Signal degrading - Check for obstacles"),
+    ('congestion', 2, "Alert: Network congestion - Consider changing channel"),
+    ('interference', 1, "Warning: High interference detected - Multiple sources competing"),
+    ('unstable', 1, "Warning: Unstable environment - Intermittent interference"),
+)
+ALERT_INDEX = {alert_type: i for i, (alert_type, _, _) in enumerate(ALERTS)}
+
+
+def constrain(value, low, high):
+    """Arduino constrain()"""
+    return low if value < low else high if value > high else value
+
+
+class AdvancedWiFiAI:
+    """
+    Python port of the generated AdvancedWiFiAI C++ class.
+    Mirrors the firmware arithmetic so predictions can be replayed and
+    benchmarked on the host.
+    """
+
+    HISTORY_SIZE = 10
+
+    def __init__(self, detector=None):
+        self.rssi_history = [0.0] * self.HISTORY_SIZE
+        self.noise_history = [0.0] * self.HISTORY_SIZE
+        self.snr_history = [0.0] * self.HISTORY_SIZE
+        self.util_history = [0.0] * self.HISTORY_SIZE
+        self.stability_history = [0.0] * self.HISTORY_SIZE
+        self.history_index = 0
+        self.history_full = False
+        self.detector = detector if detector is not None else default_detector()
+
+    def _count(self):
+        return self.HISTORY_SIZE if self.history_full else self.history_index
+
+    def calculate_moving_average(self, data):
+        count = self._count()
+        return sum(data[:count]) / count if count > 0 else 0.0
+
+    def calculate_variance(self, data):
+        mean = self.calculate_moving_average(data)
+        count = self._count()
+        variance = sum((x - mean) ** 2 for x in data[:count])
+        return variance / (count - 1) if count > 1 else 0.0
+
+    def calculate_trend(self, data):
+        count = self._count()
+        if count < 3:
+            return 0.0
+
+        # Simple linear regression slope
+        sum_x = sum_y = sum_xy = sum_x2 = 0.0
+        for i in range(count):
+            sum_x += i
+            sum_y += data[i]
+            sum_xy += i * data[i]
+            sum_x2 += i * i
+
+        return (count * sum_xy - sum_x * sum_y) / (count * sum_x2 - sum_x * sum_x)
+
+    def engineer_features(self, rssi, noise, snr, channel_util):
+        """Same features as AdvancedWiFiAI::engineerFeatures, as a dict"""
+        i = self.history_index
+        self.rssi_history[i] = rssi
+        self.noise_history[i] = noise
+        self.snr_history[i] = snr
+        self.util_history[i] = channel_util
+
+        self.history_index = (self.history_index + 1) % self.HISTORY_SIZE
+        if self.history_index == 0:
+            self.history_full = True
+
+        if rssi > -50:
+            category = 3.0
+        elif rssi > -70:
+            category = 2.0
+        elif rssi > -80:
+            category = 1.0
+        else:
+            category = 0.0
+
+        is_outlier = 1.0 if threshold_rule(rssi, snr, channel_util) else 0.0
+        if self.detector is not None:
+            self.detector.update(rssi, snr, channel_util)
+            if self.detector.is_anomaly():
+                is_outlier = 1.0
+
+        return {
+            'rssi_norm': (rssi + 90) / 30.0,
+            'noise_norm': noise / 50.0,
+            'snr_norm': (snr + 40) / 60.0,
+            'util_norm': channel_util / 100.0,
+            'signal_to_noise_ratio': rssi / (abs(noise) + 1e-6),
+            'snr_to_util_ratio': snr / (channel_util + 1e-6),
+            'signal_strength_category': category,
+            'interference_score': (abs(noise) - 95) + (channel_util / 10),
+            'quality_index': (snr * 0.4) + ((rssi + 100) * 0.6),
+            'rssi_squared': rssi * rssi,
+            'snr_squared': snr * snr,
+            'rssi_snr_interaction': rssi * snr,
+            'noise_util_interaction': noise * channel_util,
+            'rssi_trend': self.calculate_trend(self.rssi_history),
+            'noise_trend': self.calculate_trend(self.noise_history),
+            'snr_trend': self.calculate_trend(self.snr_history),
+            'util_trend': self.calculate_trend(self.util_history),
+            'rssi_variance': self.calculate_variance(self.rssi_history),
+            'noise_variance': self.calculate_variance(self.noise_history),
+            'stability_trend': self.calculate_trend(self.stability_history),
+            'stability_variance': self.calculate_variance(self.stability_history),
+            'is_outlier': is_outlier,
+        }
+
+    def predict_advanced_stability(self, rssi, noise, snr, channel_util):
+        """Same result as AdvancedWiFiAI::predictAdvancedStability, as a dict"""
+        features = self.engineer_features(rssi, noise, snr, channel_util)
+
+        stability_score = 0.0
+        confidence = 0.0
+
+        # Signal strength contribution (30%)
+        if rssi > -50:
+            stability_score += 0.30
+            confidence += 0.25
+        elif rssi > -70:
+            stability_score += 0.20
+            confidence += 0.20
+        elif rssi > -80:
+            stability_score += 0.10
+            confidence += 0.15
+
+        # SNR contribution (25%)
+        if snr > 30:
+            stability_score += 0.25
+            confidence += 0.20
+        elif snr > 20:
+            stability_score += 0.18
+            confidence += 0.15
+        elif snr > 10:
+            stability_score += 0.10
+            confidence += 0.10
+
+        # Channel utilization contribution (20%)
+        if channel_util < 30:
+            stability_score += 0.20
+            confidence += 0.15
+        elif channel_util < 60:
+            stability_score += 0.12
+            confidence += 0.10
+        elif channel_util < 80:
+            stability_score += 0.05
+            confidence += 0.05
+
+        # Trend analysis contribution (15%)
+        if features['rssi_trend'] > 0 and features['snr_trend'] > 0:
+            stability_score += 0.15
+            confidence += 0.15
+        elif features['rssi_trend'] < -1 or features['snr_trend'] < -1:
+            stability_score -= 0.10
+
+        # Variance penalty (10%)
+        if features['rssi_variance'] < 5 and features['noise_variance'] < 3:
+            stability_score += 0.10
+            confidence += 0.10
+        elif features['rssi_variance'] > 15 or features['noise_variance'] > 8:
+            stability_score -= 0.05
+
+        # Outlier penalty
+        if features['is_outlier'] > 0.5:
+            stability_score -= 0.15
+            confidence -= 0.20
+
+        result = {
+            'stability': constrain(stability_score, 0.0, 1.0),
+            'confidence': constrain(confidence, 0.0, 1.0),
+            'trend_score': (features['rssi_trend'] + features['snr_trend']) / 2.0,
+            'rssi_variance': features['rssi_variance'],
+            'noise_variance': features['noise_variance'],
+        }
+        result['alert'] = self.generate_intelligent_alert(features, result)
+        result['alert_type'], _, result['alert_message'] = ALERTS[result['alert']]
+
+        i = self.HISTORY_SIZE - 1 if self.history_index == 0 else self.history_index - 1
+        self.stability_history[i] = result['stability']
+
+        return result
+
+    @staticmethod
+    def generate_intelligent_alert(features, result):
+        """AlertType index, as generateIntelligentAlerts() picks it"""
+        if features['noise_norm'] > 0.8 and features['util_norm'] > 0.7:
+            return ALERT_INDEX['interference']
+        if features['rssi_norm'] < 0.3 and features['snr_norm'] < 0.4:
+            return ALERT_INDEX['weak_signal']
+        if features['rssi_trend'] < -0.5:
+            return ALERT_INDEX['degrading']
+        if features['util_norm'] > 0.9:
+            return ALERT_INDEX['congestion']
+        if features['noise_variance'] > 10.0:
+            return ALERT_INDEX['unstable']
+        if result['stability'] > 0.8 and result['confidence'] > 0.7:
+            return ALERT_INDEX['excellent']
+        if result['stability'] > 0.6:
+            return ALERT_INDEX['good']
+        return ALERT_INDEX['poor']
+
+
+def generate_alert_types():
+    """AlertType enum plus its constant type/message table"""
+    names = '\n'.join(f"    ALERT_{alert_type.upper()}," for alert_type, _, _ in ALERTS)
+    rows = '\n'.join(f'    {{"{alert_type}", "{message}", {severity}}},'
+                     for alert_type, severity, message in ALERTS)
+    return f'''// Alert types (ALERTS in advanced_ai_features.py). Results carry only the enum;
+// the strings are constants, so producing and copying a result never allocates.
+enum AlertType : uint8_t {{
+{names}
+    ALERT_TYPE_COUNT
+}};
+
+struct AlertInfo {{
+    const char* type;     // alert_type in /advanced-ai and /events
+    const char* message;
+    uint8_t severity;     // 0 status, 1 warning, 2 alert
+}};
+
+static const AlertInfo ALERT_INFO[ALERT_TYPE_COUNT] = {{
+{rows}
+}};
+
+inline const AlertInfo& alertInfo(uint8_t alert) {{
+    return ALERT_INFO[alert < ALERT_TYPE_COUNT ? alert : ALERT_POOR];
+}}
+'''
+
+
 def generate_esp32_advanced_ai_code():
     """Generate advanced AI prediction code for ESP32"""
     
@@ -21,6 +265,9 @@ def generate_esp32_advanced_ai_code():
 #include <vector>
 #include <cmath>
 
+#include "anomaly_detector.h"
+
+@ALERT_TYPES@
 class AdvancedWiFiAI {
 private:
     // Historical data for trend analysis
@@ -32,6 +279,7 @@ private:
     float stability_history[HISTORY_SIZE];
     int history_index = 0;
     bool history_full = false;
+    AnomalyDetectorState anomaly_state;
     
     // Advanced feature calculation methods
     float calculateMovingAverage(float* data, int size) {
@@ -80,6 +328,7 @@ public:
             util_history[i] = 0;
             stability_history[i] = 0;
         }
+        anomaly_detector_init(&anomaly_state);
     }
     
     // Advanced feature engineering
@@ -170,9 +419,11 @@ public:
         features.stability_trend = calculateTrend(stability_history, HISTORY_SIZE);
         features.stability_variance = calculateVariance(stability_history, HISTORY_SIZE);
         
-        // Outlier detection (simple threshold-based)
+        // Outlier detection: hard sensor limits plus the half-space tree detector
+        anomaly_detector_update(&anomaly_state, rssi, snr, channel_util);
         features.is_outlier = 0.0f;
-        if (rssi < -95 || rssi > -20 || snr < -10 || snr > 50 || channel_util > 95) {
+        if (rssi < -95 || rssi > -20 || snr < -10 || snr > 50 || channel_util > 95 ||
+            anomaly_detector_is_anomaly(&anomaly_state)) {
             features.is_outlier = 1.0f;
         }
         
@@ -183,9 +434,10 @@ public:
     struct PredictionResult {
         float stability;
         float confidence;
-        String alert_type;
-        String alert_message;
+        AlertType alert;
         float trend_score;
+        float rssi_variance;
+        float noise_variance;
     };
     
     PredictionResult predictAdvancedStability(float rssi, float noise, float snr, float channel_util) {
@@ -260,6 +512,8 @@ public:
         result.stability = constrain(stability_score, 0.0f, 1.0f);
         result.confidence = constrain(confidence, 0.0f, 1.0f);
         result.trend_score = (features.rssi_trend + features.snr_trend) / 2.0f;
+        result.rssi_variance = features.rssi_variance;
+        result.noise_variance = features.noise_variance;
         
         // Generate intelligent alerts
         generateIntelligentAlerts(features, result);
@@ -274,29 +528,21 @@ private:
     void generateIntelligentAlerts(const AdvancedFeatures& features, PredictionResult& result) {
         // Analyze patterns and generate specific alerts
         if (features.noise_norm > 0.8f && features.util_norm > 0.7f) {
-            result.alert_type = "interference";
-            result.alert_message = "Warning: High interference detected - Multiple sources competing";
+            result.alert = ALERT_INTERFERENCE;
         } else if (features.rssi_norm < 0.3f && features.snr_norm < 0.4f) {
-            result.alert_type = "weak_signal";
-            result.alert_message = "Alert: Weak signal strength - Move closer to router";
+            result.alert = ALERT_WEAK_SIGNAL;
         } else if (features.rssi_trend < -0.5f) {
-            result.alert_type = "degrading";
-            result.alert_message = "Warning: Signal degrading - Check for obstacles";
+            result.alert = ALERT_DEGRADING;
         } else if (features.util_norm > 0.9f) {
-            result.alert_type = "congestion";
-            result.alert_message = "Alert: Network congestion - Consider changing channel";
+            result.alert = ALERT_CONGESTION;
         } else if (features.noise_variance > 10.0f) {
-            result.alert_type = "unstable";
-            result.alert_message = "Warning: Unstable environment - Intermittent interference";
+            result.alert = ALERT_UNSTABLE;
         } else if (result.stability > 0.8f && result.confidence > 0.7f) {
-            result.alert_type = "excellent";
-            result.alert_message = "Status: Excellent connection quality";
+            result.alert = ALERT_EXCELLENT;
         } else if (result.stability > 0.6f) {
-            result.alert_type = "good";
-            result.alert_message = "Status: Good connection quality";
+            result.alert = ALERT_GOOD;
         } else {
-            result.alert_type = "poor";
-            result.alert_message = "Warning: Poor connection quality - Multiple issues detected";
+            result.alert = ALERT_POOR;
         }
     }
 };
@@ -304,7 +550,7 @@ private:
 #endif // ADVANCED_AI_H
 '''
     
-    return cpp_code
+    return cpp_code.replace('@ALERT_TYPES@', generate_alert_types())
 
 if __name__ == "__main__":
     print("🚀 Generating Advanced AI Features for ESP32...")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Alert episode log: host mirror of include/alert_log.h and /alerts decoder
+
+The firmware keeps one entry per stretch of warnings and alerts (AlertType
+severity > 0): when it started and ended, the alert that opened it, the most
+severe one seen and how often the type changed. Entries are only touched on
+alert transitions, so the timeline is available without replaying the AI
+over /history.json. An episode closes once status alerts have held for
+ALERT_CLEAR_S. /alerts serves the log image as-is:
+
+    header  <IBBBBI  magic "ALRT", version, count, capacity, event size, total
+    event   <IIHBBBBH start, end (0 = open), transitions, first, peak, last
+                      alert, peak severity, reserved
+
+Usage:
+    python alert_log.py http://192.168.4.1/alerts
+    python alert_log.py alerts.bin
+    python alert_log.py --benchmark          # log vs rederiving from 5 days of history
+"""
+
+import argparse
+import json
+import struct
+import time
+import urllib.request
+from collections import deque
+from datetime import datetime
+
+from advanced_ai_features import ALERTS, AdvancedWiFiAI
+
+ALERT_LOG_SIZE = 64            # ALERT_LOG_SIZE
+ALERT_LOG_MAGIC = 0x54524C41   # "ALRT"
+ALERT_LOG_VERSION = 1
+ALERT_CLEAR_S = 120            # seconds of status alerts that close an episode
+HEADER = struct.Struct('<IBBBBI')
+EVENT = struct.Struct('<IIHBBBBH')
+EVENT_FIELDS = ('start', 'end', 'transitions', 'first_alert', 'peak_alert', 'last_alert',
+                'peak_severity')
+
+
+class AlertLog:
+    """Same transitions and image as AlertLog in include/alert_log.h"""
+
+    def __init__(self, capacity=ALERT_LOG_SIZE):
+        self.events = deque(maxlen=capacity)
+        self.total = 0
+        self.open = False
+        self.clear_start = None
+
+    def update(self, t, alert):
+        """Feed every sample's AlertType; True only when the log changed"""
+        severity = ALERTS[alert][1]
+        if not self.open:
+            if severity == 0:
+                return False
+            self.events.append({'start': t, 'end': 0, 'transitions': 0, 'first_alert': alert,
+                                'peak_alert': alert, 'last_alert': alert, 'peak_severity': severity})
+            self.total += 1
+            self.open = True
+            return True
+
+        event = self.events[-1]
+        if severity == 0:
+            if self.clear_start is None:
+                self.clear_start = t
+            if t - self.clear_start < ALERT_CLEAR_S:
+                return False
+            event['end'] = self.clear_start
+            self.clear_start = None
+            self.open = False
+            return True
+        self.clear_start = None
+        if alert == event['last_alert']:
+            return False
+        event['last_alert'] = alert
+        event['transitions'] = min(event['transitions'] + 1, 0xFFFF)
+        if severity > event['peak_severity']:
+            event['peak_alert'] = alert
+            event['peak_severity'] = severity
+        return True
+
+    def serialize(self):
+        image = HEADER.pack(ALERT_LOG_MAGIC, ALERT_LOG_VERSION, len(self.events),
+                            self.events.maxlen, EVENT.size, self.total)
+        return image + b''.join(EVENT.pack(*(e[k] for k in EVENT_FIELDS), 0) for e in self.events)
+
+
+def decode(image):
+    """/alerts image -> {'total', 'capacity', 'dropped', 'events'} with alert names"""
+    if len(image) < HEADER.size:
+        raise ValueError("alert log image too short")
+    magic, version, count, capacity, event_size, total = HEADER.unpack_from(image)
+    if magic != ALERT_LOG_MAGIC or version != ALERT_LOG_VERSION or event_size != EVENT.size:
+        raise ValueError("not an alert log image (bad magic, version or event size)")
+    if len(image) < HEADER.size + count * EVENT.size:
+        raise ValueError("alert log image truncated")
+
+    events = []
+    for i in range(count):
+        values = EVENT.unpack_from(image, HEADER.size + i * EVENT.size)
+        event = dict(zip(EVENT_FIELDS, values))
+        for key in ('first_alert', 'peak_alert', 'last_alert'):
+            event[key] = ALERTS[event[key]][0] if event[key] < len(ALERTS) else 'unknown'
+        event['duration'] = event['end'] - event['start'] if event['end'] else None
+        events.append(event)
+    return {'total': total, 'capacity': capacity, 'dropped': total - count, 'events': events}
+
+
+def load(source):
+    """Image from a device URL or a file"""
+    if source.startswith(('http://', 'https://')):
+        with urllib.request.urlopen(source, timeout=10) as response:
+            return response.read()
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def replay_history(records, ai=None):
+    """
+    Rederive the log from raw history, as a client had to before /alerts:
+    every record goes through the AI again, since history stores no alerts
+    """
+    ai = ai if ai is not None else AdvancedWiFiAI()
+    log = AlertLog()
+    for r in records:
+        prediction = ai.predict_advanced_stability(r['rssi'], r['noise'], r['snr'], r['channel_util'])
+        log.update(r['t'], prediction['alert'])
+    return log
+
+
+def benchmark(days=5, repeat=20):
+    """Timeline from /alerts vs from /history.json (43,200 records at 5 days)"""
+    from history_store import decode_history, encode_history, generate_history
+
+    records = generate_history(days)
+    history_json = encode_history(records)
+
+    start = time.perf_counter()
+    log = replay_history(decode_history(history_json))
+    replay_s = time.perf_counter() - start
+    image = log.serialize()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        timeline = decode(image)
+    decode_s = (time.perf_counter() - start) / repeat
+
+    return {
+        'records': len(records),
+        'episodes': timeline['total'],
+        'history_bytes': len(history_json),
+        'log_bytes': len(image),
+        'replay_ms': replay_s * 1000,
+        'decode_ms': decode_s * 1000,
+    }
+
+
+def format_time(t):
+    return datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M:%S') if t else 'ongoing'
+
+
+def print_timeline(log):
+    print(f"🚨 {log['total']} alert episodes, {len(log['events'])} held"
+          + (f" ({log['dropped']} older dropped)" if log['dropped'] else ""))
+    for e in log['events']:
+        duration = f"{e['duration']}s" if e['duration'] is not None else '-'
+        path = e['first_alert'] if e['first_alert'] == e['last_alert'] else \
+            f"{e['first_alert']} → {e['last_alert']}"
+        print(f"   {format_time(e['start'])}  {format_time(e['end']):<19}  {duration:>7}  "
+              f"peak {e['peak_alert']} ({e['peak_severity']})  {path}, {e['transitions']} changes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode the /alerts episode log")
+    parser.add_argument('source', nargs='?', help='device /alerts URL or a saved image')
+    parser.add_argument('--json', action='store_true', help='print the decoded log as JSON')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare with rederiving alerts from history')
+    parser.add_argument('--days', type=float, default=5, help='history length for --benchmark')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        r = benchmark(args.days)
+        print(f"📊 {r['records']:,} history records, {r['episodes']} alert episodes")
+        print(f"   /history.json + replay: {r['history_bytes'] / 1e6:.1f} MB, {r['replay_ms']:.0f} ms")
+        print(f"   /alerts + decode:       {r['log_bytes']} bytes, {r['decode_ms']:.2f} ms")
+        return
+    if not args.source:
+        parser.error("source is required unless --benchmark is given")
+
+    log = decode(load(args.source))
+    if args.json:
+        print(json.dumps(log, indent=2))
+    else:
+        print_timeline(log)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the WiFi monitor pipeline
+
+Times the hot paths of the project (dataset generation, training, TFLite
+conversion, header generation, inference, the Python port of the advanced AI
+and history encode/decode/filter) in a pytest-benchmark-like format.
+Results are written to JSON and compared against a stored baseline; the run
+fails when a benchmark regresses by more than the threshold. Baselines are
+machine specific and not committed: record one with --save-baseline; a run
+without a baseline exits with status 2 instead of passing.
+
+Usage:
+    python benchmark_suite.py                      # run and compare
+    python benchmark_suite.py --save-baseline      # record a new baseline
+    python benchmark_suite.py -k history --quick   # subset, fewer rounds
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+RESULTS_FILE = 'benchmark_results.json'
+BASELINE_FILE = 'benchmark_baseline.json'
+DEFAULT_THRESHOLD = 0.25  # fail when the median is 25% slower than baseline
+
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+
+BENCHMARKS = []
+FIXTURES = {}
+
+
+def benchmark(name, group, rounds=5, iterations=1, requires=()):
+    """Register a benchmark; the function receives the fixture dict"""
+    def decorator(fn):
+        BENCHMARKS.append({
+            'name': name,
+            'group': group,
+            'rounds': rounds,
+            'iterations': iterations,
+            'requires': requires,
+            'fn': fn,
+        })
+        return fn
+    return decorator
+
+
+def fixture(fn):
+    """Register an input shared between benchmarks; FixtureContext computes and caches it"""
+    FIXTURES[fn.__name__] = fn
+    return fn
+
+
+def missing_modules(modules):
+    import importlib.util
+    return [m for m in modules if importlib.util.find_spec(m) is None]
+
+
+# ----------------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------------
+
+@fixture
+def dataset(ctx):
+    from generate_dataset import generate_wifi_data
+    return generate_wifi_data()
+
+
+@fixture
+def trained_model(ctx):
+    from train_model import create_advanced_model, prepare_features, train_model
+    _, X_train, X_test, y_train, y_test = prepare_features(ctx['dataset'])
+    model = create_advanced_model(X_train.shape[1])
+    train_model(model, X_train, y_train, X_test, y_test, epochs=1, verbose=0)
+    return model
+
+
+@fixture
+def interpreter(ctx):
+    import tensorflow as tf
+    interp = tf.lite.Interpreter(model_path='model.tflite')
+    interp.allocate_tensors()
+    return interp
+
+
+@fixture
+def batched_interpreter(ctx):
+    import tensorflow as tf
+    interp = tf.lite.Interpreter(model_path='model.tflite')
+    interp.resize_tensor_input(interp.get_input_details()[0]['index'], ctx['kpi_inputs'].shape)
+    interp.allocate_tensors()
+    return interp
+
+
+@fixture
+def kpi_inputs(ctx):
+    import numpy as np
+    from export_lut import normalize_inputs
+    rng = np.random.default_rng(0)
+    n = 1024
+    return normalize_inputs(rng.uniform(-95, -30, n), rng.uniform(-98, -60, n),
+                            rng.uniform(0, 100, n))
+
+
+@fixture
+def history_1d(ctx):
+    from history_store import generate_history
+    return generate_history(days=1, end=1755000000)
+
+
+@fixture
+def history_5d(ctx):
+    from history_store import generate_history
+    return generate_history(days=5, end=1755000000)
+
+
+@fixture
+def history_5d_json(ctx):
+    from history_store import encode_history
+    return encode_history(ctx['history_5d'])
+
+
+@fixture
+def history_1d_json(ctx):
+    from history_store import encode_history
+    return encode_history(ctx['history_1d'])
+
+
+@fixture
+def history_5d_raw(ctx):
+    from tiered_history import raw_record
+    return [raw_record(r['t'], r['rssi'], r['noise'], r['channel_util'], r['stability'], r['dt'])
+            for r in ctx['history_5d']]
+
+
+@fixture
+def history_5d_packed(ctx):
+    from kpi_codec import encode_blocks
+    return encode_blocks(ctx['history_5d_raw'])
+
+
+# ----------------------------------------------------------------------------
+# Benchmarks
+# ----------------------------------------------------------------------------
+
+@benchmark('dataset_generation', 'training', rounds=5, requires=('numpy', 'pandas'))
+def bench_dataset_generation(ctx):
+    from generate_dataset import generate_wifi_data
+    generate_wifi_data()
+
+
+@benchmark('scaler_fit_one_epoch', 'training', rounds=3,
+           requires=('tensorflow', 'pandas', 'sklearn'))
+def bench_scaler_fit_one_epoch(ctx):
+    from train_model import create_advanced_model, prepare_features, train_model
+    _, X_train, X_test, y_train, y_test = prepare_features(ctx['dataset'])
+    model = create_advanced_model(X_train.shape[1])
+    train_model(model, X_train, y_train, X_test, y_test, epochs=1, verbose=0)
+
+
+@benchmark('tflite_conversion', 'export', rounds=3, requires=('tensorflow', 'pandas', 'sklearn'))
+def bench_tflite_conversion(ctx):
+    from train_model import convert_to_tflite
+    convert_to_tflite(ctx['trained_model'])
+
+
+@benchmark('model_header_generation', 'export', rounds=10, requires=('tensorflow', 'sklearn'))
+def bench_model_header_generation(ctx):
+    from train_model import create_c_header
+    create_c_header('model.tflite', os.path.join(ctx['tmpdir'], 'model.h'))
+
+
+@benchmark('lut_header_generation', 'export', rounds=10, requires=('numpy',))
+def bench_lut_header_generation(ctx):
+    from export_lut import build_lut, create_lut_header
+    lut = build_lut(lambda r, n, u: (r + 100) / 80.0)
+    create_lut_header(lut, os.path.join(ctx['tmpdir'], 'model_lut.h'))
+
+
+@benchmark('inference_single', 'inference', rounds=5, iterations=1000,
+           requires=('tensorflow',))
+def bench_inference_single(ctx):
+    interp = ctx['interpreter']
+    inputs = ctx['kpi_inputs']
+    input_index = interp.get_input_details()[0]['index']
+    output_index = interp.get_output_details()[0]['index']
+    for i in range(1000):
+        interp.set_tensor(input_index, inputs[i:i + 1])
+        interp.invoke()
+        interp.get_tensor(output_index)
+
+
+@benchmark('inference_batched_1024', 'inference', rounds=10, requires=('tensorflow',))
+def bench_inference_batched(ctx):
+    interp = ctx['batched_interpreter']
+    interp.set_tensor(interp.get_input_details()[0]['index'], ctx['kpi_inputs'])
+    interp.invoke()
+    interp.get_tensor(interp.get_output_details()[0]['index'])
+
+
+@benchmark('advanced_ai_port', 'inference', rounds=5, iterations=1000)
+def bench_advanced_ai_port(ctx):
+    from advanced_ai_features import AdvancedWiFiAI
+    ai = AdvancedWiFiAI()
+    for record in ctx['history_1d'][:1000]:
+        ai.predict_advanced_stability(record['rssi'], record['noise'],
+                                      record['snr'], record['channel_util'])
+
+
+def _history_benchmarks(label, records_fixture, json_fixture):
+    @benchmark(f'history_encode_{label}', 'history', rounds=5)
+    def bench_encode(ctx):
+        from history_store import encode_history
+        encode_history(ctx[records_fixture])
+
+    @benchmark(f'history_decode_{label}', 'history', rounds=5)
+    def bench_decode(ctx):
+        from history_store import decode_history
+        decode_history(ctx[json_fixture])
+
+    @benchmark(f'history_filter_{label}', 'history', rounds=10)
+    def bench_filter(ctx):
+        from history_store import filter_history
+        filter_history(ctx[records_fixture], 1, now=1755000000)
+
+
+_history_benchmarks('1d', 'history_1d', 'history_1d_json')
+_history_benchmarks('5d', 'history_5d', 'history_5d_json')
+
+
+@benchmark('history_pack_5d', 'history', rounds=3, requires=('numpy',))
+def bench_history_pack(ctx):
+    from kpi_codec import encode_blocks
+    encode_blocks(ctx['history_5d_raw'])
+
+
+@benchmark('history_unpack_5d', 'history', rounds=10, requires=('numpy',))
+def bench_history_unpack(ctx):
+    from kpi_codec import decode_blocks_np
+    decode_blocks_np(ctx['history_5d_packed'])
+
+
+# ----------------------------------------------------------------------------
+# Runner
+# ----------------------------------------------------------------------------
+
+class FixtureContext(dict):
+    """dict that computes a fixture on first access and caches it for the run"""
+
+    def __missing__(self, key):
+        if key not in FIXTURES:
+            raise KeyError(key)
+        value = self[key] = FIXTURES[key](self)
+        return value
+
+
+def compute_stats(samples, iterations):
+    per_call = [s / iterations for s in samples]
+    return {
+        'min': min(per_call),
+        'max': max(per_call),
+        'mean': statistics.mean(per_call),
+        'median': statistics.median(per_call),
+        'stddev': statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        'rounds': len(per_call),
+        'iterations': iterations,
+        'ops': 1.0 / statistics.mean(per_call) if statistics.mean(per_call) > 0 else 0.0,
+    }
+
+
+def run_benchmarks(selected, quick=False):
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ctx = FixtureContext(tmpdir=tmpdir)
+        for bench in selected:
+            missing = missing_modules(bench['requires'])
+            if missing:
+                print(f"⏭️  {bench['name']}: skipped (missing {', '.join(missing)})")
+                results.append({'name': bench['name'], 'group': bench['group'],
+                                'skipped': f"missing {', '.join(missing)}"})
+                continue
+
+            rounds = max(2, bench['rounds'] // 2) if quick else bench['rounds']
+            samples = []
+            # Training helpers print progress; keep it out of the report and the timing
+            with contextlib.redirect_stdout(io.StringIO()):
+                bench['fn'](ctx)  # warmup, also resolves fixtures outside the timing
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    bench['fn'](ctx)
+                    samples.append(time.perf_counter() - start)
+
+            stats = compute_stats(samples, bench['iterations'])
+            results.append({'name': bench['name'], 'group': bench['group'], 'stats': stats})
+            print(f"⏱️  {bench['name']:<28} median {format_time(stats['median']):>10}  "
+                  f"(min {format_time(stats['min'])}, {rounds} rounds)")
+    return results
+
+
+def format_time(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+
+def machine_info():
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'system': platform.system(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare_to_baseline(results, baseline, threshold, metric='median'):
+    """Return a list of (name, baseline, current, ratio) regressions"""
+    previous = {b['name']: b for b in baseline.get('benchmarks', []) if 'stats' in b}
+    regressions = []
+
+    print(f"\n📊 Comparison against baseline ({metric}, threshold +{threshold * 100:.0f}%):")
+    for result in results:
+        if 'stats' not in result:
+            continue
+        old = previous.get(result['name'])
+        if old is None:
+            print(f"   {result['name']:<28} new benchmark")
+            continue
+        old_value = old['stats'][metric]
+        new_value = result['stats'][metric]
+        ratio = new_value / old_value if old_value > 0 else 1.0
+        marker = "❌" if ratio > 1 + threshold else "✅"
+        print(f"   {marker} {result['name']:<28} {format_time(old_value):>10} -> "
+              f"{format_time(new_value):>10}  ({(ratio - 1) * 100:+.1f}%)")
+        if ratio > 1 + threshold:
+            regressions.append((result['name'], old_value, new_value, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WiFi monitor performance benchmarks")
+    parser.add_argument('-k', dest='pattern', help='only run benchmarks whose name contains this')
+    parser.add_argument('--quick', action='store_true', help='halve the number of rounds')
+    parser.add_argument('--json', default=RESULTS_FILE, help='results output file')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='baseline file to compare with')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed relative slowdown before failing (default 0.25)')
+    parser.add_argument('--list', action='store_true', help='list benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    selected = [b for b in BENCHMARKS if not args.pattern or args.pattern in b['name']]
+    if args.list:
+        for bench in selected:
+            print(f"{bench['group']:<10} {bench['name']}")
+        return 0
+
+    print("🚀 WiFi Monitor Benchmark Suite")
+    print("=" * 50)
+    results = run_benchmarks(selected, args.quick)
+
+    report = {
+        'machine_info': machine_info(),
+        'datetime': datetime.now().isoformat(),
+        'benchmarks': results,
+    }
+    with open(args.json, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📄 Results saved to: {args.json}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📌 Baseline saved to: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️ No baseline at {args.baseline}, nothing compared; record one with --save-baseline")
+        return 2
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed beyond the threshold")
+        return 1
+    print("\n🎉 No performance regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Web UI asset build for the LittleFS image
+
+Minifies and gzips everything in data/ into data_dist/ (the filesystem
+image, see data_dir in platformio.ini). Scripts and stylesheets get a content
+hash in their filename so they can be cached forever; HTML pages keep their
+names and are revalidated with an ETag. assets.json maps each URL to its
+.gz file, content type, ETag and cache policy for handleStaticAsset().
+
+Runs standalone or as a PlatformIO pre-script (extra_scripts).
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+
+SOURCE_DIR = 'data'
+OUTPUT_DIR = 'data_dist'
+MANIFEST = 'assets.json'
+
+CONTENT_TYPES = {
+    '.html': 'text/html', '.css': 'text/css', '.js': 'application/javascript',
+    '.json': 'application/json', '.svg': 'image/svg+xml', '.png': 'image/png',
+    '.ico': 'image/x-icon', '.txt': 'text/plain',
+}
+HASHED_EXTENSIONS = ('.js', '.css')     # referenced from HTML, safe to rename
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+STRING_LITERAL = re.compile(r'''("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')''')
+
+
+def _outside_strings(text, transform):
+    """Apply `transform` to the parts of `text` that are not quoted strings"""
+    parts = STRING_LITERAL.split(text)
+    return ''.join(part if i % 2 else transform(part) for i, part in enumerate(parts))
+
+
+def minify_css(text):
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+
+    def squeeze(part):
+        part = re.sub(r'\s+', ' ', part)
+        part = re.sub(r'\s*([{}:;,>])\s*', r'\1', part)
+        return part.replace(';}', '}')
+
+    return _outside_strings(text, squeeze).strip()
+
+
+def minify_js(text):
+    """
+    Conservative line-level minification: drops indentation, blank lines and
+    whole-line // comments. No tokenizing, so string, template and regex
+    literals are never rewritten.
+    """
+    lines = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('//'):
+            continue
+        lines.append(stripped)
+    return '\n'.join(lines) + '\n'
+
+
+def minify_html(text):
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+    lines = [line.strip() for line in text.splitlines()]
+    return '\n'.join(line for line in lines if line) + '\n'
+
+
+def minify(name, text):
+    if name.endswith('.min.js') or name.endswith('.min.css'):
+        return text
+    if name.endswith('.css'):
+        return minify_css(text)
+    if name.endswith('.js'):
+        return minify_js(text)
+    if name.endswith('.html'):
+        return minify_html(text)
+    return text
+
+
+def content_hash(data, length=8):
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def hashed_name(name, digest):
+    """dashboard.js -> dashboard.1a2b3c4d.js, apexcharts.min.js -> apexcharts.min.1a2b3c4d.js"""
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest}{ext}"
+
+
+def rewrite_references(html, renames):
+    """Point src= and href= attributes at the hashed filenames"""
+    def replace(match):
+        attr, quote, target = match.group(1), match.group(2), match.group(3)
+        path = target.lstrip('/')
+        if path in renames:
+            prefix = '/' if target.startswith('/') else ''
+            return f'{attr}={quote}{prefix}{renames[path]}{quote}'
+        return match.group(0)
+
+    return re.sub(r'''\b(src|href)=(["'])([^"']+)\2''', replace, html)
+
+
+def build(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR, verbose=True):
+    """Build the filesystem image; returns the manifest"""
+    if os.path.isdir(output_dir):
+        shutil.rmtree(output_dir)
+    os.makedirs(output_dir)
+
+    names = sorted(n for n in os.listdir(source_dir) if os.path.isfile(os.path.join(source_dir, n)))
+    texts = {}
+    binaries = {}
+    for name in names:
+        with open(os.path.join(source_dir, name), 'rb') as f:
+            raw = f.read()
+        ext = os.path.splitext(name)[1]
+        if CONTENT_TYPES.get(ext, '').startswith(('text/', 'application/')) or ext == '.svg':
+            texts[name] = minify(name, raw.decode('utf-8'))
+        else:
+            binaries[name] = raw
+
+    # Hash scripts and stylesheets first, then rewrite the pages that load them
+    renames = {}
+    outputs = {}
+    for name, text in texts.items():
+        data = text.encode('utf-8')
+        if name.endswith(HASHED_EXTENSIONS):
+            renames[name] = hashed_name(name, content_hash(data))
+            outputs[renames[name]] = data
+    for name, text in texts.items():
+        if name.endswith('.html'):
+            text = rewrite_references(text, renames)
+        if name not in renames:
+            outputs[name] = text.encode('utf-8')
+    outputs.update(binaries)
+
+    manifest = {}
+    source_bytes = output_bytes = 0
+    for name, data in sorted(outputs.items()):
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        stored, payload = (name + '.gz', compressed) if len(compressed) < len(data) else (name, data)
+        with open(os.path.join(output_dir, stored), 'wb') as f:
+            f.write(payload)
+
+        original = next((src for src, dst in renames.items() if dst == name), name)
+        source_bytes += os.path.getsize(os.path.join(source_dir, original))
+        output_bytes += len(payload)
+        manifest['/' + name] = {
+            'file': '/' + stored,
+            'type': CONTENT_TYPES.get(os.path.splitext(name)[1], 'application/octet-stream'),
+            'etag': f'"{content_hash(data)}"',
+            'cache': IMMUTABLE_CACHE if name in renames.values() else REVALIDATE_CACHE,
+        }
+        if verbose:
+            print(f"   {original:<22} -> {stored:<32} {len(payload):>8} bytes")
+
+    with open(os.path.join(output_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+    if verbose:
+        print(f"✅ {len(manifest)} assets: {source_bytes} -> {output_bytes} bytes "
+              f"({100 * (1 - output_bytes / max(source_bytes, 1)):.0f}% smaller) in {output_dir}/")
+    return manifest
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Minify, hash and gzip the web UI for LittleFS")
+    parser.add_argument('--source', default=SOURCE_DIR)
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    args = parser.parse_args()
+
+    print(f"📦 Building web assets: {args.source}/ -> {args.output}/")
+    build(args.source, args.output)
+
+
+if __name__ == "__main__":
+    main()
+else:
+    try:
+        Import("env")  # noqa: F821 - provided by PlatformIO when run from extra_scripts
+    except NameError:
+        pass
+    else:
+        project_dir = env.subst("$PROJECT_DIR")  # noqa: F821
+        build(os.path.join(project_dir, SOURCE_DIR), os.path.join(project_dir, OUTPUT_DIR))
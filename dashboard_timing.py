@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Headless timing of the dashboard chart against the host simulator
+
+Starts the simulator with --days of history and opens dashboard.html in
+headless Chromium (Playwright). It then switches the chart between ranges and
+reports the following for each one:
+- the /history size and sample count;
+- the fetch, JSON parse and decimation time inside history_worker.js;
+- the main-thread render time and the points drawn per series;
+- the longest main-thread task.
+
+--engine node runs only the worker side (fetch, parse, decimate) in Node, for
+machines without a browser.
+
+Usage:
+    python dashboard_timing.py                          # ranges 1 and 5 in Chromium
+    python dashboard_timing.py --no-worker              # parse on the main thread instead
+    python dashboard_timing.py --cpu-throttle 4         # roughly a phone
+    python dashboard_timing.py --engine node --json
+    python dashboard_timing.py --assets data_dist       # the build_assets.py image
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+
+from host_simulator import DATA_DIR, Simulator
+
+WORKER_SCRIPT = os.path.join(DATA_DIR, 'history_worker.js')
+DEFAULT_RANGES = (1, 5)
+DEFAULT_WIDTH = 1280
+
+# Sums the page's long tasks (> 50 ms on the main thread) between range switches
+LONG_TASK_OBSERVER = '''
+window.__longTasks = [];
+new PerformanceObserver(list => {
+  for (const entry of list.getEntries()) window.__longTasks.push(entry.duration);
+}).observe({ type: 'longtask', buffered: true });
+'''
+
+# chartTimings entries of full loads (re-decimation after appends also adds entries)
+LOADS = "chartTimings.filter(timing => timing.type === 'load')"
+
+# Same requests the dashboard sends, through history_worker.js in Node
+NODE_DRIVER = '''
+const { queueHistoryRequest } = require(process.argv[1]);
+const [url, ranges, maxPoints] = [process.argv[2], JSON.parse(process.argv[3]), Number(process.argv[4])];
+(async () => {
+  const results = [];
+  for (const range of ranges) {
+    const reply = await queueHistoryRequest({ id: range, type: 'load', url: `${url}/history?range=${range}`, maxPoints });
+    results.push({
+      range,
+      count: reply.count,
+      points: Math.max(...reply.series.map(s => s.x.length)),
+      ...reply.timings,
+      extrema: reply.series.map(s => s.y.length ? [Math.min(...s.y), Math.max(...s.y)] : null)
+    });
+  }
+  console.log(JSON.stringify(results));
+})().catch(error => { console.error(error); process.exit(1); });
+'''
+
+
+def time_in_node(url, ranges=DEFAULT_RANGES, max_points=DEFAULT_WIDTH):
+    """Worker-side timings per range; render fields are None"""
+    node = shutil.which('node')
+    if node is None:
+        raise RuntimeError("node not found")
+    output = subprocess.run([node, '-e', NODE_DRIVER, WORKER_SCRIPT, url, json.dumps(list(ranges)),
+                             str(max_points)], capture_output=True, text=True, check=True).stdout
+    results = json.loads(output)
+    for result in results:
+        result.update(render_ms=None, longest_task_ms=None, worker=True)
+    return results
+
+
+def time_in_browser(url, ranges=DEFAULT_RANGES, width=DEFAULT_WIDTH, worker=True, cpu_throttle=1,
+                    timeout_s=60):
+    """Per range: the dashboard's chartTimings entry plus main-thread long tasks"""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise RuntimeError("Playwright is not installed (pip install playwright && "
+                           "python -m playwright install chromium), or use --engine node")
+
+    results = []
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        try:
+            page = browser.new_page(viewport={'width': width, 'height': 900})
+            page.add_init_script(LONG_TASK_OBSERVER)
+            if cpu_throttle > 1:
+                session = page.context.new_cdp_session(page)
+                session.send('Emulation.setCPUThrottlingRate', {'rate': cpu_throttle})
+            page.goto(url + '/dashboard.html' + ('' if worker else '?worker=0'))
+            page.wait_for_function(f'{LOADS}.length > 0', timeout=timeout_s * 1000)
+            for range_days in ranges:
+                page.evaluate('window.__longTasks = []')
+                loaded = page.evaluate(f'{LOADS}.length')
+                page.click(f'.time-btn[data-days="{range_days}"]')
+                page.wait_for_function(f'{LOADS}.length > {loaded}', timeout=timeout_s * 1000)
+                result = page.evaluate(f'{LOADS}.pop()')
+                result['longest_task_ms'] = page.evaluate('Math.max(0, ...window.__longTasks)')
+                results.append(result)
+        finally:
+            browser.close()
+    return results
+
+
+def run(days=5, ranges=DEFAULT_RANGES, engine='chromium', width=DEFAULT_WIDTH, worker=True, cpu_throttle=1,
+        asset_dir=DATA_DIR):
+    with Simulator(asset_dir=asset_dir, history_days=days, fixed_interval=60) as sim:
+        if engine == 'node':
+            return time_in_node(sim.url, ranges, width)
+        return time_in_browser(sim.url, ranges, width, worker, cpu_throttle)
+
+
+def print_report(results, engine, worker=True):
+    if engine == 'node':
+        where = 'history_worker.js only, no rendering'
+    else:
+        where = 'parsing in a Worker' if worker else 'parsing on the main thread'
+    print(f"⏱️  Dashboard history load ({engine}, {where})")
+    print(f"   {'range':>5} {'samples':>8} {'JSON KB':>8} {'fetch':>8} {'parse':>8} {'decimate':>9} "
+          f"{'render':>8} {'points':>7} {'longest task':>13}")
+
+    def ms(value):
+        return f"{value:6.1f} ms" if value is not None else f"{'—':>9}"
+
+    for r in results:
+        print(f"   {r['range']:>4}d {r['count']:>8} {r['bytes'] / 1024:>8.0f} {ms(r['fetch_ms'])}"
+              f"{ms(r['parse_ms'])} {ms(r['decimate_ms'])}{ms(r['render_ms'])} {r['points']:>7} "
+              f"{ms(r['longest_task_ms']):>13}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time dashboard history parsing and chart rendering")
+    parser.add_argument('--days', type=float, default=5, help='simulated history to preload')
+    parser.add_argument('--ranges', type=int, nargs='+', default=list(DEFAULT_RANGES))
+    parser.add_argument('--engine', choices=('chromium', 'node'), default='chromium')
+    parser.add_argument('--width', type=int, default=DEFAULT_WIDTH, help='viewport (node: max points) width')
+    parser.add_argument('--no-worker', action='store_true', help='parse on the main thread (?worker=0)')
+    parser.add_argument('--cpu-throttle', type=float, default=1, help='Chromium CPU slowdown factor')
+    parser.add_argument('--assets', default=DATA_DIR, help='data/ or a build_assets.py output')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    try:
+        results = run(args.days, args.ranges, args.engine, args.width, not args.no_worker, args.cpu_throttle,
+                      args.assets)
+    except RuntimeError as error:
+        print(f"❌ {error}")
+        return 1
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results, args.engine, not args.no_worker)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
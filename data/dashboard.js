@@ -3,6 +3,27 @@ let chart;
 let currentRange = 0;
 let statusUpdateInterval;
 let chartUpdateInterval;
+let eventSource = null;
+let chartLoaded = false;
+
+// /history goes through history_worker.js: in a Worker, or on the main thread without one
+let historyWorker = null;
+const pendingHistory = new Map();
+let historyRequestId = 0;
+let chartRequestId = 0;     // the latest load; replies to older requests are dropped
+let renderedPoints = 0;     // per series, including points appended since the last load
+let redecimating = false;
+
+// One entry per chart load (ms, sample and point counts); read by dashboard_timing.py
+const chartTimings = [];
+
+const CHART_SERIES = [
+  { name: 'RSSI (dBm)', yAxisIndex: 0 },
+  { name: 'Noise (dBm)', yAxisIndex: 0 },
+  { name: 'SNR (dB)', yAxisIndex: 0 },
+  { name: 'Channel Util (%)', yAxisIndex: 0 },
+  { name: 'AI Stability (%)', yAxisIndex: 1 }
+];
 
 // Status color mappings
 const statusColors = {
@@ -142,130 +163,189 @@ function initChart() {
   chart.render();
 }
 
+// Start history_worker.js as a Worker; ?worker=0 keeps parsing on the main thread
+function startHistoryWorker() {
+  const script = document.querySelector('script[src*="history_worker"]');
+  if (!window.Worker || !script || new URLSearchParams(location.search).get('worker') === '0') {
+    console.log('🧵 Parsing history on the main thread');
+    return;
+  }
+  historyWorker = new Worker(script.src);
+  historyWorker.onmessage = event => {
+    const reply = event.data;
+    const pending = pendingHistory.get(reply.id);
+    pendingHistory.delete(reply.id);
+    if (reply.error) pending.reject(new Error(reply.error));
+    else pending.resolve(reply);
+  };
+}
+
+function requestHistory(request) {
+  request.id = ++historyRequestId;
+  if (!historyWorker) return queueHistoryRequest(request);
+  return new Promise((resolve, reject) => {
+    pendingHistory.set(request.id, { resolve, reject });
+    historyWorker.postMessage(request);
+  });
+}
+
+// Keep the worker's columns in step with points appended from /events
+function appendHistory(record) {
+  if (historyWorker) historyWorker.postMessage({ type: 'append', record });
+  else queueHistoryRequest({ type: 'append', record });
+}
+
+// One point per horizontal pixel of the chart is all it can show
+function chartMaxPoints() {
+  const width = document.querySelector('#chart').clientWidth;
+  return Math.max(100, Math.round(width || 800));
+}
+
+function toSeriesData({ x, y }) {
+  const data = new Array(x.length);
+  for (let i = 0; i < x.length; i++) data[i] = [x[i], y[i]];
+  return data;
+}
+
+// Log whether the newest record is live data and flag it in the header
+function reportDataSource(latestRecord) {
+  const recordAge = Date.now() - (latestRecord.t * 1000);
+  const isRecent = recordAge < 300000; // Less than 5 minutes old
+
+  console.log(`🔍 Data Source Analysis:`);
+  console.log(`   Latest record: ${new Date(latestRecord.t * 1000).toLocaleString()}`);
+  console.log(`   Age: ${Math.round(recordAge / 1000)} seconds ago`);
+  console.log(`   SSID: ${latestRecord.ssid || 'Unknown'}`);
+  console.log(`   Status: ${isRecent ? '✅ REAL-TIME DATA' : '⚠️ OLD/DEMO DATA'}`);
+
+  // Show data source in dashboard
+  const statusText = document.getElementById('status-text');
+  if (statusText && isRecent) {
+    statusText.textContent += ' (Real-time data)';
+  }
+}
+
+// Replace all series with a decimated view from the worker
+function renderHistory(reply, days) {
+  const started = performance.now();
+  const series = CHART_SERIES.map((info, k) => ({ ...info, data: toSeriesData(reply.series[k]) }));
+  return chart.updateSeries(series).then(() => {
+    renderedPoints = Math.max(...reply.series.map(s => s.x.length));
+    chartLoaded = reply.count > 0;
+    chartTimings.push({
+      type: reply.type,
+      range: days,
+      count: reply.count,
+      points: renderedPoints,
+      worker: historyWorker !== null,
+      ...reply.timings,
+      render_ms: performance.now() - started
+    });
+  });
+}
+
+// Redraw from the worker's columns once appends have outgrown the chart width
+function redecimateChart() {
+  if (redecimating) return;
+  redecimating = true;
+  const request = { type: 'view', maxPoints: chartMaxPoints() };
+  const days = currentRange;
+  requestHistory(request)
+    .then(reply => {
+      if (request.id > chartRequestId && days === currentRange) return renderHistory(reply, days);
+    })
+    .finally(() => {
+      redecimating = false;
+    });
+}
+
 // Update chart with new data
 function updateChart(days) {
   currentRange = days;
   console.log(`📈 Fetching data for range: ${days} days`);
 
-  fetch(`/history?range=${days}`)
-    .then(response => response.json())
-    .then(data => {
-      console.log(`📊 Received ${data.length} data points`);
-
-      // Check if data is real or demo
-      if (data.length > 0) {
-        const latestRecord = data[data.length - 1];
-        const recordAge = Date.now() - (latestRecord.t * 1000);
-        const isRecent = recordAge < 300000; // Less than 5 minutes old
-
-        console.log(`🔍 Data Source Analysis:`);
-        console.log(`   Latest record: ${new Date(latestRecord.t * 1000).toLocaleString()}`);
-        console.log(`   Age: ${Math.round(recordAge / 1000)} seconds ago`);
-        console.log(`   SSID: ${latestRecord.ssid || 'Unknown'}`);
-        console.log(`   Status: ${isRecent ? '✅ REAL-TIME DATA' : '⚠️ OLD/DEMO DATA'}`);
-
-        // Show data source in dashboard
-        const statusText = document.getElementById('status-text');
-        if (statusText && isRecent) {
-          statusText.textContent += ' (Real-time data)';
-        }
-      }
-
-      if (!Array.isArray(data) || data.length === 0) {
+  const request = { type: 'load', url: `/history?range=${days}`, maxPoints: chartMaxPoints() };
+  requestHistory(request)
+    .then(reply => {
+      if (request.id !== chartRequestId) return;    // another range was picked meanwhile
+      console.log(`📊 Received ${reply.count} data points, drawing ${Math.max(...reply.series.map(s => s.x.length))}`);
+      if (reply.latest) {
+        reportDataSource(reply.latest);
+      } else {
         console.log('⚠️ No data available for selected range');
-        // Show empty chart with message
-        const emptySeries = [
-          { name: 'RSSI (dBm)', data: [], yAxisIndex: 0 },
-          { name: 'Noise (dBm)', data: [], yAxisIndex: 0 },
-          { name: 'SNR (dB)', data: [], yAxisIndex: 0 },
-          { name: 'Channel Util (%)', data: [], yAxisIndex: 0 },
-          { name: 'AI Stability (%)', data: [], yAxisIndex: 1 }
-        ];
-        chart.updateSeries(emptySeries);
-        return;
       }
-
-      // Simple debug - check if all data exists
-      console.log('📊 First record:', data[0]);
-      console.log('📊 All 5 curves data check:', {
-        rssi: data[0]?.rssi,
-        noise: data[0]?.noise,
-        snr: data[0]?.snr,
-        channel_util: data[0]?.channel_util,
-        stability: data[0]?.stability
+      return renderHistory(reply, days).then(() => {
+        if (reply.latest) generateAlerts([reply.latest]);
       });
-
-      const series = [
-        {
-          name: 'RSSI (dBm)',
-          data: data.map(d => [d.t * 1000, d.rssi || 0]),
-          yAxisIndex: 0
-        },
-        {
-          name: 'Noise (dBm)',
-          data: data.map(d => [d.t * 1000, d.noise || -95]),
-          yAxisIndex: 0
-        },
-        {
-          name: 'SNR (dB)',
-          data: data.map(d => [d.t * 1000, d.snr || 0]),
-          yAxisIndex: 0
-        },
-        {
-          name: 'Channel Util (%)',
-          data: data.map(d => [d.t * 1000, d.channel_util || 0]),
-          yAxisIndex: 0
-        },
-        {
-          name: 'AI Stability (%)',
-          data: data.map(d => [d.t * 1000, (d.stability || 0) * 100]),
-          yAxisIndex: 1
-        }
-      ];
-
-      // Debug: Check what noise data looks like in series
-      console.log('🔍 Noise series data:', series[1].data.slice(0, 3));
-      chart.updateSeries(series);
-      generateAlerts(data);
     })
     .catch(error => {
       console.error('❌ Error fetching chart data:', error);
     });
+  chartRequestId = request.id;
 }
 
-// Update real-time status
-function updateStatus() {
-  fetch('/status')
-    .then(response => response.json())
-    .then(data => {
-      // Update connection status
-      const statusDot = document.getElementById('status-dot');
-      const statusText = document.getElementById('status-text');
-
-      if (data.connected) {
-        statusDot.style.background = '#48bb78';
-        statusText.textContent = `Connected to ${data.ssid}`;
-      } else {
-        statusDot.style.background = '#e53e3e';
-        statusText.textContent = 'Disconnected';
+// Polling fallback: fetch the range again but only append the samples the chart lacks
+function refreshChart() {
+  if (!chartLoaded) {
+    updateChart(currentRange);
+    return;
+  }
+  const request = { type: 'refresh', url: `/history?range=${currentRange}`, maxPoints: chartMaxPoints() };
+  const days = currentRange;
+  requestHistory(request)
+    .then(reply => {
+      if (request.id < chartRequestId || days !== currentRange) return;
+      if (reply.replaced) return renderHistory(reply, days);
+      if (reply.added === 0) return;
+      renderedPoints += Math.max(...reply.series.map(s => s.x.length));
+      if (renderedPoints > 2 * chartMaxPoints()) {
+        redecimateChart();
+        return;
       }
+      chart.appendData(reply.series.map(s => ({ data: toSeriesData(s) })));
+      if (reply.latest) generateAlerts([reply.latest]);
+    })
+    .catch(error => {
+      console.error('❌ Error refreshing chart data:', error);
+    });
+}
+
+// Render a /status response or an /events message
+function renderStatus(data) {
+  // Update connection status
+  const statusDot = document.getElementById('status-dot');
+  const statusText = document.getElementById('status-text');
 
-      // Update status cards
-      updateStatusCard('rssi', data.rssi, 'dBm', getSignalStatus(data.rssi));
-      updateStatusCard('noise', data.noise, 'dBm', getNoiseStatus(data.noise));
-      updateStatusCard('snr', data.snr, 'dB', getSNRStatus(data.snr));
-      updateStatusCard('channel', data.channel_util, '%', getChannelStatus(data.channel_util));
+  if (data.connected) {
+    statusDot.style.background = '#48bb78';
+    statusText.textContent = `Connected to ${data.ssid}`;
+  } else {
+    statusDot.style.background = '#e53e3e';
+    statusText.textContent = 'Disconnected';
+  }
 
-      // Update AI stability
-      const stabilityPercent = (data.stability * 100);
-      updateStatusCard('stability', stabilityPercent, '%', getStabilityStatus(data.stability));
+  // Update status cards
+  updateStatusCard('rssi', data.rssi, 'dBm', getSignalStatus(data.rssi));
+  updateStatusCard('noise', data.noise, 'dBm', getNoiseStatus(data.noise));
+  updateStatusCard('snr', data.snr, 'dB', getSNRStatus(data.snr));
+  updateStatusCard('channel', data.channel_util, '%', getChannelStatus(data.channel_util));
 
-      // Update stability bar
-      const stabilityFill = document.getElementById('stability-fill');
-      if (stabilityFill) {
-        stabilityFill.style.width = stabilityPercent + '%';
-      }
-    })
+  // Update AI stability
+  const stabilityPercent = (data.stability * 100);
+  updateStatusCard('stability', stabilityPercent, '%', getStabilityStatus(data.stability));
+
+  // Update stability bar
+  const stabilityFill = document.getElementById('stability-fill');
+  if (stabilityFill) {
+    stabilityFill.style.width = stabilityPercent + '%';
+  }
+}
+
+// Update real-time status (polling fallback)
+function updateStatus() {
+  fetch('/status')
+    .then(response => response.json())
+    .then(renderStatus)
     .catch(error => {
       console.error('Error fetching status:', error);
     });
@@ -274,6 +354,74 @@ function updateStatus() {
   updateAIAlerts();
 }
 
+// Append one pushed sample to the "Today" chart without refetching /history
+function appendChartPoint(data) {
+  if (currentRange !== 0 || !chartLoaded) return;
+  appendHistory(data);
+  if (++renderedPoints > 2 * chartMaxPoints()) {
+    redecimateChart();
+    return;
+  }
+  const x = data.t * 1000;
+  chart.appendData([
+    { data: [[x, data.rssi]] },
+    { data: [[x, data.noise]] },
+    { data: [[x, data.snr]] },
+    { data: [[x, data.channel_util]] },
+    { data: [[x, data.stability * 100]] }
+  ]);
+}
+
+// One /events message per KPI sample: status fields plus the AI alert
+function handleKpiEvent(event) {
+  const data = JSON.parse(event.data);
+  renderStatus(data);
+  updateCurrentAIAlert(data);
+  appendChartPoint(data);
+  generateAlerts([data]);
+}
+
+function startPolling() {
+  if (statusUpdateInterval) return;
+  console.log('🔁 Falling back to polling');
+  updateStatus();
+  statusUpdateInterval = setInterval(updateStatus, 5000); // Every 5 seconds
+  chartUpdateInterval = setInterval(() => {
+    if (currentRange === 0) { // Only auto-update for "Today" view
+      refreshChart();
+    }
+  }, 30000); // Every 30 seconds
+}
+
+function stopPolling() {
+  if (statusUpdateInterval) clearInterval(statusUpdateInterval);
+  if (chartUpdateInterval) clearInterval(chartUpdateInterval);
+  statusUpdateInterval = null;
+  chartUpdateInterval = null;
+}
+
+// Subscribe to the KPI event stream; poll only if it is unavailable
+function connectEvents() {
+  if (!window.EventSource) {
+    startPolling();
+    return;
+  }
+
+  eventSource = new EventSource('/events');
+  eventSource.onmessage = handleKpiEvent;
+  eventSource.onopen = () => {
+    console.log('📡 Subscribed to /events');
+    stopPolling();
+  };
+  eventSource.onerror = () => {
+    // The browser reconnects by itself; a closed stream (e.g. subscriber limit reached) means poll instead
+    if (eventSource.readyState === EventSource.CLOSED) {
+      eventSource = null;
+      startPolling();
+    }
+  };
+}
+
 // Update AI alerts with intelligent diagnosis
 function updateAIAlerts() {
   fetch('/advanced-ai')
@@ -485,10 +633,10 @@ document.addEventListener('DOMContentLoaded', () => {
   
   // Initialize chart
   initChart();
+  startHistoryWorker();
   
-  // Load initial data (today)
+  // Load initial data (today); the first /events message fills in the status cards
   updateChart(0);
-  updateStatus();
   
   // Setup time range buttons
   document.querySelectorAll('.time-btn').forEach(btn => {
@@ -504,19 +652,15 @@ document.addEventListener('DOMContentLoaded', () => {
     });
   });
   
-  // Start periodic updates
-  statusUpdateInterval = setInterval(updateStatus, 5000); // Every 5 seconds
-  chartUpdateInterval = setInterval(() => {
-    if (currentRange === 0) { // Only auto-update for "Today" view
-      updateChart(currentRange);
-    }
-  }, 30000); // Every 30 seconds
+  // Live updates are pushed once per KPI sample
+  connectEvents();
   
   console.log('Dashboard initialized successfully');
 });
 
 // Cleanup on page unload
 window.addEventListener('beforeunload', () => {
-  if (statusUpdateInterval) clearInterval(statusUpdateInterval);
-  if (chartUpdateInterval) clearInterval(chartUpdateInterval);
+  if (eventSource) eventSource.close();
+  if (historyWorker) historyWorker.terminate();
+  stopPolling();
 });
@@ -0,0 +1,159 @@
+// /history parsing and decimation for the dashboard chart
+// dashboard.js runs this file as a Web Worker, so the main thread never parses
+// the history JSON. Samples are kept in typed arrays, one column per series,
+// and the chart only receives a view decimated to its width. The page also
+// loads it as a plain script: that gives dashboard.js the hashed URL for the
+// worker and a main-thread fallback. dashboard_timing.py loads it in Node.
+
+// field, scale, value used when the field is missing (as the old `d.noise || -95`)
+const HISTORY_SERIES = [
+  ['rssi', 1, 0],
+  ['noise', 1, -95],
+  ['snr', 1, 0],
+  ['channel_util', 1, 0],
+  ['stability', 100, 0]   // charted in %
+];
+
+class HistoryColumns {
+  constructor(capacity = 1024) {
+    this.length = 0;
+    this.t = new Float64Array(capacity);   // ms since the epoch
+    this.values = HISTORY_SERIES.map(() => new Float32Array(capacity));
+  }
+
+  grow() {
+    const capacity = this.t.length * 2;
+    const t = new Float64Array(capacity);
+    t.set(this.t);
+    this.t = t;
+    this.values = this.values.map(column => {
+      const grown = new Float32Array(capacity);
+      grown.set(column);
+      return grown;
+    });
+  }
+
+  // A /history record or an /events message; samples not newer than the last one are skipped
+  push(record) {
+    const x = record.t * 1000;
+    if (this.length && x <= this.t[this.length - 1]) return false;
+    if (this.length === this.t.length) this.grow();
+    this.t[this.length] = x;
+    for (let k = 0; k < HISTORY_SERIES.length; k++) {
+      const [field, scale, missing] = HISTORY_SERIES[k];
+      this.values[k][this.length] = (record[field] || missing) * scale;
+    }
+    this.length++;
+    return true;
+  }
+}
+
+// Parse a /history response into `columns` (new ones if null); `start` is the first added sample
+function parseHistory(text, columns = null) {
+  const records = JSON.parse(text);
+  columns = columns || new HistoryColumns(Math.max(records.length, 16));
+  const start = columns.length;
+  for (let i = 0; i < records.length; i++) columns.push(records[i]);
+  return { columns, start, latest: records.length ? records[records.length - 1] : null };
+}
+
+// Samples from `start` on, at most maxPoints per series: the min and the max of
+// each bucket in time order, so dips and spikes survive the decimation
+function decimateHistory(columns, maxPoints, start = 0) {
+  const count = columns.length - start;
+  const buckets = Math.max(1, Math.floor(maxPoints / 2));
+  return columns.values.map(column => {
+    if (count <= maxPoints) {
+      return { x: columns.t.slice(start, columns.length), y: column.slice(start, columns.length) };
+    }
+    const x = new Float64Array(buckets * 2);
+    const y = new Float32Array(buckets * 2);
+    let n = 0;
+    for (let b = 0; b < buckets; b++) {
+      const from = start + Math.floor(b * count / buckets);
+      const to = start + Math.floor((b + 1) * count / buckets);
+      let low = from;
+      let high = from;
+      for (let i = from + 1; i < to; i++) {
+        if (column[i] < column[low]) low = i;
+        if (column[i] > column[high]) high = i;
+      }
+      const first = Math.min(low, high);
+      const second = Math.max(low, high);
+      x[n] = columns.t[first];
+      y[n++] = column[first];
+      if (second !== first) {
+        x[n] = columns.t[second];
+        y[n++] = column[second];
+      }
+    }
+    return { x: x.slice(0, n), y: y.slice(0, n) };
+  });
+}
+
+let historyColumns = null;
+let historyQueue = Promise.resolve();
+
+function historyView(request, columns, start, latest, timings) {
+  const started = performance.now();
+  const series = decimateHistory(columns, request.maxPoints, start);
+  timings.decimate_ms = performance.now() - started;
+  return {
+    id: request.id,
+    type: request.type,
+    count: columns.length,
+    added: columns.length - start,
+    replaced: start === 0,
+    latest,
+    timings,
+    series
+  };
+}
+
+// load:    fetch request.url, replace the columns, reply with the whole view
+// refresh: fetch request.url, reply with the samples newer than the last one only
+// view:    re-decimate the current columns (e.g. after many appends)
+// append:  add one /events sample, no reply
+async function runHistoryRequest(request) {
+  if (request.type === 'append') {
+    if (historyColumns) historyColumns.push(request.record);
+    return null;
+  }
+  if (request.type === 'view') {
+    return historyView(request, historyColumns || new HistoryColumns(16), 0, null, {});
+  }
+  const started = performance.now();
+  const response = await fetch(request.url);
+  if (!response.ok) throw new Error(`${request.url}: HTTP ${response.status}`);
+  const text = await response.text();
+  const fetched = performance.now();
+  const parsed = parseHistory(text, request.type === 'refresh' ? historyColumns : null);
+  historyColumns = parsed.columns;
+  return historyView(request, parsed.columns, parsed.start, parsed.latest, {
+    bytes: text.length,
+    fetch_ms: fetched - started,
+    parse_ms: performance.now() - fetched
+  });
+}
+
+// One request at a time, so a refresh never lands in the columns of a newer load
+function queueHistoryRequest(request) {
+  const result = historyQueue.then(() => runHistoryRequest(request));
+  historyQueue = result.catch(() => {});
+  return result;
+}
+
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+  self.onmessage = event => {
+    const request = event.data;
+    queueHistoryRequest(request).then(reply => {
+      if (!reply) return;
+      // Typed arrays are transferred, not copied
+      self.postMessage(reply, reply.series.flatMap(s => [s.x.buffer, s.y.buffer]));
+    }, error => self.postMessage({ id: request.id, error: String(error) }));
+  };
+}
+
+if (typeof module !== 'undefined') {
+  module.exports = { HISTORY_SERIES, HistoryColumns, parseHistory, decimateHistory, queueHistoryRequest };
+}
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Quantized lookup-table export for the 4-input WiFi stability model
+
+The model only sees RSSI, noise, SNR (= RSSI - noise) and channel utilization,
+all measured at 1 dB / 1 % precision. This script evaluates model.tflite over
+a coarse node grid, stores the outputs as uint8 and emits include/model_lut.h.
+On the ESP32 inference becomes a trilinear table lookup: no TFLite runtime and
+no TENSOR_ARENA_SIZE.
+
+The error report compares the table against the float model at every point of
+the full 1 dB / 1 % grid.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+# Input domain covered by the table (firmware units, inclusive)
+RSSI_RANGE = (-100, -20)   # dBm
+NOISE_RANGE = (-100, -40)  # dBm; estimateNoise() reaches -43 with 32 cached APs
+UTIL_RANGE = (0, 100)      # %
+
+# Default node spacing of the piecewise-linear approximation
+DEFAULT_STEPS = (2, 2, 5)  # rssi dB, noise dB, channel util %
+
+
+def normalize_inputs(rssi, noise, channel_util):
+    """Normalize raw KPIs exactly as predictStability() does on the ESP32"""
+    rssi = np.asarray(rssi, dtype=np.float32)
+    noise = np.asarray(noise, dtype=np.float32)
+    channel_util = np.asarray(channel_util, dtype=np.float32)
+    snr = rssi - noise
+    return np.stack([
+        (rssi + 90) / 30.0,
+        noise / 50.0,
+        (snr + 40) / 60.0,
+        channel_util / 100.0
+    ], axis=-1).astype(np.float32)
+
+
+def load_tflite_predictor(model_path='model.tflite'):
+    """Return a batched predict(rssi, noise, util) function backed by TFLite"""
+    import tensorflow as tf
+
+    interpreter = tf.lite.Interpreter(model_path=model_path)
+    input_index = interpreter.get_input_details()[0]['index']
+    output_index = interpreter.get_output_details()[0]['index']
+
+    def predict(rssi, noise, channel_util):
+        inputs = normalize_inputs(rssi, noise, channel_util)
+        interpreter.resize_tensor_input(input_index, inputs.shape)
+        interpreter.allocate_tensors()
+        interpreter.set_tensor(input_index, inputs)
+        interpreter.invoke()
+        return interpreter.get_tensor(output_index)[:, 0].astype(np.float32)
+
+    return predict
+
+
+def axis_nodes(value_range, step):
+    """Node coordinates for one axis, always including both range ends"""
+    low, high = value_range
+    nodes = np.arange(low, high + 1e-9, step, dtype=np.float32)
+    if nodes[-1] < high:
+        nodes = np.append(nodes, np.float32(high))
+    return nodes
+
+
+def build_lut(predict_fn, steps=DEFAULT_STEPS):
+    """Evaluate predict_fn on the node grid and quantize outputs to uint8"""
+    axes = (
+        axis_nodes(RSSI_RANGE, steps[0]),
+        axis_nodes(NOISE_RANGE, steps[1]),
+        axis_nodes(UTIL_RANGE, steps[2]),
+    )
+    grid = np.meshgrid(*axes, indexing='ij')
+    values = predict_fn(grid[0].ravel(), grid[1].ravel(), grid[2].ravel())
+    values = np.clip(np.asarray(values, dtype=np.float32), 0.0, 1.0)
+    table = np.round(values * 255.0).astype(np.uint8)
+
+    return {
+        'steps': tuple(float(s) for s in steps),
+        'axes': axes,
+        'table': table.reshape(tuple(len(a) for a in axes)),
+    }
+
+
+def lut_predict(lut, rssi, noise, channel_util):
+    """Vectorized trilinear lookup, same arithmetic as the generated C code"""
+    coords = []
+    for axis, step, values in zip(lut['axes'], lut['steps'],
+                                  (rssi, noise, channel_util)):
+        values = np.clip(np.asarray(values, dtype=np.float32), axis[0], axis[-1])
+        pos = (values - axis[0]) / np.float32(step)
+        idx = np.minimum(pos.astype(np.int32), len(axis) - 2)
+        # The last cell may be narrower than step when the range is not a multiple
+        frac = (values - axis[idx]) / (axis[idx + 1] - axis[idx])
+        coords.append((idx, frac))
+
+    (ir, fr), (inn, fn), (iu, fu) = coords
+    table = lut['table'].astype(np.float32)
+    result = np.zeros(np.broadcast(ir, inn, iu).shape, dtype=np.float32)
+    for dr in (0, 1):
+        wr = fr if dr else 1 - fr
+        for dn in (0, 1):
+            wn = fn if dn else 1 - fn
+            for du in (0, 1):
+                wu = fu if du else 1 - fu
+                result += wr * wn * wu * table[ir + dr, inn + dn, iu + du]
+    return result / 255.0
+
+
+def lut_predict_scalar(lut, rssi, noise, channel_util):
+    """Single-sample pure Python lookup, used for per-call latency comparison"""
+    cells = []
+    for axis, step, value in zip(lut['axes'], lut['steps'],
+                                 (rssi, noise, channel_util)):
+        low, high = float(axis[0]), float(axis[-1])
+        value = min(max(value, low), high)
+        idx = min(int((value - low) / step), len(axis) - 2)
+        a0 = float(axis[idx])
+        cells.append((idx, (value - a0) / (float(axis[idx + 1]) - a0)))
+
+    (ir, fr), (inn, fn), (iu, fu) = cells
+    table = lut.get('table_list')
+    if table is None:
+        table = lut['table_list'] = lut['table'].tolist()
+    result = 0.0
+    for dr, wr in ((0, 1 - fr), (1, fr)):
+        for dn, wn in ((0, 1 - fn), (1, fn)):
+            for du, wu in ((0, 1 - fu), (1, fu)):
+                result += wr * wn * wu * table[ir + dr][inn + dn][iu + du]
+    return result / 255.0
+
+
+def error_report(lut, predict_fn):
+    """Compare the table against the float model on the full 1 dB / 1 % grid"""
+    rssi, noise, util = np.meshgrid(
+        axis_nodes(RSSI_RANGE, 1), axis_nodes(NOISE_RANGE, 1),
+        axis_nodes(UTIL_RANGE, 1), indexing='ij')
+    rssi, noise, util = rssi.ravel(), noise.ravel(), util.ravel()
+
+    reference = predict_fn(rssi, noise, util)
+    approx = lut_predict(lut, rssi, noise, util)
+    error = np.abs(approx - reference)
+    worst = int(np.argmax(error))
+
+    return {
+        'grid_points': int(error.size),
+        'table_bytes': int(lut['table'].size),
+        'max_abs_error': float(error.max()),
+        'mean_abs_error': float(error.mean()),
+        'p99_abs_error': float(np.percentile(error, 99)),
+        'class_agreement': float(np.mean((approx > 0.5) == (reference > 0.5))),
+        'worst_point': {
+            'rssi': float(rssi[worst]),
+            'noise': float(noise[worst]),
+            'channel_util': float(util[worst]),
+        },
+    }
+
+
+def create_lut_header(lut, header_file, report=None):
+    """Write the table and a trilinear lookup function as a C header"""
+    axes = lut['axes']
+    steps = lut['steps']
+    shape = lut['table'].shape
+    data = lut['table'].ravel()
+
+    lines = [
+        '// Precomputed lookup table for the WiFi stability model',
+        '// Generated by export_lut.py - do not edit',
+    ]
+    if report:
+        lines.append(f"// Max abs error vs float model: {report['max_abs_error']:.4f} "
+                     f"(mean {report['mean_abs_error']:.4f}, "
+                     f"{report['class_agreement'] * 100:.2f}% class agreement)")
+    lines += [
+        '',
+        '#ifndef MODEL_LUT_H',
+        '#define MODEL_LUT_H',
+        '',
+        '#include <stdint.h>',
+        '',
+    ]
+    for name, axis, step, size in zip(('RSSI', 'NOISE', 'UTIL'), axes, steps, shape):
+        lines.append(f'#define WIFI_LUT_{name}_MIN ({float(axis[0]):.1f}f)')
+        lines.append(f'#define WIFI_LUT_{name}_MAX ({float(axis[-1]):.1f}f)')
+        lines.append(f'#define WIFI_LUT_{name}_STEP {step:.1f}f')
+        lines.append(f'#define WIFI_LUT_{name}_SIZE {size}')
+    lines += [
+        '',
+        f'const unsigned int wifi_model_lut_len = {data.size};',
+        'const uint8_t wifi_model_lut[] = {',
+    ]
+    for i in range(0, data.size, 16):
+        chunk = ', '.join(f'{b:3d}' for b in data[i:i + 16])
+        lines.append(f'  {chunk},' if i + 16 < data.size else f'  {chunk}')
+    lines += [
+        '};',
+        '',
+        'static inline int wifi_lut_cell(float value, float lo, float hi, float step,',
+        '                                int size, float* frac) {',
+        '  if (!(value > lo)) value = lo;  // also catches NaN',
+        '  if (value > hi) value = hi;',
+        '  int idx = (int)((value - lo) / step);',
+        '  if (idx > size - 2) idx = size - 2;',
+        '  float a0 = lo + idx * step;',
+        '  float a1 = (idx + 1 == size - 1) ? hi : a0 + step;',
+        '  *frac = (value - a0) / (a1 - a0);',
+        '  return idx;',
+        '}',
+        '',
+        '// Stability in [0, 1] for raw KPIs (SNR is implied by rssi - noise)',
+        'static inline float wifi_model_lut_predict(float rssi, float noise, float channel_util) {',
+        '  float fr, fn, fu;',
+        '  int ir = wifi_lut_cell(rssi, WIFI_LUT_RSSI_MIN, WIFI_LUT_RSSI_MAX,',
+        '                         WIFI_LUT_RSSI_STEP, WIFI_LUT_RSSI_SIZE, &fr);',
+        '  int in = wifi_lut_cell(noise, WIFI_LUT_NOISE_MIN, WIFI_LUT_NOISE_MAX,',
+        '                         WIFI_LUT_NOISE_STEP, WIFI_LUT_NOISE_SIZE, &fn);',
+        '  int iu = wifi_lut_cell(channel_util, WIFI_LUT_UTIL_MIN, WIFI_LUT_UTIL_MAX,',
+        '                         WIFI_LUT_UTIL_STEP, WIFI_LUT_UTIL_SIZE, &fu);',
+        '',
+        '  float result = 0.0f;',
+        '  for (int dr = 0; dr < 2; dr++) {',
+        '    float wr = dr ? fr : 1.0f - fr;',
+        '    for (int dn = 0; dn < 2; dn++) {',
+        '      float wn = dn ? fn : 1.0f - fn;',
+        '      const uint8_t* row = wifi_model_lut +',
+        '          ((ir + dr) * WIFI_LUT_NOISE_SIZE + (in + dn)) * WIFI_LUT_UTIL_SIZE + iu;',
+        '      result += wr * wn * ((1.0f - fu) * row[0] + fu * row[1]);',
+        '    }',
+        '  }',
+        '  return result / 255.0f;',
+        '}',
+        '',
+        '#endif // MODEL_LUT_H',
+        '',
+    ]
+
+    with open(header_file, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+C_BENCH_SOURCE = r'''
+#include <chrono>
+#include <cstdio>
+#include "model_lut.h"
+
+int main() {
+  const int n = 1000000;
+  volatile float sink = 0;
+  auto start = std::chrono::steady_clock::now();
+  for (int i = 0; i < n; i++) {
+    float rssi = -95.0f + (i % 651) * 0.1f;
+    float noise = -98.0f + (i % 381) * 0.1f;
+    float util = (i % 1001) * 0.1f;
+    sink = sink + wifi_model_lut_predict(rssi, noise, util);
+  }
+  auto elapsed = std::chrono::steady_clock::now() - start;
+  printf("%f\n", std::chrono::duration<double, std::nano>(elapsed).count() / n);
+  return 0;
+}
+'''
+
+
+def benchmark_c_lookup(header_file):
+    """ns per call of the generated C lookup compiled on the host, or None"""
+    compiler = shutil.which('g++') or shutil.which('clang++')
+    if compiler is None:
+        return None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'lut_bench.cpp')
+        binary = os.path.join(tmp, 'lut_bench')
+        with open(source, 'w') as f:
+            f.write(C_BENCH_SOURCE)
+        include_dir = os.path.dirname(os.path.abspath(header_file))
+        build = subprocess.run([compiler, '-O2', '-I', include_dir, source, '-o', binary],
+                               capture_output=True, text=True)
+        if build.returncode != 0:
+            return None
+        run = subprocess.run([binary], capture_output=True, text=True)
+        return float(run.stdout.strip()) if run.returncode == 0 else None
+
+
+def benchmark(lut, model_path='model.tflite', header_file='include/model_lut.h',
+              iterations=2000):
+    """Host latency of a table lookup vs tf.lite.Interpreter.invoke"""
+    import tensorflow as tf
+
+    interpreter = tf.lite.Interpreter(model_path=model_path)
+    interpreter.allocate_tensors()
+    input_index = interpreter.get_input_details()[0]['index']
+    output_index = interpreter.get_output_details()[0]['index']
+
+    rng = np.random.default_rng(0)
+    rssi = rng.uniform(-95, -30, iterations)
+    noise = rng.uniform(-98, -60, iterations)
+    util = rng.uniform(0, 100, iterations)
+    inputs = normalize_inputs(rssi, noise, util)
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        interpreter.set_tensor(input_index, inputs[i:i + 1])
+        interpreter.invoke()
+        interpreter.get_tensor(output_index)
+    invoke_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        lut_predict_scalar(lut, rssi[i], noise[i], util[i])
+    lookup_us = (time.perf_counter() - start) / iterations * 1e6
+
+    batch = 100_000
+    rssi_b = rng.uniform(-95, -30, batch)
+    noise_b = rng.uniform(-98, -60, batch)
+    util_b = rng.uniform(0, 100, batch)
+    start = time.perf_counter()
+    lut_predict(lut, rssi_b, noise_b, util_b)
+    batch_ns = (time.perf_counter() - start) / batch * 1e9
+
+    return {
+        'invoke_us_per_sample': invoke_us,
+        'lookup_us_per_sample': lookup_us,
+        'lookup_batched_ns_per_sample': batch_ns,
+        'lookup_c_ns_per_sample': benchmark_c_lookup(header_file),
+    }
+
+
+def export_model_lut(model_path='model.tflite', header_file='include/model_lut.h',
+                     steps=DEFAULT_STEPS, predict_fn=None):
+    """Build the table from a TFLite model, write the header, return the report"""
+    predict_fn = predict_fn or load_tflite_predictor(model_path)
+    lut = build_lut(predict_fn, steps)
+    report = error_report(lut, predict_fn)
+    create_lut_header(lut, header_file, report)
+    return lut, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--model', default='model.tflite')
+    parser.add_argument('--header', default='include/model_lut.h')
+    parser.add_argument('--rssi-step', type=float, default=DEFAULT_STEPS[0])
+    parser.add_argument('--noise-step', type=float, default=DEFAULT_STEPS[1])
+    parser.add_argument('--util-step', type=float, default=DEFAULT_STEPS[2])
+    parser.add_argument('--max-error', type=float, default=None,
+                        help='fail if the max abs error exceeds this bound')
+    parser.add_argument('--report', help='write the error report as JSON')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='compare lookup latency with Interpreter.invoke')
+    args = parser.parse_args()
+
+    print("🧮 Exporting quantized lookup table for the stability model...")
+    steps = (args.rssi_step, args.noise_step, args.util_step)
+    lut, report = export_model_lut(args.model, args.header, steps)
+
+    print(f"✅ Lookup table saved to: {args.header}")
+    print(f"📦 Table size: {report['table_bytes']} bytes "
+          f"(shape {'x'.join(str(n) for n in lut['table'].shape)})")
+    print(f"📏 Error vs float model over {report['grid_points']} grid points:")
+    print(f"   max={report['max_abs_error']:.4f}  mean={report['mean_abs_error']:.4f}  "
+          f"p99={report['p99_abs_error']:.4f}")
+    print(f"   class agreement (>0.5): {report['class_agreement'] * 100:.2f}%")
+
+    if args.benchmark:
+        report['benchmark'] = benchmark(lut, args.model, args.header)
+        bench = report['benchmark']
+        print("⏱️ Host latency per sample:")
+        print(f"   Interpreter.invoke:   {bench['invoke_us_per_sample']:.2f} µs")
+        print(f"   LUT lookup (Python):  {bench['lookup_us_per_sample']:.2f} µs")
+        print(f"   LUT lookup (NumPy):   {bench['lookup_batched_ns_per_sample']:.1f} ns batched")
+        if bench['lookup_c_ns_per_sample'] is not None:
+            c_ns = bench['lookup_c_ns_per_sample']
+            print(f"   LUT lookup (C, -O2):  {c_ns:.1f} ns "
+                  f"({bench['invoke_us_per_sample'] * 1000 / c_ns:.0f}x faster than invoke)")
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Report saved to: {args.report}")
+
+    if args.max_error is not None and report['max_abs_error'] > args.max_error:
+        print(f"❌ Max error {report['max_abs_error']:.4f} exceeds bound {args.max_error}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Stability forecasting from a window of recent KPI samples
+
+Trains a small 1-D convolutional model that predicts whether the link will
+be stable `horizon` minutes ahead from the last W samples, instead of
+classifying only the instantaneous 4-feature sample. Each device's history
+is sorted by time and its normalized columns are turned into windows with
+sliding_window_view: a strided view over the column array, so W=360 over
+months of samples costs no more memory than the samples themselves. Only
+the current training batch is ever copied.
+
+The model is exported to TFLite (float16 weights, like model.tflite) and
+include/forecast_model.h; its tensor arena is planned from the flatbuffer
+and checked against the ESP32 heap budget. The report covers dataset build
+time, peak RSS and forecast accuracy against the instantaneous classifier
+and a "stability stays as it is" baseline.
+"""
+
+import argparse
+import json
+import os
+import resource
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from export_lut import load_tflite_predictor, normalize_inputs
+
+FEATURES = ('rssi', 'noise', 'snr', 'channel_util')
+DEFAULT_WINDOW = 360             # samples (1 h at the 10 s default interval)
+DEFAULT_HORIZON = 10             # minutes
+STABLE_THRESHOLD = 0.5           # stability above this counts as stable
+MAX_TARGET_GAP = 120             # s: no sample this close to t + horizon -> no target
+TEST_FRACTION = 0.2              # tail of every device held out for evaluation
+ARENA_BUDGET = 32 * 1024         # bytes of heap the forecast arena may take
+MODEL_FILE = 'forecast_model.tflite'
+HEADER_FILE = 'include/forecast_model.h'
+
+
+def link_score(rssi, snr, channel_util):
+    """
+    Signal, SNR and utilization terms of predictAdvancedStability(), vectorized;
+    labels the synthetic devices, which have no recorded stability
+    """
+    rssi, snr, util = np.asarray(rssi), np.asarray(snr), np.asarray(channel_util)
+    score = np.select([rssi > -50, rssi > -70, rssi > -80], [0.30, 0.20, 0.10], 0.0)
+    score += np.select([snr > 30, snr > 20, snr > 10], [0.25, 0.18, 0.10], 0.0)
+    score += np.select([util < 30, util < 60, util < 80], [0.20, 0.12, 0.05], 0.0)
+    return score
+
+
+def synthetic_device(days=30, interval=10, seed=0, events_per_day=4):
+    """
+    Vectorized synthetic history for one device: a daily RSSI cycle, slow
+    drift and degradation events. Most events build up over 10-30 minutes
+    (RSSI sagging, the channel filling up) before the link drops; the rest
+    arrive without warning.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(days * 86400 // interval)
+    t = np.arange(n, dtype=np.int64) * interval + 1_700_000_000
+
+    drift = np.cumsum(rng.normal(0, 0.05, n))
+    drift -= np.linspace(0, drift[-1], n)  # keep the walk from wandering off
+    rssi = -60 + 5 * np.sin(2 * np.pi * t / 86400 + rng.uniform(0, 2 * np.pi)) + drift
+    util = np.full(n, 20.0)
+
+    for start in rng.choice(n, size=int(days * events_per_day), replace=False):
+        ramp = int(rng.uniform(600, 1800) // interval) if rng.random() < 0.7 else 0
+        length = int(rng.uniform(1200, 3600) // interval)
+        if ramp:
+            stop = min(n, start + ramp)
+            progress = np.linspace(0, 1, stop - start)
+            rssi[start:stop] -= 10 * progress
+            util[start:stop] += 25 * progress
+        bad = slice(min(n, start + ramp), min(n, start + ramp + length))
+        rssi[bad] -= 22
+        util[bad] += 45
+
+    rssi = np.round(rssi + rng.normal(0, 2, n))
+    util = np.clip(util + rng.integers(0, 20, n), 0, 100)
+    noise = -96 + util / 10 + rng.integers(0, 7, n)
+    snr = rssi - noise
+    return {
+        't': t,
+        'rssi': rssi.astype(np.float32),
+        'noise': noise.astype(np.float32),
+        'snr': snr.astype(np.float32),
+        'channel_util': util.astype(np.float32),
+        'stability': link_score(rssi, snr, util).astype(np.float32),
+    }
+
+
+def load_devices(paths):
+    """
+    {device: columns} from /history.json downloads (one device per file, or
+    per ssid) or CSVs with t or timestamp columns (and an optional device
+    column). Columns are sorted by time.
+    """
+    import pandas as pd
+
+    frames = []
+    for path in paths:
+        if path.endswith('.json'):
+            with open(path) as f:
+                df = pd.DataFrame(json.load(f))
+            df['device'] = os.path.basename(path) + ':' + df.get('ssid', pd.Series('', index=df.index)).astype(str)
+        else:
+            df = pd.read_csv(path)
+            if 't' not in df:
+                df['t'] = (pd.to_datetime(df['timestamp']) - pd.Timestamp(0)) // pd.Timedelta(seconds=1)
+            if 'device' not in df:
+                df['device'] = os.path.basename(path)
+        frames.append(df)
+
+    devices = {}
+    for name, df in pd.concat(frames, ignore_index=True).groupby('device'):
+        df = df.sort_values('t', kind='stable')
+        devices[name] = {key: df[key].to_numpy(dtype=np.float32) for key in FEATURES + ('stability',)}
+        devices[name]['t'] = df['t'].to_numpy(dtype=np.int64)
+    return devices
+
+
+class WindowDataset:
+    """
+    Windows over every device without copying them.
+
+    views[d][i] is the (4, W) window of device d ending at sample i + W - 1;
+    index rows are (device, window, label). Windows never span two devices.
+    """
+
+    def __init__(self, devices, window=DEFAULT_WINDOW, horizon_min=DEFAULT_HORIZON):
+        self.window = window
+        self.horizon = int(horizon_min * 60)
+        self.names = []
+        self.features = []
+        self.views = []
+        self.columns = []
+        rows = []
+
+        for name, columns in devices.items():
+            if len(columns['t']) < window:
+                continue
+            features = normalize_inputs(columns['rssi'], columns['noise'], columns['channel_util'])
+            view = sliding_window_view(features, window, axis=0)
+            t, stability = columns['t'], columns['stability']
+            end_time = t[window - 1:]
+            target = np.searchsorted(t, end_time + self.horizon)
+            valid = target < len(t)
+            valid[valid] &= t[target[valid]] - (end_time[valid] + self.horizon) <= MAX_TARGET_GAP
+            windows = np.flatnonzero(valid)
+
+            d = len(self.names)
+            self.names.append(name)
+            self.features.append(features)
+            self.views.append(view)
+            self.columns.append(columns)
+            block = np.empty((windows.size, 3), dtype=np.int32)
+            block[:, 0] = d
+            block[:, 1] = windows
+            block[:, 2] = stability[target[windows]] > STABLE_THRESHOLD
+            rows.append(block)
+
+        self.index = np.concatenate(rows) if rows else np.zeros((0, 3), dtype=np.int32)
+
+    def __len__(self):
+        return len(self.index)
+
+    def split(self, test_fraction=TEST_FRACTION):
+        """Time-ordered split per device, with a gap so no test window overlaps a training target"""
+        train, test = [], []
+        gap = self.window + self.horizon // 10  # samples, at the 10 s default interval
+        for d in range(len(self.names)):
+            rows = np.flatnonzero(self.index[:, 0] == d)
+            cut = int(len(rows) * (1 - test_fraction))
+            train.append(rows[:max(0, cut - gap)])
+            test.append(rows[cut:])
+        return np.concatenate(train), np.concatenate(test)
+
+    def batch(self, rows):
+        """(B, W, 4) copy of the selected windows plus labels"""
+        x = np.empty((len(rows), self.window, len(FEATURES)), dtype=np.float32)
+        for d in np.unique(self.index[rows, 0]):
+            mask = self.index[rows, 0] == d
+            x[mask] = self.views[d][self.index[rows[mask], 1]].transpose(0, 2, 1)
+        return x, self.index[rows, 2].astype(np.float32)
+
+    def current(self, rows, key):
+        """Raw column value at the last sample of each window"""
+        values = np.empty(len(rows), dtype=np.float32)
+        for d in np.unique(self.index[rows, 0]):
+            mask = self.index[rows, 0] == d
+            values[mask] = self.columns[d][key][self.index[rows[mask], 1] + self.window - 1]
+        return values
+
+    def view_bytes(self):
+        """Bytes actually held: the feature columns behind the views"""
+        return sum(features.nbytes for features in self.features)
+
+    def materialized_bytes(self):
+        """Bytes a copied (N, W, 4) float32 window array would need"""
+        return len(self) * self.window * len(FEATURES) * 4
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_dataset(devices, window=DEFAULT_WINDOW, horizon_min=DEFAULT_HORIZON):
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    dataset = WindowDataset(devices, window, horizon_min)
+    return dataset, {
+        'devices': len(dataset.names),
+        'samples': int(sum(len(c['t']) for c in devices.values())),
+        'windows': len(dataset),
+        'build_s': time.perf_counter() - start,
+        'peak_rss_mb': peak_rss_mb(),
+        'rss_growth_mb': peak_rss_mb() - rss_before,
+        'view_bytes': dataset.view_bytes(),
+        'materialized_bytes': dataset.materialized_bytes(),
+    }
+
+
+def create_forecast_model(window):
+    import tensorflow as tf
+
+    model = tf.keras.Sequential([
+        tf.keras.layers.Input(shape=(window, len(FEATURES))),
+        tf.keras.layers.Conv1D(8, 5, strides=3, activation='relu'),
+        tf.keras.layers.Conv1D(8, 5, strides=3, activation='relu'),
+        tf.keras.layers.Flatten(),
+        tf.keras.layers.Dense(8, activation='relu'),
+        tf.keras.layers.Dense(1, activation='sigmoid'),
+    ])
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=0.003),
+                  loss='binary_crossentropy', metrics=['accuracy'])
+    return model
+
+
+def batches(dataset, rows, batch_size=256, seed=0):
+    """Keras PyDataset that copies one batch of windows at a time"""
+    import keras
+
+    class Batches(keras.utils.PyDataset):
+        def __init__(self):
+            super().__init__()
+            self.rng = np.random.default_rng(seed)
+            self.order = rows.copy()
+
+        def __len__(self):
+            return int(np.ceil(len(self.order) / batch_size))
+
+        def __getitem__(self, i):
+            return dataset.batch(np.sort(self.order[i * batch_size:(i + 1) * batch_size]))
+
+        def on_epoch_end(self):
+            self.rng.shuffle(self.order)
+
+    return Batches()
+
+
+def train_forecast(dataset, rows, epochs=5, max_windows=100_000, seed=0, verbose=2):
+    """Fit on (a random subset of) the training windows"""
+    rng = np.random.default_rng(seed)
+    if len(rows) > max_windows:
+        rows = rng.choice(rows, max_windows, replace=False)
+    model = create_forecast_model(dataset.window)
+    model.fit(batches(dataset, rows, seed=seed), epochs=epochs, verbose=verbose)
+    return model
+
+
+def predict_batched(predict, rows, batch_size=4096):
+    return np.concatenate([predict(rows[i:i + batch_size]) for i in range(0, len(rows), batch_size)]) \
+        if len(rows) else np.zeros(0)
+
+
+def scores(labels, probabilities):
+    predicted = probabilities > 0.5
+    labels = labels.astype(bool)
+    recalls = [np.mean(predicted[labels == value] == value) for value in (True, False) if np.any(labels == value)]
+    return {
+        'accuracy': float(np.mean(predicted == labels)),
+        'balanced_accuracy': float(np.mean(recalls)),
+        'brier': float(np.mean((probabilities - labels) ** 2)),
+    }
+
+
+def evaluate(model, dataset, rows, classifier_path='model.tflite'):
+    """Forecast vs the instantaneous classifier and persistence on the held-out windows"""
+    labels = dataset.index[rows, 2]
+    forecast = predict_batched(lambda r: model.predict(dataset.batch(r)[0], verbose=0)[:, 0],
+                               rows)
+    report = {'windows': int(len(rows)), 'stable_fraction': float(labels.mean()) if len(rows) else 0.0,
+              'forecast': scores(labels, forecast)}
+
+    # Current stability carried forward: what the dashboard shows now
+    report['persistence'] = scores(labels, (dataset.current(rows, 'stability') > STABLE_THRESHOLD)
+                                   .astype(np.float32))
+
+    if classifier_path and os.path.exists(classifier_path):
+        classify = load_tflite_predictor(classifier_path)
+        report['instantaneous'] = scores(labels, predict_batched(
+            lambda r: classify(dataset.current(r, 'rssi'), dataset.current(r, 'noise'),
+                               dataset.current(r, 'channel_util')), rows))
+    return report
+
+
+def export_forecast(model, dataset, tflite_file=MODEL_FILE, header_file=HEADER_FILE,
+                    arena_budget=ARENA_BUDGET):
+    """Write TFLite + C header; returns the arena check"""
+    from memory_budget import DEFAULT_MAX_ALLOC, model_memory
+    from train_model import convert_to_tflite, create_c_header
+
+    with open(tflite_file, 'wb') as f:
+        f.write(convert_to_tflite(model))
+
+    memory = model_memory(tflite_file)
+    arena = (memory['arena_required'] + 1023) // 1024 * 1024
+    create_c_header(tflite_file, header_file, array_name='wifi_forecast_tflite', guard='FORECAST_MODEL_H',
+                    defines={'FORECAST_WINDOW': dataset.window,
+                             'FORECAST_HORIZON_S': dataset.horizon,
+                             'FORECAST_ARENA_SIZE': arena})
+    memory.update({
+        'arena_size': arena,
+        'arena_budget': arena_budget,
+        'fits': arena <= min(arena_budget, DEFAULT_MAX_ALLOC),
+        'tflite_bytes': os.path.getsize(tflite_file),
+    })
+    return memory
+
+
+def print_report(report):
+    data = report['dataset']
+    print(f"🧱 Windows: {data['windows']:,} from {data['samples']:,} samples on {data['devices']} device(s) "
+          f"in {data['build_s'] * 1000:.0f} ms")
+    print(f"   held {data['view_bytes'] / 1e6:.1f} MB of columns; copying them would take "
+          f"{data['materialized_bytes'] / 1e9:.2f} GB (peak RSS {data['peak_rss_mb']:.0f} MB, "
+          f"+{data['rss_growth_mb']:.0f} MB while building)")
+
+    evaluation = report.get('evaluation')
+    if evaluation:
+        print(f"🔮 {report['horizon_min']} min ahead on {evaluation['windows']:,} held-out windows "
+              f"({evaluation['stable_fraction'] * 100:.0f}% stable):")
+        print(f"   {'model':<26}{'accuracy':>9}{'balanced':>10}{'brier':>8}")
+        for key, label in (('forecast', f"forecast (W={report['window']})"),
+                           ('instantaneous', 'instantaneous classifier'),
+                           ('persistence', 'stability stays as is')):
+            if key in evaluation:
+                r = evaluation[key]
+                print(f"   {label:<26}{r['accuracy']:>9.3f}{r['balanced_accuracy']:>10.3f}{r['brier']:>8.3f}")
+
+    memory = report.get('export')
+    if memory:
+        marker = "✅" if memory['fits'] else "❌"
+        print(f"📦 {memory['tflite_bytes']} byte model, {memory['operators']} ops; "
+              f"{marker} FORECAST_ARENA_SIZE {memory['arena_size']} bytes "
+              f"(budget {memory['arena_budget']})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the windowed stability forecast model")
+    parser.add_argument('--history', nargs='*', help='history.json / CSV files (default: synthetic devices)')
+    parser.add_argument('--devices', type=int, default=4, help='synthetic devices')
+    parser.add_argument('--days', type=float, default=30, help='synthetic days per device')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='samples per window')
+    parser.add_argument('--horizon', type=float, default=DEFAULT_HORIZON, help='minutes ahead')
+    parser.add_argument('--epochs', type=int, default=5)
+    parser.add_argument('--max-windows', type=int, default=100_000, help='training windows per run')
+    parser.add_argument('--arena-budget', type=int, default=ARENA_BUDGET)
+    parser.add_argument('--build-only', action='store_true', help='only build the windows and report')
+    parser.add_argument('--tflite', default=MODEL_FILE)
+    parser.add_argument('--header', default=HEADER_FILE)
+    parser.add_argument('--report', help='write the report as JSON')
+    args = parser.parse_args()
+
+    print("🔮 Stability forecast training")
+    if args.history:
+        devices = load_devices(args.history)
+    else:
+        devices = {f'device{i}': synthetic_device(args.days, seed=i) for i in range(args.devices)}
+
+    dataset, build = build_dataset(devices, args.window, args.horizon)
+    report = {'window': args.window, 'horizon_min': args.horizon, 'dataset': build}
+
+    if not args.build_only:
+        train_rows, test_rows = dataset.split()
+        model = train_forecast(dataset, train_rows, args.epochs, args.max_windows)
+        report['evaluation'] = evaluate(model, dataset, test_rows)
+        report['export'] = export_forecast(model, dataset, args.tflite, args.header, args.arena_budget)
+
+    print_report(report)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📄 Report saved to: {args.report}")
+    return 0 if report.get('export', {}).get('fits', True) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
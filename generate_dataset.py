@@ -2,13 +2,13 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
-def generate_wifi_data():
+def generate_wifi_data(days=5):
     data = []
     now = datetime.now()
     
-    for day in range(5):  # 5 days of data
+    for day in range(days):  # 5 days of data by default
         for minute in range(0, 1440, 2):  # Every 2 minutes
-            timestamp = now - timedelta(days=4-day) + timedelta(minutes=minute)
+            timestamp = now - timedelta(days=days-1-day) + timedelta(minutes=minute)
             hour = timestamp.hour
             
             # Base values with daily patterns
@@ -39,6 +39,7 @@ def generate_wifi_data():
         'timestamp', 'rssi', 'noise', 'snr', 'channel_util', 'stability'
     ])
 
-df = generate_wifi_data()
-df.to_csv('wifi_data.csv', index=False)
-print("Dataset generated: wifi_data.csv")
\ No newline at end of file
+if __name__ == "__main__":
+    df = generate_wifi_data()
+    df.to_csv('wifi_data.csv', index=False)
+    print("Dataset generated: wifi_data.csv")
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Host-side mirror of the ESP32 KPI history (/history.json)
+
+Records are JSON objects with the same keys saveKPI() writes:
+t, rssi, noise, snr, channel_util, stability, ssid and dt (seconds since the
+previous sample, which varies with the adaptive sampling scheduler).
+Encoding, decoding, range filtering and retention cleanup follow
+saveKPI(), handleHistory() and cleanOldRecords() in src/main.cpp.
+"""
+
+import json
+import random
+import time
+from datetime import datetime
+
+from advanced_ai_features import AdvancedWiFiAI
+from scan_cache import HOME_CHANNEL, channel_utilization, simulate_scan
+
+KPI_INTERVAL = 10          # seconds, kpiInterval in the firmware
+RETENTION_DAYS = 5         # cleanOldRecords() threshold
+RECORD_FIELDS = ('t', 'rssi', 'noise', 'snr', 'channel_util', 'stability', 'ssid', 'dt')
+
+
+def make_record(t, rssi, noise, snr, channel_util, stability, ssid="HomeNetwork",
+                dt=KPI_INTERVAL):
+    return {
+        't': int(t),
+        'rssi': rssi,
+        'noise': noise,
+        'snr': snr,
+        'channel_util': channel_util,
+        'stability': round(stability, 6),
+        'ssid': ssid,
+        'dt': int(dt),
+    }
+
+
+def noise_floor(ap_count):
+    """noiseFloor() in the firmware: the noise estimate without its random jitter"""
+    return -98 + ap_count * 1.5
+
+
+def simulate_kpi(rng, rssi_base=-62.0, ap_count_base=4, scan=None):
+    """
+    One KPI sample using the firmware's noise and utilization formulas.
+    `scan` is a cached scan_cache entry list; without one a fresh scan is simulated.
+    """
+    rssi = float(round(rssi_base + rng.gauss(0, 3)))
+    if scan is None:
+        scan = simulate_scan(rng, max(0, ap_count_base + rng.randint(-2, 2)), rssi=rssi)
+    ap_count = len(scan)
+    noise = noise_floor(ap_count) + rng.randint(0, 7)
+    snr = rssi - noise
+    channel_util = round(channel_utilization(scan, HOME_CHANNEL), 1)
+    return rssi, noise, snr, channel_util
+
+
+def generate_history(days=1, interval=KPI_INTERVAL, end=None, ssid="HomeNetwork", seed=0):
+    """Synthetic history covering `days` at the firmware sampling interval"""
+    rng = random.Random(seed)
+    ai = AdvancedWiFiAI()
+    end = int(end if end is not None else time.time())
+    count = int(days * 86400 // interval)
+    start = end - count * interval
+
+    records = []
+    rssi_base = -62.0
+    for i in range(count):
+        # Slow drift with occasional degradation episodes
+        rssi_base += rng.gauss(0, 0.3)
+        rssi_base = min(-40.0, max(-88.0, rssi_base))
+        degraded = (i // 360) % 17 == 5
+        rssi, noise, snr, channel_util = simulate_kpi(
+            rng, rssi_base - (15 if degraded else 0), 7 if degraded else 3)
+        prediction = ai.predict_advanced_stability(rssi, noise, snr, channel_util)
+        records.append(make_record(start + i * interval, rssi, noise, snr,
+                                   channel_util, prediction['stability'], ssid, interval))
+    return records
+
+
+def encode_history(records):
+    """Serialize like serializeJson(): compact, no whitespace"""
+    return json.dumps(records, separators=(',', ':'))
+
+
+def decode_history(text):
+    if not text:
+        return []
+    return json.loads(text)
+
+
+def range_threshold(range_days, now=None):
+    """Start timestamp for /history?range=N (0 = since local midnight)"""
+    now = int(now if now is not None else time.time())
+    if int(range_days) == 0:
+        midnight = datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+        return int(midnight.timestamp())
+    return now - int(range_days) * 86400
+
+
+def filter_history(records, range_days, now=None):
+    """Records returned by handleHistory() for the given range"""
+    threshold = range_threshold(range_days, now)
+    return [record for record in records if record['t'] >= threshold]
+
+
+def clean_old_records(records, now=None, retention_days=RETENTION_DAYS):
+    """Drop records older than the retention period, like cleanOldRecords()"""
+    now = int(now if now is not None else time.time())
+    threshold = now - retention_days * 86400
+    return [record for record in records if record['t'] >= threshold]
+
+
+def load_history(path):
+    with open(path) as f:
+        return decode_history(f.read())
+
+
+def save_history(records, path):
+    with open(path, 'w') as f:
+        f.write(encode_history(records))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic /history.json")
+    parser.add_argument('--days', type=float, default=1)
+    parser.add_argument('--output', default='history.json')
+    args = parser.parse_args()
+
+    history = generate_history(args.days)
+    save_history(history, args.output)
+    print(f"✅ Generated {len(history)} records ({len(encode_history(history))} bytes): {args.output}")
@@ -0,0 +1,828 @@
+#!/usr/bin/env python3
+"""
+Host simulator for the ESP32 web server
+
+Serves the web UI and emulates the firmware endpoints (/status, /advanced-ai,
+/history, /events, /alerts, /scan, /connect, /collect, /model) with simulated KPIs and the Python port of the
+advanced AI, so the dashboard and load tests run without hardware. Static
+files come from data/, or from a build_assets.py image (data_dist/) with the
+same gzip, ETag and Cache-Control handling as handleStaticAsset().
+Connections held and bytes sent per endpoint are exposed on /sim/stats.
+
+KPI sampling runs on its own thread and hands results to the handlers
+through the same snapshot buffer and SPSC queues as the firmware's dual-core
+split (include/kpi_exchange.h); --layout single serializes everything the
+way the old loop() did, for latency comparisons. Scans go through the same
+TTL cache as scan_cache.h; scan_ttl=0 scans on every sample and every /scan
+request instead, as before the cache.
+"""
+
+import contextlib
+import json
+import mimetypes
+import os
+import queue
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from adaptive_sampling import AdaptiveScheduler
+from alert_log import AlertLog
+from advanced_ai_features import AdvancedWiFiAI
+from history_store import generate_history, noise_floor, range_threshold, simulate_kpi
+from scan_cache import SCAN_CACHE_TTL_MS, ScanResults, simulate_scan
+from kpi_codec import encode_blocks
+from tiered_history import TIER_RAW, TieredHistory
+from upload_model import MODEL_SLOT_BYTES, MODEL_SLOT_COUNT, check_blob
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+MAX_EVENT_CLIENTS = 4        # MAX_EVENT_CLIENTS in src/main.cpp
+EVENT_KEEPALIVE = 15.0       # seconds, EVENT_KEEPALIVE_MS
+LAYOUTS = ('dual', 'single')   # KPI task split across cores, or the old single loop()
+COMMAND_COLLECT = 'collect'  # KPI_COMMAND_COLLECT
+COMMAND_SCAN = 'scan'        # KPI_COMMAND_SCAN
+COMMAND_LOAD_MODEL = 'model'  # KPI_COMMAND_LOAD_MODEL
+COMMAND_CONNECT = 'connect'  # KPI_COMMAND_CONNECT
+BUILT_IN_MODEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model.tflite')
+SCAN_RETRY_AFTER = 2         # seconds, SCAN_RETRY_AFTER_S
+WPA2_MIN_PASSPHRASE = 8      # shorter passwords never join a secured network
+
+
+def load_manifest(asset_dir):
+    """assets.json from build_assets.py, or {} for a plain data/ directory"""
+    try:
+        with open(os.path.join(asset_dir, 'assets.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def multipart_file(body, content_type):
+    """First part of a multipart/form-data body, as WebServer hands it to an upload handler"""
+    if 'boundary=' not in content_type:
+        return None
+    boundary = b'--' + content_type.split('boundary=', 1)[1].strip('"').encode()
+    parts = body.split(boundary)
+    if len(parts) < 3:
+        return None
+    head, _, data = parts[1].partition(b'\r\n\r\n')
+    return data[:-2] if data.endswith(b'\r\n') else data
+
+
+def stability_class(stability):
+    if stability > 0.8:
+        return 'excellent'
+    if stability > 0.6:
+        return 'good'
+    if stability > 0.4:
+        return 'fair'
+    return 'poor'
+
+
+class SnapshotBuffer:
+    """SnapshotBuffer<T> in include/kpi_exchange.h: one writer, lock-free readers"""
+
+    def __init__(self, value=None):
+        self.value = value
+        self.sequence = 0   # odd while a publish is in progress
+
+    def publish(self, value):
+        self.sequence += 1
+        self.value = value
+        self.sequence += 1
+
+    def read(self):
+        while True:
+            before = self.sequence
+            value = self.value
+            if not before & 1 and self.sequence == before:
+                return value
+
+    def version(self):
+        return self.sequence // 2
+
+
+class SpscQueue:
+    """SpscQueue<T, N> in include/kpi_exchange.h: drops instead of blocking when full"""
+
+    def __init__(self, capacity):
+        self.items = [None] * capacity
+        self.capacity = capacity
+        self.head = 0
+        self.tail = 0
+
+    def push(self, item):
+        if self.tail - self.head == self.capacity:
+            return False
+        self.items[self.tail % self.capacity] = item
+        self.tail += 1
+        return True
+
+    def pop(self):
+        if self.head == self.tail:
+            return None
+        item = self.items[self.head % self.capacity]
+        self.head += 1
+        return item
+
+    def __len__(self):
+        return self.tail - self.head
+
+
+class SimulatedDevice:
+    """
+    KPI state, history and event subscribers, like the globals in main.cpp.
+
+    layout='dual' mirrors the firmware: a KPI thread (kpiTask) is the only
+    writer and publishes snapshots, HTTP handlers never wait for it.
+    layout='single' emulates the old single loop(): sampling and every
+    request share one lock, so a slow scan or flash commit stalls the server.
+    scan_ms and commit_ms add the real time WiFi.scanNetworks() and the
+    history write take on the device. Scan results are reused for scan_ttl
+    seconds (scaled by time_scale); scan_ttl=0 drives the radio on every sample
+    and every /scan, serialized by a lock like the old wifiScanMutex.
+    """
+
+    def __init__(self, ssid='HomeNetwork', seed=0, history_days=0.0, time_scale=1.0,
+                 fixed_interval=None, max_event_clients=MAX_EVENT_CLIENTS,
+                 layout='dual', scan_ms=0.0, commit_ms=0.0, scan_ttl=SCAN_CACHE_TTL_MS / 1000):
+        if layout not in LAYOUTS:
+            raise ValueError(f"layout must be one of {LAYOUTS}")
+        self.ssid = ssid
+        self.rng = random.Random(seed)
+        self.ai = AdvancedWiFiAI()
+        self.scheduler = AdaptiveScheduler()
+        self.fixed_interval = fixed_interval
+        self.time_scale = time_scale
+        self.max_event_clients = max_event_clients
+        self.layout = layout
+        self.scan_ms = scan_ms
+        self.commit_ms = commit_ms
+        self.scan_ttl = scan_ttl
+
+        self.core = threading.RLock()          # single layout: the one loop()
+        self.latest = SnapshotBuffer()         # latestSample
+        self.events = SpscQueue(8)             # eventQueue
+        self.commands = SpscQueue(4)           # commandQueue
+        self.wake = threading.Event()          # xTaskNotifyGive(kpiTaskHandle)
+        self.events_ready = threading.Event()
+        self.alert_log = AlertLog()            # alertLog, written by the KPI thread only
+        self.alerts = SnapshotBuffer(self.alert_log.serialize())  # publishedAlerts
+        self.radio = threading.Lock()          # uncached: /scan and sampling share the radio
+        self.scan_results = ScanResults()      # scanResults, KPI thread only
+        self.saved_config = (ssid, '')         # CONFIG_FILE
+        self.connect_state = 'idle'            # connectState, outcome set by the KPI thread
+        self.published_scan = SnapshotBuffer(self.scan_results)  # publishedScan
+
+        self.model_slots = [None] * MODEL_SLOT_COUNT  # the "model" partition
+        self.pending_model = None              # pendingModelSlot, cleared by the KPI thread
+        self.model_info = SnapshotBuffer(self.built_in_model())  # publishedModel
+
+        self.history = TieredHistory(ssid)     # tier rings, written by the KPI thread only
+        preload = generate_history(history_days, ssid=ssid, seed=seed) if history_days else []
+        self.history.add_records(preload)
+        self.last_timestamp = preload[-1]['t'] if preload else 0
+
+        self.subscribers = []
+        self.stats_lock = threading.Lock()
+        self.requests = Counter()
+        self.bytes_sent = Counter()
+        self.connections = 0
+        self.peak_connections = 0
+        self.peak_subscribers = 0
+        self.samples = 0
+        self.scans = 0
+        self.dropped_events = 0
+        self.sample()
+
+    def serialized(self):
+        """Context held by HTTP handlers: the shared loop() in the single layout"""
+        return self.core if self.layout == 'single' else contextlib.nullcontext()
+
+    # --- KPI collection -------------------------------------------------
+
+    def interval(self):
+        """Seconds until the next sample, scaled for accelerated runs"""
+        interval_ms = self.fixed_interval * 1000 if self.fixed_interval else self.scheduler.interval_ms
+        return interval_ms / 1000 / self.time_scale
+
+    def now_ms(self):
+        """millis() on the scaled clock the scan TTL is measured in"""
+        return time.monotonic() * 1000 * self.time_scale
+
+    def scan(self):
+        """WiFi.scanNetworks(): blocks the radio for scan_ms"""
+        with self.radio:
+            time.sleep(self.scan_ms / 1000)
+            entries = simulate_scan(self.rng, max(0, 4 + self.rng.randint(-2, 2)), self.ssid)
+        with self.stats_lock:
+            self.scans += 1
+        return entries
+
+    def refresh_scan(self):
+        """refreshScan(): scan and publish, KPI thread only"""
+        self.scan_results = ScanResults(self.scan(), self.now_ms(), self.scan_results.scans + 1)
+        self.published_scan.publish(self.scan_results)
+
+    def sample(self):
+        """saveKPI(): a cached or fresh scan, one prediction, one history record, one event"""
+        with self.serialized():
+            if not self.scan_ttl:
+                scan = self.scan()
+            else:
+                if not self.scan_fresh(self.scan_results):
+                    self.refresh_scan()
+                scan = self.scan_results.entries
+            rssi, noise, snr, channel_util = simulate_kpi(self.rng, scan=scan)
+            prediction = self.ai.predict_advanced_stability(rssi, noise, snr, channel_util)
+            self.scheduler.next(prediction, rssi, noise_floor(len(scan)))
+
+            now = int(time.time())
+            t = now if now > self.last_timestamp else self.last_timestamp + 1
+            dt = t - self.last_timestamp if self.last_timestamp else 10
+            self.last_timestamp = t
+            if self.alert_log.update(t, prediction['alert']):
+                self.alerts.publish(self.alert_log.serialize())
+            self.history.add(t, rssi, noise, channel_util, prediction['stability'], dt)
+            time.sleep(self.commit_ms / 1000)
+
+            snapshot = {
+                't': t,
+                'sample_interval_ms': int(self.interval() * self.time_scale * 1000),
+                'connected': True,
+                'ssid': self.ssid,
+                'rssi': rssi,
+                'noise': noise,
+                'snr': snr,
+                'channel_util': channel_util,
+                'stability': prediction['stability'],
+                'ai_stability': prediction['stability'],
+                'confidence': prediction['confidence'],
+                'trend_score': prediction['trend_score'],
+                'alert_type': prediction['alert_type'],
+                'alert_message': prediction['alert_message'],
+            }
+            self.latest.publish(snapshot)
+            pushed = self.events.push(snapshot)
+
+        with self.stats_lock:
+            self.samples += 1
+            self.dropped_events += not pushed
+        self.events_ready.set()
+
+    def scan_fresh(self, results):
+        return results.taken_ms is not None and \
+            self.now_ms() - results.taken_ms < self.scan_ttl * 1000
+
+    def scan_json(self):
+        """
+        handleScan(): (networks, age in seconds, scan version). networks is None
+        while the first scan is still running: the handler replies 202.
+        """
+        version = self.published_scan.sequence
+        if not self.scan_ttl:
+            return ScanResults(self.scan()).to_json(), None, version
+        results = self.published_scan.read()
+        if not self.scan_fresh(results):
+            self.commands.push(COMMAND_SCAN)
+            self.wake.set()
+        if results.taken_ms is None:
+            return None, None, version
+        return results.to_json(), int((self.now_ms() - results.taken_ms) / 1000), version
+
+    def connect(self, ssid, password):
+        """handleConnect(): save the credentials, the KPI thread joins"""
+        self.saved_config = (ssid, password)
+        self.connect_state = 'connecting'
+        self.commands.push(COMMAND_CONNECT)
+        self.wake.set()
+
+    def join_network(self):
+        """connectWiFi(), KPI thread only"""
+        ssid, password = self.saved_config
+        if 0 < len(password) < WPA2_MIN_PASSPHRASE:
+            self.connect_state = 'failed'
+            return
+        self.ssid = self.history.ssid = ssid
+        self.sample()   # publishes the new SSID before the state flips
+        self.connect_state = 'connected'
+
+    def connect_json(self):
+        """handleConnectStatus()"""
+        sample = self.latest.read()
+        return {'state': self.connect_state, 'ssid': sample['ssid'] if sample else ''}
+
+    def built_in_model(self):
+        """setupTFLite() with no valid upload: the model.h array"""
+        try:
+            with open(BUILT_IN_MODEL, 'rb') as f:
+                model = f.read()
+        except OSError:
+            model = b''
+        return {'slot': -1, 'loads': 1, 'generation': 0, 'length': len(model),
+                'crc32': zlib.crc32(model), 'loaded': time.monotonic()}
+
+    def upload_model(self, blob):
+        """handleModelUpload() + handleModelUploaded(): (HTTP status, JSON response)"""
+        if self.pending_model is not None:
+            return 409, {'error': 'a model swap is pending'}
+        if len(blob) > MODEL_SLOT_BYTES:
+            return 400, {'error': 'too large'}
+        slot = 1 if self.model_info.read()['slot'] == 0 else 0
+        self.model_slots[slot] = blob
+        status, header = check_blob(blob)
+        if status != 'ok':
+            return 400, {'error': status}
+        self.pending_model = slot
+        if self.layout == 'single':
+            self.load_pending_model()
+        else:
+            self.commands.push(COMMAND_LOAD_MODEL)
+            self.wake.set()
+        return 202, {'slot': slot, 'generation': header['generation'], 'length': header['length'],
+                     'crc32': header['crc32']}
+
+    def load_pending_model(self):
+        """loadPendingModel(): KPI thread, between samples"""
+        slot = self.pending_model
+        if slot is None:
+            return
+        status, header = check_blob(self.model_slots[slot] or b'')
+        if status == 'ok':
+            info = self.model_info.read()
+            self.model_info.publish({'slot': slot, 'loads': info['loads'] + 1,
+                                     'generation': header['generation'], 'length': header['length'],
+                                     'crc32': header['crc32'], 'loaded': time.monotonic()})
+        self.pending_model = None
+
+    def model_json(self):
+        """handleModelInfo()"""
+        info = self.model_info.read()
+        return {
+            'source': 'built-in' if info['slot'] < 0 else 'partition',
+            'slot': info['slot'],
+            'generation': info['generation'],
+            'length': info['length'],
+            'crc32': info['crc32'],
+            'loads': info['loads'],
+            'age_s': int((time.monotonic() - info['loaded']) * self.time_scale),
+            'pending': self.pending_model is not None,
+            'partition': True,
+            'slot_bytes': MODEL_SLOT_BYTES,
+        }
+
+    def collect(self):
+        """/collect: queued for the KPI thread, or run inline on the single loop()"""
+        if self.layout == 'single':
+            self.sample()
+        else:
+            self.commands.push(COMMAND_COLLECT)
+            self.wake.set()
+
+    def run(self, stop):
+        """kpiTask(): queued commands first, then the scheduler"""
+        last_sample = time.monotonic()
+        while not stop.is_set():
+            self.wake.clear()
+            command = self.commands.pop()
+            while command is not None:
+                if command == COMMAND_COLLECT:
+                    last_sample = time.monotonic()
+                    self.sample()
+                elif command == COMMAND_SCAN and not self.scan_fresh(self.scan_results):
+                    self.refresh_scan()
+                elif command == COMMAND_LOAD_MODEL:
+                    self.load_pending_model()
+                elif command == COMMAND_CONNECT:
+                    last_sample = time.monotonic()
+                    self.join_network()
+                command = self.commands.pop()
+
+            remaining = self.interval() - (time.monotonic() - last_sample)
+            if remaining <= 0:
+                last_sample = time.monotonic()
+                self.sample()
+                remaining = self.interval()
+            self.wake.wait(remaining)
+
+    def pump_events(self, stop):
+        """serviceEventClients(): drains the event queue on the web server side"""
+        while not stop.is_set():
+            self.events_ready.wait(0.5)
+            self.events_ready.clear()
+            snapshot = self.events.pop()
+            while snapshot is not None:
+                self.broadcast(self.event_message(snapshot))
+                snapshot = self.events.pop()
+
+    # --- Endpoint payloads ----------------------------------------------
+
+    def status_json(self):
+        sample = self.latest.read()
+        return {
+            'connected': sample['connected'],
+            'ssid': sample['ssid'],
+            'rssi': sample['rssi'],
+            'noise': sample['noise'],
+            'snr': sample['snr'],
+            'channel_util': sample['channel_util'],
+            'stability': sample['stability'],
+            'sample_interval': sample['sample_interval_ms'] // 1000,
+            'ip': '127.0.0.1',
+            'timestamp': int(time.time()),
+        }
+
+    def advanced_ai_json(self):
+        sample = self.latest.read()
+        return {
+            'rssi': sample['rssi'],
+            'noise': sample['noise'],
+            'snr': sample['snr'],
+            'channel_util': sample['channel_util'],
+            'stability': sample['ai_stability'],
+            'confidence': sample['confidence'],
+            'trend_score': sample['trend_score'],
+            'alert_type': sample['alert_type'],
+            'alert_message': sample['alert_message'],
+            'stability_class': stability_class(sample['ai_stability']),
+            'timestamp': int(time.time()),
+        }
+
+    def history_json(self, range_days):
+        """handleHistory(): (tier name, records) from the tier covering the range"""
+        return self.history.query(range_days)
+
+    def history_packed(self, range_days):
+        """handleHistory() with format=packed: raw samples in range as codec blocks"""
+        threshold = range_threshold(range_days)
+        return encode_blocks([r for r in self.history.rings[TIER_RAW].records() if r[0] >= threshold])
+
+    def event_message(self, sample=None):
+        """buildKpiEvent(): status fields plus the AI alert, as one SSE message"""
+        sample = sample or self.latest.read()
+        event = {
+            't': sample['t'],
+            'connected': sample['connected'],
+            'ssid': sample['ssid'],
+            'rssi': sample['rssi'],
+            'noise': sample['noise'],
+            'snr': sample['snr'],
+            'channel_util': sample['channel_util'],
+            'stability': sample['stability'],
+            'sample_interval': sample['sample_interval_ms'] // 1000,
+            'confidence': sample['confidence'],
+            'trend_score': sample['trend_score'],
+            'alert_type': sample['alert_type'],
+            'alert_message': sample['alert_message'],
+            'stability_class': stability_class(sample['ai_stability']),
+        }
+        data = json.dumps(event, separators=(',', ':'))
+        return f"id: {event['t']}\ndata: {data}\n\n".encode()
+
+    # --- Event subscribers ----------------------------------------------
+
+    def subscribe(self):
+        with self.stats_lock:
+            if len(self.subscribers) >= self.max_event_clients:
+                return None
+            subscriber = queue.Queue()
+            self.subscribers.append(subscriber)
+            self.peak_subscribers = max(self.peak_subscribers, len(self.subscribers))
+            return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.stats_lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+
+    def broadcast(self, message):
+        with self.stats_lock:
+            for subscriber in self.subscribers:
+                subscriber.put(message)
+
+    # --- Statistics -----------------------------------------------------
+
+    def count_connection(self, delta):
+        with self.stats_lock:
+            self.connections += delta
+            self.peak_connections = max(self.peak_connections, self.connections)
+
+    def count_bytes(self, path, size):
+        with self.stats_lock:
+            self.bytes_sent[path] += size
+
+    def count_request(self, path):
+        with self.stats_lock:
+            self.requests[path] += 1
+
+    def stats(self):
+        with self.stats_lock:
+            return {
+                'samples': self.samples,
+                'scans': self.scans,
+                'connections': self.connections,
+                'peak_connections': self.peak_connections,
+                'event_clients': len(self.subscribers),
+                'peak_event_clients': self.peak_subscribers,
+                'dropped_events': self.dropped_events,
+                'layout': self.layout,
+                'requests': dict(self.requests),
+                'bytes_sent': dict(self.bytes_sent),
+            }
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests.clear()
+            self.bytes_sent.clear()
+            self.peak_connections = self.connections
+            self.peak_subscribers = len(self.subscribers)
+
+
+class _CountingWriter:
+    """Wraps the socket writer so every byte sent is attributed to a path"""
+
+    def __init__(self, raw, device):
+        self.raw = raw
+        self.device = device
+        self.path = None
+
+    def write(self, data):
+        written = self.raw.write(data)
+        if self.path is not None:
+            self.device.count_bytes(self.path, len(data))
+        return written
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    # WebServer closes the connection after every response
+    protocol_version = 'HTTP/1.0'
+    device = None
+    stop_event = None
+    asset_dir = DATA_DIR
+    manifest = {}
+
+    def setup(self):
+        super().setup()
+        self.wfile = _CountingWriter(self.wfile, self.device)
+        self.device.count_connection(1)
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            self.device.count_connection(-1)
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, content_type, body, headers=None):
+        if isinstance(body, str):
+            body = body.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, payload):
+        self.send_body(200, 'application/json', json.dumps(payload, separators=(',', ':')))
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path
+        self.wfile.path = path if not path.startswith('/sim/') else None
+        self.device.count_request(path)
+
+        if path == '/events':
+            self.stream_events()
+        elif path.startswith('/sim/'):
+            self.simulator_control(path)
+        else:
+            with self.device.serialized():
+                self.route(url)
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        self.wfile.path = path
+        self.device.count_request(path)
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        if path == '/model':
+            blob = multipart_file(body, self.headers.get('Content-Type', ''))
+            if blob is None:
+                status, response = 400, {'error': 'expected a multipart file upload'}
+            else:
+                with self.device.serialized():
+                    status, response = self.device.upload_model(blob)
+            self.send_body(status, 'application/json', json.dumps(response, separators=(',', ':')))
+        elif path == '/connect':
+            form = parse_qs(body.decode(errors='replace'))
+            ssid = form.get('ssid', [''])[0]
+            if not ssid:
+                self.send_body(400, 'text/plain', 'SSID required')
+                return
+            self.device.connect(ssid, form.get('password', [''])[0])
+            self.send_body(202, 'text/plain', f'Connecting to {ssid}', {'Retry-After': '1'})
+        else:
+            self.send_body(404, 'text/plain', 'Not found')
+
+    def route(self, url):
+        path = url.path
+        if path == '/':
+            self.send_response(302)
+            self.send_header('Location', '/dashboard.html')
+            self.end_headers()
+        elif path == '/status':
+            self.send_json(self.device.status_json())
+        elif path == '/advanced-ai':
+            self.send_json(self.device.advanced_ai_json())
+        elif path == '/history':
+            query = parse_qs(url.query)
+            range_days = query.get('range', ['0'])[0]
+            if query.get('format') == ['packed']:
+                self.send_body(200, 'application/octet-stream', self.device.history_packed(range_days),
+                               {'X-History-Tier': 'raw'})
+                return
+            tier, records = self.device.history_json(range_days)
+            self.send_body(200, 'application/json', json.dumps(records, separators=(',', ':')),
+                           {'X-History-Tier': tier})
+        elif path == '/alerts':
+            self.send_body(200, 'application/octet-stream', self.device.alerts.read())
+        elif path == '/scan':
+            networks, age, version = self.device.scan_json()
+            headers = {'X-Scan-Version': str(version)}
+            if networks is None:
+                headers['Retry-After'] = str(SCAN_RETRY_AFTER)
+                self.send_body(202, 'application/json', '[]', headers)
+                return
+            if age is not None:
+                headers['Age'] = str(age)
+            self.send_body(200, 'application/json', json.dumps(networks, separators=(',', ':')),
+                           headers)
+        elif path == '/connect':
+            self.send_json(self.device.connect_json())
+        elif path == '/collect':
+            self.device.collect()
+            self.send_body(200, 'text/plain', 'KPI collection queued')
+        elif path == '/model':
+            self.send_json(self.device.model_json())
+        else:
+            self.serve_static(path)
+
+    def simulator_control(self, path):
+        if path == '/sim/stats':
+            self.send_json(self.device.stats())
+        elif path == '/sim/reset':
+            self.device.reset_stats()
+            self.send_json({'reset': True})
+        else:
+            self.send_body(404, 'text/plain', 'Not found')
+
+    def stream_events(self):
+        subscriber = self.device.subscribe()
+        if subscriber is None:
+            self.send_body(503, 'text/plain', 'Too many event subscribers')
+            return
+
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('Connection', 'keep-alive')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(b'retry: 5000\n\n' + self.device.event_message())
+            self.wfile.flush()
+
+            keepalive = EVENT_KEEPALIVE / self.device.time_scale
+            while not self.stop_event.is_set():
+                try:
+                    message = subscriber.get(timeout=keepalive)
+                except queue.Empty:
+                    message = b': keepalive\n\n'
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            pass
+        finally:
+            self.device.unsubscribe(subscriber)
+
+    def serve_static(self, path):
+        if path.endswith('/'):
+            path += 'index.html'
+
+        asset = self.manifest.get(path)
+        if asset:
+            headers = {'ETag': asset['etag'], 'Cache-Control': asset['cache']}
+            if self.headers.get('If-None-Match') == asset['etag']:
+                self.send_body(304, asset['type'], b'', headers)
+                return
+            if asset['file'].endswith('.gz'):
+                headers['Content-Encoding'] = 'gzip'
+            with open(os.path.join(self.asset_dir, asset['file'].lstrip('/')), 'rb') as f:
+                self.send_body(200, asset['type'], f.read(), headers)
+            return
+
+        relative = os.path.normpath(path.lstrip('/'))
+        full = os.path.join(self.asset_dir, relative)
+        if relative.startswith('..') or not os.path.isfile(full):
+            self.send_body(404, 'text/plain', 'Not found')
+            return
+        with open(full, 'rb') as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(full)[0] or 'application/octet-stream'
+        self.send_body(200, content_type, body)
+
+
+class Simulator:
+    """Runs the HTTP server, the KPI thread and the event pump in background threads"""
+
+    def __init__(self, host='127.0.0.1', port=0, asset_dir=DATA_DIR, **device_options):
+        self.device = SimulatedDevice(**device_options)
+        self.stop_event = threading.Event()
+        handler = type('Handler', (SimulatorHandler,),
+                       {'device': self.device, 'stop_event': self.stop_event,
+                        'asset_dir': asset_dir, 'manifest': load_manifest(asset_dir)})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.threads = []
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        for target in (self.server.serve_forever, lambda: self.device.run(self.stop_event),
+                       lambda: self.device.pump_events(self.stop_event)):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        self.device.wake.set()
+        self.device.events_ready.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the WiFi monitor web server on the host")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--history-days', type=float, default=1,
+                        help='synthetic history to preload')
+    parser.add_argument('--interval', type=float,
+                        help='fixed sample interval in seconds (default: adaptive scheduler)')
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='run the sampler N times faster than real time')
+    parser.add_argument('--max-event-clients', type=int, default=MAX_EVENT_CLIENTS)
+    parser.add_argument('--layout', choices=LAYOUTS, default='dual',
+                        help='dual: KPI thread + lock-free snapshot (firmware); single: one shared loop')
+    parser.add_argument('--scan-ms', type=float, default=0,
+                        help='time each WiFi scan blocks the KPI thread')
+    parser.add_argument('--scan-ttl', type=float, default=SCAN_CACHE_TTL_MS / 1000,
+                        help='seconds scan results are reused (0: scan on every sample and /scan)')
+    parser.add_argument('--commit-ms', type=float, default=0,
+                        help='time each history file commit blocks the KPI thread')
+    parser.add_argument('--assets', default=DATA_DIR,
+                        help='static files: data/ or a build_assets.py output such as data_dist/')
+    args = parser.parse_args()
+
+    simulator = Simulator(args.host, args.port, asset_dir=args.assets,
+                          history_days=args.history_days, fixed_interval=args.interval,
+                          time_scale=args.time_scale, max_event_clients=args.max_event_clients,
+                          layout=args.layout, scan_ms=args.scan_ms, commit_ms=args.commit_ms,
+                          scan_ttl=args.scan_ttl)
+    simulator.start()
+    print(f"🛰️  Simulator running on {simulator.url}/dashboard.html (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n👋 Stopping simulator")
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
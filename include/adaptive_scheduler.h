@@ -0,0 +1,96 @@
+// Adaptive KPI sampling scheduler
+// Samples fast while the link degrades and backs off while it is stable. An
+// RSSI or noise step between samples re-arms fast sampling at once, so a long
+// stable interval does not delay the first sample of a degradation.
+// Mirrored by AdaptiveScheduler in adaptive_sampling.py for replay evaluation.
+
+#ifndef ADAPTIVE_SCHEDULER_H
+#define ADAPTIVE_SCHEDULER_H
+
+#include "advanced_ai.h"
+
+#define SAMPLE_INTERVAL_MIN_MS 2000      // degradation: sample every 2 s
+#define SAMPLE_INTERVAL_DEFAULT_MS 10000 // unclear conditions: the original 10 s
+#define SAMPLE_INTERVAL_MAX_MS 60000     // long stable stretches: back off to 60 s
+#define STABLE_SAMPLES_BEFORE_BACKOFF 3  // consecutive stable samples before slowing down
+#define RSSI_STEP_DB 6.0f                // RSSI change since the last sample that re-arms 2 s sampling
+#define NOISE_STEP_DB 10.0f              // same for noiseFloor(), the noise estimate without its jitter
+#define SAMPLES_AFTER_STEP 5             // samples kept at 2 s after a step
+
+class AdaptiveScheduler {
+private:
+    unsigned long interval_ms = SAMPLE_INTERVAL_DEFAULT_MS;
+    int stable_streak = 0;
+    int fast_samples = 0;
+    float last_rssi = NAN;   // KPIs of the last sample, the reference for stepDetected()
+    float last_noise = NAN;
+
+    // Alerts that describe a changing link; steady "poor" or "weak_signal"
+    // links stay at the default interval instead of the fastest one
+    static bool isDegradationAlert(AlertType alert) {
+        return alert == ALERT_INTERFERENCE || alert == ALERT_DEGRADING || alert == ALERT_UNSTABLE;
+    }
+
+public:
+    unsigned long currentInterval() const { return interval_ms; }
+
+    // Called on KPI task ticks between samples with values that need no scan:
+    // WiFi.RSSI() and the deterministic noise floor that next() was given.
+    // True when RSSI or noise stepped since the last sample: the caller samples
+    // now and the next SAMPLES_AFTER_STEP samples are 2 s apart.
+    bool stepDetected(float rssi, float noise) {
+        if (std::isnan(last_rssi)) return false;
+        if (fabsf(rssi - last_rssi) < RSSI_STEP_DB && fabsf(noise - last_noise) < NOISE_STEP_DB) {
+            return false;
+        }
+        stable_streak = 0;
+        fast_samples = SAMPLES_AFTER_STEP;
+        interval_ms = SAMPLE_INTERVAL_MIN_MS;
+        return true;
+    }
+
+    // Interval until the next sample, given the prediction and KPIs of this one
+    unsigned long next(const AdvancedWiFiAI::PredictionResult& prediction,
+                       float rssi = NAN, float noise = NAN) {
+        if (!std::isnan(rssi)) {
+            last_rssi = rssi;
+            last_noise = noise;
+        }
+
+        bool degrading = isDegradationAlert(prediction.alert) ||
+                         prediction.trend_score < -0.5f ||
+                         prediction.rssi_variance > 15.0f;
+        bool stable = !degrading &&
+                      (prediction.alert == ALERT_EXCELLENT || prediction.alert == ALERT_GOOD) &&
+                      fabsf(prediction.trend_score) < 0.3f &&
+                      prediction.rssi_variance < 6.0f &&
+                      prediction.noise_variance < 8.0f;
+
+        if (degrading) {
+            stable_streak = 0;
+            interval_ms = SAMPLE_INTERVAL_MIN_MS;
+        } else if (stable) {
+            stable_streak++;
+            if (stable_streak >= STABLE_SAMPLES_BEFORE_BACKOFF) {
+                interval_ms = interval_ms * 2;
+            } else if (interval_ms < SAMPLE_INTERVAL_DEFAULT_MS) {
+                interval_ms = SAMPLE_INTERVAL_DEFAULT_MS;
+            }
+        } else {
+            stable_streak = 0;
+            interval_ms = SAMPLE_INTERVAL_DEFAULT_MS;
+        }
+
+        if (fast_samples > 0) {
+            fast_samples--;
+            stable_streak = 0;
+            interval_ms = SAMPLE_INTERVAL_MIN_MS;
+        }
+
+        interval_ms = constrain(interval_ms, (unsigned long)SAMPLE_INTERVAL_MIN_MS,
+                                (unsigned long)SAMPLE_INTERVAL_MAX_MS);
+        return interval_ms;
+    }
+};
+
+#endif // ADAPTIVE_SCHEDULER_H
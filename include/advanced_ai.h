@@ -9,6 +9,43 @@
 #include <vector>
 #include <cmath>
 
+#include "anomaly_detector.h"
+
+// Alert types (ALERTS in advanced_ai_features.py). Results carry only the enum;
+// the strings are constants, so producing and copying a result never allocates.
+enum AlertType : uint8_t {
+    ALERT_EXCELLENT,
+    ALERT_GOOD,
+    ALERT_POOR,
+    ALERT_WEAK_SIGNAL,
+    ALERT_DEGRADING,
+    ALERT_CONGESTION,
+    ALERT_INTERFERENCE,
+    ALERT_UNSTABLE,
+    ALERT_TYPE_COUNT
+};
+
+struct AlertInfo {
+    const char* type;     // alert_type in /advanced-ai and /events
+    const char* message;
+    uint8_t severity;     // 0 status, 1 warning, 2 alert
+};
+
+static const AlertInfo ALERT_INFO[ALERT_TYPE_COUNT] = {
+    {"excellent", "Status: Excellent connection quality", 0},
+    {"good", "Status: Good connection quality", 0},
+    {"poor", "Warning: Poor connection quality - Multiple issues detected", 1},
+    {"weak_signal", "Alert: Weak signal strength - Move closer to router", 2},
+    {"degrading", "Warning: Signal degrading - Check for obstacles", 1},
+    {"congestion", "Alert: Network congestion - Consider changing channel", 2},
+    {"interference", "Warning: High interference detected - Multiple sources competing", 1},
+    {"unstable", "Warning: Unstable environment - Intermittent interference", 1},
+};
+
+inline const AlertInfo& alertInfo(uint8_t alert) {
+    return ALERT_INFO[alert < ALERT_TYPE_COUNT ? alert : ALERT_POOR];
+}
+
 class AdvancedWiFiAI {
 private:
     // Historical data for trend analysis
@@ -20,6 +57,7 @@ private:
     float stability_history[HISTORY_SIZE];
     int history_index = 0;
     bool history_full = false;
+    AnomalyDetectorState anomaly_state;
     
     // Advanced feature calculation methods
     float calculateMovingAverage(float* data, int size) {
@@ -68,6 +106,7 @@ public:
             util_history[i] = 0;
             stability_history[i] = 0;
         }
+        anomaly_detector_init(&anomaly_state);
     }
     
     // Advanced feature engineering
@@ -158,9 +197,11 @@ public:
         features.stability_trend = calculateTrend(stability_history, HISTORY_SIZE);
         features.stability_variance = calculateVariance(stability_history, HISTORY_SIZE);
         
-        // Outlier detection (simple threshold-based)
+        // Outlier detection: hard sensor limits plus the half-space tree detector
+        anomaly_detector_update(&anomaly_state, rssi, snr, channel_util);
         features.is_outlier = 0.0f;
-        if (rssi < -95 || rssi > -20 || snr < -10 || snr > 50 || channel_util > 95) {
+        if (rssi < -95 || rssi > -20 || snr < -10 || snr > 50 || channel_util > 95 ||
+            anomaly_detector_is_anomaly(&anomaly_state)) {
             features.is_outlier = 1.0f;
         }
         
@@ -171,9 +212,10 @@ public:
     struct PredictionResult {
         float stability;
         float confidence;
-        String alert_type;
-        String alert_message;
+        AlertType alert;
         float trend_score;
+        float rssi_variance;
+        float noise_variance;
     };
     
     PredictionResult predictAdvancedStability(float rssi, float noise, float snr, float channel_util) {
@@ -248,6 +290,8 @@ public:
         result.stability = constrain(stability_score, 0.0f, 1.0f);
         result.confidence = constrain(confidence, 0.0f, 1.0f);
         result.trend_score = (features.rssi_trend + features.snr_trend) / 2.0f;
+        result.rssi_variance = features.rssi_variance;
+        result.noise_variance = features.noise_variance;
         
         // Generate intelligent alerts
         generateIntelligentAlerts(features, result);
@@ -262,29 +306,21 @@ private:
     void generateIntelligentAlerts(const AdvancedFeatures& features, PredictionResult& result) {
         // Analyze patterns and generate specific alerts
         if (features.noise_norm > 0.8f && features.util_norm > 0.7f) {
-            result.alert_type = "interference";
-            result.alert_message = "Warning: High interference detected - Multiple sources competing";
+            result.alert = ALERT_INTERFERENCE;
         } else if (features.rssi_norm < 0.3f && features.snr_norm < 0.4f) {
-            result.alert_type = "weak_signal";
-            result.alert_message = "Alert: Weak signal strength - Move closer to router";
+            result.alert = ALERT_WEAK_SIGNAL;
         } else if (features.rssi_trend < -0.5f) {
-            result.alert_type = "degrading";
-            result.alert_message = "Warning: Signal degrading - Check for obstacles";
+            result.alert = ALERT_DEGRADING;
         } else if (features.util_norm > 0.9f) {
-            result.alert_type = "congestion";
-            result.alert_message = "Alert: Network congestion - Consider changing channel";
+            result.alert = ALERT_CONGESTION;
         } else if (features.noise_variance > 10.0f) {
-            result.alert_type = "unstable";
-            result.alert_message = "Warning: Unstable environment - Intermittent interference";
+            result.alert = ALERT_UNSTABLE;
         } else if (result.stability > 0.8f && result.confidence > 0.7f) {
-            result.alert_type = "excellent";
-            result.alert_message = "Status: Excellent connection quality";
+            result.alert = ALERT_EXCELLENT;
         } else if (result.stability > 0.6f) {
-            result.alert_type = "good";
-            result.alert_message = "Status: Good connection quality";
+            result.alert = ALERT_GOOD;
         } else {
-            result.alert_type = "poor";
-            result.alert_message = "Warning: Poor connection quality - Multiple issues detected";
+            result.alert = ALERT_POOR;
         }
     }
 };
@@ -0,0 +1,136 @@
+// Alert episode log
+// One entry per stretch of warnings/alerts (AlertInfo severity > 0), updated only
+// when the alert type changes, so the timeline never has to be rederived from
+// /history.json. An episode closes once status alerts have held for ALERT_CLEAR_S,
+// so a single good sample inside a degradation does not split it.
+// Written by the KPI task, served as-is by /alerts and kept in ALERT_LOG_FILE.
+// Mirrored and decoded by alert_log.py.
+
+#ifndef ALERT_LOG_H
+#define ALERT_LOG_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#define ALERT_LOG_SIZE 64            // episodes kept; the oldest is overwritten
+#define ALERT_LOG_MAGIC 0x54524c41u  // "ALRT" little-endian
+#define ALERT_LOG_VERSION 1
+#define ALERT_CLEAR_S 120            // seconds of status alerts that close an episode
+
+struct AlertEvent {
+    uint32_t start;         // sample time the episode opened
+    uint32_t end;           // first sample of the status run that closed it, 0 while open
+    uint16_t transitions;   // alert type changes inside the episode
+    uint8_t first_alert;    // AlertType values
+    uint8_t peak_alert;     // most severe type seen (the first one on ties)
+    uint8_t last_alert;
+    uint8_t peak_severity;
+    uint16_t reserved;
+};
+
+struct AlertLogHeader {
+    uint32_t magic;
+    uint8_t version;
+    uint8_t count;          // events that follow, oldest first
+    uint8_t capacity;
+    uint8_t event_size;
+    uint32_t total;         // episodes ever opened, so readers can tell what was dropped
+};
+
+#define ALERT_LOG_BYTES (sizeof(AlertLogHeader) + ALERT_LOG_SIZE * sizeof(AlertEvent))
+
+static_assert(sizeof(AlertEvent) == 16, "AlertEvent is a wire format");
+static_assert(sizeof(AlertLogHeader) == 12, "AlertLogHeader is a wire format");
+
+class AlertLog {
+private:
+    AlertEvent events[ALERT_LOG_SIZE];
+    uint32_t total = 0;     // the newest episode is events[(total - 1) % ALERT_LOG_SIZE]
+    bool open = false;
+    uint32_t clear_start = 0;  // first status sample of the current run, 0 if none
+
+    AlertEvent& newest() { return events[(total - 1) % ALERT_LOG_SIZE]; }
+
+public:
+    AlertLog() : events() {}
+
+    // Feed every sample; returns true only when the log changed
+    bool update(uint32_t t, uint8_t alert, uint8_t severity) {
+        if (!open) {
+            if (severity == 0) return false;
+            AlertEvent& event = events[total % ALERT_LOG_SIZE];
+            event = AlertEvent();
+            event.start = t;
+            event.first_alert = event.peak_alert = event.last_alert = alert;
+            event.peak_severity = severity;
+            total++;
+            open = true;
+            return true;
+        }
+
+        AlertEvent& event = newest();
+        if (severity == 0) {
+            if (clear_start == 0) clear_start = t;
+            if (t - clear_start < ALERT_CLEAR_S) return false;
+            event.end = clear_start;
+            clear_start = 0;
+            open = false;
+            return true;
+        }
+        clear_start = 0;
+        if (alert == event.last_alert) return false;
+        event.last_alert = alert;
+        if (event.transitions < UINT16_MAX) event.transitions++;
+        if (severity > event.peak_severity) {
+            event.peak_alert = alert;
+            event.peak_severity = severity;
+        }
+        return true;
+    }
+
+    bool isOpen() const { return open; }
+    uint32_t totalEvents() const { return total; }
+    size_t count() const { return total < ALERT_LOG_SIZE ? total : ALERT_LOG_SIZE; }
+
+    // i = 0 is the oldest episode still held
+    const AlertEvent& at(size_t i) const {
+        return events[(total - count() + i) % ALERT_LOG_SIZE];
+    }
+
+    // Header plus events, oldest first; returns the bytes written (0 if out is too small)
+    size_t serialize(uint8_t* out, size_t size) const {
+        size_t length = sizeof(AlertLogHeader) + count() * sizeof(AlertEvent);
+        if (size < length) return 0;
+        AlertLogHeader header = {ALERT_LOG_MAGIC, ALERT_LOG_VERSION, (uint8_t)count(),
+                                 ALERT_LOG_SIZE, sizeof(AlertEvent), total};
+        memcpy(out, &header, sizeof(header));
+        for (size_t i = 0; i < count(); i++) {
+            memcpy(out + sizeof(header) + i * sizeof(AlertEvent), &at(i), sizeof(AlertEvent));
+        }
+        return length;
+    }
+
+    // Inverse of serialize(); leaves the log untouched and returns false on a bad image
+    bool restore(const uint8_t* data, size_t size) {
+        AlertLogHeader header;
+        if (size < sizeof(header)) return false;
+        memcpy(&header, data, sizeof(header));
+        if (header.magic != ALERT_LOG_MAGIC || header.version != ALERT_LOG_VERSION ||
+            header.event_size != sizeof(AlertEvent) || header.count > ALERT_LOG_SIZE ||
+            header.count > header.total ||
+            size < sizeof(header) + header.count * sizeof(AlertEvent)) {
+            return false;
+        }
+        total = header.total;
+        for (size_t i = 0; i < header.count; i++) {
+            memcpy(&events[(total - header.count + i) % ALERT_LOG_SIZE],
+                   data + sizeof(header) + i * sizeof(AlertEvent), sizeof(AlertEvent));
+        }
+        open = header.count > 0 && newest().end == 0;
+        clear_start = 0;
+        return true;
+    }
+};
+
+#endif // ALERT_LOG_H
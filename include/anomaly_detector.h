@@ -0,0 +1,380 @@
+// Half-space tree anomaly detector for raw WiFi KPIs
+// Generated by anomaly_detector.py - do not edit
+// Recall 70.9% at 0.53% false positives (threshold rule: 1.1% at 19.85%)
+
+#ifndef ANOMALY_DETECTOR_H
+#define ANOMALY_DETECTOR_H
+
+#include <stdint.h>
+
+#define ANOMALY_TREES 16
+#define ANOMALY_LEAVES 256
+#define ANOMALY_FEATURES 4  // rssi, snr, channel_util, rssi_delta
+#define ANOMALY_THRESHOLD 112795u
+#define ANOMALY_EWMA_ALPHA 0.20000000298023224f
+#define ANOMALY_EWMA_KEEP 0.800000011920929f
+
+// One tree as a grid: feature f falls in cell (x - lo) * scale of cells[f]
+typedef struct {
+  float lo[ANOMALY_FEATURES];
+  float scale[ANOMALY_FEATURES];
+  uint16_t cells[ANOMALY_FEATURES];
+  uint16_t stride[ANOMALY_FEATURES];
+} AnomalyTree;
+
+// Everything the detector keeps between samples
+typedef struct {
+  float ewma;       // RSSI baseline
+  uint8_t primed;
+  uint32_t score;   // last ensemble score, lower is more anomalous
+} AnomalyDetectorState;
+
+static const AnomalyTree anomaly_trees[ANOMALY_TREES] = {
+  {{-110.1573486328125f, -38.96329116821289f, -22.938425064086914f, -52.326576232910156f}, {0.05855255201458931f, 0.021068913862109184f, 0.03232226520776749f, 0.014833612367510796f}, {8, 4, 4, 2}, {1, 8, 32, 128}},
+  {{-112.01097869873047f, -90.26065063476562f, -29.212427139282227f, -86.68254089355469f}, {0.013884654268622398f, 0.009949545376002789f, 0.10749097168445587f, 0.02625375986099243f}, {2, 2, 16, 4}, {1, 2, 4, 64}},
+  {{-156.4317169189453f, -76.11180877685547f, -26.201845169067383f, -48.52348327636719f}, {0.049006905406713486f, 0.04392006993293762f, 0.01461909431964159f, 0.01672009378671646f}, {8, 8, 2, 2}, {1, 8, 64, 128}},
+  {{-104.79276275634766f, -25.323883056640625f, -27.110782623291016f, -57.119964599609375f}, {0.00868273712694645f, 0.05912981927394867f, 0.01424063928425312f, 0.14166517555713654f}, {1, 8, 2, 16}, {1, 1, 8, 16}},
+  {{-98.78474426269531f, -37.75336837768555f, -39.6362190246582f, -61.434635162353516f}, {0.023153599351644516f, 0.021620048210024834f, 0.041984859853982925f, 0.033699747174978256f}, {2, 4, 8, 4}, {1, 2, 8, 64}},
+  {{-110.656005859375f, -37.79426574707031f, -59.24488830566406f, -47.4144287109375f}, {0.009783969260752201f, 0.04320189356803894f, 0.20296861231327057f, 0.008682038635015488f}, {1, 8, 32, 1}, {1, 1, 8, 256}},
+  {{-112.81233978271484f, -86.36338806152344f, -42.57408905029297f, -90.20014953613281f}, {0.054329611361026764f, 0.04085429385304451f, 0.007383772637695074f, 0.025469714775681496f}, {8, 8, 1, 4}, {1, 8, 64, 64}},
+  {{-109.0264663696289f, -64.53196716308594f, -80.11478424072266f, -45.43427276611328f}, {0.039985887706279755f, 0.011996932327747345f, 0.010782462544739246f, 0.1491706371307373f}, {4, 2, 2, 16}, {1, 4, 8, 16}},
+  {{-113.9961166381836f, -79.04273986816406f, -24.084516525268555f, -61.459590911865234f}, {0.018750909715890884f, 0.01074939500540495f, 0.015583841130137444f, 0.18674029409885406f}, {2, 2, 2, 32}, {1, 2, 4, 8}},
+  {{-102.04896545410156f, -43.245018005371094f, -40.39612579345703f, -47.26090621948242f}, {0.038389239460229874f, 0.1546042561531067f, 0.005165702663362026f, 0.020040692761540413f}, {4, 32, 1, 2}, {1, 4, 128, 128}},
+  {{-107.75336456298828f, -29.693145751953125f, -28.268287658691406f, -61.686241149902344f}, {0.02033805474638939f, 0.052365418523550034f, 0.013786149211227894f, 0.046439383178949356f}, {2, 8, 2, 8}, {1, 2, 16, 32}},
+  {{-158.14700317382812f, -36.40928649902344f, -42.04094696044922f, -62.84834671020508f}, {0.04832980036735535f, 0.005566777661442757f, 0.01998363435268402f, 0.04521919786930084f}, {8, 1, 4, 8}, {1, 8, 8, 32}},
+  {{-99.52152252197266f, -59.24982452392578f, -32.89590835571289f, -61.29212188720703f}, {0.022893240675330162f, 0.05010445788502693f, 0.012226161547005177f, 0.04686828702688217f}, {2, 8, 2, 8}, {1, 2, 16, 32}},
+  {{-154.89564514160156f, -29.564321517944336f, -23.333036422729492f, -107.09969329833984f}, {0.012407394126057625f, 0.05254264175891876f, 0.031915195286273956f, 0.022273948416113853f}, {2, 8, 4, 4}, {1, 2, 16, 64}},
+  {{-115.02237701416016f, -85.19113159179688f, -34.90718078613281f, -101.78718566894531f}, {0.05125264450907707f, 0.010295753367245197f, 0.023306122049689293f, 0.02318858541548252f}, {8, 2, 4, 4}, {1, 8, 16, 64}},
+  {{-127.38306427001953f, -57.798587799072266f, -37.29403305053711f, -79.72198486328125f}, {0.03212574124336243f, 0.025359557941555977f, 0.02207796275615692f, 0.027956703677773476f}, {4, 4, 4, 4}, {1, 4, 16, 64}},
+};
+
+static const uint16_t anomaly_scores[ANOMALY_TREES][ANOMALY_LEAVES] = {
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     1,     1, 19206, 49506,  6658,     0,     0,     0,
+        0,     0,     0,     0,   987,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0, 10705,  2083,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,   118,   341,    13,    13,    13,    13,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,  1501,    93,
+        0,     0, 16787,   938,     0,     0, 30221,  1256,     0,     0, 22686,   517,     0,     0, 10094,     0,
+        0,     0,  4170,     0,     0,     0,  1465,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,   380,     0,     0,     0,
+        0,     0,     0,     0, 23610,  2370,     0,     0,     0,     0,     0,     0,   565, 53843,     0,     0,
+        0,     0,     0,     0,     0,     4,     0,     0,     0,     0,     0,     0,     0,     4,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,   816,     0,     0,     0,
+        0,     0,     0,     0,  6822,    59,     0,     0,     0,     0,     0,     0,     4,   335,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,   230,    23,     0,     0,     0,     0,     0,     0,     4,   571,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,
+        0,     0,     0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,
+        0,     0,     0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,
+        0,     0,     0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,    10,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,    10,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,    10,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,    10,     0,     0,     0,     0,
+        0,     0,     1,     1,     0,     0,     0,     0,     0,     0,     0,    10,     0,     0,     0,     0,
+        0,     0,     1,     1,     0,     0,     0,     0,     0,     0,     0,    10,     0,     0,     0,     0,
+        0,     0,     4,     6,     0,     0,     0,     0,     0,     0,     0,    10,     0,     0,     0,     0,
+        0,     0,  5207,  6101, 10764,     0,     0,     0,     0,     0,  1706,    10,     0,     0,     0,     0,
+        0,     0, 11821, 14487, 33088,     5,     0,     0,     0,     0,  4351,   536,     0,     0,     0,     0,
+        0,     0,   118,   194,   443,     5,     0,     0,     0,     0,    53,     6,     0,     0,     0,     0,
+        0,     0,    61,    82,   253,     5,     0,     0,     0,     0,    24,     3,     0,     0,     0,     0,
+        0,     0,    61,    82,   135,     5,     0,     0,     0,     0,    24,     3,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     5,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     5,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     5,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     5,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,   479,  1189,     0,     6,     0,     6,     0,     0,   460,   207,     0,     0,     0,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,     1,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0, 14365, 46003,     0,  1697,     0,     0,     0,     0, 14722,  9343,     0,    42,     0,    42,
+        0,     0,  1138,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,    38,    38,     0,     0,     0,     0,   599,  2435,    38,    38,     0,     0,
+        0,     0,  1368,  6422,   318,     0,     0,     0,     0,     0,  2783, 11237,   434,     0,     0,     0,
+        0,     0,  3729, 12955,   485,     0,     0,     0,     0,     0,  4102, 11877,   283,     0,     0,     0,
+        0,     0,  4098,  8026,    30,    30,     0,     0,     0,     0,  3139,  3304,    30,    30,     0,     0,
+        0,     0,  4010,  1636,     0,     0,     0,     0,     0,     0,  2770,     0,     0,     0,     0,     0,
+        0,     0,  1994,     0,     0,     0,     0,     0,     0,     0,  1147,     0,     0,     0,     0,     0,
+        0,     0,   320,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0, 30020,  2298,     0,     0,     0,     0,     0,     0,    13, 54448,  2796,     0,     0,     0,
+        0,     0,     0,     0,     1,     1,     0,     0,     0,     0,     0,     0,     1,     1,     0,     0,
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0,     5,     5,     0,     0,     0,     0,     0,     0,     5,     5,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     1,     1,     0,     0,     0,     0,     0,     0,     1,     1,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     1,     1,     1,     1,     0,     0,     0,     0,     1,     1,     1,     1,
+        0,     0,     0,     0,     1,     1,     1,     1,     0,     0,     0,     0,     1,     1,     1,     1,
+        7,     7,     7,     7,     0,  1187,  5747,     0,     0,  6542,     0,     0,     0, 18634, 46641,     0,
+        7,     7,     7,     7,    88,    88,   719,     0,     0,   419,     0,     0,     0,  2656,  5692,     0,
+        1,     1,     1,     1,    11,    11,    11,    11,     1,     1,     1,     1,    77,    77,   388,     0,
+        1,     1,     1,     1,    11,    11,    11,    11,     1,     1,     1,     1,    49,    49,   264,     0,
+        1,     1,     1,     1,     3,     3,     3,     3,     1,     1,     1,     1,    20,    20,    20,    20,
+        1,     1,     1,     1,     3,     3,     3,     3,     1,     1,     1,     1,    20,    20,    20,    20,
+        1,     1,     1,     1,     0,     0,     0,     0,     1,     1,     1,     1,     0,     0,     0,     0,
+        1,     1,     1,     1,     0,     0,     0,     0,     1,     1,     1,     1,     0,     0,     0,     0,
+        1,     1,     1,     1,     0,     0,     0,     0,     1,     1,     1,     1,     0,     0,     0,     0,
+        1,     1,     1,     1,     0,     0,     0,     0,     1,     1,     1,     1,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        5,     5,     5,     2,     0,     0,     0,     0,     5,     5,     5,     2,     0,     0,     0,     0,
+        5,     5,   188,   495,    25,     0,    59,    13,     5,     5, 19789, 55856,   538,     0,  8426,  1269,
+        5,     5,   361,  1172,     1,     1,   175,    11,     5,     5,   124,   358,     1,     1,    49,    11,
+        5,     5,    66,   245,     1,     1,    32,    11,     5,     5,    66,   162,     1,     1,    32,    11,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,  1195,     0,     0,     0, 11679,     0,     0,     0, 13665,     0,     0,     0,  3445,     0,     0,
+        0,  7469,  2317,     0,     0,  4956, 17913,     0,     0,     0, 20922,     0,     0,     0,  2827,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,    21,     0,     0,     0,   350,     0,     0,     0,   567,     0,     0,     0,   154,     0,     0,
+        0,   228,    88,     0,     0,   158,   742,     0,     0,     0,   883,     0,     0,     0,   158,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0, 20736,     0,  2424, 31952,     0, 25745,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,  5947,     0,    26,    26,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,   597,     0,    93,   978,     0,   904,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,   177,     0,    26,    26,     0,     0,     0,     0,     0,     0,     0,     0,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+        1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,     1,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0, 31433, 55704,     0,     0,
+        0,     0,     0,     0,   314,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,   761,  1490,     0,     0,
+        0,     0,     0,     0,     6,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     1,     2,     0,     0,     0,     0,     0,     0,     1,     2,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     1,     2,     0,     0,     0,     0,     0,     0,     1,     2,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     1,     2,     0,     0,     0,     0,     0,     0,     1,     2,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     1,     2,     0,     0,     0,     0,     0,     0,     1,     2,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     1,     0,     1,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     1,     0,     1,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,  9308,     0, 16998,  9681,     0, 46726,     0,     1,     0,     1,
+        0,     0,     0,     0,     0,     0,  2426,     0,  1419,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,   245,     0,   670,   282,     0,  1754,     0,     1,     0,     1,
+        0,     0,     0,     0,     0,     0,    65,     0,    44,     0,     0,     0,     0,     0,     0,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     5,     1,     5,     1,     5,     1,     5,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     5,     1,     5,     1,     5,     1,     5,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     5,     1,     5,     1,     5,     1,     5,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        1,     0,     1,     0,     1,     0,     1,     0,     1,     5,     1,     5,     1,     5,     1,     5,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     5, 17479,     0, 33716,     0, 26658,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     3,  9980,     0,  1866,     2,     2,     2,     2,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     2,     2,     2,     2,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     5,     0,     0,     2,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     3,     0,     0,     0,     2,     2,     2,     2,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     2,     2,     2,     2,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        3,     3,     3,     3,     3,     3,     3,     3,     0,     0,     0,     0,     6,     6,     6,     6,
+        3,     3,     3,     3,     3,     3,     3,     3,     0,     0, 27432, 59177,     6,     6,     6,     6,
+        2,     2,     2,     2,     2,     2,     2,     2,     0,     0,  2884,     0,     0,     0,     0,     0,
+        2,     2,     2,     2,     2,     2,     2,     2,     0,     0,     0,     0,     0,     0,     0,     0,
+        3,     3,     3,     3,     3,     3,     3,     3,     0,     0,     0,     0,     6,     6,     6,     6,
+        3,     3,     3,     3,     3,     3,     3,     3,     0,     0,     0,     0,     6,     6,     6,     6,
+        2,     2,     2,     2,     2,     2,     2,     2,     0,     0,     0,     0,     0,     0,     0,     0,
+        2,     2,     2,     2,     2,     2,     2,     2,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+  {
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     1,     1,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     1,     1,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,     0,     3,     3,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,     0,     3,     3,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     1,     1,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     1,     1,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,     0,     3,     3,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,     0,     3,     3,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     1,     0,     0,     0,     0,
+        0,     0,     0,     0,     0, 11597,   485,     0,     0, 10347, 65535,     1,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,  1052,     3,     3,     0,   181,   419,     0,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,     0,     3,     3,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,     0,     3,     3,     0,     0,     0,     0,     0,     0,     0,     0,
+        0,     0,     3,     3,     0,     0,     3,     3,     0,     0,     0,     0,     0,     0,     0,     0,
+  },
+};
+
+static inline void anomaly_detector_init(AnomalyDetectorState* state) {
+  state->ewma = 0.0f;
+  state->primed = 0;
+  state->score = 0;
+}
+
+// Score one sample and advance the RSSI baseline
+static inline uint32_t anomaly_detector_update(AnomalyDetectorState* state, float rssi,
+                                               float snr, float channel_util) {
+  if (!state->primed) {
+    state->ewma = rssi;
+    state->primed = 1;
+  }
+  const float sample[ANOMALY_FEATURES] = {rssi, snr, channel_util, rssi - state->ewma};
+  state->ewma = ANOMALY_EWMA_ALPHA * rssi + ANOMALY_EWMA_KEEP * state->ewma;
+
+  uint32_t total = 0;
+  for (int t = 0; t < ANOMALY_TREES; t++) {
+    const AnomalyTree* tree = &anomaly_trees[t];
+    int leaf = 0;
+    for (int f = 0; f < ANOMALY_FEATURES; f++) {
+      float position = (sample[f] - tree->lo[f]) * tree->scale[f];
+      int cell = 0;
+      if (position > 0) {  // also catches NaN
+        cell = position < tree->cells[f] - 1 ? (int)position : tree->cells[f] - 1;
+      }
+      leaf += cell * tree->stride[f];
+    }
+    total += anomaly_scores[t][leaf];
+  }
+  state->score = total;
+  return total;
+}
+
+static inline bool anomaly_detector_is_anomaly(const AnomalyDetectorState* state) {
+  return state->primed && state->score < ANOMALY_THRESHOLD;
+}
+
+#endif // ANOMALY_DETECTOR_H
@@ -0,0 +1,1075 @@
+#ifndef FORECAST_MODEL_H
+#define FORECAST_MODEL_H
+
+#define FORECAST_WINDOW 360
+#define FORECAST_HORIZON_S 600
+#define FORECAST_ARENA_SIZE 26624
+
+const unsigned char wifi_forecast_tflite[] = {
+  0x1c, 0x00, 0x00, 0x00, 0x54, 0x46, 0x4c, 0x33, 0x14, 0x00, 0x20, 0x00, 
+  0x1c, 0x00, 0x18, 0x00, 0x14, 0x00, 0x10, 0x00, 0x0c, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x04, 0x00, 0x14, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 
+  0x8c, 0x00, 0x00, 0x00, 0x14, 0x01, 0x00, 0x00, 0x04, 0x1b, 0x00, 0x00, 
+  0x14, 0x1b, 0x00, 0x00, 0xf0, 0x30, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x52, 0xe2, 0xff, 0xff, 
+  0x0c, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0x3c, 0x00, 0x00, 0x00, 
+  0x0f, 0x00, 0x00, 0x00, 0x73, 0x65, 0x72, 0x76, 0x69, 0x6e, 0x67, 0x5f, 
+  0x64, 0x65, 0x66, 0x61, 0x75, 0x6c, 0x74, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x60, 0xff, 0xff, 0xff, 0x23, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x6f, 0x75, 0x74, 0x70, 
+  0x75, 0x74, 0x5f, 0x30, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0xf2, 0xe3, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 
+  0x0c, 0x00, 0x00, 0x00, 0x6b, 0x65, 0x72, 0x61, 0x73, 0x5f, 0x74, 0x65, 
+  0x6e, 0x73, 0x6f, 0x72, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x64, 0x00, 0x00, 0x00, 0x2c, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0xb0, 0xff, 0xff, 0xff, 0x27, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x13, 0x00, 0x00, 0x00, 0x43, 0x4f, 0x4e, 0x56, 0x45, 0x52, 0x53, 0x49, 
+  0x4f, 0x4e, 0x5f, 0x4d, 0x45, 0x54, 0x41, 0x44, 0x41, 0x54, 0x41, 0x00, 
+  0xd4, 0xff, 0xff, 0xff, 0x26, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x19, 0x00, 0x00, 0x00, 0x72, 0x65, 0x64, 0x75, 0x63, 0x65, 0x64, 0x5f, 
+  0x70, 0x72, 0x65, 0x63, 0x69, 0x73, 0x69, 0x6f, 0x6e, 0x5f, 0x73, 0x75, 
+  0x70, 0x70, 0x6f, 0x72, 0x74, 0x00, 0x00, 0x00, 0x08, 0x00, 0x0c, 0x00, 
+  0x08, 0x00, 0x04, 0x00, 0x08, 0x00, 0x00, 0x00, 0x25, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x13, 0x00, 0x00, 0x00, 0x6d, 0x69, 0x6e, 0x5f, 
+  0x72, 0x75, 0x6e, 0x74, 0x69, 0x6d, 0x65, 0x5f, 0x76, 0x65, 0x72, 0x73, 
+  0x69, 0x6f, 0x6e, 0x00, 0x28, 0x00, 0x00, 0x00, 0xec, 0x19, 0x00, 0x00, 
+  0xe4, 0x19, 0x00, 0x00, 0xd0, 0x19, 0x00, 0x00, 0xbc, 0x19, 0x00, 0x00, 
+  0xa8, 0x19, 0x00, 0x00, 0x94, 0x19, 0x00, 0x00, 0x04, 0x06, 0x00, 0x00, 
+  0xe4, 0x05, 0x00, 0x00, 0x94, 0x04, 0x00, 0x00, 0x04, 0x02, 0x00, 0x00, 
+  0xe8, 0x01, 0x00, 0x00, 0xcc, 0x01, 0x00, 0x00, 0xb8, 0x01, 0x00, 0x00, 
+  0x98, 0x01, 0x00, 0x00, 0x78, 0x01, 0x00, 0x00, 0x58, 0x01, 0x00, 0x00, 
+  0x50, 0x01, 0x00, 0x00, 0x48, 0x01, 0x00, 0x00, 0x40, 0x01, 0x00, 0x00, 
+  0x38, 0x01, 0x00, 0x00, 0x30, 0x01, 0x00, 0x00, 0x28, 0x01, 0x00, 0x00, 
+  0x20, 0x01, 0x00, 0x00, 0x18, 0x01, 0x00, 0x00, 0x10, 0x01, 0x00, 0x00, 
+  0x08, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0xf8, 0x00, 0x00, 0x00, 
+  0xf0, 0x00, 0x00, 0x00, 0xe8, 0x00, 0x00, 0x00, 0xe0, 0x00, 0x00, 0x00, 
+  0xd8, 0x00, 0x00, 0x00, 0xd0, 0x00, 0x00, 0x00, 0xc8, 0x00, 0x00, 0x00, 
+  0xc0, 0x00, 0x00, 0x00, 0xb8, 0x00, 0x00, 0x00, 0xb0, 0x00, 0x00, 0x00, 
+  0x90, 0x00, 0x00, 0x00, 0x74, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x3e, 0xe5, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00, 
+  0x0c, 0x00, 0x00, 0x00, 0x08, 0x00, 0x0e, 0x00, 0x08, 0x00, 0x04, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x28, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x06, 0x00, 0x08, 0x00, 0x04, 0x00, 0x06, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0xe9, 0x03, 0x00, 0x00, 
+  0x0c, 0x00, 0x18, 0x00, 0x14, 0x00, 0x10, 0x00, 0x0c, 0x00, 0x04, 0x00, 
+  0x0c, 0x00, 0x00, 0x00, 0x16, 0xcf, 0x52, 0x16, 0xe5, 0x4e, 0xa0, 0xcd, 
+  0x02, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x06, 0x00, 0x00, 0x00, 0x32, 0x2e, 0x32, 0x31, 0x2e, 0x30, 0x00, 0x00, 
+  0xaa, 0xe5, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x0b, 0x00, 0x00, 0x00, 
+  0x66, 0x70, 0x31, 0x36, 0x61, 0x63, 0x63, 0x66, 0x70, 0x33, 0x32, 0x00, 
+  0xc2, 0xe5, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 
+  0x31, 0x2e, 0x31, 0x35, 0x2e, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x00, 0x98, 0xd1, 0xff, 0xff, 0x9c, 0xd1, 0xff, 0xff, 
+  0xa0, 0xd1, 0xff, 0xff, 0xa4, 0xd1, 0xff, 0xff, 0xa8, 0xd1, 0xff, 0xff, 
+  0xac, 0xd1, 0xff, 0xff, 0xb0, 0xd1, 0xff, 0xff, 0xb4, 0xd1, 0xff, 0xff, 
+  0xb8, 0xd1, 0xff, 0xff, 0xbc, 0xd1, 0xff, 0xff, 0xc0, 0xd1, 0xff, 0xff, 
+  0xc4, 0xd1, 0xff, 0xff, 0xc8, 0xd1, 0xff, 0xff, 0xcc, 0xd1, 0xff, 0xff, 
+  0xd0, 0xd1, 0xff, 0xff, 0xd4, 0xd1, 0xff, 0xff, 0xd8, 0xd1, 0xff, 0xff, 
+  0xdc, 0xd1, 0xff, 0xff, 0xe0, 0xd1, 0xff, 0xff, 0xe4, 0xd1, 0xff, 0xff, 
+  0xe8, 0xd1, 0xff, 0xff, 0x32, 0xe6, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 
+  0x10, 0x00, 0x00, 0x00, 0x5c, 0x2d, 0x76, 0xa9, 0xa4, 0x2b, 0x23, 0x2d, 
+  0xfc, 0x24, 0xa8, 0x2a, 0x0c, 0x27, 0x97, 0x2c, 0x4e, 0xe6, 0xff, 0xff, 
+  0x04, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0xe2, 0x2c, 0xd1, 0x27, 
+  0x53, 0x28, 0x32, 0x9c, 0x44, 0x8f, 0x41, 0x2c, 0x16, 0x22, 0x7a, 0xae, 
+  0x6a, 0xe6, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 
+  0x65, 0x93, 0x9a, 0x27, 0x1b, 0xa1, 0xc4, 0xa5, 0xa8, 0xa9, 0xce, 0xaa, 
+  0x8c, 0x2f, 0x5b, 0x27, 0x86, 0xe6, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 
+  0x02, 0x00, 0x00, 0x00, 0x46, 0x2c, 0x00, 0x00, 0x96, 0xe6, 0xff, 0xff, 
+  0x04, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 
+  0x27, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0xae, 0xe6, 0xff, 0xff, 
+  0x04, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 
+  0x77, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0xc6, 0xe6, 0xff, 0xff, 
+  0x04, 0x00, 0x00, 0x00, 0x80, 0x02, 0x00, 0x00, 0x52, 0xb5, 0x4e, 0x2a, 
+  0x01, 0xb2, 0xed, 0x25, 0x99, 0xa7, 0xeb, 0x2c, 0xa4, 0x32, 0x34, 0x2b, 
+  0x83, 0x26, 0x58, 0x33, 0x46, 0x21, 0xa9, 0x32, 0x84, 0xad, 0x56, 0xa3, 
+  0x7a, 0xa8, 0x3c, 0x2f, 0x1d, 0xb2, 0x01, 0xaf, 0x51, 0x33, 0x50, 0x31, 
+  0x81, 0xae, 0x0c, 0xa9, 0x0c, 0x30, 0xf7, 0x2b, 0x90, 0x2e, 0x47, 0x29, 
+  0x0b, 0x31, 0x7b, 0x2e, 0xa9, 0x33, 0xbe, 0x2f, 0x09, 0x35, 0x33, 0xa6, 
+  0x96, 0x2d, 0x87, 0xaa, 0x2a, 0x9a, 0xec, 0xa4, 0x15, 0xb2, 0x07, 0xb1, 
+  0xfb, 0x32, 0x89, 0x2a, 0xcb, 0x2b, 0x55, 0x2a, 0x12, 0x2f, 0xed, 0x2d, 
+  0x9c, 0x34, 0x56, 0xb1, 0xea, 0xb1, 0x94, 0xb4, 0x9d, 0xa9, 0x6b, 0x34, 
+  0xd8, 0xaa, 0x41, 0xb0, 0xf9, 0x35, 0xa3, 0x29, 0xa9, 0xa4, 0xce, 0xad, 
+  0xae, 0x34, 0x0d, 0xaf, 0x91, 0xb4, 0x2f, 0xa9, 0x00, 0xab, 0xce, 0xb0, 
+  0xb2, 0xb4, 0xac, 0xad, 0x3d, 0x33, 0xc3, 0xaa, 0xba, 0x2c, 0x16, 0xa0, 
+  0x9d, 0xaf, 0x07, 0x34, 0xe7, 0xae, 0x4a, 0xae, 0x27, 0x36, 0xf8, 0xb2, 
+  0xf1, 0x24, 0x5d, 0x2d, 0x43, 0xb8, 0x34, 0xad, 0xd1, 0x2f, 0xdf, 0x32, 
+  0x30, 0xb4, 0x98, 0x34, 0xae, 0x28, 0x7f, 0xae, 0x7b, 0x33, 0xe1, 0x2b, 
+  0x70, 0x33, 0x6b, 0x25, 0x6e, 0xaa, 0xe2, 0x32, 0x25, 0xb0, 0x47, 0x30, 
+  0x45, 0x34, 0xa0, 0xab, 0x88, 0xb4, 0xab, 0x24, 0xb3, 0xb2, 0xb4, 0xaa, 
+  0xf8, 0xac, 0x33, 0xab, 0x48, 0xb0, 0x19, 0x2f, 0xff, 0xac, 0xea, 0xb1, 
+  0xf6, 0xb6, 0x47, 0x30, 0xde, 0x32, 0xab, 0x2f, 0x1e, 0x2e, 0x3f, 0xb3, 
+  0xf7, 0xa7, 0x3a, 0xb3, 0x92, 0xb6, 0xfc, 0x2d, 0xa9, 0xb4, 0x79, 0x32, 
+  0x44, 0x32, 0xf0, 0xb1, 0x79, 0xb6, 0xbc, 0x33, 0x1b, 0xb0, 0x1a, 0x30, 
+  0xe3, 0xaa, 0x39, 0x34, 0x92, 0x30, 0xa3, 0xa9, 0x98, 0x32, 0xf8, 0x32, 
+  0xe2, 0x2a, 0x9a, 0x2d, 0xd9, 0xb1, 0xfa, 0x96, 0x1a, 0xb0, 0xc0, 0xb0, 
+  0xbb, 0x2e, 0xfd, 0xad, 0x43, 0xb0, 0x46, 0xb1, 0x9b, 0x1c, 0x4f, 0xa9, 
+  0x9c, 0xaf, 0xb5, 0xb3, 0x56, 0xb2, 0xc9, 0x2f, 0xe8, 0xb0, 0xcb, 0xab, 
+  0xe4, 0x2a, 0xf6, 0xb0, 0xf8, 0xa4, 0x80, 0x26, 0xc7, 0xad, 0x28, 0x29, 
+  0xf2, 0xb1, 0x21, 0xb4, 0x38, 0xb1, 0x74, 0x33, 0x47, 0xae, 0x68, 0xb0, 
+  0xf5, 0xb1, 0x77, 0x2e, 0x31, 0xa6, 0x93, 0xb3, 0x0e, 0x33, 0xbc, 0x94, 
+  0x6b, 0x30, 0x56, 0xb1, 0x52, 0x25, 0xde, 0xb4, 0xac, 0x2c, 0xb5, 0xb3, 
+  0x78, 0x9e, 0x3d, 0x34, 0x3c, 0xad, 0xfa, 0x31, 0xa9, 0xb0, 0x3b, 0xb1, 
+  0x24, 0xb0, 0x7d, 0xa6, 0xd1, 0x26, 0x88, 0xaa, 0x61, 0xb4, 0x94, 0xad, 
+  0x82, 0xb0, 0xc9, 0x31, 0x26, 0xae, 0xff, 0x26, 0x93, 0x2f, 0x2d, 0xac, 
+  0x01, 0xb4, 0x94, 0x31, 0x6c, 0xa4, 0x0b, 0xb0, 0x84, 0x31, 0x50, 0x27, 
+  0x46, 0x29, 0x4c, 0xa8, 0x6a, 0x9c, 0x4d, 0x2b, 0x39, 0x2d, 0x6a, 0xb1, 
+  0x07, 0x30, 0x28, 0x30, 0x8e, 0x31, 0x0a, 0xb1, 0x1b, 0x2e, 0x82, 0x30, 
+  0xd1, 0x31, 0xbb, 0x32, 0xca, 0xb3, 0x66, 0x33, 0x0f, 0xae, 0x2c, 0xae, 
+  0x52, 0xaf, 0xcb, 0x31, 0x3c, 0x34, 0x4c, 0xb2, 0xd3, 0xb4, 0x22, 0x31, 
+  0x98, 0xb1, 0x50, 0x32, 0x5f, 0xb3, 0x90, 0x31, 0x86, 0xae, 0x32, 0xb0, 
+  0x16, 0xb3, 0xe5, 0xaf, 0x3d, 0x30, 0x49, 0xb0, 0x49, 0xb4, 0x68, 0x2f, 
+  0xbc, 0x35, 0xe6, 0x32, 0x49, 0xa2, 0x8a, 0x34, 0xc7, 0xb3, 0xd6, 0x31, 
+  0xb3, 0xac, 0xda, 0xb3, 0xd8, 0x28, 0x04, 0xb0, 0x21, 0xb5, 0x65, 0xb2, 
+  0xb1, 0xa6, 0x3c, 0x33, 0x45, 0xaf, 0xb3, 0x24, 0xd3, 0x1c, 0x85, 0xa5, 
+  0x23, 0xb3, 0x2a, 0x32, 0x20, 0xb4, 0xae, 0x32, 0x20, 0x30, 0xbe, 0x2b, 
+  0x1e, 0x34, 0x0b, 0xb3, 0xd7, 0x2d, 0xb7, 0x25, 0x03, 0xb0, 0xb5, 0xb1, 
+  0x49, 0xad, 0xa1, 0xb0, 0xf5, 0x31, 0x7e, 0xb0, 0x65, 0x2b, 0x9a, 0x29, 
+  0x4e, 0xb0, 0x0b, 0x31, 0x2d, 0xb2, 0x14, 0xb4, 0xb8, 0xaf, 0xf0, 0x2c, 
+  0x83, 0x33, 0xbc, 0xaa, 0x21, 0x33, 0xd3, 0xa4, 0xc5, 0x30, 0x0d, 0x31, 
+  0xb9, 0x2a, 0x13, 0x31, 0x45, 0xa3, 0x53, 0x29, 0xa8, 0x25, 0x51, 0xad, 
+  0x3d, 0xab, 0xe9, 0xb0, 0x7e, 0xb3, 0x16, 0x30, 0x85, 0xb2, 0xa9, 0xa4, 
+  0x02, 0xb2, 0x9d, 0x2d, 0xe6, 0x2c, 0x0b, 0x2a, 0xc6, 0xb1, 0xe8, 0x30, 
+  0x8d, 0x33, 0xe1, 0x2f, 0x0a, 0xb2, 0x7a, 0xae, 0xc3, 0xb0, 0x17, 0x31, 
+  0xd7, 0x2b, 0x10, 0x30, 0xff, 0xaa, 0x6a, 0x28, 0xcb, 0x2f, 0x81, 0x33, 
+  0x4a, 0xb1, 0x6f, 0x23, 0x1b, 0x32, 0x8b, 0xb0, 0xdb, 0x35, 0xc9, 0x2e, 
+  0xac, 0xb4, 0xb5, 0x31, 0x51, 0xb1, 0xc7, 0xb3, 0xfc, 0x25, 0x0e, 0x32, 
+  0x52, 0xe9, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x40, 0x01, 0x00, 0x00, 
+  0x76, 0xac, 0x9f, 0x31, 0xea, 0x27, 0xee, 0x37, 0x04, 0x2c, 0x73, 0xae, 
+  0xe5, 0xb2, 0x30, 0x38, 0x99, 0xb0, 0xcc, 0xa7, 0x21, 0x32, 0x89, 0x38, 
+  0x94, 0xb0, 0x66, 0x32, 0x9d, 0x32, 0x1e, 0x39, 0xe8, 0xb2, 0x2d, 0x2d, 
+  0x1c, 0x2e, 0xdf, 0x38, 0xff, 0x2d, 0xcf, 0xac, 0x2d, 0x30, 0x48, 0x31, 
+  0x5e, 0xb0, 0xc2, 0xb1, 0x21, 0xb0, 0x8d, 0xb5, 0xaf, 0xa6, 0x6d, 0xb1, 
+  0x7e, 0x34, 0x98, 0xb5, 0xfe, 0xa6, 0x89, 0xb5, 0xb2, 0xb0, 0xeb, 0xb5, 
+  0xde, 0x2f, 0x0a, 0x30, 0x31, 0xb2, 0x09, 0x2c, 0xfd, 0xaf, 0xe7, 0xb1, 
+  0x8a, 0xb2, 0xed, 0x2f, 0x2d, 0x1d, 0x4c, 0x33, 0x07, 0xb1, 0x76, 0x34, 
+  0x46, 0xaf, 0x35, 0xb4, 0xfe, 0xa9, 0xf1, 0xae, 0x84, 0xac, 0x5d, 0xb3, 
+  0x9c, 0x31, 0x9e, 0x2c, 0xb1, 0x2d, 0x8d, 0x2d, 0xef, 0xb1, 0xd5, 0x35, 
+  0x90, 0xb4, 0xc0, 0x34, 0x1e, 0xb2, 0x57, 0x25, 0x24, 0x34, 0xa0, 0xae, 
+  0x62, 0x31, 0x62, 0x30, 0x7b, 0xa2, 0xf6, 0x2e, 0xfa, 0x9d, 0xc9, 0x2c, 
+  0xfc, 0xac, 0x80, 0xaf, 0xaa, 0xad, 0xa7, 0xb4, 0xe4, 0x30, 0x57, 0x21, 
+  0xe9, 0x27, 0x0a, 0xa8, 0x20, 0x34, 0xf0, 0x24, 0x03, 0xb4, 0x19, 0x30, 
+  0x39, 0x35, 0x26, 0xb2, 0x76, 0xb0, 0xc5, 0xab, 0x72, 0x32, 0xe3, 0x31, 
+  0xd5, 0x31, 0x8c, 0xb4, 0x6e, 0x35, 0x22, 0x34, 0xd0, 0x31, 0x2f, 0x2e, 
+  0xb2, 0x34, 0x0c, 0x25, 0x8f, 0xac, 0xb2, 0xb4, 0x4d, 0xb3, 0x16, 0x30, 
+  0x72, 0x34, 0x23, 0x28, 0xb1, 0xaf, 0x1c, 0xb4, 0xc7, 0xae, 0xd5, 0x2c, 
+  0x74, 0x30, 0xd1, 0x34, 0x9d, 0xb3, 0x19, 0x34, 0x1e, 0x2c, 0xe1, 0x33, 
+  0x3b, 0xaa, 0x3b, 0x2a, 0x98, 0xab, 0x69, 0x32, 0xbd, 0x30, 0x9b, 0xb2, 
+  0x7f, 0xb7, 0xfa, 0xb0, 0x4d, 0x2f, 0x5a, 0xb5, 0xa0, 0xb3, 0xe3, 0xa9, 
+  0x9d, 0xa5, 0xf9, 0x31, 0xda, 0xae, 0x45, 0x2d, 0x60, 0xaa, 0x18, 0xb1, 
+  0xa4, 0xb7, 0xc1, 0xb0, 0x9d, 0x32, 0x72, 0x32, 0x03, 0xb8, 0x5d, 0xb5, 
+  0x74, 0xb1, 0x9e, 0x9b, 0x1d, 0xb4, 0x69, 0x34, 0x3d, 0x34, 0xec, 0x35, 
+  0x84, 0x1a, 0x8f, 0xb3, 0x7f, 0xb3, 0x9b, 0x2b, 0x31, 0xaf, 0xcc, 0x15, 
+  0x9d, 0x18, 0x49, 0xaf, 0x74, 0xb1, 0x9f, 0x2d, 0x0b, 0x34, 0xb0, 0x34, 
+  0xc4, 0xb4, 0x97, 0xb4, 0xd4, 0x32, 0x79, 0xab, 0x9e, 0xea, 0xff, 0xff, 
+  0x04, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x27, 0xb7, 0x3c, 0x36, 
+  0x29, 0xb9, 0x50, 0xb5, 0x4a, 0xbc, 0xc4, 0x38, 0xa9, 0xb8, 0x2e, 0xb9, 
+  0xba, 0xea, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x80, 0x13, 0x00, 0x00, 
+  0x78, 0x30, 0xaa, 0xa8, 0x54, 0x2e, 0x4f, 0xb0, 0xb3, 0xad, 0xc4, 0x2b, 
+  0xb9, 0xad, 0x2d, 0xaa, 0xa3, 0xa9, 0xfc, 0x2c, 0x71, 0x27, 0x22, 0xa8, 
+  0x76, 0x2c, 0xd6, 0xa7, 0x6c, 0x28, 0x28, 0x2d, 0xeb, 0x25, 0xc3, 0x2d, 
+  0x7a, 0x20, 0x20, 0xb0, 0x03, 0x20, 0xfe, 0xa3, 0x00, 0x31, 0x81, 0x2c, 
+  0x49, 0x28, 0xa7, 0x30, 0xf7, 0x9a, 0xb9, 0xa7, 0x30, 0x30, 0xda, 0x2c, 
+  0x7e, 0xa0, 0xbc, 0xa6, 0xf2, 0xa7, 0x9c, 0x9b, 0x71, 0x2c, 0x71, 0xb0, 
+  0xcf, 0xa7, 0xee, 0xa9, 0x99, 0x2a, 0x9c, 0x27, 0x36, 0x2c, 0xbe, 0xa6, 
+  0x24, 0x30, 0xc2, 0xa7, 0x66, 0xae, 0x61, 0x1b, 0xa0, 0x28, 0x40, 0x2b, 
+  0x13, 0x25, 0x64, 0xac, 0x3a, 0x2c, 0x21, 0x30, 0x1d, 0xa3, 0x19, 0xa8, 
+  0x96, 0x2f, 0x3c, 0x28, 0x4c, 0xac, 0x1d, 0x19, 0x72, 0x2d, 0xbd, 0x2e, 
+  0x92, 0x2f, 0x5e, 0xaa, 0x20, 0xa8, 0x25, 0x30, 0x97, 0x2c, 0x49, 0x1d, 
+  0x9a, 0x2f, 0x5b, 0xab, 0x7e, 0xac, 0x99, 0xae, 0x2f, 0xa8, 0xe9, 0x21, 
+  0xb2, 0x2f, 0xa5, 0x2f, 0x53, 0x30, 0x28, 0x29, 0x71, 0x21, 0x0f, 0xad, 
+  0x81, 0x30, 0xfd, 0xac, 0x3d, 0x2d, 0xeb, 0x28, 0x02, 0xae, 0xd0, 0x2b, 
+  0x91, 0x2e, 0xb0, 0xaf, 0xcb, 0x2a, 0x92, 0xab, 0xd5, 0x2f, 0xf9, 0x26, 
+  0x1e, 0x8e, 0x9d, 0xa9, 0xbb, 0xae, 0x87, 0x2e, 0xc3, 0x2f, 0x80, 0x24, 
+  0xff, 0x2e, 0xc9, 0x2f, 0x25, 0x2e, 0x27, 0x2b, 0x85, 0xad, 0x62, 0x30, 
+  0xcd, 0xad, 0xcd, 0x20, 0x3b, 0xb0, 0x88, 0xa9, 0x3e, 0x31, 0x42, 0x2c, 
+  0xe9, 0x2e, 0x79, 0x30, 0x3a, 0x26, 0x00, 0x2c, 0xb4, 0xa6, 0x20, 0x2c, 
+  0xf0, 0xa9, 0xc0, 0xac, 0x74, 0xae, 0x2e, 0xa8, 0xee, 0x2b, 0x5a, 0x26, 
+  0x85, 0xad, 0x56, 0x26, 0xa5, 0x29, 0x78, 0x2a, 0x68, 0x2c, 0x67, 0x9d, 
+  0x93, 0x28, 0x37, 0x25, 0xd7, 0x2e, 0xcc, 0xab, 0x58, 0x10, 0xb5, 0x29, 
+  0x72, 0xa8, 0x08, 0xb0, 0xde, 0x2c, 0x61, 0x2f, 0xd4, 0x21, 0xb8, 0x2c, 
+  0x2e, 0xa9, 0x04, 0xb0, 0x1d, 0x27, 0x75, 0xac, 0x00, 0xaf, 0x06, 0x25, 
+  0x2d, 0x2e, 0x9f, 0x99, 0x77, 0xaa, 0x37, 0xae, 0xff, 0x2f, 0x7b, 0x2d, 
+  0x59, 0x2b, 0xbf, 0x18, 0x49, 0xac, 0xc9, 0x2d, 0x51, 0x1c, 0x0d, 0x2e, 
+  0xe4, 0xa4, 0x67, 0xa1, 0xd1, 0xa9, 0xe9, 0xab, 0xaf, 0xad, 0xdf, 0xa3, 
+  0x6b, 0x29, 0x39, 0xb0, 0x3e, 0x9e, 0x78, 0x20, 0x43, 0x2f, 0xff, 0x30, 
+  0xc4, 0xab, 0x50, 0x2d, 0x81, 0x98, 0xcb, 0xa9, 0x9f, 0xa8, 0x8e, 0x29, 
+  0x30, 0xad, 0x5a, 0x31, 0x06, 0x2f, 0x03, 0x2e, 0x5d, 0x24, 0x14, 0xa6, 
+  0x53, 0x2e, 0x3f, 0x2d, 0x16, 0x2c, 0x4c, 0x30, 0x4c, 0x2c, 0x76, 0x30, 
+  0x99, 0x2d, 0x2a, 0xa8, 0x50, 0x30, 0x57, 0x26, 0xf9, 0xaf, 0x78, 0xa9, 
+  0xf7, 0xad, 0xf1, 0xad, 0x64, 0xa9, 0x4f, 0xa9, 0xb1, 0xaa, 0x66, 0x31, 
+  0xc6, 0x2e, 0x26, 0x24, 0xd2, 0xad, 0x2f, 0x28, 0x57, 0x98, 0xbb, 0x2a, 
+  0x39, 0x30, 0x5e, 0x30, 0x96, 0xa0, 0x4a, 0x29, 0x17, 0xaf, 0x46, 0xaf, 
+  0x22, 0x9d, 0x2d, 0x2b, 0xe9, 0x2d, 0xfa, 0x2e, 0x83, 0xac, 0x6a, 0x29, 
+  0x0a, 0x28, 0x46, 0x2c, 0x0e, 0x27, 0x86, 0x2d, 0x20, 0xa8, 0x9f, 0x29, 
+  0xe1, 0x28, 0x85, 0x2d, 0xcf, 0x2b, 0x2c, 0xa3, 0x48, 0x2f, 0x99, 0x2e, 
+  0x5c, 0xae, 0xae, 0x2f, 0x2c, 0x2c, 0xe5, 0xae, 0x43, 0xaa, 0x59, 0xad, 
+  0x40, 0xa5, 0x0f, 0xa8, 0xd9, 0x2f, 0xe0, 0x30, 0xfc, 0xac, 0x26, 0x24, 
+  0x07, 0x2a, 0x5b, 0xac, 0x56, 0x28, 0x51, 0x30, 0x14, 0x2e, 0x81, 0x2f, 
+  0xc0, 0x2c, 0xd7, 0x2c, 0x31, 0x2d, 0x48, 0xb1, 0x89, 0x23, 0x38, 0x2a, 
+  0x98, 0x2e, 0x26, 0x2e, 0x00, 0x2e, 0x19, 0x30, 0xf3, 0x27, 0x68, 0xb2, 
+  0x0d, 0xad, 0xd4, 0x30, 0x0b, 0xa8, 0x9b, 0x30, 0x53, 0x2f, 0x20, 0x2f, 
+  0xd2, 0x2d, 0x0c, 0xb2, 0xbe, 0xaf, 0x50, 0x31, 0xc7, 0xac, 0xf7, 0x31, 
+  0x44, 0xaa, 0xc2, 0x99, 0x14, 0x30, 0x63, 0xa0, 0x52, 0xaa, 0x87, 0x1e, 
+  0x2f, 0xad, 0xef, 0x31, 0x75, 0xac, 0x93, 0xa8, 0x43, 0x30, 0xb3, 0xa9, 
+  0x0e, 0xb2, 0x20, 0x17, 0x81, 0xad, 0x4a, 0x32, 0xb7, 0x2d, 0x7c, 0xad, 
+  0x18, 0x30, 0xec, 0xb3, 0x83, 0xb0, 0xdf, 0xad, 0x53, 0xaf, 0x62, 0x30, 
+  0xe3, 0xad, 0xfa, 0xa9, 0x9c, 0x32, 0xc3, 0xaf, 0x2c, 0xb1, 0x4e, 0x27, 
+  0xb3, 0x2d, 0x5e, 0x31, 0x14, 0x28, 0x20, 0xac, 0x52, 0x34, 0x3b, 0x36, 
+  0xce, 0xb4, 0xd2, 0x28, 0xe8, 0x24, 0x8e, 0x35, 0xad, 0x33, 0x22, 0x32, 
+  0xc9, 0x2e, 0x7e, 0x07, 0x00, 0x2b, 0x79, 0xac, 0x32, 0xae, 0xe1, 0xac, 
+  0x59, 0x2e, 0x15, 0xae, 0xa8, 0x2d, 0x25, 0xaa, 0xd6, 0xa1, 0x49, 0x2a, 
+  0xe8, 0x27, 0x15, 0xaf, 0x5c, 0xa7, 0xae, 0x2d, 0x59, 0x22, 0x12, 0xb0, 
+  0xf2, 0x26, 0x16, 0xaf, 0x33, 0x14, 0xeb, 0x2d, 0x23, 0xac, 0x78, 0xb0, 
+  0x00, 0x30, 0xfb, 0xab, 0x33, 0x28, 0x5d, 0x9e, 0x43, 0x2d, 0x0d, 0xae, 
+  0xbd, 0xad, 0x11, 0x21, 0xd0, 0xa4, 0xeb, 0x2c, 0x12, 0x2c, 0xb1, 0xae, 
+  0xbd, 0x2b, 0x75, 0x20, 0x71, 0xb1, 0x12, 0xb0, 0xb2, 0xa7, 0x5c, 0xb1, 
+  0x5b, 0xb2, 0x05, 0xb0, 0xca, 0xad, 0x20, 0x9e, 0xa9, 0xae, 0x58, 0xab, 
+  0x49, 0xae, 0xc2, 0xae, 0x22, 0xaf, 0x97, 0xad, 0x2c, 0x2a, 0x89, 0x29, 
+  0x06, 0x2c, 0xb6, 0xb0, 0x70, 0xad, 0x16, 0x24, 0xbf, 0xaf, 0x2e, 0xb0, 
+  0xac, 0x2d, 0xe8, 0xa9, 0x10, 0xa6, 0x5b, 0xaa, 0x02, 0x29, 0xb6, 0xa5, 
+  0xb9, 0xb1, 0x36, 0xa7, 0x4d, 0xad, 0x30, 0x2d, 0xa7, 0x2a, 0x72, 0xa9, 
+  0x19, 0x2b, 0xc2, 0xb0, 0xa8, 0x29, 0x7b, 0xa3, 0xdb, 0xa8, 0x85, 0x2e, 
+  0x7f, 0xad, 0xda, 0xa9, 0xbb, 0x2a, 0xb1, 0x26, 0x39, 0xad, 0xf5, 0xa2, 
+  0x7c, 0xa4, 0x3d, 0xa8, 0xae, 0xaa, 0xb2, 0x25, 0x41, 0x2e, 0x06, 0x2c, 
+  0x22, 0xb1, 0xf9, 0x29, 0x74, 0xad, 0x19, 0xb0, 0xc8, 0xaf, 0x3e, 0xa0, 
+  0x2f, 0xa9, 0x29, 0x2c, 0x40, 0x26, 0x24, 0x2b, 0xa4, 0xad, 0xdc, 0xa9, 
+  0x72, 0xa8, 0xb7, 0xac, 0x34, 0xac, 0x4a, 0x2d, 0x55, 0xb0, 0x82, 0x2f, 
+  0xde, 0xa4, 0xd8, 0x1c, 0xe4, 0x29, 0xca, 0xa5, 0xa2, 0xb0, 0x01, 0x2d, 
+  0x55, 0xac, 0x37, 0x28, 0x5a, 0xaf, 0xe1, 0xac, 0x3b, 0x2c, 0x11, 0x29, 
+  0x15, 0xb1, 0x57, 0xa8, 0x47, 0x26, 0x1a, 0x27, 0x12, 0xae, 0xec, 0x28, 
+  0x52, 0xb3, 0xbe, 0xb0, 0xb6, 0xac, 0xe5, 0x25, 0xfe, 0x2b, 0x26, 0x25, 
+  0xe9, 0x2b, 0x01, 0x30, 0x6d, 0xb1, 0x09, 0xb2, 0xa9, 0x2c, 0x9e, 0x25, 
+  0x70, 0x2d, 0xcf, 0xaf, 0xe8, 0xac, 0xc6, 0xac, 0xae, 0xad, 0xff, 0x2c, 
+  0x5e, 0xae, 0x55, 0x1c, 0x35, 0x2b, 0x75, 0xae, 0xb8, 0x9d, 0x28, 0xb0, 
+  0x8c, 0x95, 0x5a, 0xa0, 0x3e, 0xb0, 0x0b, 0xad, 0x62, 0x2d, 0xc3, 0x25, 
+  0x71, 0x2f, 0xb8, 0xae, 0x33, 0xb1, 0x93, 0xb1, 0xf9, 0xa7, 0x33, 0x25, 
+  0x29, 0xac, 0x57, 0xac, 0x27, 0xac, 0x59, 0x2e, 0x04, 0xae, 0x5e, 0xb0, 
+  0x32, 0x28, 0x57, 0xb0, 0x4d, 0xab, 0x16, 0x26, 0xe7, 0xaa, 0xb5, 0xa7, 
+  0xe7, 0xb0, 0x0c, 0xb2, 0x13, 0xa8, 0xc7, 0xa3, 0xf2, 0x28, 0x56, 0xb0, 
+  0x78, 0xa8, 0x23, 0xa9, 0x40, 0xb0, 0xbd, 0xaf, 0x01, 0xaf, 0x2c, 0xb0, 
+  0x97, 0xae, 0x69, 0xa2, 0xa5, 0xae, 0x1a, 0x2a, 0xc9, 0xb0, 0x55, 0x2b, 
+  0xaf, 0xa7, 0xe1, 0xaa, 0x89, 0xab, 0x3c, 0x24, 0xb1, 0x1d, 0x04, 0xb0, 
+  0xc1, 0xb1, 0x62, 0xb1, 0x1c, 0xb1, 0x3e, 0xaa, 0xcb, 0x2a, 0xb2, 0xa9, 
+  0x87, 0x2d, 0x92, 0x2a, 0x20, 0xac, 0xc9, 0xab, 0x61, 0x28, 0x50, 0xb0, 
+  0xbd, 0x2e, 0x11, 0xb0, 0x18, 0x2d, 0x1f, 0xaf, 0x3e, 0xac, 0x6d, 0xa5, 
+  0x1f, 0xab, 0x42, 0xb1, 0x15, 0x2b, 0xa1, 0xa8, 0xa3, 0x21, 0x07, 0xa2, 
+  0x6d, 0xac, 0xec, 0xb1, 0x15, 0xa0, 0x6a, 0x23, 0x94, 0x2b, 0x8c, 0xac, 
+  0x40, 0x30, 0xdb, 0x29, 0xec, 0xa8, 0x55, 0xb1, 0x72, 0xaa, 0xe7, 0xa8, 
+  0xd7, 0xac, 0xbf, 0x2e, 0xe2, 0xac, 0x05, 0xa5, 0x40, 0xac, 0x14, 0x28, 
+  0xd9, 0xa8, 0x70, 0xb1, 0xd4, 0x9b, 0x0e, 0xb0, 0x2a, 0xae, 0xb8, 0xb1, 
+  0x81, 0xae, 0x9f, 0xa8, 0x6a, 0xad, 0xcc, 0xa0, 0xdf, 0xad, 0xe7, 0x25, 
+  0x65, 0x2d, 0x48, 0xaf, 0x14, 0xae, 0xed, 0x22, 0x62, 0xaf, 0x3f, 0xb1, 
+  0x53, 0xac, 0x89, 0x2e, 0x3b, 0x2e, 0x19, 0x2c, 0xbc, 0xac, 0xb6, 0x2c, 
+  0xe5, 0x27, 0x4c, 0x22, 0xfa, 0xab, 0xbc, 0x2f, 0xa7, 0x20, 0xc8, 0xaf, 
+  0x2b, 0xaf, 0x1b, 0xb0, 0xba, 0xb0, 0x16, 0xb4, 0xb6, 0x2f, 0xcb, 0xa5, 
+  0x76, 0xa1, 0x2c, 0xab, 0x1b, 0xb3, 0x32, 0xad, 0xe5, 0x21, 0xf8, 0xa8, 
+  0x16, 0x29, 0xe4, 0xa8, 0xeb, 0xac, 0x98, 0xa9, 0xb9, 0xae, 0x7b, 0xa6, 
+  0xa7, 0xad, 0x2e, 0xb4, 0x99, 0xac, 0x5c, 0x30, 0xe7, 0x28, 0xcf, 0x2a, 
+  0x04, 0xb2, 0x49, 0xac, 0xcd, 0xac, 0xf3, 0xa9, 0x99, 0x2c, 0x17, 0xac, 
+  0x3f, 0xae, 0x3a, 0xae, 0x5a, 0x9c, 0x47, 0xa8, 0x1d, 0x2c, 0x94, 0xac, 
+  0xff, 0x32, 0x60, 0x26, 0xa2, 0x1f, 0x8b, 0xac, 0x7d, 0xa5, 0x40, 0xac, 
+  0x52, 0x30, 0xfe, 0x11, 0x3b, 0xad, 0x1c, 0x2a, 0xa3, 0x2c, 0x94, 0x2e, 
+  0x38, 0xab, 0xde, 0x2c, 0x48, 0xaa, 0x46, 0x2b, 0xb6, 0xa0, 0xa0, 0xae, 
+  0xee, 0x24, 0x07, 0x2d, 0x16, 0xaa, 0x81, 0x30, 0x56, 0xaa, 0x20, 0x2c, 
+  0x71, 0xa4, 0xb9, 0x29, 0xc5, 0xa7, 0x9a, 0xaa, 0x5d, 0xa7, 0xc3, 0x11, 
+  0xad, 0xa8, 0x30, 0xa4, 0xde, 0x2d, 0xf6, 0x24, 0x33, 0x29, 0x25, 0xa9, 
+  0x10, 0x2c, 0x85, 0x2c, 0xbe, 0xa1, 0x68, 0xac, 0xb7, 0xa9, 0xfb, 0xad, 
+  0xbb, 0x2f, 0x34, 0x20, 0x40, 0x26, 0x30, 0x2f, 0xce, 0x2c, 0xa6, 0xa1, 
+  0x3e, 0x2f, 0x6c, 0x2d, 0xcb, 0xae, 0xb4, 0x2c, 0x06, 0xae, 0xd1, 0x2f, 
+  0x4b, 0x25, 0x2e, 0xac, 0x81, 0xa7, 0xcb, 0x2d, 0x44, 0xb0, 0x89, 0x1d, 
+  0xdd, 0x2b, 0xb4, 0x9c, 0xf2, 0x27, 0x3b, 0xac, 0xab, 0x2b, 0xf9, 0xaa, 
+  0x42, 0xa9, 0xe5, 0x2a, 0x4c, 0x2f, 0xce, 0xab, 0x23, 0xac, 0xfc, 0xab, 
+  0x5c, 0xad, 0x84, 0xaa, 0x27, 0x2d, 0x28, 0x2f, 0xf0, 0x18, 0x8b, 0xa3, 
+  0xf4, 0x24, 0xb1, 0x25, 0x27, 0x9e, 0x0c, 0x2d, 0xd5, 0x2e, 0x62, 0x2a, 
+  0x32, 0xae, 0x64, 0x1e, 0xa1, 0xad, 0x1b, 0x28, 0x16, 0x28, 0x29, 0xb0, 
+  0x46, 0x2e, 0x10, 0xa5, 0x34, 0x22, 0x1a, 0x29, 0xd6, 0xae, 0xec, 0xac, 
+  0x44, 0x2e, 0x1e, 0xb0, 0x08, 0x2e, 0xe9, 0x2f, 0x32, 0x28, 0xd0, 0xaf, 
+  0x4c, 0xa2, 0xbb, 0x2e, 0xe5, 0xae, 0x07, 0x2d, 0x93, 0xae, 0x60, 0x2f, 
+  0xd8, 0x2c, 0xdc, 0xab, 0x50, 0x30, 0x4c, 0xad, 0x10, 0x30, 0x29, 0x2d, 
+  0x54, 0xab, 0x73, 0x2f, 0xb4, 0x2e, 0xfd, 0x2c, 0x0f, 0x25, 0x4b, 0x24, 
+  0x32, 0xad, 0x12, 0xaa, 0x1a, 0xb0, 0x8b, 0x2f, 0xbc, 0xa7, 0x27, 0x20, 
+  0xa5, 0xa8, 0x55, 0xa8, 0x92, 0x30, 0x7b, 0x20, 0xc3, 0x2c, 0xb0, 0x26, 
+  0x5a, 0xad, 0xe5, 0xad, 0x50, 0xad, 0x7b, 0x24, 0xc9, 0xa9, 0x9d, 0xb0, 
+  0x2d, 0x2f, 0x6f, 0x2e, 0xcd, 0x28, 0xe4, 0xa2, 0x8d, 0x2d, 0xff, 0x30, 
+  0xf1, 0x26, 0x2f, 0x28, 0x86, 0xa9, 0x6f, 0x2a, 0x78, 0x2d, 0x71, 0xa9, 
+  0xf0, 0xaa, 0xb4, 0x30, 0x50, 0xae, 0xd0, 0xa9, 0xb6, 0xaa, 0xa2, 0x2c, 
+  0x24, 0x25, 0x8c, 0xa9, 0xbc, 0x2e, 0x2f, 0x28, 0x54, 0x29, 0x1a, 0x14, 
+  0x59, 0xae, 0x65, 0x2e, 0x56, 0x2e, 0x08, 0xae, 0x86, 0x2d, 0x14, 0x18, 
+  0xe9, 0xac, 0x39, 0x2b, 0xdc, 0xa5, 0x25, 0x30, 0x40, 0xa5, 0x33, 0x2f, 
+  0xc8, 0x31, 0xa4, 0x2a, 0x04, 0x32, 0xeb, 0x25, 0x1b, 0xb0, 0xc7, 0x2b, 
+  0xc6, 0xa5, 0x5e, 0x2f, 0x1b, 0x23, 0x07, 0x30, 0x5e, 0xa2, 0x97, 0x27, 
+  0x3b, 0xad, 0x79, 0x2f, 0x41, 0xaf, 0x39, 0x2e, 0x0f, 0x9b, 0x40, 0x29, 
+  0x6c, 0x2f, 0x42, 0x2c, 0x64, 0x1e, 0x05, 0x30, 0xa2, 0x30, 0xed, 0xad, 
+  0x35, 0x31, 0x7a, 0x30, 0x5f, 0xab, 0x5e, 0xac, 0x52, 0xaf, 0xf4, 0x26, 
+  0x0d, 0x2f, 0x67, 0x2c, 0x14, 0x2a, 0x19, 0x2e, 0xbc, 0x2c, 0x3a, 0x2c, 
+  0x21, 0x30, 0x67, 0x30, 0x87, 0x2a, 0x25, 0xac, 0x0f, 0x28, 0x01, 0x2b, 
+  0x02, 0x29, 0x49, 0x2d, 0x34, 0xb0, 0x77, 0xa9, 0x03, 0xb0, 0x49, 0x2b, 
+  0xb7, 0x20, 0x0f, 0xae, 0x30, 0x23, 0xbc, 0x2a, 0xd7, 0x2c, 0xae, 0x2a, 
+  0xd2, 0x25, 0x9e, 0x29, 0xc2, 0xa3, 0x7f, 0x2a, 0xf3, 0x28, 0xea, 0xad, 
+  0xe6, 0x2d, 0x40, 0x2e, 0xd1, 0x2d, 0xdf, 0xae, 0xcb, 0x28, 0x46, 0xae, 
+  0xa2, 0xa8, 0x51, 0xb0, 0x64, 0xab, 0x16, 0x31, 0x50, 0x30, 0x1e, 0x30, 
+  0x1a, 0x24, 0x7c, 0xab, 0xbe, 0x29, 0xd8, 0x2f, 0xa3, 0xa7, 0x71, 0x2d, 
+  0x08, 0x28, 0x6f, 0x2b, 0x6b, 0x2e, 0x49, 0xb1, 0xc5, 0xa3, 0xdb, 0x2c, 
+  0x15, 0x9d, 0x8c, 0xaa, 0x51, 0xa8, 0xd6, 0x2f, 0x84, 0x28, 0x4a, 0x12, 
+  0x79, 0xad, 0x08, 0x2b, 0x2d, 0x9f, 0xad, 0xa8, 0x3e, 0x2d, 0x4e, 0xa9, 
+  0x28, 0x31, 0xbd, 0xb0, 0x2b, 0x2f, 0xd0, 0x30, 0x28, 0x30, 0xaf, 0x31, 
+  0xaf, 0x31, 0xab, 0x2a, 0xf4, 0x2e, 0x13, 0xa8, 0xe1, 0x2a, 0x25, 0x2b, 
+  0x08, 0xaf, 0x05, 0x2c, 0xb7, 0xa0, 0x52, 0xad, 0x55, 0xad, 0x17, 0xb1, 
+  0x13, 0xac, 0x10, 0x28, 0x3c, 0xae, 0x8e, 0x2c, 0xee, 0x2c, 0xe1, 0xaa, 
+  0x1e, 0xad, 0xdc, 0xa2, 0xe8, 0xa9, 0x7f, 0x9f, 0xdc, 0x2f, 0x75, 0x32, 
+  0xe8, 0x2d, 0xb1, 0xae, 0xf5, 0x2a, 0x3b, 0xa7, 0x52, 0xb1, 0x57, 0x25, 
+  0x23, 0xad, 0xdd, 0x30, 0xd4, 0x2e, 0xcc, 0x2f, 0xea, 0x2b, 0xe3, 0x35, 
+  0x8f, 0xb4, 0x57, 0x31, 0x58, 0x2d, 0x83, 0x35, 0xc9, 0x30, 0x34, 0xa5, 
+  0x70, 0xad, 0x9b, 0x18, 0x02, 0x30, 0x49, 0xa8, 0x9a, 0xae, 0x98, 0x2b, 
+  0x92, 0xaa, 0xd4, 0xaa, 0xec, 0x28, 0xf1, 0x28, 0x30, 0x30, 0xfd, 0xad, 
+  0x09, 0xae, 0x03, 0xb0, 0xba, 0x24, 0xed, 0xa8, 0x55, 0x2d, 0xd6, 0x2c, 
+  0xa7, 0x21, 0x86, 0xa9, 0xd7, 0xaf, 0x6c, 0xae, 0x8b, 0x1f, 0x21, 0xad, 
+  0x00, 0x2b, 0x2d, 0x2e, 0x31, 0xaa, 0x10, 0x20, 0x5a, 0xae, 0x41, 0x2e, 
+  0x75, 0x9b, 0xe2, 0x2d, 0x2d, 0x30, 0x27, 0x9f, 0xb7, 0x2f, 0x94, 0x29, 
+  0x79, 0x2f, 0x83, 0x31, 0x97, 0x2b, 0x25, 0x30, 0x2e, 0xa8, 0x0f, 0x28, 
+  0xb3, 0x2c, 0x48, 0x2d, 0xc2, 0x28, 0x95, 0xa9, 0xe1, 0xa2, 0x8d, 0xab, 
+  0x84, 0x2d, 0x32, 0x2c, 0x57, 0xae, 0x96, 0xac, 0x94, 0x2d, 0x7e, 0xa7, 
+  0x77, 0x29, 0x45, 0x2c, 0x01, 0x2d, 0xcf, 0xb0, 0x9c, 0xad, 0x6d, 0x25, 
+  0x27, 0xaf, 0x0e, 0xac, 0xa4, 0x30, 0x62, 0x25, 0xfa, 0x2c, 0x63, 0xac, 
+  0x97, 0xa7, 0xb1, 0xab, 0xaa, 0x2c, 0x25, 0x30, 0x61, 0xa8, 0xda, 0xa9, 
+  0xa5, 0xac, 0x11, 0x2e, 0x45, 0x31, 0x46, 0x22, 0x11, 0x2e, 0x77, 0xad, 
+  0x68, 0x30, 0xda, 0xaa, 0xa5, 0xa8, 0x41, 0x30, 0xa4, 0x28, 0x5e, 0xac, 
+  0xe5, 0xa9, 0x97, 0xa8, 0x17, 0x2d, 0x14, 0x24, 0x0b, 0x2f, 0xcf, 0xaa, 
+  0x70, 0x25, 0xd1, 0xaf, 0xd0, 0xac, 0xbc, 0x2e, 0x62, 0xad, 0xa3, 0xac, 
+  0x86, 0x2b, 0x1c, 0x2e, 0x71, 0x1c, 0x68, 0x2e, 0x74, 0xad, 0x56, 0xaa, 
+  0x01, 0xa7, 0x4e, 0x2a, 0x61, 0xb0, 0x91, 0xad, 0xd4, 0xa2, 0xc7, 0xad, 
+  0x4f, 0x28, 0x2b, 0xac, 0xcf, 0x24, 0x93, 0x2e, 0xca, 0x19, 0x43, 0xa4, 
+  0xd0, 0x20, 0x28, 0x28, 0xc4, 0xa8, 0x49, 0x26, 0x7c, 0x26, 0xf7, 0x2d, 
+  0xf2, 0xad, 0xdd, 0x2b, 0x5b, 0x2d, 0xa5, 0xb0, 0x67, 0xaa, 0x70, 0x2d, 
+  0x14, 0x2a, 0x75, 0xa5, 0xbf, 0xa2, 0x5d, 0x2a, 0x65, 0x2c, 0xfc, 0xae, 
+  0x56, 0xa3, 0xf8, 0x29, 0x3b, 0x29, 0xd6, 0x1e, 0xef, 0xae, 0xff, 0x2f, 
+  0x05, 0x30, 0x94, 0x2c, 0x40, 0xac, 0xfe, 0xaf, 0xf4, 0x2c, 0x7e, 0x2d, 
+  0xc9, 0xae, 0x79, 0xad, 0x30, 0xa6, 0xc7, 0x19, 0x53, 0xa1, 0x5a, 0x9f, 
+  0x16, 0x29, 0x22, 0xac, 0xfc, 0x2a, 0xe3, 0x30, 0x4c, 0xad, 0x1e, 0xb0, 
+  0x5a, 0x2b, 0xba, 0x28, 0xaf, 0xa9, 0x3c, 0xa3, 0x56, 0x2b, 0x64, 0x31, 
+  0x63, 0x31, 0x3e, 0x21, 0x06, 0xae, 0xb3, 0xac, 0x78, 0xa7, 0x56, 0x31, 
+  0x60, 0xa1, 0x4c, 0x2c, 0xc1, 0x30, 0x81, 0xaf, 0xb3, 0x2f, 0x58, 0x28, 
+  0xd6, 0xad, 0x66, 0x2c, 0xdd, 0x2b, 0x83, 0xa8, 0x70, 0xa2, 0xe7, 0x25, 
+  0x4f, 0xaa, 0x01, 0x2b, 0x86, 0x29, 0xf9, 0x2b, 0xd0, 0x2d, 0x71, 0xae, 
+  0x61, 0x25, 0x85, 0x1f, 0x4a, 0x30, 0x27, 0x2e, 0x03, 0xad, 0x40, 0x2f, 
+  0xb7, 0x2f, 0xa8, 0x2b, 0xf2, 0x32, 0xca, 0xa4, 0x9a, 0xa4, 0xc5, 0xaa, 
+  0x76, 0x2c, 0x1c, 0x2c, 0xd5, 0xa8, 0x3f, 0x31, 0x0c, 0x2b, 0x00, 0xb0, 
+  0xa5, 0x2e, 0x23, 0xa8, 0x63, 0x29, 0xe2, 0xa7, 0xbf, 0x26, 0x6b, 0xac, 
+  0x5e, 0x2b, 0x49, 0x2f, 0x59, 0x30, 0xf1, 0x2d, 0xc2, 0x2a, 0xef, 0x30, 
+  0xd1, 0x30, 0xb6, 0x28, 0xd5, 0xa9, 0x6a, 0x2e, 0x3d, 0x24, 0x2f, 0xaa, 
+  0x70, 0xaf, 0xe9, 0x29, 0xe0, 0xad, 0xfa, 0x2b, 0x3d, 0xa8, 0x7a, 0xad, 
+  0xb0, 0x99, 0x73, 0x2f, 0x70, 0xad, 0x92, 0x2d, 0x5c, 0x20, 0xa1, 0xae, 
+  0x80, 0x21, 0x78, 0x9d, 0x85, 0x2a, 0xed, 0x2d, 0x23, 0x2f, 0x92, 0xae, 
+  0xa4, 0x1d, 0xbb, 0x25, 0xde, 0x2f, 0x26, 0x16, 0x81, 0xa6, 0x45, 0x2f, 
+  0x8e, 0xa5, 0x22, 0x30, 0xca, 0x1f, 0x07, 0xb0, 0x91, 0xad, 0x84, 0xaa, 
+  0xb7, 0x25, 0x16, 0x28, 0xdf, 0x1e, 0xdf, 0xa9, 0x79, 0xaf, 0x54, 0x1e, 
+  0x8f, 0xa9, 0xbf, 0x2e, 0x4b, 0x2c, 0x5e, 0x2c, 0x58, 0x30, 0x75, 0x2e, 
+  0xce, 0xac, 0x88, 0xac, 0x80, 0xa8, 0x80, 0xac, 0xd2, 0xac, 0x9d, 0xa6, 
+  0xcd, 0x22, 0xda, 0xac, 0xfb, 0x23, 0x1a, 0xb2, 0xd4, 0xb1, 0xc9, 0xa7, 
+  0x99, 0x2b, 0x8d, 0xaa, 0x70, 0x2f, 0x85, 0xae, 0x28, 0xaa, 0xfb, 0xb3, 
+  0x35, 0xab, 0xa4, 0xa9, 0x61, 0xa4, 0xf3, 0x31, 0x20, 0xa5, 0xfc, 0x2d, 
+  0x82, 0xaa, 0x63, 0xb2, 0x7d, 0xb2, 0x01, 0x31, 0xd6, 0x28, 0xb4, 0x2a, 
+  0xee, 0x2c, 0xa7, 0x9a, 0x55, 0x19, 0x44, 0x97, 0x74, 0xb2, 0xe8, 0x29, 
+  0xdd, 0x20, 0xce, 0x33, 0x08, 0x30, 0x97, 0xab, 0x9f, 0x2f, 0xdf, 0x36, 
+  0x97, 0xb6, 0x56, 0x26, 0x15, 0x30, 0x56, 0x35, 0x4f, 0x33, 0xa3, 0x2a, 
+  0x30, 0xaa, 0xd7, 0xa8, 0x2c, 0x29, 0x78, 0x2c, 0xc7, 0x2f, 0x7d, 0x2d, 
+  0xe6, 0x2b, 0xfa, 0x2e, 0xf5, 0xaa, 0x7a, 0x2c, 0x04, 0xa9, 0x0e, 0x2d, 
+  0x7d, 0xa5, 0xb0, 0x2e, 0x94, 0x2e, 0x3b, 0xa3, 0xe9, 0x2c, 0x6c, 0x29, 
+  0x3b, 0x31, 0x90, 0x2c, 0x58, 0xa7, 0x8a, 0x2c, 0x97, 0x27, 0x6e, 0xa7, 
+  0x95, 0xa5, 0xc3, 0xa1, 0x09, 0xab, 0x65, 0xa8, 0x1a, 0x2c, 0xf1, 0xa8, 
+  0x68, 0xae, 0x48, 0x23, 0xf7, 0x2a, 0x48, 0x25, 0x9e, 0x31, 0x6d, 0xa9, 
+  0x79, 0xa6, 0x5f, 0x2d, 0x32, 0x26, 0x62, 0xac, 0x59, 0x2f, 0xe1, 0x2a, 
+  0x57, 0xa7, 0xf7, 0x2a, 0x9e, 0xaa, 0x89, 0x2d, 0x20, 0xb0, 0x81, 0xae, 
+  0xf4, 0xa2, 0xc9, 0x27, 0xc8, 0x31, 0x54, 0xaf, 0xab, 0x29, 0xf6, 0x95, 
+  0x17, 0xae, 0x2c, 0xae, 0x6c, 0x27, 0x1a, 0xab, 0x18, 0xad, 0x52, 0x2d, 
+  0xc8, 0x28, 0xce, 0x2c, 0x7e, 0xa8, 0xfb, 0x2d, 0x23, 0x27, 0x12, 0xac, 
+  0x6a, 0xac, 0x8f, 0xb0, 0xdb, 0xae, 0x55, 0x2e, 0x96, 0x9f, 0xfc, 0xa8, 
+  0x0d, 0x2a, 0x35, 0xa4, 0x2e, 0x9e, 0x96, 0x29, 0xdd, 0x23, 0x6b, 0x29, 
+  0xff, 0x27, 0x25, 0xae, 0xee, 0x9c, 0x4b, 0xac, 0x3d, 0x1e, 0xcd, 0xae, 
+  0x97, 0x2c, 0xa6, 0xb0, 0xf9, 0x2c, 0x91, 0xad, 0x09, 0xb0, 0x94, 0xb0, 
+  0xee, 0x2c, 0x1c, 0xa6, 0x3a, 0x25, 0xa7, 0xae, 0x3e, 0x27, 0x2c, 0xa2, 
+  0x7a, 0x2d, 0x21, 0xab, 0x05, 0xa8, 0xf6, 0xb0, 0x83, 0xae, 0x8d, 0xaf, 
+  0x22, 0x2a, 0x36, 0xa3, 0x11, 0xb0, 0xc0, 0xaf, 0x0c, 0xac, 0x6f, 0xac, 
+  0x0a, 0xae, 0xb5, 0x2e, 0x61, 0xa7, 0x17, 0x30, 0x79, 0xae, 0x3d, 0xa9, 
+  0xba, 0xab, 0xf1, 0xb0, 0x9f, 0x90, 0xa1, 0x30, 0x9a, 0x24, 0xb8, 0xac, 
+  0x8b, 0x2b, 0x45, 0x2d, 0xea, 0xac, 0xc4, 0x14, 0x6d, 0xab, 0x51, 0x28, 
+  0x21, 0x2d, 0xc8, 0xac, 0x1d, 0xa9, 0xb1, 0x27, 0x66, 0x2d, 0x2e, 0xa8, 
+  0xa7, 0x2f, 0x9c, 0xb0, 0xe8, 0x29, 0xc4, 0xa0, 0x36, 0x24, 0x11, 0xa9, 
+  0x3d, 0xa6, 0x2c, 0xae, 0x85, 0x2d, 0x70, 0xae, 0x81, 0xa8, 0xb2, 0xad, 
+  0xd8, 0xac, 0x78, 0x2c, 0x2d, 0x26, 0x83, 0x19, 0x42, 0x2f, 0x77, 0x22, 
+  0xab, 0xac, 0xc6, 0xa5, 0xac, 0xa6, 0xda, 0xab, 0xfb, 0x20, 0x48, 0x2a, 
+  0x11, 0x25, 0x1b, 0xaf, 0x3d, 0xaa, 0xc7, 0x25, 0x71, 0xa5, 0xdf, 0x24, 
+  0xea, 0x30, 0x5e, 0x2c, 0x75, 0xaf, 0x72, 0xb0, 0x1b, 0xaf, 0xe2, 0xac, 
+  0x76, 0xb3, 0x06, 0xa7, 0xcc, 0xac, 0x0f, 0xb0, 0xa9, 0xa9, 0x52, 0x29, 
+  0xeb, 0xae, 0x7b, 0xaa, 0x4d, 0xa8, 0x31, 0xb4, 0x85, 0x31, 0xf0, 0x2e, 
+  0x92, 0x2e, 0x6e, 0x2a, 0x9e, 0xad, 0x1c, 0x2d, 0x17, 0xaf, 0x04, 0xb2, 
+  0x1b, 0x2e, 0x10, 0x99, 0x97, 0xa2, 0xe8, 0x2a, 0xf3, 0xb0, 0xab, 0x2b, 
+  0x24, 0xb0, 0x9f, 0xb1, 0xf4, 0x2b, 0x4c, 0xac, 0x35, 0x28, 0x11, 0xb1, 
+  0x62, 0xb0, 0x6c, 0x29, 0x4b, 0xb1, 0x1f, 0xb4, 0xdf, 0x32, 0xd8, 0x2c, 
+  0x2d, 0x30, 0xc0, 0x2c, 0xc6, 0xb0, 0x4d, 0xa7, 0x2a, 0xb4, 0x90, 0xb2, 
+  0x8b, 0x2c, 0xa8, 0xb0, 0x8c, 0x2c, 0xa8, 0x29, 0xd4, 0xa8, 0xd0, 0x29, 
+  0x3f, 0xaf, 0x1b, 0xb4, 0xd3, 0x32, 0xa1, 0x2a, 0x25, 0x30, 0x28, 0xb1, 
+  0x4c, 0xb2, 0x37, 0xb0, 0x0b, 0xb0, 0x32, 0xb4, 0xdb, 0x31, 0x76, 0x2d, 
+  0x6c, 0x2d, 0x0c, 0xb0, 0x4a, 0xad, 0x13, 0x2c, 0x87, 0xab, 0x57, 0xb3, 
+  0x0d, 0x31, 0xcd, 0xa4, 0x7f, 0xad, 0x9f, 0xa0, 0x30, 0x2b, 0x34, 0xb1, 
+  0x8c, 0xa7, 0xc4, 0xb1, 0xff, 0x31, 0x18, 0x31, 0xa5, 0x2c, 0x67, 0xaa, 
+  0x2e, 0xb1, 0xd5, 0x95, 0xbf, 0x2d, 0x83, 0xb0, 0x1f, 0x31, 0x13, 0x30, 
+  0x10, 0x2a, 0x8e, 0xa5, 0xa2, 0x29, 0x10, 0x2a, 0x1e, 0x2f, 0xfc, 0xac, 
+  0x4a, 0x30, 0x8d, 0xa9, 0xe7, 0xae, 0xbc, 0xb0, 0x54, 0x2b, 0x35, 0xac, 
+  0xc7, 0x2d, 0x82, 0x2d, 0x4f, 0x30, 0xbf, 0x2d, 0x00, 0x2b, 0xcb, 0xac, 
+  0x01, 0xa6, 0x73, 0xa2, 0x2e, 0x2b, 0xdb, 0x2e, 0x25, 0xaf, 0x32, 0x31, 
+  0x00, 0xb0, 0x37, 0x28, 0xec, 0x19, 0xd4, 0xac, 0xfd, 0x2e, 0x61, 0x34, 
+  0x8a, 0xb3, 0x5b, 0x28, 0x31, 0xb0, 0x89, 0xb3, 0x0d, 0x34, 0x08, 0x31, 
+  0x86, 0x30, 0x9f, 0x37, 0x59, 0xb5, 0xa3, 0x28, 0x62, 0xaf, 0x16, 0xad, 
+  0x28, 0x34, 0xc2, 0x2c, 0x09, 0x32, 0xad, 0x39, 0x96, 0xb8, 0xd5, 0xa1, 
+  0x52, 0xa7, 0x19, 0xad, 0xbd, 0x34, 0x60, 0x33, 0x1a, 0x33, 0x40, 0x3c, 
+  0x34, 0xba, 0x40, 0xa8, 0x4b, 0x25, 0xcb, 0xb3, 0x56, 0x30, 0x0f, 0x31, 
+  0x4f, 0x31, 0x38, 0x96, 0x43, 0x2d, 0xce, 0xa5, 0x65, 0x2c, 0x9b, 0x2b, 
+  0x5c, 0x30, 0x67, 0x29, 0xe1, 0x29, 0xad, 0x2c, 0x41, 0x2c, 0x3e, 0xae, 
+  0xe6, 0x2d, 0x4b, 0xad, 0x32, 0xad, 0x31, 0x27, 0xa1, 0x24, 0x1f, 0x2c, 
+  0xbd, 0x2f, 0xa6, 0x2d, 0x58, 0x30, 0x9c, 0xad, 0x3a, 0xa8, 0x54, 0x30, 
+  0x74, 0x2f, 0xec, 0xa0, 0x23, 0xaa, 0xe4, 0x2a, 0x18, 0xa5, 0xc8, 0x9c, 
+  0xec, 0xa9, 0x93, 0x30, 0x0b, 0x2e, 0x81, 0x2e, 0x1a, 0x2f, 0x86, 0xa6, 
+  0x04, 0x28, 0x0b, 0xb0, 0xdc, 0xaa, 0xd9, 0x32, 0xa2, 0x1f, 0x77, 0x2c, 
+  0x91, 0x2a, 0x62, 0x2f, 0x3e, 0xa7, 0x1b, 0x2d, 0x04, 0x28, 0xd9, 0x31, 
+  0xb3, 0x31, 0xf4, 0x9b, 0x68, 0x2f, 0xfe, 0x2e, 0x3b, 0x30, 0x1c, 0x2b, 
+  0xf3, 0x2e, 0x8e, 0xa9, 0x3e, 0xa5, 0x21, 0x2d, 0xf8, 0x2b, 0x06, 0xab, 
+  0xfb, 0xad, 0x8a, 0xad, 0x38, 0x2e, 0xae, 0x2f, 0x0b, 0x2c, 0xbb, 0x2c, 
+  0x3a, 0x2d, 0x82, 0x2c, 0x05, 0x2c, 0x7e, 0xa8, 0x41, 0x2e, 0x70, 0x9c, 
+  0x51, 0x32, 0x9a, 0x29, 0x78, 0x2e, 0x49, 0xac, 0x07, 0xb0, 0xbf, 0x2e, 
+  0x9f, 0x30, 0xe2, 0xa7, 0x26, 0x2e, 0x7b, 0x31, 0xfb, 0x2f, 0x30, 0xae, 
+  0x5c, 0xa7, 0x59, 0x2e, 0xdc, 0xad, 0xcb, 0xa2, 0xc0, 0xab, 0x92, 0x2d, 
+  0x6e, 0x30, 0x2b, 0x28, 0x3a, 0x25, 0x71, 0xa5, 0xcf, 0x30, 0xbb, 0x2c, 
+  0x2b, 0x28, 0x92, 0x2f, 0x99, 0x28, 0xa1, 0xa4, 0x4c, 0x2f, 0x53, 0x30, 
+  0xa9, 0x2a, 0x47, 0x25, 0xd3, 0xa5, 0xf1, 0x2d, 0x7c, 0x31, 0xc5, 0x20, 
+  0xc6, 0x2d, 0x39, 0xab, 0x48, 0x31, 0xf5, 0xaa, 0xd3, 0x2e, 0xa9, 0x2d, 
+  0x11, 0x31, 0x44, 0x2f, 0x50, 0xae, 0xc8, 0xac, 0x5e, 0x2f, 0x72, 0x30, 
+  0x09, 0x2f, 0xbe, 0x24, 0x7c, 0x2b, 0xb8, 0xac, 0x0a, 0xa4, 0x81, 0xaa, 
+  0x0f, 0x31, 0x05, 0x2b, 0x8f, 0x9e, 0x2e, 0x2c, 0xb8, 0x31, 0x54, 0x0e, 
+  0x80, 0xaf, 0x97, 0xa8, 0xdf, 0x2d, 0x2c, 0x2f, 0xdd, 0xaa, 0xa5, 0xad, 
+  0x29, 0x32, 0xf9, 0xab, 0xd3, 0xab, 0x71, 0x29, 0x78, 0x2d, 0xfe, 0x31, 
+  0x84, 0x2b, 0xcf, 0x2f, 0xfe, 0x26, 0xf5, 0xac, 0xbd, 0xa7, 0xda, 0x2b, 
+  0x6a, 0x24, 0x0a, 0x32, 0xf7, 0xa3, 0x9f, 0x2f, 0xcc, 0x28, 0x93, 0x2b, 
+  0x41, 0xad, 0x52, 0xab, 0xaf, 0x27, 0x42, 0x2d, 0xfc, 0x2e, 0x3a, 0x11, 
+  0x9f, 0x27, 0x6c, 0xab, 0x0e, 0x26, 0x9c, 0x2a, 0x0e, 0xa1, 0x6a, 0xa7, 
+  0x3d, 0x25, 0x42, 0xae, 0x03, 0x30, 0xa8, 0xb0, 0x21, 0x2c, 0xce, 0x1d, 
+  0xb4, 0xaa, 0x3a, 0x25, 0xac, 0x2b, 0x7a, 0x31, 0x9a, 0x32, 0x26, 0x2b, 
+  0xc8, 0xa6, 0xe5, 0x29, 0x7e, 0xa2, 0x23, 0x32, 0x89, 0x30, 0xe1, 0x2e, 
+  0x83, 0x32, 0xe2, 0xae, 0xe2, 0xaf, 0xf7, 0xaf, 0x18, 0x30, 0x59, 0x30, 
+  0x5f, 0x2d, 0x06, 0xa9, 0x2f, 0x24, 0x4d, 0xa6, 0x69, 0xa9, 0x56, 0xa8, 
+  0x35, 0x30, 0x44, 0x30, 0x7b, 0x2e, 0xa9, 0xae, 0x52, 0x31, 0x73, 0x2c, 
+  0xe7, 0xab, 0x32, 0xb0, 0x96, 0xa5, 0x8c, 0x2b, 0x5c, 0x31, 0xfa, 0xa7, 
+  0x38, 0x33, 0xb3, 0x2e, 0xbc, 0xaa, 0x0a, 0x2c, 0x7e, 0x9b, 0x0b, 0x2d, 
+  0xae, 0x2a, 0xa7, 0x23, 0x5c, 0x28, 0xa8, 0xae, 0xd1, 0xa8, 0xcd, 0xaa, 
+  0xf9, 0x30, 0xae, 0x94, 0x2f, 0x28, 0xe4, 0x28, 0x77, 0x31, 0x67, 0x2c, 
+  0x84, 0xab, 0x9a, 0xa3, 0xa7, 0xaa, 0xba, 0x2e, 0xc7, 0xa7, 0xd7, 0x30, 
+  0x86, 0x32, 0xb3, 0x2d, 0xf7, 0xa7, 0x63, 0x28, 0x91, 0x31, 0x71, 0x29, 
+  0xf0, 0x25, 0xf5, 0x0f, 0x70, 0x32, 0xce, 0xa9, 0xfe, 0x27, 0x6c, 0xac, 
+  0x54, 0x30, 0x69, 0x2f, 0x3b, 0xa2, 0x91, 0x23, 0xf1, 0x2e, 0xc1, 0xb1, 
+  0x50, 0x2f, 0xac, 0x29, 0x99, 0xaa, 0x6f, 0xa5, 0x6a, 0xac, 0x58, 0xa1, 
+  0x3b, 0x31, 0xc4, 0x28, 0xa2, 0x20, 0x0d, 0xa8, 0xbf, 0x2c, 0x42, 0x30, 
+  0x8f, 0x29, 0x8d, 0x31, 0x26, 0x2f, 0x7c, 0xaf, 0x36, 0x2e, 0x2a, 0xa0, 
+  0x0e, 0x30, 0xd5, 0x26, 0x7f, 0x11, 0x76, 0x33, 0xb5, 0x31, 0xa5, 0x28, 
+  0x51, 0xaa, 0x98, 0xa0, 0xa2, 0xa7, 0x87, 0x2e, 0x74, 0xae, 0x4a, 0x34, 
+  0xb3, 0x31, 0xa6, 0x2e, 0x1e, 0xac, 0xab, 0xb2, 0xf4, 0x2c, 0x69, 0x28, 
+  0xa7, 0xb0, 0xc2, 0x32, 0xfa, 0x33, 0xba, 0x13, 0x65, 0x2c, 0xa7, 0xa9, 
+  0xef, 0x30, 0xa8, 0x26, 0x00, 0xa0, 0xaf, 0x2e, 0xb2, 0x36, 0x2b, 0xaf, 
+  0xd7, 0x2a, 0x97, 0xb0, 0x9d, 0x29, 0x6c, 0x31, 0x11, 0xb4, 0xd9, 0xb4, 
+  0x77, 0x38, 0xa6, 0x2b, 0x7e, 0x2a, 0xa5, 0xb1, 0x34, 0xa5, 0xf5, 0x28, 
+  0xcd, 0x2d, 0xa4, 0x2a, 0xbb, 0x2b, 0x23, 0x2e, 0x01, 0xad, 0x50, 0xae, 
+  0xf9, 0xaf, 0xd8, 0xa9, 0x5f, 0xac, 0xee, 0xa6, 0x82, 0xb0, 0x9e, 0x2e, 
+  0x2d, 0x8c, 0xfb, 0xae, 0xcb, 0xac, 0x7e, 0x30, 0xd0, 0x27, 0x8d, 0x2f, 
+  0xe3, 0xad, 0x6b, 0xaa, 0x91, 0xa9, 0x2a, 0x2c, 0x17, 0x9d, 0x7e, 0xa9, 
+  0x04, 0x29, 0x95, 0x32, 0x8f, 0x2c, 0xd0, 0x2a, 0x80, 0x2f, 0xfe, 0x2b, 
+  0xcc, 0xae, 0x12, 0xac, 0x6f, 0x22, 0xa0, 0x2a, 0x9e, 0xac, 0x8b, 0xa8, 
+  0xb5, 0x2d, 0x14, 0x2d, 0x4a, 0x2a, 0xdd, 0x24, 0x80, 0x2f, 0x78, 0x31, 
+  0xc4, 0x29, 0xf4, 0x2c, 0x3d, 0xac, 0xdb, 0xb0, 0x92, 0xac, 0xe4, 0xa1, 
+  0xd8, 0xae, 0x0b, 0x32, 0x00, 0x2f, 0x12, 0x25, 0x02, 0xaf, 0x11, 0xa4, 
+  0x37, 0xa8, 0x19, 0xa5, 0x90, 0xa3, 0x11, 0x30, 0xae, 0x2b, 0x43, 0x30, 
+  0x35, 0xae, 0x61, 0xac, 0xf1, 0x2d, 0xc6, 0x28, 0x30, 0x2a, 0x52, 0x2b, 
+  0xa9, 0xae, 0xab, 0x2e, 0xb4, 0xab, 0x61, 0xaa, 0xb5, 0xa9, 0xc7, 0xae, 
+  0x4b, 0x2d, 0x2f, 0x28, 0x14, 0xac, 0x32, 0xab, 0xf5, 0x2c, 0xdb, 0x9d, 
+  0xb9, 0x99, 0xb4, 0x2f, 0x2d, 0xa5, 0x15, 0x2d, 0xc8, 0x2d, 0x25, 0x25, 
+  0x84, 0x2c, 0xba, 0x27, 0x64, 0x2c, 0xf5, 0xa2, 0xc5, 0x2f, 0xb3, 0x2d, 
+  0x6d, 0xac, 0x6f, 0x22, 0x4a, 0xa6, 0x95, 0x2b, 0xff, 0x23, 0x4c, 0xaa, 
+  0x8a, 0xa8, 0x59, 0x2e, 0x74, 0x28, 0xad, 0xa4, 0xcd, 0xad, 0xb6, 0xb0, 
+  0x7c, 0xaf, 0xa4, 0x2b, 0xec, 0x13, 0x9f, 0x32, 0x13, 0x27, 0x78, 0x29, 
+  0x31, 0x2f, 0xd8, 0x2d, 0x1c, 0xad, 0x49, 0x2a, 0xfd, 0xa9, 0xb5, 0x30, 
+  0x08, 0xa0, 0x95, 0x2d, 0x0b, 0xac, 0x93, 0xa9, 0xbc, 0x1f, 0x72, 0x28, 
+  0xbb, 0xad, 0x62, 0x9e, 0x84, 0xaa, 0x4b, 0xab, 0x9e, 0xac, 0x17, 0xaa, 
+  0x1e, 0x2e, 0x39, 0xad, 0x2a, 0xb0, 0xdd, 0xa9, 0xf0, 0x29, 0x26, 0x27, 
+  0x74, 0xac, 0xf9, 0x25, 0x12, 0xa6, 0xad, 0x21, 0x70, 0xb0, 0x2d, 0xa9, 
+  0x38, 0x31, 0xb2, 0x18, 0x22, 0xa8, 0x1c, 0xa6, 0x63, 0x2b, 0x95, 0x2b, 
+  0xf2, 0xae, 0x2e, 0xae, 0x0e, 0x9d, 0xcd, 0xac, 0xf2, 0x27, 0x8e, 0xa8, 
+  0x34, 0xae, 0xab, 0x2e, 0xa8, 0xb0, 0xac, 0xaf, 0x9f, 0x2d, 0x18, 0x2b, 
+  0xe4, 0x2f, 0xa8, 0xab, 0xcb, 0xae, 0xda, 0x2c, 0x5a, 0xb2, 0x2b, 0xb0, 
+  0x8e, 0x2e, 0xe6, 0xa7, 0xb2, 0x2e, 0x26, 0x29, 0xe0, 0xac, 0x7d, 0xa6, 
+  0xca, 0x2b, 0x00, 0x27, 0x4e, 0x30, 0x66, 0xb0, 0xf3, 0x2c, 0x76, 0xb0, 
+  0x27, 0xa4, 0x01, 0xae, 0x14, 0xb1, 0xbd, 0xa2, 0xfb, 0x30, 0x8f, 0x2d, 
+  0x27, 0xa5, 0x2a, 0x1a, 0xc1, 0xac, 0x48, 0xad, 0x2e, 0x2a, 0x5f, 0xa9, 
+  0xfb, 0xa5, 0xee, 0x28, 0x4a, 0x2e, 0xc4, 0xae, 0x69, 0xb0, 0x27, 0x2a, 
+  0x2d, 0xa7, 0xf4, 0xb0, 0xdc, 0x30, 0xbc, 0xa6, 0xc3, 0x2d, 0xb5, 0x2f, 
+  0x6a, 0xac, 0x7b, 0xa3, 0x2f, 0xaf, 0xd9, 0xb3, 0xe3, 0xa1, 0x3e, 0xaa, 
+  0xd2, 0xac, 0x6d, 0x2d, 0x55, 0xaf, 0x80, 0x28, 0xe6, 0xae, 0x33, 0xb6, 
+  0xb0, 0x29, 0x2c, 0x2e, 0x22, 0x2c, 0xf4, 0x29, 0xea, 0xb3, 0xa2, 0x23, 
+  0xa8, 0xae, 0x0a, 0xb8, 0x28, 0x28, 0x2c, 0xad, 0xce, 0x2e, 0xae, 0x18, 
+  0x28, 0xa7, 0x20, 0xaa, 0x1a, 0xb4, 0x96, 0xb5, 0x7b, 0x31, 0x38, 0xaf, 
+  0x42, 0xa9, 0x78, 0xa8, 0x31, 0xad, 0xdc, 0xb0, 0x2c, 0xb4, 0x02, 0xb9, 
+  0x6b, 0x33, 0x9b, 0x2d, 0x52, 0xa6, 0x41, 0xab, 0xbc, 0xb3, 0xe6, 0xac, 
+  0x07, 0xb3, 0x3e, 0xb8, 0x2c, 0x2c, 0xe4, 0xa6, 0x61, 0xb0, 0xce, 0x2d, 
+  0xc2, 0x20, 0x5d, 0xab, 0xad, 0xac, 0xf9, 0xb7, 0x03, 0x30, 0xf0, 0x2f, 
+  0xe1, 0xae, 0xd7, 0x2d, 0xb6, 0x2c, 0x1e, 0xb2, 0x60, 0x28, 0xc7, 0xb5, 
+  0x3f, 0x2f, 0x35, 0x26, 0x23, 0x28, 0x7f, 0xa4, 0x5c, 0x2c, 0x5a, 0xa6, 
+  0x94, 0x21, 0x65, 0xb2, 0xe6, 0x23, 0x3c, 0xac, 0xfc, 0x1f, 0xad, 0xb0, 
+  0x75, 0x1b, 0x97, 0xac, 0x6a, 0x30, 0x37, 0x2e, 0x08, 0xaf, 0x84, 0x15, 
+  0x88, 0x29, 0xdc, 0xb0, 0x42, 0x30, 0x64, 0xab, 0xcc, 0x30, 0xf4, 0x30, 
+  0xca, 0xb3, 0x2d, 0x30, 0x0e, 0x93, 0xd5, 0xad, 0x47, 0x20, 0x39, 0xa8, 
+  0x34, 0x32, 0x51, 0x38, 0x73, 0xb5, 0xd1, 0x2d, 0x0f, 0x2c, 0xf0, 0xb0, 
+  0x87, 0x34, 0xb6, 0x31, 0x01, 0x34, 0x2d, 0x3a, 0x5c, 0xb7, 0xac, 0x2b, 
+  0xd7, 0x2e, 0xae, 0xb0, 0x37, 0x33, 0xc7, 0x30, 0x09, 0x36, 0x04, 0x3c, 
+  0x67, 0xba, 0x48, 0xaa, 0x4d, 0x2f, 0x56, 0xa9, 0x2a, 0x34, 0x35, 0x2b, 
+  0x1b, 0x21, 0xff, 0xac, 0x61, 0x28, 0x14, 0x1c, 0x47, 0xaf, 0x37, 0xad, 
+  0xb7, 0x27, 0x38, 0x30, 0x00, 0xaa, 0x1f, 0x2c, 0xf8, 0x29, 0x08, 0x2c, 
+  0xbb, 0x2c, 0x94, 0xa2, 0xe4, 0xac, 0x10, 0x31, 0x30, 0xa5, 0xa5, 0x2c, 
+  0x25, 0x2a, 0xc7, 0xa8, 0x5c, 0xb0, 0xba, 0x2d, 0x41, 0x2c, 0xfc, 0xac, 
+  0x7b, 0x21, 0x34, 0x2c, 0x7f, 0x2c, 0xb9, 0xae, 0xa8, 0x28, 0x38, 0xa8, 
+  0xdd, 0xa9, 0x07, 0x30, 0xca, 0xa9, 0x7c, 0xa9, 0x7d, 0x31, 0x26, 0xac, 
+  0x5f, 0xac, 0x2a, 0x2d, 0xb0, 0xac, 0xf7, 0xaa, 0x76, 0x2c, 0x67, 0x26, 
+  0x08, 0xab, 0xe9, 0xa8, 0x30, 0xa3, 0x24, 0x29, 0xca, 0xaf, 0x84, 0xae, 
+  0x1f, 0x2d, 0x45, 0xac, 0x0f, 0x2b, 0x8a, 0xad, 0x8c, 0xaa, 0xe5, 0x26, 
+  0x1e, 0x2f, 0x67, 0x2b, 0x43, 0x28, 0x31, 0x2f, 0x03, 0xa7, 0xe5, 0xa2, 
+  0x18, 0x2d, 0x66, 0x29, 0x0b, 0x2b, 0x4d, 0x28, 0x12, 0x2c, 0xc3, 0xaf, 
+  0xdf, 0xa8, 0x80, 0x9c, 0x68, 0x90, 0x9f, 0xa3, 0x6f, 0xaa, 0xc7, 0x2e, 
+  0x09, 0xae, 0x98, 0x1e, 0x70, 0x2c, 0x8e, 0xa6, 0xed, 0x28, 0x6c, 0x2a, 
+  0x13, 0xae, 0x48, 0x2e, 0x0e, 0x30, 0x17, 0xaf, 0x91, 0x23, 0x72, 0xa5, 
+  0xeb, 0xaa, 0x70, 0x2d, 0xdf, 0x2e, 0x15, 0xab, 0x23, 0x9c, 0x5d, 0x2f, 
+  0x97, 0x24, 0xc5, 0xa8, 0x7b, 0xaf, 0x47, 0x04, 0x71, 0x1e, 0x40, 0xa8, 
+  0x71, 0xac, 0xf0, 0x30, 0xb7, 0x2e, 0x37, 0xb0, 0x39, 0x2d, 0x65, 0xa1, 
+  0x9e, 0xac, 0x23, 0xa6, 0xe0, 0xab, 0x57, 0x2c, 0x57, 0x2e, 0x05, 0x31, 
+  0x36, 0x29, 0xd6, 0x2c, 0x18, 0x30, 0x58, 0xad, 0x71, 0xab, 0xd9, 0x2f, 
+  0xcc, 0x29, 0xb5, 0x2d, 0x42, 0x2e, 0xb7, 0xa8, 0x5b, 0x2b, 0xd8, 0xa1, 
+  0xd1, 0x2f, 0x06, 0x2b, 0x6b, 0x2c, 0x09, 0x2c, 0x18, 0xa7, 0xe3, 0xac, 
+  0x8d, 0x30, 0xcf, 0x30, 0xbb, 0xa8, 0x93, 0x31, 0xc0, 0xa9, 0xaf, 0xb0, 
+  0xe7, 0xac, 0x0a, 0x2e, 0xf6, 0xab, 0x24, 0xab, 0xc6, 0x2c, 0x35, 0x26, 
+  0x1e, 0x30, 0x3f, 0x30, 0x08, 0x24, 0xe7, 0xad, 0x1c, 0xac, 0x5e, 0x23, 
+  0x18, 0x1d, 0x99, 0x29, 0xc9, 0x2f, 0x12, 0x2e, 0xfe, 0x25, 0x38, 0xaa, 
+  0x23, 0xb0, 0x90, 0xaa, 0x3f, 0x2f, 0x1b, 0x32, 0xda, 0xaf, 0xea, 0x15, 
+  0x90, 0xac, 0xc5, 0xa0, 0x60, 0x1c, 0x4e, 0xa9, 0xc6, 0xad, 0x9a, 0x22, 
+  0x61, 0x22, 0xcd, 0x23, 0x34, 0xae, 0x16, 0x2c, 0xe6, 0x24, 0x60, 0x10, 
+  0x56, 0x99, 0xe9, 0xa3, 0xd0, 0x2a, 0x46, 0x2d, 0x27, 0x2e, 0x7d, 0x2e, 
+  0x18, 0xa2, 0x23, 0x30, 0xad, 0x2f, 0xed, 0x29, 0x88, 0x2f, 0xc1, 0xac, 
+  0xef, 0x28, 0x9c, 0x2c, 0x92, 0x2d, 0xa7, 0xac, 0x18, 0x2c, 0xb7, 0x2c, 
+  0x56, 0xa7, 0xf1, 0xaf, 0xfd, 0xaa, 0x36, 0xa5, 0x1c, 0xad, 0x32, 0x2c, 
+  0x2e, 0xae, 0x7f, 0x31, 0x1a, 0x1f, 0xb9, 0x2e, 0x74, 0x27, 0x24, 0xa9, 
+  0xa8, 0x1e, 0x97, 0xa8, 0xb5, 0xab, 0xe5, 0x2e, 0xa4, 0x31, 0x09, 0xad, 
+  0x0f, 0xaf, 0xed, 0xaa, 0x82, 0x26, 0x20, 0xae, 0x2f, 0x2c, 0xf9, 0x2d, 
+  0xb2, 0x31, 0xe4, 0xa7, 0x47, 0xa3, 0xf5, 0x25, 0xc5, 0x1e, 0x2e, 0xae, 
+  0x30, 0x30, 0x6d, 0x2b, 0xd7, 0x9d, 0x51, 0x2d, 0x9d, 0x26, 0x23, 0x27, 
+  0x01, 0xa2, 0x5a, 0xaf, 0x8d, 0xac, 0x7e, 0xaa, 0xed, 0x20, 0x3d, 0x2c, 
+  0x83, 0xaf, 0x6d, 0xb0, 0x0d, 0x2c, 0x9a, 0x24, 0x20, 0x29, 0x54, 0xac, 
+  0xb3, 0x29, 0xd9, 0xa7, 0xeb, 0x28, 0x14, 0xab, 0x6f, 0xae, 0x6b, 0x2d, 
+  0xdd, 0x30, 0xaa, 0x22, 0xd8, 0xab, 0x96, 0x2a, 0x1d, 0xaa, 0x93, 0xaa, 
+  0x83, 0x20, 0x04, 0xad, 0x07, 0x2a, 0x9a, 0xb0, 0xf0, 0xaa, 0x68, 0x28, 
+  0x44, 0x2f, 0x5e, 0xa8, 0x99, 0x2e, 0x09, 0xa1, 0x4c, 0xa8, 0x55, 0xa8, 
+  0xce, 0x25, 0xa3, 0x2e, 0x96, 0xaa, 0x94, 0x2d, 0xe3, 0xa9, 0x5f, 0x2c, 
+  0xa9, 0x2c, 0x93, 0xac, 0xc2, 0x2b, 0x07, 0x31, 0x75, 0x2d, 0x8b, 0xa8, 
+  0xd2, 0xa8, 0xcb, 0xaa, 0x07, 0x29, 0x47, 0xb0, 0x9a, 0xae, 0xc5, 0x31, 
+  0x33, 0x30, 0xa7, 0x30, 0x16, 0xab, 0x8d, 0x2a, 0xe2, 0x2f, 0x65, 0xb1, 
+  0x36, 0xb1, 0xab, 0xa9, 0x7c, 0x28, 0xfe, 0x2c, 0x81, 0x28, 0xff, 0xa9, 
+  0x92, 0x30, 0xcb, 0xa3, 0x10, 0xb4, 0x3c, 0x31, 0xa3, 0x26, 0xac, 0x31, 
+  0x52, 0xaf, 0x06, 0x30, 0x1a, 0x30, 0x1f, 0x2d, 0x56, 0xb5, 0xdd, 0xac, 
+  0x84, 0x2f, 0x28, 0x30, 0x1f, 0xa6, 0xb2, 0x28, 0x63, 0x35, 0xf7, 0x35, 
+  0xbb, 0xb6, 0xcd, 0xac, 0x4c, 0x2d, 0x37, 0x33, 0x21, 0x32, 0x6a, 0x29, 
+  0x46, 0xfe, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x56, 0xfe, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x66, 0xfe, 0xff, 0xff, 
+  0x04, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x38, 0x01, 0x00, 0x00, 
+  0x76, 0xfe, 0xff, 0xff, 0x04, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0xfd, 0xff, 0xff, 0xff, 0x40, 0xea, 0xff, 0xff, 0x44, 0xea, 0xff, 0xff, 
+  0x0f, 0x00, 0x00, 0x00, 0x4d, 0x4c, 0x49, 0x52, 0x20, 0x43, 0x6f, 0x6e, 
+  0x76, 0x65, 0x72, 0x74, 0x65, 0x64, 0x2e, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0e, 0x00, 0x18, 0x00, 0x14, 0x00, 
+  0x10, 0x00, 0x0c, 0x00, 0x08, 0x00, 0x04, 0x00, 0x0e, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0x34, 0x04, 0x00, 0x00, 
+  0x38, 0x04, 0x00, 0x00, 0x3c, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x6d, 0x61, 0x69, 0x6e, 0x00, 0x00, 0x00, 0x00, 0x15, 0x00, 0x00, 0x00, 
+  0xfc, 0x03, 0x00, 0x00, 0xd0, 0x03, 0x00, 0x00, 0xb0, 0x03, 0x00, 0x00, 
+  0x90, 0x03, 0x00, 0x00, 0x70, 0x03, 0x00, 0x00, 0x50, 0x03, 0x00, 0x00, 
+  0x30, 0x03, 0x00, 0x00, 0x10, 0x03, 0x00, 0x00, 0xdc, 0x02, 0x00, 0x00, 
+  0x78, 0x02, 0x00, 0x00, 0x50, 0x02, 0x00, 0x00, 0x10, 0x02, 0x00, 0x00, 
+  0xc8, 0x01, 0x00, 0x00, 0xa0, 0x01, 0x00, 0x00, 0x64, 0x01, 0x00, 0x00, 
+  0x04, 0x01, 0x00, 0x00, 0xc4, 0x00, 0x00, 0x00, 0x9c, 0x00, 0x00, 0x00, 
+  0x60, 0x00, 0x00, 0x00, 0x28, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0xe6, 0xfd, 0xff, 0xff, 0x0c, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x23, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x22, 0x00, 0x00, 0x00, 0x86, 0xfd, 0xff, 0xff, 
+  0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x10, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x28, 0xeb, 0xff, 0xff, 
+  0x01, 0x00, 0x00, 0x00, 0x22, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x21, 0x00, 0x00, 0x00, 0x15, 0x00, 0x00, 0x00, 0x12, 0x00, 0x00, 0x00, 
+  0xba, 0xfd, 0xff, 0xff, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 
+  0x14, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 
+  0x0a, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 
+  0x21, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 
+  0x16, 0x00, 0x00, 0x00, 0x0f, 0x00, 0x00, 0x00, 0x72, 0xfe, 0xff, 0xff, 
+  0x0c, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x1b, 0x00, 0x00, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x76, 0xff, 0xff, 0xff, 
+  0x1c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3b, 0x1c, 0x00, 0x00, 0x00, 
+  0x20, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 
+  0x08, 0x00, 0x04, 0x00, 0x06, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x1e, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xb2, 0xff, 0xff, 0xff, 
+  0x24, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x24, 0x00, 0x00, 0x00, 
+  0x28, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0e, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 
+  0x0e, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x1e, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x1d, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x0e, 0x00, 0x1a, 0x00, 0x14, 0x00, 0x10, 0x00, 0x0c, 0x00, 
+  0x0b, 0x00, 0x04, 0x00, 0x0e, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x37, 0x1c, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x08, 0x00, 0x07, 0x00, 
+  0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x01, 0x00, 0x00, 0x00, 
+  0x1d, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 
+  0x66, 0xff, 0xff, 0xff, 0x0c, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 
+  0x02, 0x00, 0x00, 0x00, 0x1b, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x00, 0x00, 
+  0x0a, 0xff, 0xff, 0xff, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 
+  0x20, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x5c, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 
+  0x1b, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 
+  0x13, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x4e, 0xff, 0xff, 0xff, 
+  0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x34, 0x10, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0xf0, 0xec, 0xff, 0xff, 
+  0x01, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x19, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0a, 0x00, 
+  0x10, 0x00, 0x0c, 0x00, 0x08, 0x00, 0x04, 0x00, 0x0a, 0x00, 0x00, 0x00, 
+  0x0c, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x19, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x18, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0xae, 0xff, 0xff, 0xff, 
+  0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x2c, 0x00, 0x00, 0x00, 
+  0x30, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x14, 0x00, 
+  0x13, 0x00, 0x0c, 0x00, 0x08, 0x00, 0x07, 0x00, 0x0c, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x17, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 
+  0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0e, 0x00, 0x18, 0x00, 0x14, 0x00, 
+  0x10, 0x00, 0x0c, 0x00, 0x0b, 0x00, 0x04, 0x00, 0x0e, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x34, 0x10, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0xb0, 0xed, 0xff, 0xff, 
+  0x01, 0x00, 0x00, 0x00, 0x17, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x3a, 0xff, 0xff, 0xff, 
+  0x08, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x16, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 
+  0x56, 0xff, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x15, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x06, 0x00, 0x00, 0x00, 0x72, 0xff, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00, 
+  0x0c, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x8e, 0xff, 0xff, 0xff, 
+  0x08, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x13, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 
+  0xaa, 0xff, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x12, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x0b, 0x00, 0x00, 0x00, 0xc6, 0xff, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00, 
+  0x0c, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x11, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0xe2, 0xff, 0xff, 0xff, 
+  0x08, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x10, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x0d, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x0a, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x08, 0x00, 0x04, 0x00, 
+  0x0a, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x0f, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x0e, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x23, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x0c, 0x11, 0x00, 0x00, 0xb8, 0x10, 0x00, 0x00, 0x4c, 0x10, 0x00, 0x00, 
+  0xf0, 0x0f, 0x00, 0x00, 0xb0, 0x0f, 0x00, 0x00, 0x60, 0x0f, 0x00, 0x00, 
+  0x0c, 0x0f, 0x00, 0x00, 0xac, 0x0e, 0x00, 0x00, 0x4c, 0x0e, 0x00, 0x00, 
+  0xf0, 0x0d, 0x00, 0x00, 0x94, 0x0d, 0x00, 0x00, 0x48, 0x0d, 0x00, 0x00, 
+  0x74, 0x0c, 0x00, 0x00, 0x94, 0x0b, 0x00, 0x00, 0x2c, 0x0b, 0x00, 0x00, 
+  0xc8, 0x0a, 0x00, 0x00, 0xd4, 0x09, 0x00, 0x00, 0x04, 0x09, 0x00, 0x00, 
+  0xbc, 0x08, 0x00, 0x00, 0x5c, 0x08, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 
+  0xb0, 0x07, 0x00, 0x00, 0x60, 0x07, 0x00, 0x00, 0xe0, 0x06, 0x00, 0x00, 
+  0xec, 0x05, 0x00, 0x00, 0x20, 0x05, 0x00, 0x00, 0xa0, 0x04, 0x00, 0x00, 
+  0xa0, 0x03, 0x00, 0x00, 0xcc, 0x02, 0x00, 0x00, 0x7c, 0x02, 0x00, 0x00, 
+  0x28, 0x02, 0x00, 0x00, 0xd0, 0x01, 0x00, 0x00, 0x70, 0x01, 0x00, 0x00, 
+  0xdc, 0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x9a, 0xef, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x1c, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x34, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 
+  0x01, 0x00, 0x00, 0x00, 0x80, 0xef, 0xff, 0xff, 0x1b, 0x00, 0x00, 0x00, 
+  0x53, 0x74, 0x61, 0x74, 0x65, 0x66, 0x75, 0x6c, 0x50, 0x61, 0x72, 0x74, 
+  0x69, 0x74, 0x69, 0x6f, 0x6e, 0x65, 0x64, 0x43, 0x61, 0x6c, 0x6c, 0x5f, 
+  0x31, 0x3a, 0x30, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0xf2, 0xef, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 
+  0x23, 0x00, 0x00, 0x00, 0x54, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0xff, 0xff, 0xff, 0xff, 0x01, 0x00, 0x00, 0x00, 0xd8, 0xef, 0xff, 0xff, 
+  0x38, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 
+  0x5f, 0x32, 0x2f, 0x4d, 0x61, 0x74, 0x4d, 0x75, 0x6c, 0x3b, 0x73, 0x65, 
+  0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 
+  0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x41, 0x64, 0x64, 
+  0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x6a, 0xf0, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 
+  0x22, 0x00, 0x00, 0x00, 0x6c, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0xff, 0xff, 0xff, 0xff, 0x08, 0x00, 0x00, 0x00, 0x50, 0xf0, 0xff, 0xff, 
+  0x52, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 
+  0x2f, 0x4d, 0x61, 0x74, 0x4d, 0x75, 0x6c, 0x3b, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 
+  0x73, 0x65, 0x5f, 0x31, 0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 0x65, 
+  0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 
+  0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 
+  0x64, 0x64, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0xfa, 0xf0, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 0x1c, 0x00, 0x00, 0x00, 
+  0x21, 0x00, 0x00, 0x00, 0x38, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0xff, 0xff, 0xff, 0xff, 0x38, 0x01, 0x00, 0x00, 0xe0, 0xf0, 0xff, 0xff, 
+  0x1e, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x66, 0x6c, 0x61, 0x74, 0x74, 0x65, 0x6e, 
+  0x5f, 0x31, 0x2f, 0x52, 0x65, 0x73, 0x68, 0x61, 0x70, 0x65, 0x00, 0x00, 
+  0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x38, 0x01, 0x00, 0x00, 
+  0xa6, 0xf1, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 
+  0x34, 0x00, 0x00, 0x00, 0x30, 0xf1, 0xff, 0xff, 0x24, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x66, 0x6c, 0x61, 0x74, 0x74, 0x65, 0x6e, 0x5f, 0x31, 0x2f, 0x52, 
+  0x65, 0x73, 0x68, 0x61, 0x70, 0x65, 0x2f, 0x73, 0x68, 0x61, 0x70, 0x65, 
+  0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0xfa, 0xf1, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x1f, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 
+  0x34, 0x00, 0x00, 0x00, 0x84, 0xf1, 0xff, 0xff, 0x24, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x66, 0x6c, 0x61, 0x74, 0x74, 0x65, 0x6e, 0x5f, 0x31, 0x2f, 0x73, 
+  0x74, 0x72, 0x69, 0x64, 0x65, 0x64, 0x5f, 0x73, 0x6c, 0x69, 0x63, 0x65, 
+  0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x4a, 0xf2, 0xff, 0xff, 
+  0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 
+  0x1e, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x2c, 0x00, 0x00, 0x00, 
+  0xd4, 0xf1, 0xff, 0xff, 0x1c, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x66, 0x6c, 0x61, 
+  0x74, 0x74, 0x65, 0x6e, 0x5f, 0x31, 0x2f, 0x53, 0x68, 0x61, 0x70, 0x65, 
+  0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x46, 0xf2, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x20, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x1d, 0x00, 0x00, 0x00, 
+  0xa8, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 
+  0x27, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x30, 0xf2, 0xff, 0xff, 
+  0x88, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 
+  0x31, 0x5f, 0x32, 0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x42, 0x69, 0x61, 
+  0x73, 0x41, 0x64, 0x64, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 
+  0x74, 0x69, 0x6f, 0x6e, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 
+  0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 
+  0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 
+  0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x00, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x27, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x16, 0xf3, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x1c, 0x00, 0x00, 0x00, 0xd0, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0xff, 0xff, 0xff, 0xff, 0x01, 0x00, 0x00, 0x00, 0x27, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x04, 0xf3, 0xff, 0xff, 0xad, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 
+  0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 0x64, 0x64, 
+  0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 
+  0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 
+  0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x53, 0x71, 0x75, 
+  0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 
+  0x74, 0x69, 0x6f, 0x6e, 0x32, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x27, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x12, 0xf4, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x1b, 0x00, 0x00, 0x00, 0x50, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0xff, 0xff, 0xff, 0xff, 0x01, 0x00, 0x00, 0x00, 0x77, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x00, 0xf4, 0xff, 0xff, 0x2e, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 
+  0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x2f, 
+  0x45, 0x78, 0x70, 0x61, 0x6e, 0x64, 0x44, 0x69, 0x6d, 0x73, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x77, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x8e, 0xf4, 0xff, 0xff, 
+  0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 
+  0x20, 0x00, 0x00, 0x00, 0x1a, 0x00, 0x00, 0x00, 0xa0, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0x77, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x78, 0xf4, 0xff, 0xff, 0x80, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x52, 0x65, 
+  0x6c, 0x75, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 
+  0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 
+  0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 0x64, 0x64, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 
+  0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 
+  0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 
+  0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 
+  0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x00, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x77, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x56, 0xf5, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x19, 0x00, 0x00, 0x00, 0xc4, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0xff, 0xff, 0xff, 0xff, 0x01, 0x00, 0x00, 0x00, 0x77, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x44, 0xf5, 0xff, 0xff, 0xa3, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x52, 0x65, 
+  0x6c, 0x75, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 
+  0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 
+  0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 0x64, 0x64, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 
+  0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 
+  0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 
+  0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 
+  0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 
+  0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x32, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x77, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x46, 0xf6, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x18, 0x00, 0x00, 0x00, 0x50, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0xff, 0xff, 0xff, 0xff, 0x01, 0x00, 0x00, 0x00, 0x68, 0x01, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x34, 0xf6, 0xff, 0xff, 0x2c, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x2f, 0x45, 0x78, 
+  0x70, 0x61, 0x6e, 0x64, 0x44, 0x69, 0x6d, 0x73, 0x00, 0x00, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x68, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0xca, 0xfc, 0xff, 0xff, 
+  0x00, 0x00, 0x00, 0x01, 0x10, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 
+  0x17, 0x00, 0x00, 0x00, 0x2c, 0x00, 0x00, 0x00, 0x98, 0xf6, 0xff, 0xff, 
+  0x1c, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 
+  0x2f, 0x4d, 0x61, 0x74, 0x4d, 0x75, 0x6c, 0x31, 0x00, 0x00, 0x00, 0x00, 
+  0x02, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x38, 0x01, 0x00, 0x00, 
+  0x16, 0xfd, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x10, 0x00, 0x00, 0x00, 
+  0x10, 0x00, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00, 0x2c, 0x00, 0x00, 0x00, 
+  0xe4, 0xf6, 0xff, 0xff, 0x1e, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 
+  0x73, 0x65, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x4d, 0x61, 0x74, 0x4d, 0x75, 
+  0x6c, 0x31, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x62, 0xfd, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x10, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x15, 0x00, 0x00, 0x00, 
+  0x30, 0x00, 0x00, 0x00, 0x30, 0xf7, 0xff, 0xff, 0x22, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x31, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x05, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0xba, 0xfd, 0xff, 0xff, 
+  0x00, 0x00, 0x00, 0x01, 0x10, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x34, 0x00, 0x00, 0x00, 0x88, 0xf7, 0xff, 0xff, 
+  0x24, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 
+  0x31, 0x5f, 0x32, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 
+  0x69, 0x6f, 0x6e, 0x31, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x16, 0xfe, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x10, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x13, 0x00, 0x00, 0x00, 
+  0x28, 0x00, 0x00, 0x00, 0xe4, 0xf7, 0xff, 0xff, 0x1b, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x41, 
+  0x64, 0x64, 0x31, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x5a, 0xfe, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x10, 0x00, 0x00, 0x00, 
+  0x10, 0x00, 0x00, 0x00, 0x12, 0x00, 0x00, 0x00, 0xb0, 0x00, 0x00, 0x00, 
+  0x28, 0xf8, 0xff, 0xff, 0xa3, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 
+  0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 
+  0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 
+  0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x42, 0x69, 0x61, 
+  0x73, 0x41, 0x64, 0x64, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 
+  0x6f, 0x6e, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 
+  0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 
+  0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x53, 0x71, 0x75, 
+  0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 
+  0x6f, 0x6e, 0x31, 0x00, 0x01, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 
+  0x26, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x10, 0x00, 0x00, 0x00, 
+  0x10, 0x00, 0x00, 0x00, 0x11, 0x00, 0x00, 0x00, 0xbc, 0x00, 0x00, 0x00, 
+  0xf4, 0xf8, 0xff, 0xff, 0xad, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 
+  0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x52, 0x65, 0x6c, 0x75, 
+  0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 
+  0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 
+  0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 0x64, 0x64, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x63, 0x6f, 0x6e, 
+  0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x2f, 0x53, 0x71, 0x75, 
+  0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 
+  0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 
+  0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 
+  0x31, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x16, 0x00, 0x18, 0x00, 0x14, 0x00, 0x00, 0x00, 0x10, 0x00, 
+  0x0c, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 
+  0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x10, 0x00, 0x00, 0x00, 
+  0x10, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x44, 0x00, 0x00, 0x00, 
+  0xe4, 0xf9, 0xff, 0xff, 0x37, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 
+  0x73, 0x65, 0x5f, 0x31, 0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 0x65, 
+  0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 
+  0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x2f, 0x42, 0x69, 0x61, 0x73, 0x41, 
+  0x64, 0x64, 0x31, 0x00, 0x01, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 
+  0xbe, 0xfa, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x0f, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 
+  0x44, 0x00, 0x00, 0x00, 0x48, 0xfa, 0xff, 0xff, 0x36, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x2f, 0x52, 0x65, 0x6c, 
+  0x75, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 
+  0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x2f, 0x42, 
+  0x69, 0x61, 0x73, 0x41, 0x64, 0x64, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x22, 0xfb, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x0e, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x01, 0xbc, 0x00, 0x00, 0x00, 0xac, 0xfa, 0xff, 0xff, 
+  0xac, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 
+  0x31, 0x5f, 0x32, 0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x42, 0x69, 0x61, 
+  0x73, 0x41, 0x64, 0x64, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 
+  0x74, 0x69, 0x6f, 0x6e, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 
+  0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 
+  0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 
+  0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 
+  0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 
+  0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x63, 0x6f, 0x6e, 
+  0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x00, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0xfe, 0xfb, 0xff, 0xff, 
+  0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 
+  0x0d, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xb0, 0x00, 0x00, 0x00, 
+  0x88, 0xfb, 0xff, 0xff, 0xa2, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 
+  0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x52, 0x65, 0x6c, 0x75, 0x3b, 0x73, 
+  0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 
+  0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x42, 0x69, 0x61, 
+  0x73, 0x41, 0x64, 0x64, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 
+  0x6f, 0x6e, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 
+  0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 
+  0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x2f, 0x53, 0x71, 0x75, 
+  0x65, 0x65, 0x7a, 0x65, 0x3b, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 
+  0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 
+  0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 
+  0x6f, 0x6e, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 
+  0xce, 0xfc, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 
+  0x28, 0x00, 0x00, 0x00, 0x58, 0xfc, 0xff, 0xff, 0x1a, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x41, 
+  0x64, 0x64, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x16, 0xfd, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x0b, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 
+  0x38, 0x00, 0x00, 0x00, 0xa0, 0xfc, 0xff, 0xff, 0x2b, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 
+  0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x2f, 
+  0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x6e, 0xfd, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x0a, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x02, 0x38, 0x00, 0x00, 0x00, 0xf8, 0xfc, 0xff, 0xff, 
+  0x29, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 
+  0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 
+  0x6e, 0x2f, 0x53, 0x71, 0x75, 0x65, 0x65, 0x7a, 0x65, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xc6, 0xfd, 0xff, 0xff, 
+  0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 
+  0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x30, 0x00, 0x00, 0x00, 
+  0x50, 0xfd, 0xff, 0xff, 0x23, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 
+  0x76, 0x31, 0x64, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 
+  0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 0x6e, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 
+  0x08, 0x00, 0x00, 0x00, 0x22, 0xfe, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x01, 0x30, 0x00, 0x00, 0x00, 0xac, 0xfd, 0xff, 0xff, 
+  0x21, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x31, 0x64, 0x5f, 
+  0x31, 0x2f, 0x63, 0x6f, 0x6e, 0x76, 0x6f, 0x6c, 0x75, 0x74, 0x69, 0x6f, 
+  0x6e, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x7e, 0xfe, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 
+  0x2c, 0x00, 0x00, 0x00, 0x08, 0xfe, 0xff, 0xff, 0x1d, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x64, 0x65, 0x6e, 0x73, 0x65, 0x5f, 0x31, 0x5f, 0x32, 0x2f, 0x4d, 
+  0x61, 0x74, 0x4d, 0x75, 0x6c, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0xce, 0xfe, 0xff, 0xff, 
+  0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 
+  0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x28, 0x00, 0x00, 0x00, 
+  0x58, 0xfe, 0xff, 0xff, 0x1b, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 
+  0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x64, 0x65, 0x6e, 
+  0x73, 0x65, 0x5f, 0x31, 0x2f, 0x4d, 0x61, 0x74, 0x4d, 0x75, 0x6c, 0x00, 
+  0x02, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x38, 0x01, 0x00, 0x00, 
+  0x1a, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 
+  0x1c, 0x00, 0x00, 0x00, 0xa4, 0xfe, 0xff, 0xff, 0x0f, 0x00, 0x00, 0x00, 
+  0x61, 0x72, 0x69, 0x74, 0x68, 0x2e, 0x63, 0x6f, 0x6e, 0x73, 0x74, 0x61, 
+  0x6e, 0x74, 0x31, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x56, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 
+  0x38, 0x00, 0x00, 0x00, 0xe0, 0xfe, 0xff, 0xff, 0x2a, 0x00, 0x00, 0x00, 
+  0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 0x61, 0x6c, 0x5f, 0x31, 
+  0x2f, 0x66, 0x6c, 0x61, 0x74, 0x74, 0x65, 0x6e, 0x5f, 0x31, 0x2f, 0x73, 
+  0x74, 0x72, 0x69, 0x64, 0x65, 0x64, 0x5f, 0x73, 0x6c, 0x69, 0x63, 0x65, 
+  0x2f, 0x73, 0x74, 0x61, 0x63, 0x6b, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
+  0x01, 0x00, 0x00, 0x00, 0xae, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x01, 
+  0x14, 0x00, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x02, 0x34, 0x00, 0x00, 0x00, 0x38, 0xff, 0xff, 0xff, 
+  0x26, 0x00, 0x00, 0x00, 0x73, 0x65, 0x71, 0x75, 0x65, 0x6e, 0x74, 0x69, 
+  0x61, 0x6c, 0x5f, 0x31, 0x2f, 0x66, 0x6c, 0x61, 0x74, 0x74, 0x65, 0x6e, 
+  0x5f, 0x31, 0x2f, 0x52, 0x65, 0x73, 0x68, 0x61, 0x70, 0x65, 0x2f, 0x73, 
+  0x68, 0x61, 0x70, 0x65, 0x2f, 0x31, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x16, 0x00, 0x1c, 0x00, 0x18, 0x00, 0x17, 0x00, 0x10, 0x00, 
+  0x0c, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 
+  0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 
+  0x1c, 0x00, 0x00, 0x00, 0xa0, 0xff, 0xff, 0xff, 0x0e, 0x00, 0x00, 0x00, 
+  0x61, 0x72, 0x69, 0x74, 0x68, 0x2e, 0x63, 0x6f, 0x6e, 0x73, 0x74, 0x61, 
+  0x6e, 0x74, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x16, 0x00, 
+  0x1c, 0x00, 0x18, 0x00, 0x00, 0x00, 0x14, 0x00, 0x10, 0x00, 0x0c, 0x00, 
+  0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x07, 0x00, 0x16, 0x00, 0x00, 0x00, 
+  0x00, 0x00, 0x00, 0x01, 0x14, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x24, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x40, 0x00, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0xff, 0xff, 0xff, 0xff, 0x68, 0x01, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x04, 0x00, 0x04, 0x00, 0x04, 0x00, 0x00, 0x00, 
+  0x1e, 0x00, 0x00, 0x00, 0x73, 0x65, 0x72, 0x76, 0x69, 0x6e, 0x67, 0x5f, 
+  0x64, 0x65, 0x66, 0x61, 0x75, 0x6c, 0x74, 0x5f, 0x6b, 0x65, 0x72, 0x61, 
+  0x73, 0x5f, 0x74, 0x65, 0x6e, 0x73, 0x6f, 0x72, 0x3a, 0x30, 0x00, 0x00, 
+  0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x68, 0x01, 0x00, 0x00, 
+  0x04, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x9c, 0x00, 0x00, 0x00, 
+  0x80, 0x00, 0x00, 0x00, 0x64, 0x00, 0x00, 0x00, 0x54, 0x00, 0x00, 0x00, 
+  0x44, 0x00, 0x00, 0x00, 0x34, 0x00, 0x00, 0x00, 0x24, 0x00, 0x00, 0x00, 
+  0x14, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0xac, 0xff, 0xff, 0xff, 
+  0x0e, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0e, 0xb8, 0xff, 0xff, 0xff, 
+  0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0xc4, 0xff, 0xff, 0xff, 
+  0x53, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x53, 0xd0, 0xff, 0xff, 0xff, 
+  0x2d, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x2d, 0xdc, 0xff, 0xff, 0xff, 
+  0x4d, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x4d, 0xe8, 0xff, 0xff, 0xff, 
+  0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x16, 0xf4, 0xff, 0xff, 0xff, 
+  0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x0c, 0x00, 0x0c, 0x00, 
+  0x0b, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x0c, 0x00, 0x00, 0x00, 
+  0x46, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x46, 0x0c, 0x00, 0x10, 0x00, 
+  0x0f, 0x00, 0x00, 0x00, 0x08, 0x00, 0x04, 0x00, 0x0c, 0x00, 0x00, 0x00, 
+  0x06, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06
+};
+const unsigned int wifi_forecast_tflite_len = 12756;
+
+#endif // FORECAST_MODEL_H
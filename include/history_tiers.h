@@ -0,0 +1,353 @@
+// Tiered KPI history
+// Three fixed-size rings replace the single /history.json:
+//   raw     one record per sample, 8640 slots (24 h at 10 s)
+//   minute  1-minute min/mean/max rollups, 30 days
+//   hour    1-hour min/mean/max rollups, 1 year
+// Each sample is written to the raw ring and folded into the minute and hour
+// accumulators; a rollup is written when its bucket closes.
+// LittleFS is copy-on-write: writing into a file rewrites every block from the
+// write position to the end of the file. So each ring is a directory of
+// one-block segment files plus an index file holding the header (16 bytes,
+// kept inline in the directory entry). An append rewrites one segment block and
+// the index, whatever the ring size.
+// Mirrored by tiered_history.py.
+
+#ifndef HISTORY_TIERS_H
+#define HISTORY_TIERS_H
+
+#include <math.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+
+#include <utility>
+
+#define HISTORY_RING_MAGIC 0x52484b57u  // "WKHR" little-endian
+#define HISTORY_RING_VERSION 2          // 1: header and slots in one file
+#define HISTORY_SEGMENT_BYTES 4096      // LittleFS block size on the ESP32
+#define HISTORY_PATH_MAX 32
+
+enum HistoryTier : uint8_t {
+    TIER_RAW,
+    TIER_MINUTE,
+    TIER_HOUR,
+    TIER_COUNT,
+};
+
+struct TierInfo {
+    const char* name;
+    const char* dir;        // "index" and the segment files "0", "1", ...
+    uint32_t period_s;      // rollup bucket length, 0 for raw samples
+    uint32_t capacity;      // records kept; the oldest is overwritten
+    uint32_t span_s;        // nominal retention, used to pick the tier for a /history range
+};
+
+static const TierInfo HISTORY_TIERS[TIER_COUNT] = {
+    {"raw", "/history_raw", 0, 8640, 86400},
+    {"minute", "/history_1m", 60, 43200, 30 * 86400},
+    {"hour", "/history_1h", 3600, 8760, 365 * 86400},
+};
+
+// Fixed-point fields: dBm in 0.1 dB, utilization in 0.5 %, stability in 1/250
+#define DB_SCALE 10.0f
+#define UTIL_SCALE 2.0f
+#define STABILITY_SCALE 250.0f
+
+// Raw tier: one sample; snr is rssi - noise, exactly as saveKPI() computes it
+struct RawRecord {
+    uint32_t t;
+    int16_t rssi;           // 0.1 dBm
+    int16_t noise;          // 0.1 dBm
+    uint8_t channel_util;   // 0.5 %
+    uint8_t stability;      // 1/250
+    uint16_t dt;            // seconds since the previous sample
+};
+
+// Minute and hour tiers: one bucket; snr mean is rssi mean - noise mean
+struct RollupRecord {
+    uint32_t t;             // bucket start
+    uint16_t samples;
+    int16_t rssi_mean;      // 0.1 dBm
+    int16_t noise_mean;     // 0.1 dBm
+    int8_t rssi_min;        // whole dB, rounded outwards
+    int8_t rssi_max;
+    int8_t snr_min;
+    int8_t snr_max;
+    uint8_t util_min;       // 0.5 %
+    uint8_t util_mean;
+    uint8_t util_max;
+    uint8_t stability_min;  // 1/250
+    uint8_t stability_mean;
+    uint8_t stability_max;
+};
+
+struct RingHeader {
+    uint32_t magic;
+    uint8_t version;
+    uint8_t tier;
+    uint16_t record_size;
+    uint32_t capacity;
+    uint32_t total;         // records ever appended; slot of record n is n % capacity
+};
+
+static_assert(sizeof(RawRecord) == 12, "RawRecord is a file format");
+static_assert(sizeof(RollupRecord) == 20, "RollupRecord is a file format");
+static_assert(sizeof(RingHeader) == 16, "RingHeader is a file format");
+
+inline size_t tierRecordSize(uint8_t tier) {
+    return tier == TIER_RAW ? sizeof(RawRecord) : sizeof(RollupRecord);
+}
+
+inline int32_t quantize(float value, float scale, int32_t low, int32_t high) {
+    int32_t q = (int32_t)floorf(value * scale + 0.5f);
+    return q < low ? low : q > high ? high : q;
+}
+
+inline int8_t floorDb(float value) {
+    float q = floorf(value);
+    return q < -128.0f ? -128 : q > 127.0f ? 127 : (int8_t)q;
+}
+
+inline int8_t ceilDb(float value) {
+    float q = ceilf(value);
+    return q < -128.0f ? -128 : q > 127.0f ? 127 : (int8_t)q;
+}
+
+inline RawRecord makeRawRecord(uint32_t t, float rssi, float noise, float channel_util,
+                               float stability, uint32_t dt) {
+    RawRecord record;
+    record.t = t;
+    record.rssi = quantize(rssi, DB_SCALE, INT16_MIN, INT16_MAX);
+    record.noise = quantize(noise, DB_SCALE, INT16_MIN, INT16_MAX);
+    record.channel_util = quantize(channel_util, UTIL_SCALE, 0, 200);
+    record.stability = quantize(stability, STABILITY_SCALE, 0, 250);
+    record.dt = dt > UINT16_MAX ? UINT16_MAX : dt;
+    return record;
+}
+
+// Running min/mean/max of one bucket; add() every sample, in time order
+class RollupAccumulator {
+private:
+    uint32_t period;
+    uint32_t start = 0;
+    uint16_t samples = 0;
+    float rssi_sum, noise_sum, util_sum, stability_sum;
+    float rssi_min, rssi_max, snr_min, snr_max, util_min, util_max, stability_min, stability_max;
+
+public:
+    explicit RollupAccumulator(uint32_t period_s) : period(period_s) {}
+
+    bool empty() const { return samples == 0; }
+
+    // Returns true and fills `closed` when t starts a new bucket
+    bool add(uint32_t t, float rssi, float noise, float channel_util, float stability,
+             RollupRecord& closed) {
+        uint32_t bucket = t - t % period;
+        bool rolled = samples > 0 && bucket != start;
+        if (rolled) closed = finish();
+        float snr = rssi - noise;
+        if (samples == 0 || rolled) {
+            start = bucket;
+            samples = 0;
+            rssi_sum = noise_sum = util_sum = stability_sum = 0.0f;
+            rssi_min = rssi_max = rssi;
+            snr_min = snr_max = snr;
+            util_min = util_max = channel_util;
+            stability_min = stability_max = stability;
+        }
+        if (samples < UINT16_MAX) samples++;
+        rssi_sum += rssi;
+        noise_sum += noise;
+        util_sum += channel_util;
+        stability_sum += stability;
+        rssi_min = fminf(rssi_min, rssi);
+        rssi_max = fmaxf(rssi_max, rssi);
+        snr_min = fminf(snr_min, snr);
+        snr_max = fmaxf(snr_max, snr);
+        util_min = fminf(util_min, channel_util);
+        util_max = fmaxf(util_max, channel_util);
+        stability_min = fminf(stability_min, stability);
+        stability_max = fmaxf(stability_max, stability);
+        return rolled;
+    }
+
+    RollupRecord finish() const {
+        RollupRecord record;
+        record.t = start;
+        record.samples = samples;
+        record.rssi_mean = quantize(rssi_sum / samples, DB_SCALE, INT16_MIN, INT16_MAX);
+        record.noise_mean = quantize(noise_sum / samples, DB_SCALE, INT16_MIN, INT16_MAX);
+        record.rssi_min = floorDb(rssi_min);
+        record.rssi_max = ceilDb(rssi_max);
+        record.snr_min = floorDb(snr_min);
+        record.snr_max = ceilDb(snr_max);
+        record.util_min = quantize(util_min, UTIL_SCALE, 0, 200);
+        record.util_mean = quantize(util_sum / samples, UTIL_SCALE, 0, 200);
+        record.util_max = quantize(util_max, UTIL_SCALE, 0, 200);
+        record.stability_min = quantize(stability_min, STABILITY_SCALE, 0, 250);
+        record.stability_mean = quantize(stability_sum / samples, STABILITY_SCALE, 0, 250);
+        record.stability_max = quantize(stability_max, STABILITY_SCALE, 0, 250);
+        return record;
+    }
+};
+
+// Finest tier whose nominal span covers range_s. If that tier misses more than one
+// coarser bucket at the start of the range (adaptive sampling fills the raw ring
+// faster) and the coarser tier holds older data, the coarser tier is used; an empty
+// tier falls back to the finest one holding data.
+// oldest[tier] is the first record time held, 0 if the tier is empty.
+inline uint8_t selectTier(uint32_t range_s, uint32_t threshold, const uint32_t oldest[TIER_COUNT]) {
+    uint8_t tier = 0;
+    while (tier + 1 < TIER_COUNT && HISTORY_TIERS[tier].span_s < range_s) tier++;
+    while (tier > 0 && oldest[tier] == 0) tier--;  // no bucket closed yet
+    while (tier + 1 < TIER_COUNT) {
+        uint32_t period = HISTORY_TIERS[tier + 1].period_s;
+        uint32_t coarser = oldest[tier + 1];
+        if (oldest[tier] != 0 && oldest[tier] <= threshold + period) break;  // covers the range
+        if (coarser == 0 || (oldest[tier] != 0 && coarser + period > oldest[tier])) break;
+        tier++;
+    }
+    return tier;
+}
+
+// Ring access over any FS-like type with open(path, mode) and mkdir(path), whose
+// files have seek(), read(), write(), size() and close()
+inline uint32_t ringCount(const RingHeader& header) {
+    return header.total < header.capacity ? header.total : header.capacity;
+}
+
+inline uint32_t ringSegmentRecords(const RingHeader& header) {
+    return HISTORY_SEGMENT_BYTES / header.record_size;
+}
+
+inline void ringIndexPath(uint8_t tier, char* path, size_t size) {
+    snprintf(path, size, "%s/index", HISTORY_TIERS[tier].dir);
+}
+
+inline void ringSegmentPath(const RingHeader& header, uint32_t segment, char* path, size_t size) {
+    snprintf(path, size, "%s/%u", HISTORY_TIERS[header.tier].dir, (unsigned)segment);
+}
+
+// Reads the index; false for a missing, foreign or differently sized ring, or one
+// whose newest record is not in its segment file
+template <typename FS>
+bool ringLoad(FS& fs, uint8_t tier, RingHeader& header) {
+    char path[HISTORY_PATH_MAX];
+    ringIndexPath(tier, path, sizeof(path));
+    auto index = fs.open(path, "r");
+    if (!index) return false;
+    bool ok = index.read((uint8_t*)&header, sizeof(header)) == sizeof(header) &&
+              header.magic == HISTORY_RING_MAGIC && header.version == HISTORY_RING_VERSION &&
+              header.tier == tier && header.record_size == tierRecordSize(tier) &&
+              header.capacity == HISTORY_TIERS[tier].capacity;
+    index.close();
+    if (!ok || header.total == 0) return ok;
+    uint32_t slot = (header.total - 1) % header.capacity;
+    uint32_t per = ringSegmentRecords(header);
+    ringSegmentPath(header, slot / per, path, sizeof(path));
+    auto segment = fs.open(path, "r");
+    ok = segment && segment.size() >= (size_t)(slot % per + 1) * header.record_size;
+    if (segment) segment.close();
+    return ok;
+}
+
+template <typename FS>
+bool ringWriteIndex(FS& fs, const RingHeader& header) {
+    char path[HISTORY_PATH_MAX];
+    ringIndexPath(header.tier, path, sizeof(path));
+    auto index = fs.open(path, "w");
+    if (!index) return false;
+    bool ok = index.write((const uint8_t*)&header, sizeof(header)) == sizeof(header);
+    index.close();
+    return ok;
+}
+
+// Starts an empty ring; old segment files are truncated as the first lap reaches them
+template <typename FS>
+bool ringInit(FS& fs, uint8_t tier, RingHeader& header) {
+    header = {HISTORY_RING_MAGIC, HISTORY_RING_VERSION, tier, (uint16_t)tierRecordSize(tier),
+              HISTORY_TIERS[tier].capacity, 0};
+    fs.mkdir(HISTORY_TIERS[tier].dir);  // false when it exists
+    return ringWriteIndex(fs, header);
+}
+
+// Writes the record into its segment, then the index: a record whose index write
+// was lost is overwritten by the next append
+template <typename FS>
+bool ringAppend(FS& fs, RingHeader& header, const void* record) {
+    uint32_t slot = header.total % header.capacity;
+    uint32_t per = ringSegmentRecords(header);
+    char path[HISTORY_PATH_MAX];
+    ringSegmentPath(header, slot / per, path, sizeof(path));
+    bool fresh = header.total < header.capacity && slot % per == 0;  // first lap opens the segment
+    auto file = fs.open(path, fresh ? "w" : "r+");
+    if (!file) return false;
+    bool ok = file.seek((slot % per) * header.record_size) &&
+              file.write((const uint8_t*)record, header.record_size) == header.record_size;
+    file.close();
+    if (!ok) return false;
+    header.total++;
+    return ringWriteIndex(fs, header);
+}
+
+// Reads the records of one loaded ring, keeping the last segment file open.
+// i = 0 is the oldest record held when the header was loaded.
+template <typename FS>
+class RingReader {
+private:
+    using File = decltype(std::declval<FS&>().open("", "r"));
+
+    FS& fs;
+    RingHeader header;
+    File file;
+    uint32_t segment = UINT32_MAX;
+
+    bool seekRecord(uint32_t i) {
+        uint32_t slot = (header.total - ringCount(header) + i) % header.capacity;
+        uint32_t per = ringSegmentRecords(header);
+        if (slot / per != segment) {
+            if (file) file.close();
+            char path[HISTORY_PATH_MAX];
+            ringSegmentPath(header, slot / per, path, sizeof(path));
+            file = fs.open(path, "r");
+            segment = file ? slot / per : UINT32_MAX;
+        }
+        return file && file.seek((slot % per) * header.record_size);
+    }
+
+public:
+    RingReader(FS& fs, const RingHeader& header) : fs(fs), header(header) {}
+    ~RingReader() {
+        if (file) file.close();
+    }
+
+    uint32_t count() const { return ringCount(header); }
+
+    bool read(uint32_t i, void* record) {
+        return seekRecord(i) && file.read((uint8_t*)record, header.record_size) == header.record_size;
+    }
+
+    // Every record starts with its uint32_t time
+    uint32_t time(uint32_t i) {
+        uint32_t t = 0;
+        if (seekRecord(i)) file.read((uint8_t*)&t, sizeof(t));
+        return t;
+    }
+
+    // Index of the first record with time >= t (binary search, records are time-ordered)
+    uint32_t lowerBound(uint32_t t) {
+        uint32_t low = 0, high = count();
+        while (low < high) {
+            uint32_t mid = low + (high - low) / 2;
+            if (time(mid) < t) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
+    }
+};
+
+#endif // HISTORY_TIERS_H
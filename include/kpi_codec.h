@@ -0,0 +1,175 @@
+// Block codec for raw KPI samples
+// Samples (RawRecord, see history_tiers.h) are packed into fixed KPI_BLOCK_BYTES
+// blocks. The first sample of a block is stored as-is; every following one as
+// five zigzag varints:
+//   delta-of-delta of t, then the deltas of rssi, noise, channel_util, stability
+// dt is implied by the time step; the rare samples where it differs (first sample
+// after a reboot or a clock step) are listed after the samples as
+// (index, dt - step) varint pairs. At 10 s sampling a sample costs ~5 bytes
+// against 12 in the raw ring and ~125 as /history.json text.
+// Used by /history?format=packed; mirrored and decoded by kpi_codec.py.
+
+#ifndef KPI_CODEC_H
+#define KPI_CODEC_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#include "history_tiers.h"
+
+#define KPI_BLOCK_BYTES 256
+#define KPI_BLOCK_MAGIC 0x424bu  // "KB" little-endian
+#define KPI_BLOCK_VERSION 1
+#define KPI_SAMPLE_MAX_BYTES 25  // five 5-byte varints
+#define KPI_EXCEPTIONS_MAX 32
+
+struct KpiBlockHeader {
+    uint16_t magic;
+    uint16_t count;         // samples, including `first`
+    uint16_t used;          // header + samples + exceptions; the rest is zero padding
+    uint8_t exceptions;     // (index, dt - step) pairs after the samples
+    uint8_t version;
+    RawRecord first;
+};
+
+static_assert(sizeof(KpiBlockHeader) == 20, "KpiBlockHeader is a wire format");
+
+inline uint32_t zigzag(int32_t v) { return ((uint32_t)v << 1) ^ (uint32_t)(v >> 31); }
+
+inline int32_t unzigzag(uint32_t v) { return (int32_t)(v >> 1) ^ -(int32_t)(v & 1); }
+
+inline size_t putVarint(uint8_t* out, uint32_t v) {
+    size_t n = 0;
+    while (v >= 0x80) {
+        out[n++] = (uint8_t)(v | 0x80);
+        v >>= 7;
+    }
+    out[n++] = (uint8_t)v;
+    return n;
+}
+
+// Bytes consumed, 0 if the varint runs past `end` or is longer than 5 bytes
+inline size_t getVarint(const uint8_t* p, const uint8_t* end, uint32_t& v) {
+    v = 0;
+    for (size_t n = 0; n < 5 && p + n < end; n++) {
+        v |= (uint32_t)(p[n] & 0x7f) << (7 * n);
+        if (!(p[n] & 0x80)) return n + 1;
+    }
+    return 0;
+}
+
+class KpiBlockEncoder {
+private:
+    uint8_t exception_bytes[KPI_EXCEPTIONS_MAX * 8];
+    size_t exception_used = 0;
+    KpiBlockHeader header = {};
+    RawRecord last = {};
+    int32_t step = 0;
+
+public:
+    uint8_t data[KPI_BLOCK_BYTES];
+
+    KpiBlockEncoder() { reset(); }
+
+    void reset() {
+        header = {};
+        header.magic = KPI_BLOCK_MAGIC;
+        header.version = KPI_BLOCK_VERSION;
+        header.used = sizeof(KpiBlockHeader);
+        exception_used = 0;
+    }
+
+    uint16_t count() const { return header.count; }
+
+    // False when the sample does not fit: finish() the block, reset() and add it again
+    bool add(const RawRecord& record) {
+        if (header.count == 0) {
+            header.first = record;
+            header.count = 1;
+            last = record;
+            step = record.dt;
+            return true;
+        }
+        int32_t delta = (int32_t)(record.t - last.t);
+        uint8_t sample[KPI_SAMPLE_MAX_BYTES];
+        size_t n = putVarint(sample, zigzag(delta - step));
+        n += putVarint(sample + n, zigzag(record.rssi - last.rssi));
+        n += putVarint(sample + n, zigzag(record.noise - last.noise));
+        n += putVarint(sample + n, zigzag(record.channel_util - last.channel_util));
+        n += putVarint(sample + n, zigzag(record.stability - last.stability));
+
+        uint8_t exception[10];
+        size_t e = 0;
+        if (record.dt != delta) {
+            if (header.exceptions == KPI_EXCEPTIONS_MAX || header.count == UINT16_MAX) return false;
+            e = putVarint(exception, header.count);
+            e += putVarint(exception + e, zigzag((int32_t)record.dt - delta));
+        }
+        if (header.used + n + exception_used + e > KPI_BLOCK_BYTES) return false;
+
+        memcpy(data + header.used, sample, n);
+        header.used += n;
+        memcpy(exception_bytes + exception_used, exception, e);
+        exception_used += e;
+        if (e) header.exceptions++;
+        header.count++;
+        step = delta;
+        last = record;
+        return true;
+    }
+
+    // Completes the block in `data`, always KPI_BLOCK_BYTES long; reset() before reuse
+    const uint8_t* finish() {
+        memcpy(data + header.used, exception_bytes, exception_used);
+        header.used += exception_used;
+        exception_used = 0;
+        memset(data + header.used, 0, KPI_BLOCK_BYTES - header.used);
+        memcpy(data, &header, sizeof(header));
+        return data;
+    }
+};
+
+// Decodes one block into out[0..max); returns the sample count, 0 for a bad block
+inline uint16_t kpiBlockDecode(const uint8_t* block, RawRecord* out, uint16_t max) {
+    KpiBlockHeader header;
+    memcpy(&header, block, sizeof(header));
+    if (header.magic != KPI_BLOCK_MAGIC || header.version != KPI_BLOCK_VERSION ||
+        header.count == 0 || header.count > max || header.used > KPI_BLOCK_BYTES ||
+        header.used < sizeof(header)) {
+        return 0;
+    }
+    const uint8_t* p = block + sizeof(header);
+    const uint8_t* end = block + header.used;
+    out[0] = header.first;
+    int32_t step = header.first.dt;
+    for (uint16_t i = 1; i < header.count; i++) {
+        uint32_t v[5];
+        for (int k = 0; k < 5; k++) {
+            size_t n = getVarint(p, end, v[k]);
+            if (!n) return 0;
+            p += n;
+        }
+        step += unzigzag(v[0]);
+        RawRecord& r = out[i];
+        r.t = out[i - 1].t + step;
+        r.rssi = out[i - 1].rssi + unzigzag(v[1]);
+        r.noise = out[i - 1].noise + unzigzag(v[2]);
+        r.channel_util = out[i - 1].channel_util + unzigzag(v[3]);
+        r.stability = out[i - 1].stability + unzigzag(v[4]);
+        r.dt = step;
+    }
+    for (uint8_t e = 0; e < header.exceptions; e++) {
+        uint32_t index, residual;
+        size_t n = getVarint(p, end, index);
+        if (!n) return 0;
+        p += n;
+        n = getVarint(p, end, residual);
+        if (!n || index == 0 || index >= header.count) return 0;
+        p += n;
+        out[index].dt = (uint16_t)((int32_t)(out[index].t - out[index - 1].t) + unzigzag(residual));
+    }
+    return header.count;
+}
+
+#endif // KPI_CODEC_H
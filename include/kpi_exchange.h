@@ -0,0 +1,119 @@
+// Lock-free exchange between the KPI task and the web server task
+// The KPI task (one core) publishes samples; loop() (the other core) serves them.
+// Mirrored by SnapshotBuffer and SpscQueue in host_simulator.py.
+
+#ifndef KPI_EXCHANGE_H
+#define KPI_EXCHANGE_H
+
+#include <atomic>
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+#include <type_traits>
+
+// One KPI sample as plain data (no String), so it can be copied between cores
+struct KpiSnapshot {
+    uint32_t t;
+    uint32_t sample_interval_ms;
+    float rssi;
+    float noise;
+    float snr;
+    float channel_util;
+    float stability;      // combined AI + ML stability (currentStability)
+    float ai_stability;   // currentPrediction.stability
+    float confidence;
+    float trend_score;
+    bool connected;
+    char ssid[33];
+    uint8_t alert;        // AlertType; text comes from alertInfo()
+};
+
+// Requests from web handlers that must run on the KPI task
+enum KpiCommand : uint8_t {
+    KPI_COMMAND_COLLECT,  // /collect: sample now
+    KPI_COMMAND_DEMO,     // /demo: write demo history
+    KPI_COMMAND_SCAN,     // /scan: refresh the scan cache if it has gone stale
+    KPI_COMMAND_LOAD_MODEL, // POST /model: swap in the uploaded model slot
+    KPI_COMMAND_CONNECT,  // POST /connect: join the network saved in CONFIG_FILE
+};
+
+inline void copyField(char* dst, size_t size, const char* src) {
+    strncpy(dst, src, size - 1);
+    dst[size - 1] = '\0';
+}
+
+// Single-producer single-consumer ring buffer; push() from one task, pop() from another
+template <typename T, size_t N>
+class SpscQueue {
+    static_assert((N & (N - 1)) == 0, "capacity must be a power of two");
+
+private:
+    T items[N];
+    std::atomic<uint32_t> head{0};  // next slot to read, owned by the consumer
+    std::atomic<uint32_t> tail{0};  // next slot to write, owned by the producer
+
+public:
+    bool push(const T& item) {
+        uint32_t t = tail.load(std::memory_order_relaxed);
+        if (t - head.load(std::memory_order_acquire) == N) {
+            return false;  // full: the consumer is behind, drop rather than block
+        }
+        items[t & (N - 1)] = item;
+        tail.store(t + 1, std::memory_order_release);
+        return true;
+    }
+
+    bool pop(T& item) {
+        uint32_t h = head.load(std::memory_order_relaxed);
+        if (h == tail.load(std::memory_order_acquire)) {
+            return false;
+        }
+        item = items[h & (N - 1)];
+        head.store(h + 1, std::memory_order_release);
+        return true;
+    }
+
+    size_t size() const {
+        return tail.load(std::memory_order_acquire) - head.load(std::memory_order_acquire);
+    }
+};
+
+// Latest value behind a seqlock: one writer publishes, readers copy without locking.
+// The sequence is odd while a publish is in progress and even once it completes. A
+// reader copies only from an even sequence and retries when the sequence changed
+// during the copy, so a copy that overlapped a publish is never returned.
+template <typename T>
+class SnapshotBuffer {
+    static_assert(std::is_trivially_copyable<T>::value, "snapshots are copied byte by byte");
+
+private:
+    T value;
+    std::atomic<uint32_t> sequence{0};  // odd: publish in progress; sequence / 2: publishes so far
+
+public:
+    SnapshotBuffer() : value() {}
+
+    void publish(const T& next) {
+        uint32_t s = sequence.load(std::memory_order_relaxed);
+        sequence.store(s + 1, std::memory_order_relaxed);
+        std::atomic_thread_fence(std::memory_order_release);  // odd is visible before the data
+        memcpy((void*)&value, &next, sizeof(T));
+        sequence.store(s + 2, std::memory_order_release);      // the data is visible before even
+    }
+
+    T read() const {
+        T copy;
+        uint32_t before, after;
+        do {
+            before = sequence.load(std::memory_order_acquire);
+            memcpy((void*)&copy, (const void*)&value, sizeof(T));
+            std::atomic_thread_fence(std::memory_order_acquire);  // the copy completes before the check
+            after = sequence.load(std::memory_order_relaxed);
+        } while ((before & 1) || before != after);
+        return copy;
+    }
+
+    uint32_t version() const { return sequence.load(std::memory_order_acquire) / 2; }
+};
+
+#endif // KPI_EXCHANGE_H
@@ -0,0 +1,1731 @@
+// Precomputed lookup table for the WiFi stability model
+// Generated by export_lut.py - do not edit
+// Max abs error vs float model: 0.0288 (mean 0.0007, 99.99% class agreement)
+
+#ifndef MODEL_LUT_H
+#define MODEL_LUT_H
+
+#include <stdint.h>
+
+#define WIFI_LUT_RSSI_MIN (-100.0f)
+#define WIFI_LUT_RSSI_MAX (-20.0f)
+#define WIFI_LUT_RSSI_STEP 2.0f
+#define WIFI_LUT_RSSI_SIZE 41
+#define WIFI_LUT_NOISE_MIN (-100.0f)
+#define WIFI_LUT_NOISE_MAX (-40.0f)
+#define WIFI_LUT_NOISE_STEP 2.0f
+#define WIFI_LUT_NOISE_SIZE 31
+#define WIFI_LUT_UTIL_MIN (0.0f)
+#define WIFI_LUT_UTIL_MAX (100.0f)
+#define WIFI_LUT_UTIL_STEP 5.0f
+#define WIFI_LUT_UTIL_SIZE 21
+
+const unsigned int wifi_model_lut_len = 26691;
+const uint8_t wifi_model_lut[] = {
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 253, 253, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253,
+  253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 254, 254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 254, 254, 253, 253, 253, 252, 252, 251, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 253, 252, 252,
+  251, 249, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253,
+  253, 253, 252, 251, 251, 249, 248, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 254, 253, 253, 253, 252, 251, 250, 249, 248, 246, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 252, 251, 250, 249, 247, 245,
+  242, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 252, 251,
+  250, 249, 247, 245, 241, 235, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253,
+  253, 252, 251, 251, 250, 248, 246, 244, 240, 233, 224, 255, 255, 255, 254, 254,
+  254, 254, 254, 253, 253, 252, 251, 250, 249, 247, 245, 242, 238, 230, 219, 207,
+  255, 254, 254, 254, 254, 254, 253, 253, 253, 252, 251, 250, 248, 247, 244, 241,
+  236, 227, 214, 200, 184, 254, 254, 254, 254, 254, 253, 253, 252, 252, 251, 249,
+  248, 246, 243, 240, 234, 224, 210, 193, 175, 155, 254, 254, 254, 254, 253, 252,
+  252, 251, 250, 248, 247, 245, 242, 238, 231, 220, 205, 186, 166, 144, 114, 254,
+  254, 253, 253, 252, 251, 250, 249, 247, 245, 243, 240, 236, 229, 216, 200, 179,
+  155, 129,  98,  70, 254, 253, 252, 252, 251, 249, 248, 246, 244, 241, 237, 234,
+  227, 213, 194, 173, 147, 114,  84,  58,  39, 253, 252, 251, 250, 249, 246, 244,
+  241, 238, 234, 231, 226, 212, 191, 166, 136,  99,  71,  48,  32,  22, 252, 251,
+  250, 248, 245, 242, 238, 234, 230, 227, 224, 210, 190, 163, 127,  89,  60,  40,
+   27,  18,  12, 251, 250, 247, 244, 240, 235, 231, 226, 222, 219, 206, 186, 160,
+  119,  81,  51,  34,  23,  15,  10,   7, 250, 247, 243, 238, 233, 226, 221, 217,
+  213, 201, 181, 151, 112,  75,  46,  29,  19,  13,   8,   6,   4, 248, 243, 236,
+  230, 222, 215, 211, 206, 192, 170, 136, 101,  68,  42,  25,  16,  11,   7,   5,
+    3,   2, 243, 236, 227, 219, 209, 205, 196, 178, 153, 122,  87,  59,  38,  23,
+   14,   9,   6,   4,   3,   2,   1, 237, 225, 214, 204, 197, 182, 158, 131, 103,
+   76,  51,  33,  21,  13,   8,   5,   4,   2,   2,   1,   1, 230, 214, 199, 191,
+  164, 137, 109,  85,  64,  45,  29,  18,  11,   7,   4,   3,   2,   1,   1,   1,
+    1, 223, 203, 186, 160, 123,  95,  73,  55,  38,  26,  16,  10,   6,   4,   3,
+    2,   1,   1,   1,   1,   0, 215, 190, 155, 122,  84,  63,  47,  33,  22,  15,
+    9,   6,   4,   2,   2,   1,   1,   1,   0,   0,   0, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 254, 253, 253, 252, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253,
+  253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 254, 254, 253, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 254, 254, 254, 253, 253, 252, 251, 250, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 253, 252, 251,
+  250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253,
+  253, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 254, 253, 253, 253, 252, 251, 250, 249, 247, 245, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 252, 251, 250, 249, 247, 245,
+  240, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 252, 251,
+  250, 249, 247, 245, 240, 233, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254,
+  253, 253, 252, 251, 250, 249, 247, 245, 240, 232, 222, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 253, 252, 251, 249, 248, 245, 243, 237, 228, 217, 204,
+  255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 252, 250, 249, 246, 243, 240,
+  233, 223, 212, 197, 179, 255, 254, 254, 254, 254, 254, 253, 253, 252, 251, 250,
+  248, 245, 242, 238, 230, 218, 206, 190, 171, 149, 254, 254, 254, 254, 254, 253,
+  253, 252, 251, 250, 247, 244, 240, 237, 228, 215, 199, 182, 162, 134, 102, 254,
+  254, 254, 253, 253, 252, 251, 250, 249, 246, 243, 239, 236, 226, 212, 194, 174,
+  152, 120,  89,  62, 254, 254, 253, 253, 252, 251, 250, 248, 245, 241, 237, 234,
+  226, 210, 189, 166, 138, 106,  76,  52,  34, 253, 253, 252, 252, 250, 249, 247,
+  244, 239, 235, 232, 225, 209, 188, 159, 124,  92,  65,  44,  29,  19, 253, 252,
+  251, 250, 247, 244, 241, 238, 234, 229, 224, 208, 187, 154, 112,  80,  55,  37,
+   25,  16,  11, 251, 251, 249, 246, 242, 239, 234, 231, 227, 221, 207, 185, 150,
+  107,  70,  47,  31,  21,  14,   9,   6, 250, 248, 244, 241, 235, 230, 226, 222,
+  216, 202, 180, 144, 103,  65,  40,  27,  18,  12,   8,   5,   4, 246, 243, 238,
+  233, 225, 221, 216, 208, 194, 170, 135,  96,  62,  37,  23,  15,  10,   6,   4,
+    3,   2, 241, 236, 228, 220, 215, 210, 198, 177, 152, 122,  87,  57,  36,  21,
+   13,   8,   5,   4,   3,   2,   1, 236, 227, 215, 208, 201, 181, 156, 130, 102,
+   76,  52,  33,  20,  12,   7,   5,   3,   2,   2,   1,   1, 230, 218, 204, 194,
+  169, 142, 114,  87,  66,  46,  31,  18,  11,   7,   4,   3,   2,   1,   1,   1,
+    1, 224, 209, 189, 162, 128, 100,  75,  56,  40,  27,  18,  11,   6,   4,   3,
+    2,   1,   1,   1,   1,   0, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 254, 254, 253, 253, 253, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 254, 253, 253, 252, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253,
+  253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 254, 254, 253, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 254, 253, 253, 253, 252, 251, 250, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 253, 252, 251,
+  250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253,
+  253, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 254, 253, 253, 253, 252, 251, 250, 249, 247, 243, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 254, 253, 253, 253, 252, 251, 250, 248, 247, 243,
+  238, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 251,
+  250, 248, 247, 243, 238, 230, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254,
+  253, 253, 252, 251, 250, 249, 246, 243, 236, 227, 215, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 253, 252, 251, 250, 248, 246, 242, 235, 225, 212, 197,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 249, 247, 244, 240,
+  233, 223, 210, 194, 175, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251,
+  249, 246, 243, 238, 230, 219, 205, 189, 168, 141, 255, 254, 254, 254, 254, 254,
+  253, 252, 251, 250, 248, 245, 242, 237, 226, 214, 200, 182, 160, 127,  95, 254,
+  254, 254, 254, 253, 253, 252, 251, 249, 247, 244, 241, 237, 226, 209, 193, 175,
+  147, 114,  83,  57, 254, 254, 254, 253, 253, 252, 250, 248, 246, 243, 240, 236,
+  226, 208, 187, 164, 133, 101,  72,  48,  31, 254, 253, 253, 252, 251, 249, 247,
+  245, 241, 238, 235, 226, 208, 184, 151, 118,  87,  61,  41,  27,  18, 253, 253,
+  252, 250, 248, 246, 243, 240, 237, 233, 225, 208, 182, 142, 106,  75,  51,  34,
+   23,  15,  10, 252, 251, 250, 247, 245, 242, 238, 235, 231, 223, 208, 179, 138,
+   97,  66,  43,  29,  19,  13,   9,   6, 251, 249, 246, 243, 239, 236, 232, 228,
+  219, 204, 176, 133,  91,  59,  37,  24,  16,  11,   7,   5,   3, 248, 245, 241,
+  237, 233, 229, 225, 215, 194, 165, 129,  86,  54,  35,  22,  14,   9,   6,   4,
+    3,   2, 246, 240, 233, 228, 225, 219, 203, 180, 151, 117,  81,  52,  32,  20,
+   12,   8,   5,   4,   3,   2,   1, 243, 235, 225, 218, 210, 190, 164, 134, 103,
+   73,  50,  30,  19,  11,   7,   5,   3,   2,   2,   1,   1, 238, 228, 214, 200,
+  174, 147, 118,  89,  65,  46,  30,  18,  11,   7,   4,   3,   2,   1,   1,   1,
+    1, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 254, 253, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 253, 252, 252, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253,
+  253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 254, 254, 253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 252, 251, 249, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 253, 252, 251,
+  250, 248, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253,
+  253, 253, 252, 251, 250, 248, 245, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 253, 252, 251, 250, 248, 246, 241, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 251, 250, 249, 246, 241,
+  235, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 251,
+  250, 248, 246, 242, 235, 226, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 253, 252, 251, 250, 248, 246, 241, 234, 224, 211, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 254, 253, 252, 251, 249, 247, 245, 240, 232, 222, 208, 191,
+  255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 252, 251, 249, 247, 244, 238,
+  231, 220, 205, 187, 167, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251,
+  248, 247, 244, 238, 229, 218, 202, 184, 161, 129, 255, 255, 254, 254, 254, 254,
+  253, 253, 252, 250, 248, 246, 244, 239, 228, 215, 199, 180, 152, 120,  88, 254,
+  254, 254, 254, 254, 253, 252, 251, 250, 247, 245, 243, 239, 228, 213, 194, 172,
+  140, 107,  77,  52, 254, 254, 254, 253, 253, 252, 251, 249, 246, 244, 242, 239,
+  228, 212, 190, 159, 127,  95,  66,  44,  29, 254, 254, 253, 252, 251, 250, 248,
+  245, 243, 241, 238, 228, 212, 186, 148, 113,  83,  57,  37,  24,  16, 254, 253,
+  252, 251, 249, 247, 244, 242, 239, 236, 227, 212, 181, 141, 103,  71,  48,  31,
+   21,  14,   9, 253, 252, 250, 248, 246, 243, 241, 238, 234, 224, 208, 177, 135,
+   93,  63,  40,  26,  18,  12,   8,   5, 252, 250, 247, 244, 241, 239, 236, 232,
+  222, 201, 171, 130,  88,  56,  36,  23,  15,  11,   7,   5,   3, 250, 247, 243,
+  239, 236, 233, 228, 214, 192, 161, 124,  84,  52,  33,  21,  13,   9,   6,   4,
+    3,   2, 249, 245, 239, 233, 229, 221, 204, 181, 150, 114,  79,  51,  31,  20,
+   12,   8,   5,   4,   3,   2,   1, 247, 241, 233, 225, 217, 194, 166, 135, 103,
+   73,  47,  29,  18,  12,   7,   5,   3,   2,   2,   1,   1, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 253, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254,
+  254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253,
+  252, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 254, 253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 251, 250, 249, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 252, 252, 251,
+  249, 247, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254,
+  253, 253, 252, 251, 250, 248, 244, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 253, 253, 252, 251, 250, 248, 245, 240, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 250, 248, 245, 240,
+  233, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 252, 251,
+  250, 248, 245, 240, 233, 223, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 253, 252, 251, 249, 248, 245, 239, 231, 221, 206, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 252, 251, 249, 247, 244, 238, 230, 218, 203, 184,
+  255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 251, 249, 247, 243, 236,
+  228, 216, 200, 180, 156, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 250,
+  249, 247, 244, 237, 226, 214, 197, 177, 147, 114, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 250, 248, 246, 244, 238, 227, 211, 194, 169, 137, 105,  75, 255,
+  254, 254, 254, 254, 253, 252, 251, 250, 248, 246, 244, 239, 229, 213, 190, 160,
+  128,  96,  67,  45, 254, 254, 254, 254, 253, 252, 251, 249, 247, 246, 243, 239,
+  230, 215, 189, 152, 118,  87,  60,  40,  26, 254, 254, 253, 253, 252, 251, 248,
+  247, 245, 243, 239, 230, 216, 187, 148, 108,  77,  52,  34,  22,  15, 254, 253,
+  252, 251, 250, 248, 246, 244, 241, 237, 228, 212, 183, 143, 100,  67,  44,  29,
+   20,  13,   9, 253, 252, 251, 249, 247, 245, 243, 240, 236, 224, 204, 177, 137,
+   94,  60,  38,  25,  17,  12,   8,   5, 252, 251, 249, 246, 244, 242, 239, 234,
+  219, 196, 167, 131,  89,  54,  35,  23,  15,  10,   7,   5,   3, 252, 249, 246,
+  243, 239, 237, 230, 213, 188, 155, 120,  84,  53,  33,  22,  14,   9,   6,   4,
+    3,   2, 250, 247, 243, 238, 234, 227, 209, 183, 147, 109,  77,  51,  31,  20,
+   13,   8,   5,   3,   2,   2,   1, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254, 253, 253, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 254, 254, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253,
+  252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 254, 253, 252, 252, 251, 249, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 250, 248, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 250,
+  249, 246, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  253, 253, 252, 250, 249, 247, 243, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 253, 253, 252, 251, 249, 247, 244, 238, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 252, 251, 250, 248, 244, 239,
+  231, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 251,
+  249, 248, 244, 238, 230, 219, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 253, 252, 251, 249, 247, 243, 237, 229, 217, 202, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 252, 251, 249, 247, 242, 236, 227, 215, 198, 178,
+  255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 250, 249, 247, 243, 235,
+  225, 212, 195, 173, 141, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 250,
+  249, 247, 244, 236, 224, 209, 192, 164, 132,  99, 255, 255, 255, 254, 254, 254,
+  253, 253, 251, 250, 248, 247, 244, 237, 226, 209, 186, 155, 122,  91,  63, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 248, 246, 244, 238, 228, 211, 183, 146,
+  113,  82,  56,  37, 255, 254, 254, 254, 253, 252, 251, 249, 248, 246, 244, 238,
+  229, 212, 182, 142, 104,  74,  50,  32,  22, 254, 254, 254, 253, 252, 251, 249,
+  247, 246, 244, 238, 229, 212, 182, 142,  99,  66,  44,  29,  20,  14, 254, 254,
+  253, 252, 251, 249, 247, 245, 243, 237, 226, 208, 181, 141,  98,  62,  40,  27,
+   19,  13,   9, 254, 253, 252, 251, 249, 247, 245, 243, 236, 223, 203, 176, 140,
+   96,  60,  38,  24,  17,  11,   8,   5, 253, 252, 251, 249, 246, 244, 242, 234,
+  218, 194, 165, 130,  91,  59,  36,  23,  15,  10,   7,   4,   3, 252, 251, 249,
+  246, 243, 240, 234, 216, 189, 154, 118,  84,  57,  35,  22,  14,   9,   6,   4,
+    3,   2, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253,
+  252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 254, 253, 252, 252, 250, 249, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 249, 247, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 250,
+  248, 244, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  253, 252, 251, 250, 249, 245, 241, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 249, 246, 242, 235, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 250, 249, 247, 243, 237,
+  228, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 251,
+  249, 247, 243, 236, 228, 216, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 253, 252, 251, 249, 247, 241, 235, 226, 213, 196, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 252, 251, 249, 247, 242, 233, 224, 210, 193, 169,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 250, 249, 247, 242, 234,
+  222, 208, 189, 160, 126, 255, 255, 255, 255, 254, 254, 254, 253, 253, 251, 250,
+  249, 247, 243, 235, 223, 205, 183, 151, 117,  85, 255, 255, 255, 254, 254, 254,
+  253, 252, 251, 250, 248, 247, 243, 236, 225, 207, 176, 142, 107,  77,  52, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 248, 246, 243, 237, 226, 207, 175, 134,
+   98,  69,  47,  31, 255, 254, 254, 254, 253, 252, 251, 250, 248, 246, 243, 237,
+  226, 207, 175, 133,  91,  62,  41,  28,  19, 254, 254, 254, 253, 252, 251, 250,
+  248, 246, 243, 236, 224, 204, 174, 133,  90,  57,  38,  26,  18,  12, 254, 254,
+  253, 252, 251, 250, 248, 246, 243, 235, 221, 200, 172, 132,  90,  57,  36,  24,
+   16,  11,   8, 254, 253, 253, 252, 250, 248, 246, 244, 235, 220, 196, 166, 131,
+   92,  59,  36,  23,  15,  10,   7,   5, 254, 253, 252, 251, 249, 246, 244, 236,
+  222, 199, 166, 127,  94,  61,  37,  23,  14,   9,   6,   4,   3, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 252, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 253, 252, 252, 251, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253,
+  252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 250, 248, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 253, 252, 251, 250, 249, 246, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249,
+  247, 243, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  253, 252, 251, 249, 247, 244, 238, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 253, 252, 251, 250, 248, 245, 239, 232, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 245, 241, 234,
+  223, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251,
+  249, 245, 240, 233, 223, 209, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 249, 246, 240, 233, 222, 208, 189, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 252, 251, 249, 246, 241, 232, 220, 206, 187, 157,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 247, 242, 233,
+  220, 203, 179, 147, 112, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250,
+  249, 247, 242, 234, 222, 202, 171, 137, 102,  72, 255, 255, 255, 255, 254, 254,
+  253, 252, 251, 250, 248, 247, 242, 235, 224, 202, 168, 128,  93,  65,  43, 255,
+  255, 255, 254, 254, 253, 252, 251, 250, 248, 246, 242, 235, 224, 202, 167, 125,
+   84,  58,  39,  27, 255, 255, 254, 254, 253, 252, 251, 250, 248, 247, 242, 234,
+  221, 200, 167, 125,  83,  53,  36,  25,  17, 255, 254, 254, 254, 253, 251, 250,
+  249, 247, 243, 234, 218, 196, 166, 124,  84,  53,  34,  23,  15,  11, 254, 254,
+  254, 253, 252, 250, 249, 247, 243, 234, 218, 193, 160, 124,  86,  55,  33,  21,
+   14,  10,   7, 254, 254, 253, 252, 251, 249, 247, 244, 235, 220, 196, 162, 124,
+   89,  57,  34,  21,  13,   9,   6,   5, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 251, 250, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252,
+  251, 250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 252, 251, 249, 248, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 248, 245, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249,
+  245, 241, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  252, 251, 250, 249, 246, 242, 235, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 251, 249, 247, 243, 237, 228, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 248, 244, 238, 229,
+  218, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250,
+  249, 244, 237, 229, 217, 201, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 252, 250, 249, 245, 239, 228, 216, 200, 177, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 249, 246, 240, 231, 216, 199, 172, 138,
+  255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250, 249, 246, 241, 232,
+  219, 197, 167, 132,  97, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250,
+  249, 246, 241, 233, 221, 196, 160, 123,  89,  61, 255, 255, 255, 255, 254, 254,
+  253, 252, 251, 250, 249, 246, 241, 234, 220, 196, 160, 117,  81,  55,  38, 255,
+  255, 255, 254, 254, 253, 252, 251, 250, 249, 247, 242, 233, 218, 195, 159, 116,
+   76,  51,  35,  24, 255, 255, 254, 254, 254, 253, 252, 250, 249, 247, 242, 233,
+  216, 191, 159, 116,  78,  49,  32,  22,  15, 255, 255, 254, 254, 253, 252, 251,
+  249, 247, 243, 233, 217, 191, 156, 118,  81,  51,  31,  20,  14,  10, 255, 254,
+  254, 253, 253, 251, 250, 247, 244, 234, 218, 193, 159, 123,  84,  53,  31,  19,
+   13,   9,   7, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252,
+  251, 250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 247, 243, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 249, 248,
+  244, 239, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  252, 251, 250, 248, 245, 240, 233, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 252, 251, 250, 249, 245, 241, 234, 225, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 249, 247, 242, 234, 225,
+  211, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250,
+  248, 243, 235, 224, 211, 193, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 251, 250, 248, 244, 237, 225, 210, 190, 159, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 249, 245, 238, 228, 212, 186, 154, 118,
+  255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250, 249, 245, 240, 230,
+  215, 186, 148, 112,  80, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250,
+  249, 246, 240, 232, 216, 189, 150, 107,  75,  51, 255, 255, 255, 255, 254, 254,
+  253, 252, 251, 250, 249, 246, 241, 232, 214, 189, 151, 108,  71,  49,  34, 255,
+  255, 255, 255, 254, 254, 253, 252, 250, 249, 247, 242, 232, 215, 188, 151, 109,
+   73,  46,  31,  22, 255, 255, 255, 254, 254, 253, 252, 251, 249, 247, 242, 232,
+  215, 189, 154, 113,  75,  48,  30,  20,  14, 255, 255, 254, 254, 254, 253, 251,
+  250, 248, 243, 233, 216, 190, 158, 122,  81,  50,  30,  20,  14,  11, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252,
+  251, 250, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 253, 252, 251, 250, 248, 246, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 246, 242, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 247,
+  243, 237, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 251, 249, 247, 243, 238, 230, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 252, 251, 250, 248, 244, 239, 231, 220, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249, 246, 239, 231, 220,
+  205, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 249,
+  247, 241, 232, 219, 203, 179, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 251, 250, 247, 242, 234, 222, 202, 174, 142, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 248, 244, 236, 225, 205, 170, 136, 103,
+  255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250, 249, 245, 238, 227,
+  206, 174, 133,  97,  69, 255, 255, 255, 255, 255, 254, 254, 253, 252, 252, 251,
+  249, 246, 240, 229, 209, 177, 137,  97,  65,  44, 255, 255, 255, 255, 255, 254,
+  254, 253, 252, 251, 249, 246, 241, 231, 212, 182, 141, 102,  69,  44,  30, 255,
+  255, 255, 255, 254, 254, 253, 252, 251, 249, 247, 242, 231, 213, 186, 152, 112,
+   74,  47,  29,  21, 255, 255, 255, 254, 254, 253, 253, 251, 250, 247, 242, 232,
+  214, 188, 157, 121,  81,  51,  33,  22,  16, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 251, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251,
+  250, 249, 247, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 252, 251, 251, 249, 248, 244, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 248, 245, 240, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 248, 245,
+  241, 234, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  252, 251, 249, 246, 242, 236, 227, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 250, 247, 243, 236, 227, 215, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 248, 244, 237, 226, 214,
+  198, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249,
+  245, 239, 228, 213, 195, 168, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253,
+  253, 252, 251, 249, 246, 241, 231, 217, 192, 162, 130, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 247, 242, 235, 219, 195, 162, 123,  91,
+  255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250, 248, 244, 237, 223,
+  200, 167, 127,  88,  59, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 250,
+  249, 245, 239, 225, 205, 175, 135,  92,  61,  39, 255, 255, 255, 255, 255, 254,
+  254, 253, 252, 251, 249, 246, 240, 227, 207, 180, 146, 105,  69,  45,  30, 255,
+  255, 255, 255, 254, 254, 253, 252, 252, 250, 247, 241, 229, 210, 186, 155, 118,
+   84,  56,  36,  24, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 252, 251, 249, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 248, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251,
+  250, 249, 246, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 252, 251, 250, 249, 247, 243, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 252, 252, 250, 249, 247, 243, 238, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 247, 244,
+  239, 232, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  251, 250, 249, 245, 240, 233, 224, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 252, 251, 249, 247, 241, 233, 223, 211, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 253, 253, 252, 251, 250, 248, 243, 234, 223, 209,
+  190, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249,
+  244, 237, 227, 210, 185, 156, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253,
+  253, 252, 251, 249, 245, 240, 231, 214, 188, 151, 117, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 249, 247, 241, 233, 218, 194, 159, 115,  80,
+  255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250, 247, 243, 235, 221,
+  199, 168, 126,  83,  52, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 250,
+  248, 244, 237, 224, 203, 174, 136,  97,  66,  43, 255, 255, 255, 255, 255, 254,
+  254, 253, 252, 251, 249, 245, 238, 226, 207, 180, 151, 117,  83,  56,  36, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 253, 252, 252, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 251, 250, 249, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 248, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251,
+  250, 248, 245, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 248, 245, 241, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 246, 242, 237, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249, 246, 242,
+  237, 231, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252,
+  251, 250, 248, 244, 238, 231, 221, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 252, 250, 249, 246, 240, 231, 220, 206, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 253, 253, 252, 251, 250, 247, 243, 235, 223, 205,
+  180, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 248,
+  244, 238, 227, 210, 181, 144, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253,
+  253, 252, 250, 249, 245, 239, 231, 214, 188, 150, 107, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 249, 246, 241, 233, 218, 194, 160, 117,  79,
+  255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250, 247, 242, 235, 220,
+  199, 168, 133,  94,  64, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251,
+  248, 244, 236, 223, 203, 179, 148, 114,  81,  55, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 251, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  252, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 252, 252, 251, 250, 249, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 247, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250,
+  249, 247, 244, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 249, 248, 244, 240, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 251, 250, 248, 245, 241, 235, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249, 247, 242,
+  236, 229, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252,
+  251, 250, 248, 245, 238, 228, 217, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 251, 250, 249, 246, 241, 232, 219, 202, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 253, 252, 252, 251, 249, 247, 243, 235, 224, 205,
+  173, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 248,
+  244, 238, 228, 210, 181, 141, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253,
+  252, 252, 250, 249, 245, 239, 231, 214, 188, 154, 115, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 249, 246, 241, 232, 217, 196, 167, 132,  93,
+  255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 251, 250, 247, 242, 234, 222,
+  204, 179, 147, 111,  79, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253,
+  252, 251, 250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 252, 252, 251, 250, 248, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 246, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 251, 250,
+  249, 247, 243, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 252, 251, 249, 247, 244, 239, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 251, 250, 249, 245, 240, 234, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 247, 243,
+  236, 227, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 252, 252,
+  251, 250, 248, 245, 239, 229, 214, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 251, 250, 249, 246, 241, 233, 219, 200, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 253, 252, 252, 251, 249, 247, 242, 236, 224, 205,
+  175, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 248,
+  244, 237, 228, 210, 186, 153, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253,
+  253, 252, 250, 249, 245, 239, 231, 217, 196, 167, 130, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 252, 251, 250, 246, 241, 234, 222, 204, 179, 146, 109,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 251, 250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 253, 253, 252, 251, 250, 249, 248, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 248, 246, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 251, 250,
+  249, 246, 242, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 252, 251, 249, 248, 243, 238, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 251, 250, 248, 246, 240, 233, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 247, 243,
+  237, 225, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252,
+  251, 250, 248, 245, 239, 230, 215, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 251, 250, 249, 246, 241, 233, 220, 201, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 249, 247, 242, 235, 226, 210,
+  185, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 248,
+  244, 238, 230, 217, 195, 167, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253,
+  253, 252, 251, 249, 246, 241, 234, 222, 205, 179, 145, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 251, 251, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 251, 250, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 251, 250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 250, 249, 248, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 248, 245, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250,
+  249, 246, 242, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 251, 251, 249, 248, 244, 237, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 252, 251, 250, 248, 246, 241, 233, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 247, 244,
+  237, 226, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252,
+  251, 250, 248, 245, 239, 230, 218, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 251, 250, 249, 246, 241, 235, 225, 209, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 249, 247, 243, 238, 230, 217,
+  195, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249,
+  245, 240, 233, 223, 204, 178, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 252, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 251, 249, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  252, 251, 250, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249, 248, 244, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250,
+  249, 246, 242, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 251, 250, 249, 248, 244, 238, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 252, 251, 250, 248, 246, 242, 234, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 251, 250, 249, 247, 244,
+  238, 229, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252,
+  251, 250, 248, 245, 241, 234, 223, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 252, 250, 249, 247, 243, 237, 229, 216, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 253, 253, 252, 251, 250, 248, 245, 240, 233, 223,
+  204, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  252, 251, 250, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249, 248, 245, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250,
+  248, 247, 242, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 252, 250, 249, 247, 245, 239, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 252, 251, 250, 248, 246, 243, 237, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 250, 249, 247, 245,
+  240, 233, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252,
+  251, 250, 249, 247, 242, 236, 227, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 252, 252, 251, 250, 248, 245, 239, 232, 221, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  252, 251, 250, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249, 248, 245, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 251, 250,
+  248, 247, 243, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 252, 251, 249, 248, 245, 242, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 251, 250, 249, 247, 244, 240, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 248, 246,
+  242, 236, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252,
+  251, 251, 249, 248, 244, 239, 231, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  252, 251, 249, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 253, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 252, 252, 251, 249, 248, 246, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 251, 250,
+  249, 247, 245, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 252, 252, 251, 250, 248, 246, 243, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 251, 251, 249, 247, 245, 241, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 247,
+  244, 238, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  252, 251, 249, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 253, 253, 252, 251, 250, 249, 247, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 248, 246, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251,
+  249, 247, 245, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 249, 247, 244, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 252, 251, 250, 248, 246, 243, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 252, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 251, 250, 248, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 253, 253, 252, 252, 251, 249, 247, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 249, 247, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251,
+  250, 248, 246, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 252, 251, 249, 248, 245, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251, 249, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 251, 250, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 253, 253, 253, 252, 251, 250, 248, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 251, 249, 247, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251,
+  250, 249, 247, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 253, 252, 251, 250, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 252, 251, 249, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 251, 250, 249, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 253, 252, 251, 250, 248, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 252,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 252, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 250, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 252, 251, 249, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 251,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 252, 252, 251, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 251, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  253, 252, 251, 250, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 253, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 251, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 253, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 253, 252, 252, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253,
+  252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 253, 253, 252, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 253, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 253, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 252,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254,
+  254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 254, 253, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254,
+  253, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 253, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 254, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 254, 254, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 254, 255, 255,
+  255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+  255, 254, 254
+};
+
+static inline int wifi_lut_cell(float value, float lo, float hi, float step,
+                                int size, float* frac) {
+  if (!(value > lo)) value = lo;  // also catches NaN
+  if (value > hi) value = hi;
+  int idx = (int)((value - lo) / step);
+  if (idx > size - 2) idx = size - 2;
+  float a0 = lo + idx * step;
+  float a1 = (idx + 1 == size - 1) ? hi : a0 + step;
+  *frac = (value - a0) / (a1 - a0);
+  return idx;
+}
+
+// Stability in [0, 1] for raw KPIs (SNR is implied by rssi - noise)
+static inline float wifi_model_lut_predict(float rssi, float noise, float channel_util) {
+  float fr, fn, fu;
+  int ir = wifi_lut_cell(rssi, WIFI_LUT_RSSI_MIN, WIFI_LUT_RSSI_MAX,
+                         WIFI_LUT_RSSI_STEP, WIFI_LUT_RSSI_SIZE, &fr);
+  int in = wifi_lut_cell(noise, WIFI_LUT_NOISE_MIN, WIFI_LUT_NOISE_MAX,
+                         WIFI_LUT_NOISE_STEP, WIFI_LUT_NOISE_SIZE, &fn);
+  int iu = wifi_lut_cell(channel_util, WIFI_LUT_UTIL_MIN, WIFI_LUT_UTIL_MAX,
+                         WIFI_LUT_UTIL_STEP, WIFI_LUT_UTIL_SIZE, &fu);
+
+  float result = 0.0f;
+  for (int dr = 0; dr < 2; dr++) {
+    float wr = dr ? fr : 1.0f - fr;
+    for (int dn = 0; dn < 2; dn++) {
+      float wn = dn ? fn : 1.0f - fn;
+      const uint8_t* row = wifi_model_lut +
+          ((ir + dr) * WIFI_LUT_NOISE_SIZE + (in + dn)) * WIFI_LUT_UTIL_SIZE + iu;
+      result += wr * wn * ((1.0f - fu) * row[0] + fu * row[1]);
+    }
+  }
+  return result / 255.0f;
+}
+
+#endif // MODEL_LUT_H
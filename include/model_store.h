@@ -0,0 +1,104 @@
+// Model partition
+// A retrained model.tflite can replace the compiled-in model.h array without a
+// rebuild: upload_model.py POSTs a blob (ModelBlobHeader + model bytes) to
+// /model, which writes it to the idle slot of the "model" data partition
+// (partitions.csv). The KPI task validates the slot and swaps between ticks;
+// the interpreter reads the model straight from memory-mapped flash, so no RAM
+// copy is made. At boot the valid slots are tried newest generation first, and
+// the model.h array is the fallback when no slot holds a model the interpreter accepts.
+// Mirrored by upload_model.py.
+
+#ifndef MODEL_STORE_H
+#define MODEL_STORE_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#define MODEL_BLOB_MAGIC 0x4c444d57u  // "WMDL" little-endian
+#define MODEL_BLOB_VERSION 1
+#define MODEL_PARTITION_LABEL "model"
+#define MODEL_PARTITION_SUBTYPE 0x40  // first custom data subtype
+#define MODEL_SLOT_COUNT 2
+#define MODEL_SLOT_BYTES 0x8000       // 32 KB per slot, the partition holds two
+
+// Model bytes start right after the header, 16-byte aligned for the flatbuffer
+struct ModelBlobHeader {
+    uint32_t magic;
+    uint16_t version;
+    uint16_t header_size;
+    uint32_t length;        // model bytes
+    uint32_t crc32;         // CRC-32 (zlib) of the model bytes
+    uint32_t generation;    // higher wins at boot; upload_model.py uses the active one + 1
+    uint32_t reserved[3];
+};
+
+static_assert(sizeof(ModelBlobHeader) == 32, "ModelBlobHeader is a flash format");
+
+enum ModelBlobStatus : uint8_t {
+    MODEL_BLOB_OK,
+    MODEL_BLOB_EMPTY,       // erased flash
+    MODEL_BLOB_BAD_HEADER,
+    MODEL_BLOB_TOO_LARGE,
+    MODEL_BLOB_BAD_CRC,
+    MODEL_BLOB_NOT_TFLITE,
+};
+
+inline const char* modelBlobStatusName(uint8_t status) {
+    static const char* const names[] = {"ok", "empty", "bad header", "too large", "bad crc", "not tflite"};
+    return status <= MODEL_BLOB_NOT_TFLITE ? names[status] : "unknown";
+}
+
+// Same polynomial and conditioning as zlib.crc32(), so Python can compute it
+inline uint32_t modelCrc32(const uint8_t* data, size_t length, uint32_t crc = 0) {
+    crc = ~crc;
+    for (size_t i = 0; i < length; i++) {
+        crc ^= data[i];
+        for (int bit = 0; bit < 8; bit++) crc = (crc >> 1) ^ (0xEDB88320u & -(crc & 1));
+    }
+    return ~crc;
+}
+
+// Validates a slot image (mapped flash or a RAM copy) of `size` bytes
+inline ModelBlobStatus checkModelBlob(const uint8_t* slot, size_t size, ModelBlobHeader* out = nullptr) {
+    ModelBlobHeader header;
+    if (size < sizeof(header)) return MODEL_BLOB_BAD_HEADER;
+    memcpy(&header, slot, sizeof(header));
+    if (out) *out = header;
+    if (header.magic == 0xFFFFFFFFu) return MODEL_BLOB_EMPTY;
+    if (header.magic != MODEL_BLOB_MAGIC || header.version != MODEL_BLOB_VERSION ||
+        header.header_size < sizeof(header) || header.header_size % 16 != 0) {
+        return MODEL_BLOB_BAD_HEADER;
+    }
+    if (header.length > size || header.header_size > size - header.length) return MODEL_BLOB_TOO_LARGE;
+    const uint8_t* model = slot + header.header_size;
+    if (modelCrc32(model, header.length) != header.crc32) return MODEL_BLOB_BAD_CRC;
+    // TFLite flatbuffers carry the "TFL3" file identifier at offset 4
+    if (header.length < 8 || memcmp(model + 4, "TFL3", 4) != 0) return MODEL_BLOB_NOT_TFLITE;
+    return MODEL_BLOB_OK;
+}
+
+// Valid slots into `order`, highest generation first; returns how many there are
+inline int orderModelSlots(const ModelBlobHeader headers[MODEL_SLOT_COUNT], const bool valid[MODEL_SLOT_COUNT],
+                           int order[MODEL_SLOT_COUNT]) {
+    int count = 0;
+    for (int slot = 0; slot < MODEL_SLOT_COUNT; slot++) {
+        if (!valid[slot]) continue;
+        int i = count++;
+        for (; i > 0 && headers[order[i - 1]].generation < headers[slot].generation; i--) order[i] = order[i - 1];
+        order[i] = slot;
+    }
+    return count;
+}
+
+// Which model the interpreter runs; published by the KPI task for GET /model
+struct ModelInfo {
+    int8_t slot;            // -1: the compiled-in model.h array
+    uint16_t loads;         // models loaded since boot
+    uint32_t generation;
+    uint32_t length;
+    uint32_t crc32;
+    uint32_t loaded_ms;     // millis() of the last swap
+};
+
+#endif // MODEL_STORE_H
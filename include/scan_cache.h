@@ -0,0 +1,67 @@
+// Shared WiFi scan results
+// The KPI task is the only code that scans. It keeps the last result set for
+// SCAN_CACHE_TTL_MS: /scan is served from it and saveKPI() derives the AP count
+// and channel utilization from it instead of scanning on every sample.
+// Mirrored by ScanResults in scan_cache.py.
+
+#ifndef SCAN_CACHE_H
+#define SCAN_CACHE_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+#define SCAN_CACHE_TTL_MS 30000     // results younger than this are reused
+#define SCAN_MAX_RESULTS 32         // strongest-first from the driver; the rest are dropped
+#define SCAN_CHANNELS 14            // 2.4 GHz channels 1-14
+#define CHANNEL_SPAN 5              // a 20 MHz channel overlaps the 4 channels on each side
+#define CHANNEL_BASE_UTIL 5.0f      // % airtime with no neighbours (beacons, own traffic)
+#define CHANNEL_UTIL_PER_AP 12.0f   // % airtime of one strong co-channel AP
+
+struct ScanEntry {
+    char ssid[33];
+    int8_t rssi;
+    uint8_t channel;
+    bool open;              // WIFI_AUTH_OPEN
+};
+
+struct ScanResults {
+    uint32_t taken_ms = 0;  // millis() when the scan finished, 0 before the first one
+    uint32_t scans = 0;     // radio scans since boot
+    uint8_t count = 0;
+    ScanEntry entries[SCAN_MAX_RESULTS];
+    // Audible APs per channel (index = channel): each counts by how loud it is, from 0 at
+    // -95 dBm to 1 at -55 dBm and up. channelUtilization() reads this, not the entries.
+    float channel_load[SCAN_CHANNELS + 1];
+
+    ScanResults() : entries(), channel_load() {}
+
+    bool fresh(uint32_t now_ms) const {
+        return taken_ms != 0 && now_ms - taken_ms < SCAN_CACHE_TTL_MS;
+    }
+
+    // Rebuild channel_load after entries[0..count) were filled
+    void summarize() {
+        for (int c = 0; c <= SCAN_CHANNELS; c++) channel_load[c] = 0.0f;
+        for (int i = 0; i < count; i++) {
+            uint8_t c = entries[i].channel <= SCAN_CHANNELS ? entries[i].channel : 0;
+            float loudness = (entries[i].rssi + 95) / 40.0f;
+            channel_load[c] += loudness < 0.0f ? 0.0f : loudness > 1.0f ? 1.0f : loudness;
+        }
+    }
+
+    // Airtime estimate (%) on `channel`: the load of every channel within CHANNEL_SPAN,
+    // weighted by how much it overlaps ours. channel 0 (not associated) counts every
+    // channel as co-channel.
+    float channelUtilization(uint8_t channel) const {
+        float load = 0.0f;
+        for (int c = 0; c <= SCAN_CHANNELS; c++) {
+            int distance = channel ? abs(c - (int)channel) : 0;
+            if (distance >= CHANNEL_SPAN) continue;
+            load += (1.0f - (float)distance / CHANNEL_SPAN) * channel_load[c];
+        }
+        float util = CHANNEL_BASE_UTIL + CHANNEL_UTIL_PER_AP * load;
+        return util > 100.0f ? 100.0f : util;
+    }
+};
+
+#endif // SCAN_CACHE_H
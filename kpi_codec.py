@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Block codec for raw KPI samples: host mirror of include/kpi_codec.h, a
+vectorized NumPy decoder and a benchmark
+
+/history?range=N&format=packed streams the raw tier as fixed 256-byte blocks:
+
+    header  <HHHBB + raw record   magic "KB", count, used bytes, exceptions,
+                                  version, then the first sample as stored in
+                                  the raw ring (<IhhBBH)
+    samples count - 1 x 5 zigzag varints: delta-of-delta of t, deltas of rssi,
+            noise, channel_util and stability (ring units: 0.1 dB, 0.5 %, 1/250)
+    exceptions  (index, dt - step) varint pairs for samples whose dt is not the
+                time step since the previous one
+    padding     zeros up to 256 bytes
+
+Usage:
+    python kpi_codec.py --benchmark                # 5 days: ratio, encode and decode cost
+    python kpi_codec.py "http://192.168.4.1/history?range=1&format=packed"
+    python kpi_codec.py history.bin --json
+"""
+
+import argparse
+import json
+import struct
+import time
+import urllib.request
+
+import numpy as np
+
+from tiered_history import RAW, TIER_RAW, raw_record, record_json
+
+KPI_BLOCK_BYTES = 256
+KPI_BLOCK_MAGIC = 0x424B        # "KB"
+KPI_BLOCK_VERSION = 1
+KPI_EXCEPTIONS_MAX = 32
+BLOCK_HEADER = struct.Struct('<HHHBB')
+HEADER_BYTES = BLOCK_HEADER.size + RAW.size
+FIELDS = ('t', 'rssi', 'noise', 'channel_util', 'stability', 'dt')
+RAW_DTYPE = np.dtype([('t', '<u4'), ('rssi', '<i2'), ('noise', '<i2'), ('channel_util', 'u1'),
+                      ('stability', 'u1'), ('dt', '<u2')])
+BLOCK_DTYPE = np.dtype([('magic', '<u2'), ('count', '<u2'), ('used', '<u2'), ('exceptions', 'u1'),
+                        ('version', 'u1'), ('first', RAW_DTYPE),
+                        ('payload', 'u1', KPI_BLOCK_BYTES - HEADER_BYTES)])
+
+
+def zigzag(v):
+    return ((v << 1) ^ (v >> 31)) & 0xFFFFFFFF
+
+
+def unzigzag(v):
+    return (v >> 1) ^ -(v & 1)
+
+
+def put_varint(out, v):
+    while v >= 0x80:
+        out.append((v & 0x7F) | 0x80)
+        v >>= 7
+    out.append(v)
+
+
+def get_varint(data, pos, end):
+    value = shift = 0
+    while pos < end and shift < 35:
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        pos += 1
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+    raise ValueError("truncated varint")
+
+
+def int32(v):
+    return (v + 0x80000000) % 0x100000000 - 0x80000000
+
+
+class BlockEncoder:
+    """KpiBlockEncoder: add() raw ring tuples until it returns False, then finish()"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.first = None
+        self.count = 0
+        self.samples = bytearray()
+        self.exceptions = bytearray()
+        self.exception_count = 0
+
+    def add(self, record):
+        if not self.count:
+            self.first = self.last = record
+            self.count = 1
+            self.step = record[5]
+            return True
+        delta = int32(record[0] - self.last[0])
+        sample = bytearray()
+        put_varint(sample, zigzag(delta - self.step))
+        for i in range(1, 5):
+            put_varint(sample, zigzag(record[i] - self.last[i]))
+        exception = bytearray()
+        if record[5] != delta:
+            if self.exception_count == KPI_EXCEPTIONS_MAX or self.count == 0xFFFF:
+                return False
+            put_varint(exception, self.count)
+            put_varint(exception, zigzag(record[5] - delta))
+        if HEADER_BYTES + len(self.samples) + len(sample) + len(self.exceptions) + len(exception) \
+                > KPI_BLOCK_BYTES:
+            return False
+        self.samples += sample
+        self.exceptions += exception
+        self.exception_count += bool(exception)
+        self.count += 1
+        self.step = delta
+        self.last = record
+        return True
+
+    def finish(self):
+        used = HEADER_BYTES + len(self.samples) + len(self.exceptions)
+        block = (BLOCK_HEADER.pack(KPI_BLOCK_MAGIC, self.count, used, self.exception_count,
+                                   KPI_BLOCK_VERSION)
+                 + RAW.pack(*self.first) + self.samples + self.exceptions)
+        return bytes(block) + bytes(KPI_BLOCK_BYTES - used)
+
+
+def encode_blocks(records):
+    """Raw ring tuples (t, rssi, noise, util, stability, dt) -> concatenated blocks"""
+    blocks = []
+    encoder = BlockEncoder()
+    for record in records:
+        if not encoder.add(record):
+            blocks.append(encoder.finish())
+            encoder.reset()
+            encoder.add(record)
+    if encoder.count:
+        blocks.append(encoder.finish())
+    return b''.join(blocks)
+
+
+def decode_blocks(data):
+    """Reference decoder, one sample at a time, like kpiBlockDecode()"""
+    if len(data) % KPI_BLOCK_BYTES:
+        raise ValueError("packed history is not a whole number of blocks")
+    records = []
+    for offset in range(0, len(data), KPI_BLOCK_BYTES):
+        magic, count, used, exceptions, version = BLOCK_HEADER.unpack_from(data, offset)
+        if magic != KPI_BLOCK_MAGIC or version != KPI_BLOCK_VERSION or not count \
+                or not HEADER_BYTES <= used <= KPI_BLOCK_BYTES:
+            raise ValueError(f"bad block at byte {offset}")
+        block = [list(RAW.unpack_from(data, offset + BLOCK_HEADER.size))]
+        pos, end = offset + HEADER_BYTES, offset + used
+        step = block[0][5]
+        for _ in range(count - 1):
+            values = []
+            for _ in range(5):
+                value, pos = get_varint(data, pos, end)
+                values.append(unzigzag(value))
+            step += values[0]
+            prev = block[-1]
+            block.append([prev[0] + step] + [prev[i] + values[i] for i in range(1, 5)] + [step])
+        for _ in range(exceptions):
+            index, pos = get_varint(data, pos, end)
+            residual, pos = get_varint(data, pos, end)
+            if not 0 < index < count:
+                raise ValueError(f"bad exception index in block at byte {offset}")
+            block[index][5] = block[index][0] - block[index - 1][0] + unzigzag(residual)
+        records += [tuple(r) for r in block]
+    return records
+
+
+def decode_varints(data):
+    """Every LEB128 varint in a uint8 array, at once"""
+    ends = np.flatnonzero(data < 0x80)
+    if len(ends) and ends[-1] != len(data) - 1 or not len(ends) and len(data):
+        raise ValueError("truncated varint")
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    shift = np.arange(len(data)) - np.repeat(starts, ends - starts + 1)
+    if len(shift) and shift.max() >= 5:
+        raise ValueError("varint longer than 5 bytes")
+    values = (data & 0x7F).astype(np.int64) << (7 * shift)
+    return np.add.reduceat(values, starts) if len(starts) else values[:0]
+
+
+def segment_cumsum(values, starts):
+    """cumsum restarting at every index in `starts` (which must include 0)"""
+    total = np.cumsum(values)
+    offsets = np.concatenate(([0], total[starts[1:] - 1]))
+    return total - np.repeat(offsets, np.diff(np.append(starts, len(values))))
+
+
+def decode_blocks_np(data):
+    """Vectorized decoder: packed history -> structured array with the raw ring fields"""
+    if len(data) % KPI_BLOCK_BYTES:
+        raise ValueError("packed history is not a whole number of blocks")
+    blocks = np.frombuffer(data, dtype=BLOCK_DTYPE)
+    if not len(blocks):
+        return np.zeros(0, RAW_DTYPE)
+    count = blocks['count'].astype(np.int64)
+    used = blocks['used'].astype(np.int64)
+    exceptions = blocks['exceptions'].astype(np.int64)
+    if ((blocks['magic'] != KPI_BLOCK_MAGIC) | (blocks['version'] != KPI_BLOCK_VERSION)
+            | (count == 0) | (used < HEADER_BYTES) | (used > KPI_BLOCK_BYTES)).any():
+        raise ValueError("bad block header")
+
+    # All payload bytes, block after block, then every varint at once
+    payload = blocks['payload'][np.arange(KPI_BLOCK_BYTES - HEADER_BYTES) < (used - HEADER_BYTES)[:, None]]
+    varints = decode_varints(payload)
+    per_block = 5 * (count - 1) + 2 * exceptions
+    if len(varints) != per_block.sum():
+        raise ValueError("block payload does not match its sample count")
+    values = unzigzag(varints)
+    block_start = np.cumsum(per_block) - per_block
+    position = np.arange(len(values)) - np.repeat(block_start, per_block)
+    is_sample = position < np.repeat(5 * (count - 1), per_block)
+    deltas = values[is_sample].reshape(-1, 5)
+    exception_pairs = values[~is_sample].reshape(-1, 2)
+    exception_index = varints[~is_sample].reshape(-1, 2)[:, 0]
+
+    # One row per sample; the first row of each block holds the stored record
+    rows = int(count.sum())
+    row_start = np.cumsum(count) - count
+    first = np.zeros(rows, bool)
+    first[row_start] = True
+    out = np.zeros(rows, RAW_DTYPE)
+    firsts = blocks['first']
+
+    step = np.zeros(rows, np.int64)
+    step[first] = firsts['dt']
+    step[~first] = deltas[:, 0]
+    step = segment_cumsum(step, row_start)
+    offsets = step.copy()
+    offsets[first] = 0
+    out['t'] = np.repeat(firsts['t'].astype(np.int64), count) + segment_cumsum(offsets, row_start)
+    for column, name in enumerate(('rssi', 'noise', 'channel_util', 'stability'), start=1):
+        change = np.zeros(rows, np.int64)
+        change[first] = firsts[name]
+        change[~first] = deltas[:, column]
+        out[name] = segment_cumsum(change, row_start)
+    dt = step
+    if len(exception_index):
+        exception_block = np.repeat(np.arange(len(blocks)), exceptions)
+        if ((exception_index <= 0) | (exception_index >= count[exception_block])).any():
+            raise ValueError("bad exception index")
+        index = row_start[exception_block] + exception_index
+        dt[index] = offsets[index] + exception_pairs[:, 1]
+    out['dt'] = dt
+    return out
+
+
+def load(source):
+    if source.startswith(('http://', 'https://')):
+        with urllib.request.urlopen(source, timeout=30) as response:
+            return response.read()
+    with open(source, 'rb') as f:
+        return f.read()
+
+
+def benchmark(days=5, repeat=5):
+    """Packed blocks vs the raw ring and /history.json on synthetic history"""
+    from history_store import encode_history, generate_history
+
+    history = generate_history(days)
+    records = [raw_record(r['t'], r['rssi'], r['noise'], r['channel_util'], r['stability'], r['dt'])
+               for r in history]
+
+    start = time.perf_counter()
+    packed = encode_blocks(records)
+    encode_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = decode_blocks(packed)
+    decode_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decoded = decode_blocks_np(packed)
+    decode_np_s = (time.perf_counter() - start) / repeat
+
+    assert reference == records and decoded.tolist() == records
+    n = len(records)
+    interval = history[-1]['t'] - history[-2]['t'] if n > 1 else 10
+    return {
+        'samples': n,
+        'interval_s': interval,
+        'json_bytes': len(encode_history(history)),
+        'raw_bytes': n * RAW.size,
+        'packed_bytes': len(packed),
+        'blocks': len(packed) // KPI_BLOCK_BYTES,
+        'encode_us_per_sample': encode_s / n * 1e6,
+        'decode_samples_per_s': n / decode_s,
+        'decode_np_samples_per_s': n / decode_np_s,
+    }
+
+
+def print_benchmark(r, fs_bytes):
+    n = r['samples']
+    print(f"📦 {n:,} samples ({n * r['interval_s'] / 86400:g} days at {r['interval_s']} s)")
+    for label, key in (('/history.json', 'json_bytes'), ('raw ring', 'raw_bytes'),
+                       ('packed blocks', 'packed_bytes')):
+        size = r[key]
+        print(f"   {label:<14} {size / 1024:>9.1f} KB  {size / n:6.2f} B/sample  "
+              f"{r['json_bytes'] / size:5.1f}x vs JSON")
+    print(f"⏱️  encode {r['encode_us_per_sample']:.2f} µs/sample (Python), decode "
+          f"{r['decode_samples_per_s'] / 1e6:.2f} M samples/s (reference), "
+          f"{r['decode_np_samples_per_s'] / 1e6:.2f} M samples/s (NumPy)")
+    per_sample = r['packed_bytes'] / n
+    days = fs_bytes / per_sample * r['interval_s'] / 86400
+    raw_days = fs_bytes / RAW.size * r['interval_s'] / 86400
+    print(f"💾 {fs_bytes / 1024:.0f} KB of flash holds {raw_days:.1f} days of raw samples as ring "
+          f"records, {days:.1f} days as packed blocks")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode /history?format=packed or benchmark the codec")
+    parser.add_argument('source', nargs='?', help='device URL or a saved packed history')
+    parser.add_argument('--json', action='store_true', help='print the samples as /history records')
+    parser.add_argument('--ssid', default='', help='SSID to put in --json records')
+    parser.add_argument('--benchmark', action='store_true')
+    parser.add_argument('--days', type=float, default=5, help='history length for --benchmark')
+    parser.add_argument('--flash', type=int, default=1_090_000,
+                        help='bytes of flash for the retention estimate (default: the tier rings)')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        print_benchmark(benchmark(args.days), args.flash)
+        return
+    if not args.source:
+        parser.error("source is required unless --benchmark is given")
+
+    samples = decode_blocks_np(load(args.source))
+    if args.json:
+        print(json.dumps([record_json(TIER_RAW, r, args.ssid) for r in samples.tolist()]))
+        return
+    if not len(samples):
+        print("📭 No samples")
+        return
+    print(f"📈 {len(samples):,} samples, {samples['t'][0]} → {samples['t'][-1]}")
+    for name in ('rssi', 'noise'):
+        values = samples[name] / 10
+        print(f"   {name:<6} min {values.min():.1f}  mean {values.mean():.1f}  max {values.max():.1f} dBm")
+
+
+if __name__ == "__main__":
+    main()
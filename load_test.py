@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+Dashboard load test against the host simulator (or a device)
+
+Each viewer behaves like one open dashboard tab:
+  poll  - the old dashboard.js: /status and /advanced-ai every 5 s,
+          /history?range=0 every 30 s
+  sse   - one /history?range=0 load, then a single /events subscription
+          (falling back to polling when the device refuses the stream)
+
+Reports requests, bytes/s per viewer and connections held for each mode.
+Times are device seconds; --time-scale runs everything N times faster.
+
+--mode page measures cold (empty cache) and warm (revisit) dashboard loads
+for the plain data/ files and the build_assets.py image.
+
+--mode latency polls /status while the simulator spends --scan-ms and
+--commit-ms per sample, once with the old single loop() and once with the
+dual-core KPI task split, and reports response time percentiles.
+
+--mode scan polls /scan like an open network picker while the device
+samples, with and without the scan cache (--scan-ttl), and reports /scan
+response times and radio scans per device hour.
+"""
+
+import gzip
+import http.client
+import json
+import os
+import re
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
+from adaptive_sampling import percentile
+from host_simulator import DATA_DIR, LAYOUTS, Simulator
+from scan_cache import SCAN_CACHE_TTL_MS
+
+STATUS_POLL = 5.0      # setInterval(updateStatus, 5000)
+CHART_POLL = 30.0      # chart refresh for the "Today" view
+STALL_MS = 100.0       # latency mode: a response this slow counts as stalled
+SCAN_POLL = 5.0        # scan mode: network picker refresh per client, device seconds
+
+
+class ConnectionGauge:
+    """Client-side count of sockets currently open"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.open = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.open += 1
+            self.peak = max(self.peak, self.open)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.open -= 1
+
+
+class Viewer(threading.Thread):
+    def __init__(self, url, mode, deadline, time_scale, gauge):
+        super().__init__(daemon=True)
+        parsed = urlparse(url)
+        self.host, self.port = parsed.hostname, parsed.port or 80
+        self.mode = mode
+        self.deadline = deadline
+        self.time_scale = time_scale
+        self.gauge = gauge
+        self.requests = 0
+        self.bytes = 0
+        self.messages = 0
+        self.errors = 0
+        self.fell_back = False
+
+    def get(self, path):
+        """One request; returns (status, body) and counts header plus body bytes"""
+        with self.gauge:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=10)
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                body = response.read()
+            finally:
+                conn.close()
+        header_bytes = len(f"HTTP/1.0 {response.status} {response.reason}\r\n\r\n") + sum(
+            len(name) + len(value) + 4 for name, value in response.getheaders())
+        self.requests += 1
+        self.bytes += header_bytes + len(body)
+        return response.status, body
+
+    def sleep_until(self, when):
+        delay = min(when, self.deadline) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def poll(self):
+        next_status = next_chart = time.monotonic()
+        while time.monotonic() < self.deadline:
+            now = time.monotonic()
+            try:
+                if now >= next_chart:
+                    self.get('/history?range=0')
+                    next_chart += CHART_POLL / self.time_scale
+                if now >= next_status:
+                    self.get('/status')
+                    self.get('/advanced-ai')
+                    next_status += STATUS_POLL / self.time_scale
+            except (OSError, http.client.HTTPException):
+                self.errors += 1
+            self.sleep_until(min(next_status, next_chart))
+
+    def stream(self):
+        """Hold one /events connection open until the deadline"""
+        with self.gauge:
+            sock = socket.create_connection((self.host, self.port), timeout=10)
+            try:
+                sock.sendall(f"GET /events HTTP/1.1\r\nHost: {self.host}\r\n"
+                             "Accept: text/event-stream\r\n\r\n".encode())
+                self.requests += 1
+                sock.settimeout(0.2)
+                buffer = b''
+                headers_done = False
+                while time.monotonic() < self.deadline:
+                    try:
+                        chunk = sock.recv(4096)
+                    except socket.timeout:
+                        continue
+                    if not chunk:
+                        break
+                    self.bytes += len(chunk)
+                    buffer += chunk
+                    if not headers_done:
+                        if b'\r\n\r\n' not in buffer:
+                            continue
+                        head, buffer = buffer.split(b'\r\n\r\n', 1)
+                        headers_done = True
+                        if b' 200 ' not in head.split(b'\r\n', 1)[0]:
+                            return False
+                    *complete, buffer = buffer.split(b'\n\n')
+                    self.messages += sum(1 for m in complete if b'data: ' in m)
+            finally:
+                sock.close()
+        return True
+
+    def run(self):
+        try:
+            if self.mode == 'poll':
+                self.poll()
+                return
+            self.get('/history?range=0')
+            if not self.stream():
+                self.fell_back = True
+                self.poll()
+        except (OSError, http.client.HTTPException):
+            self.errors += 1
+
+
+def server_stats(url):
+    parsed = urlparse(url)
+    conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=5)
+    try:
+        conn.request('GET', '/sim/stats')
+        response = conn.getresponse()
+        return json.loads(response.read()) if response.status == 200 else None
+    except (OSError, http.client.HTTPException, ValueError):
+        return None
+    finally:
+        conn.close()
+
+
+def reset_server_stats(url):
+    parsed = urlparse(url)
+    conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=5)
+    try:
+        conn.request('GET', '/sim/reset')
+        conn.getresponse().read()
+    except (OSError, http.client.HTTPException):
+        pass
+    finally:
+        conn.close()
+
+
+def run_load(url, mode, viewers=4, duration=60.0, time_scale=1.0, stagger=True):
+    """Run `viewers` dashboard tabs for `duration` device seconds"""
+    reset_server_stats(url)
+    gauge = ConnectionGauge()
+    start = time.monotonic()
+    deadline = start + duration / time_scale
+    tabs = [Viewer(url, mode, deadline, time_scale, gauge) for _ in range(viewers)]
+    for i, tab in enumerate(tabs):
+        tab.start()
+        if stagger:  # tabs are not opened in lockstep
+            time.sleep(STATUS_POLL / time_scale / viewers / 2)
+    for tab in tabs:
+        tab.join(duration / time_scale + 15)
+
+    elapsed = duration  # device seconds
+    requests = sum(t.requests for t in tabs)
+    total_bytes = sum(t.bytes for t in tabs)
+    stats = server_stats(url)
+    return {
+        'mode': mode,
+        'viewers': viewers,
+        'duration': elapsed,
+        'requests': requests,
+        'requests_per_s': requests / elapsed,
+        'bytes_per_s_per_viewer': total_bytes / elapsed / max(viewers, 1),
+        'messages_per_viewer': sum(t.messages for t in tabs) / max(viewers, 1),
+        'fallbacks': sum(t.fell_back for t in tabs),
+        'errors': sum(t.errors for t in tabs),
+        'peak_client_connections': gauge.peak,
+        'server': stats,
+    }
+
+
+def print_result(result):
+    server = result['server'] or {}
+    print(f"📊 {result['mode']:<5} {result['viewers']} viewers, {result['duration']:.0f} s")
+    print(f"   requests        {result['requests']:>8} ({result['requests_per_s']:.2f}/s)")
+    print(f"   bytes/s/viewer  {result['bytes_per_s_per_viewer']:>8.0f}")
+    print(f"   connections     {result['peak_client_connections']:>8} peak held by clients"
+          + (f", {server.get('peak_connections', 0)} on the server" if server else ''))
+    if result['mode'] == 'sse':
+        print(f"   events/viewer   {result['messages_per_viewer']:>8.1f}"
+              f"   fallbacks {result['fallbacks']}")
+    if server:
+        print(f"   device samples  {server['samples']:>8}")
+    if result['errors']:
+        print(f"   ⚠️  {result['errors']} request errors")
+
+
+class BrowserCache:
+    """Just enough HTTP caching to tell a cold page load from a warm one"""
+
+    def __init__(self):
+        self.entries = {}   # path -> (etag, cache-control)
+        self.bodies = {}    # page bodies, re-parsed on a 304
+
+    def fresh(self, path):
+        entry = self.entries.get(path)
+        return entry is not None and 'max-age' in entry[1] and 'no-cache' not in entry[1]
+
+    def etag(self, path):
+        entry = self.entries.get(path)
+        return entry[0] if entry else None
+
+    def store(self, path, response):
+        etag = response.getheader('ETag')
+        cache_control = response.getheader('Cache-Control') or ''
+        if etag or 'max-age' in cache_control:
+            self.entries[path] = (etag, cache_control)
+
+
+def load_page(url, cache, page='/dashboard.html', rtt_ms=30.0, bandwidth_kbps=1000.0):
+    """
+    Fetch a page and the scripts/stylesheets it references, one request at a
+    time like the single-threaded WebServer. Returns bytes on the wire,
+    requests, measured time and time modelled for a slow AP link.
+    """
+    parsed = urlparse(url)
+    result = {'requests': 0, 'bytes': 0, 'not_modified': 0, 'cached': 0,
+              'time_ms': 0.0, 'link_ms': 0.0}
+
+    def fetch(path):
+        if cache.fresh(path):
+            result['cached'] += 1
+            return None
+        headers = {'Accept-Encoding': 'gzip'}
+        if cache.etag(path):
+            headers['If-None-Match'] = cache.etag(path)
+        started = time.perf_counter()
+        conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=10)
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        finally:
+            conn.close()
+        result['time_ms'] += (time.perf_counter() - started) * 1000
+        wire = len(body) + len(f"HTTP/1.0 {response.status} {response.reason}\r\n\r\n") + sum(
+            len(name) + len(value) + 4 for name, value in response.getheaders())
+        result['requests'] += 1
+        result['bytes'] += wire
+        result['link_ms'] += rtt_ms + wire * 8 / bandwidth_kbps
+        if response.status == 304:
+            result['not_modified'] += 1
+            return None
+        cache.store(path, response)
+        if response.getheader('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return body
+
+    html = fetch(page)
+    if html is None:  # 304: the browser renders its cached copy
+        html = cache.bodies.get(page, b'')
+    cache.bodies[page] = html
+    for _, target in re.findall(rb'''\b(src|href)=(?:"|')([^"'#?]+\.(?:js|css))''', html):
+        target = target.decode()
+        if '://' not in target:
+            fetch(target if target.startswith('/') else '/' + target)
+    return result
+
+
+def measure_page_load(url, page='/dashboard.html', rtt_ms=30.0, bandwidth_kbps=1000.0):
+    cache = BrowserCache()
+    cold = load_page(url, cache, page, rtt_ms, bandwidth_kbps)
+    warm = load_page(url, cache, page, rtt_ms, bandwidth_kbps)
+    return {'cold': cold, 'warm': warm}
+
+
+def compare_page_load(rtt_ms=30.0, bandwidth_kbps=1000.0, dist_dir='data_dist'):
+    """Dashboard load from plain data/ versus the build_assets.py image"""
+    from build_assets import build
+
+    build(DATA_DIR, dist_dir, verbose=False)
+    results = {}
+    for label, asset_dir in (('data', DATA_DIR), (os.path.basename(dist_dir), dist_dir)):
+        with Simulator(asset_dir=asset_dir, fixed_interval=60) as simulator:
+            results[label] = measure_page_load(simulator.url, rtt_ms=rtt_ms,
+                                               bandwidth_kbps=bandwidth_kbps)
+    return results
+
+
+def print_page_load(results, rtt_ms, bandwidth_kbps):
+    print(f"🌐 Dashboard page load ({rtt_ms:g} ms RTT, {bandwidth_kbps:g} kbit/s link model)")
+    print(f"{'assets':<11}{'load':<6}{'requests':>9}{'304':>5}{'cached':>7}{'bytes':>10}"
+          f"{'local ms':>10}{'link ms':>10}")
+    for label, loads in results.items():
+        for kind in ('cold', 'warm'):
+            r = loads[kind]
+            print(f"{label:<11}{kind:<6}{r['requests']:>9}{r['not_modified']:>5}{r['cached']:>7}"
+                  f"{r['bytes']:>10}{r['time_ms']:>10.1f}{r['link_ms']:>10.0f}")
+
+
+def measure_latency(url, duration=30.0, clients=2, period=0.05, path='/status'):
+    """Poll `path` from `clients` threads for `duration` seconds; response times in ms"""
+    parsed = urlparse(url)
+    deadline = time.monotonic() + duration
+    latencies = []
+    errors = []
+
+    def client():
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=30)
+            try:
+                conn.request('GET', path)
+                conn.getresponse().read()
+                latencies.append((time.monotonic() - start) * 1000)
+            except (OSError, http.client.HTTPException):
+                errors.append(path)
+            finally:
+                conn.close()
+            time.sleep(period)
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(duration + 60)
+
+    return {
+        'requests': len(latencies),
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'max_ms': max(latencies, default=0.0),
+        'stalled': sum(latency > STALL_MS for latency in latencies),
+        'errors': len(errors),
+    }
+
+
+def compare_layouts(duration=30.0, interval=5.0, scan_ms=1500.0, commit_ms=300.0, clients=2,
+                    time_scale=1.0):
+    """
+    /status latency with the single loop() versus the KPI task split; every
+    sample scans (scan_ttl=0) so each one costs scan_ms + commit_ms
+    """
+    results = {}
+    for layout in LAYOUTS[::-1]:
+        with Simulator(fixed_interval=interval, time_scale=time_scale, layout=layout,
+                       scan_ms=scan_ms, commit_ms=commit_ms, scan_ttl=0) as simulator:
+            result = measure_latency(simulator.url, duration, clients)
+            result['samples'] = simulator.device.stats()['samples']
+            results[layout] = result
+    return results
+
+
+def print_latency(results, scan_ms, commit_ms):
+    print(f"⏱️  /status latency while sampling ({scan_ms:g} ms scan + {commit_ms:g} ms commit per sample)")
+    print(f"{'layout':<8}{'requests':>9}{'samples':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'max ms':>9}{'stalled':>9}")
+    for layout, r in results.items():
+        print(f"{layout:<8}{r['requests']:>9}{r['samples']:>9}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}"
+              f"{r['p99_ms']:>9.1f}{r['max_ms']:>9.1f}{r['stalled']:>9}")
+    if {'single', 'dual'} <= set(results) and results['dual']['max_ms']:
+        single, dual = results['single'], results['dual']
+        print(f"📉 Dual-core worst case {single['max_ms'] / dual['max_ms']:.0f}x lower; "
+              f"{single['stalled']} vs {dual['stalled']} requests over {STALL_MS:g} ms")
+
+
+def compare_scan_cache(duration=30.0, interval=10.0, scan_ms=1500.0, clients=2, time_scale=1.0,
+                       scan_ttl=SCAN_CACHE_TTL_MS / 1000):
+    """/scan latency and radio scans per hour, scanning per request versus the TTL cache"""
+    hours = duration * time_scale / 3600
+    results = {}
+    for name, ttl in (('uncached', 0), ('cached', scan_ttl)):
+        with Simulator(fixed_interval=interval, time_scale=time_scale, scan_ms=scan_ms,
+                       scan_ttl=ttl) as simulator:
+            simulator.device.reset_stats()
+            scans_before = simulator.device.stats()['scans']
+            result = measure_latency(simulator.url, duration, clients, SCAN_POLL / time_scale, '/scan')
+            stats = simulator.device.stats()
+            result['samples'] = stats['samples']
+            result['scans'] = stats['scans'] - scans_before
+            result['scans_per_hour'] = result['scans'] / hours
+            results[name] = result
+    return results
+
+
+def print_scan_cache(results, scan_ms, scan_ttl):
+    print(f"📡 /scan while sampling ({scan_ms:g} ms per scan, cache TTL {scan_ttl:g} s)")
+    print(f"{'scans':<10}{'requests':>9}{'samples':>9}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"
+          f"{'scans':>8}{'per hour':>10}")
+    for name, r in results.items():
+        print(f"{name:<10}{r['requests']:>9}{r['samples']:>9}{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}"
+              f"{r['max_ms']:>9.1f}{r['scans']:>8}{r['scans_per_hour']:>10.0f}")
+    if {'uncached', 'cached'} <= set(results) and results['cached']['scans']:
+        uncached, cached = results['uncached'], results['cached']
+        print(f"📉 {uncached['scans'] / cached['scans']:.1f}x fewer scans, "
+              f"/scan p95 {uncached['p95_ms']:.0f} ms -> {cached['p95_ms']:.0f} ms")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare dashboard polling with /events push")
+    parser.add_argument('--url', help='device or simulator URL (default: start a simulator)')
+    parser.add_argument('--viewers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=60, help='device seconds per mode')
+    parser.add_argument('--mode', choices=('poll', 'sse', 'both', 'page', 'latency', 'scan'), default='both')
+    parser.add_argument('--interval', type=float, default=10,
+                        help='simulator sample interval in seconds')
+    parser.add_argument('--time-scale', type=float, default=1.0,
+                        help='run the simulator and viewers N times faster')
+    parser.add_argument('--rtt-ms', type=float, default=30, help='page mode: modelled link RTT')
+    parser.add_argument('--bandwidth-kbps', type=float, default=1000,
+                        help='page mode: modelled link bandwidth')
+    parser.add_argument('--scan-ms', type=float, default=1500,
+                        help='latency and scan modes: simulated WiFi scan time')
+    parser.add_argument('--scan-ttl', type=float, default=SCAN_CACHE_TTL_MS / 1000,
+                        help='scan mode: seconds scan results are reused')
+    parser.add_argument('--commit-ms', type=float, default=300,
+                        help='latency mode: simulated history commit time per sample')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    if args.mode == 'page':
+        if args.url:
+            results = {args.url: measure_page_load(args.url, rtt_ms=args.rtt_ms,
+                                                   bandwidth_kbps=args.bandwidth_kbps)}
+        else:
+            results = compare_page_load(args.rtt_ms, args.bandwidth_kbps)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_page_load(results, args.rtt_ms, args.bandwidth_kbps)
+        return
+
+    if args.mode == 'latency':
+        if args.url:
+            results = {args.url: measure_latency(args.url, args.duration / args.time_scale)}
+            results[args.url]['samples'] = 0
+        else:
+            results = compare_layouts(args.duration / args.time_scale, args.interval, args.scan_ms,
+                                      args.commit_ms, time_scale=args.time_scale)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_latency(results, args.scan_ms, args.commit_ms)
+        return
+
+    if args.mode == 'scan':
+        results = compare_scan_cache(args.duration / args.time_scale, args.interval, args.scan_ms,
+                                     time_scale=args.time_scale, scan_ttl=args.scan_ttl)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_scan_cache(results, args.scan_ms, args.scan_ttl)
+        return
+
+    simulator = None
+    url = args.url
+    if not url:
+        simulator = Simulator(history_days=0.1, fixed_interval=args.interval,
+                              time_scale=args.time_scale).start()
+        url = simulator.url
+        print(f"🛰️  Simulator on {url}, sampling every {args.interval:g} s")
+
+    modes = ('poll', 'sse') if args.mode == 'both' else (args.mode,)
+    try:
+        results = [run_load(url, mode, args.viewers, args.duration, args.time_scale) for mode in modes]
+    finally:
+        if simulator:
+            simulator.stop()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        print_result(result)
+    if len(results) == 2 and results[1]['bytes_per_s_per_viewer']:
+        poll, sse = results
+        print(f"📉 /events: {poll['requests'] / max(sse['requests'], 1):.0f}x fewer requests, "
+              f"{poll['bytes_per_s_per_viewer'] / sse['bytes_per_s_per_viewer']:.1f}x fewer bytes per viewer")
+
+
+if __name__ == "__main__":
+    main()
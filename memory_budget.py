@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Memory budget estimator for the ESP32 firmware
+
+Estimates the peak heap of each HTTP endpoint and of the KPI tick, the
+TFLite tensor arena the model needs, and the LittleFS footprint of the
+history, so retention, sampling interval and model size can be chosen
+before flashing. history='tiered' models the ring files of
+include/history_tiers.h; history='json' the single /history.json they replaced.
+
+The ArduinoJson figures follow the v7 memory model on a 32-bit target:
+fixed-size variant slots allocated from 4 KB pools, object members costing
+a key slot plus a value slot, and deduplicated strings in a separate pool.
+All results are estimates; they are meant to rank configurations and catch
+order-of-magnitude problems, not to replace a heap trace on the device.
+"""
+
+import argparse
+import json
+import math
+import re
+
+from history_store import (KPI_INTERVAL, RECORD_FIELDS, RETENTION_DAYS, encode_history,
+                           make_record)
+
+# ArduinoJson 7 memory model (ESP32, 32-bit)
+SLOT_SIZE = 8                 # bytes per variant slot
+POOL_BYTES = 4096             # slots are allocated in pools of this size
+EXTENSION_SLOTS = 1           # 64-bit values (parsed doubles) need one extra slot
+STRING_NODE_HEADER = 8        # refcount + length + next pointer
+HEAP_BLOCK_OVERHEAD = 8       # multi_heap bookkeeping per malloc()
+STRING_GROWTH_FACTOR = 2.0    # Arduino String realloc may briefly hold old + new buffer
+
+# ESP32 platform figures (typical for the Arduino core with WiFi AP+STA running)
+KPI_TASK_STACK = 12288        # KPI_TASK_STACK: kpiTask() stack, allocated from the heap
+DEFAULT_FREE_HEAP = 180_000 - KPI_TASK_STACK  # free after WiFi, LittleFS, WebServer and kpiTask start
+DEFAULT_MAX_ALLOC = 110_000   # largest contiguous block
+DEFAULT_FS_SIZE = 1_441_792   # LittleFS partition of the default 4 MB layout (0x160000)
+FS_BLOCK_SIZE = 4096
+FS_FILE_CACHE = 512           # esp_littlefs per-open-file cache
+SCAN_RECORD_BYTES = 80        # sizeof(wifi_ap_record_t)
+HTTP_HEADER_BYTES = 512       # response header String and request parsing
+EVENT_CLIENTS = 4             # MAX_EVENT_CLIENTS: /events subscribers held open
+SOCKET_BYTES = 2 * 1460       # lwIP pcb + one unacknowledged segment per open socket
+HISTORY_CHUNK_BYTES = 2048    # HISTORY_CHUNK_BYTES: /history streaming buffer
+HISTORY_LINE_BYTES = 384      # one serialized record in handleHistory()
+HISTORY_LAYOUTS = ('tiered', 'json')
+
+# TFLite Micro bookkeeping on top of the planned activation memory
+TFLM_BYTES_PER_TENSOR = 16    # TfLiteEvalTensor + dims pointer
+TFLM_BYTES_PER_OP = 48        # NodeAndRegistration + op user data
+TFLM_FIXED_OVERHEAD = 512     # interpreter, allocator and alignment slack
+
+
+def json_slots(members, extensions=0):
+    """Variant slots for one JSON object: key + value per member"""
+    return 2 * members + extensions
+
+
+def pool_bytes(slots):
+    per_pool = POOL_BYTES // SLOT_SIZE
+    pools = math.ceil(slots / per_pool) if slots else 0
+    directory = 4 * max(1, 2 ** math.ceil(math.log2(pools))) if pools else 0
+    return pools * (POOL_BYTES + HEAP_BLOCK_OVERHEAD) + directory
+
+
+def string_pool_bytes(strings):
+    return sum(STRING_NODE_HEADER + len(s) + 1 + HEAP_BLOCK_OVERHEAD for s in strings)
+
+
+def record_profile(ssid_length=11):
+    """Serialized size and slot usage of one history record"""
+    sample = [make_record(1755000000 + i * KPI_INTERVAL, -61.0, -89.5, 28.5, 37.0,
+                          0.734512, 'x' * ssid_length) for i in range(100)]
+    serialized = len(encode_history(sample)) / len(sample)
+    return {
+        'serialized_bytes': serialized,
+        # Array element slot + one key/value pair per field, stability parsed as a double
+        'slots': 1 + json_slots(len(RECORD_FIELDS), EXTENSION_SLOTS),
+        'unique_strings': list(RECORD_FIELDS) + ['x' * ssid_length],
+    }
+
+
+def document_bytes(records, profile):
+    """Heap held by a JsonDocument containing `records` history records"""
+    if records <= 0:
+        return pool_bytes(1)
+    return pool_bytes(1 + records * profile['slots']) + string_pool_bytes(profile['unique_strings'])
+
+
+def parse_arena_size(main_cpp='src/main.cpp'):
+    """TENSOR_ARENA_SIZE as configured in the firmware, or None"""
+    try:
+        with open(main_cpp) as f:
+            match = re.search(r'#define\s+TENSOR_ARENA_SIZE\s+([0-9*\s]+)', f.read())
+    except OSError:
+        return None
+    if not match:
+        return None
+    return math.prod(int(term) for term in match.group(1).split('*') if term.strip())
+
+
+def model_memory(model_path):
+    """Weights, planned arena and tensor inventory from the TFLite flatbuffer"""
+    from tflite_reader import load_model, plan_arena
+
+    model = load_model(model_path)
+    subgraph = model['subgraphs'][0]
+    tensors = subgraph['tensors']
+    activations = plan_arena(subgraph)
+    required = (activations + TFLM_BYTES_PER_TENSOR * len(tensors)
+                + TFLM_BYTES_PER_OP * len(subgraph['operators']) + TFLM_FIXED_OVERHEAD)
+
+    return {
+        'flatbuffer_bytes': sum(len(b) for b in model['buffers']),
+        'weight_bytes': sum(t['bytes'] for t in tensors if t['constant']),
+        'activation_bytes': activations,
+        'arena_required': required,
+        'tensors': len(tensors),
+        'operators': len(subgraph['operators']),
+        'float16_weights': any(t['constant'] and t['type'] == 'FLOAT16' for t in tensors),
+    }
+
+
+def estimate(retention_days=RETENTION_DAYS, interval=KPI_INTERVAL, range_days=None,
+             ssid_length=11, ap_count=12, model_path='model.tflite', arena_size=None,
+             fs_size=DEFAULT_FS_SIZE, history='tiered'):
+    """Peak heap per code path plus LittleFS usage for one configuration"""
+    if history not in HISTORY_LAYOUTS:
+        raise ValueError(f"history must be one of {HISTORY_LAYOUTS}")
+    profile = record_profile(ssid_length)
+    samples_per_day = 86400 / interval
+    records = int(retention_days * samples_per_day)
+    range_days = retention_days if range_days is None else range_days
+    filtered = int(min(range_days, retention_days) * samples_per_day) if range_days else \
+        int(samples_per_day / 2)  # range=0 (today) is half a day on average
+    file_bytes = records * profile['serialized_bytes'] + 2
+    history_doc = document_bytes(records + 1, profile)
+
+    paths = {
+        # saveKPI(): scan (when the cache is stale), deserialize whole history, append,
+        # serialize back to the file
+        'tick (saveKPI)': (history_doc + ap_count * SCAN_RECORD_BYTES + FS_FILE_CACHE),
+        # handleHistory(): full document + deep-copied filtered document + JSON String
+        f'/history?range={range_days:g}': (
+            history_doc + document_bytes(filtered, profile) + FS_FILE_CACHE
+            + filtered * profile['serialized_bytes'] * STRING_GROWTH_FACTOR + HTTP_HEADER_BYTES),
+        '/status': pool_bytes(json_slots(9)) + 256 * STRING_GROWTH_FACTOR + HTTP_HEADER_BYTES,
+        '/advanced-ai': (pool_bytes(json_slots(11)) + 512 * STRING_GROWTH_FACTOR
+                         + HTTP_HEADER_BYTES),
+        # serviceEventClients(): one event String written to every held subscriber socket
+        '/events': (pool_bytes(json_slots(14)) + 512 * STRING_GROWTH_FACTOR
+                    + EVENT_CLIENTS * SOCKET_BYTES),
+        # handleAlerts(): log copy on the stack, image in a static buffer
+        '/alerts': HTTP_HEADER_BYTES,
+        # handleScan(): served from the scan cache (static copy), the driver list is gone
+        '/scan': (pool_bytes(1 + ap_count * (1 + json_slots(4)))
+                  + ap_count * 82 * STRING_GROWTH_FACTOR + HTTP_HEADER_BYTES),
+        # /debug reads the whole history file into a String, then takes a substring
+        '/debug': file_bytes + FS_FILE_CACHE + 1024 + HTTP_HEADER_BYTES,
+        '/demo': document_bytes(50, profile) + FS_FILE_CACHE,
+    }
+    history_path = f'/history?range={range_days:g}'
+    # Largest single contiguous allocation on each path (pools are 4 KB chunks)
+    largest_block = {
+        history_path: filtered * profile['serialized_bytes'],
+        '/debug': file_bytes,
+    }
+    littlefs = {
+        'bytes_per_day': int(samples_per_day * profile['serialized_bytes']),
+        'file_bytes': int(file_bytes),
+        # Rewriting the file each tick needs room for the old and the new copy
+        'required_bytes': int(2 * math.ceil(file_bytes / FS_BLOCK_SIZE) * FS_BLOCK_SIZE),
+        'partition_bytes': fs_size,
+        'flash_writes_per_day': int(file_bytes * samples_per_day),
+    }
+
+    if history == 'tiered':
+        from tiered_history import footprint
+
+        chunk = (HISTORY_CHUNK_BYTES + HISTORY_LINE_BYTES) * STRING_GROWTH_FACTOR
+        paths.update({
+            # saveKPI(): scan when stale, then ring appends, one file open at a time
+            'tick (saveKPI)': ap_count * SCAN_RECORD_BYTES + FS_FILE_CACHE,
+            # handleHistory(): one record document and one chunk, whatever the range
+            history_path: (pool_bytes(json_slots(17)) + HISTORY_LINE_BYTES + chunk
+                           + FS_FILE_CACHE + HTTP_HEADER_BYTES),
+            # /debug prints the tier headers
+            '/debug': FS_FILE_CACHE + 1024 * STRING_GROWTH_FACTOR + HTTP_HEADER_BYTES,
+            '/demo': FS_FILE_CACHE,
+        })
+        largest_block = {history_path: chunk, '/debug': 1024 * STRING_GROWTH_FACTOR}
+        tiers = footprint(fs_size, interval, json_record_bytes=profile['serialized_bytes'])
+        littlefs = {
+            'tiers': tiers['tiers'],
+            'file_bytes': tiers['tiered_bytes'],
+            'required_bytes': tiers['tiered_bytes'],
+            'available_bytes': tiers['available_bytes'],
+            'partition_bytes': fs_size,
+            'retention_s': tiers['tiered_retention_s'],
+            'flash_writes_per_day': tiers['tiered_flash_writes_per_day'],
+        }
+
+    # kpiTask() and loop() run on separate cores, so a sample can land mid-request
+    paths[f'tick + {history_path}'] = paths['tick (saveKPI)'] + paths[history_path]
+
+    result = {
+        'config': {
+            'history': history,
+            'retention_days': retention_days,
+            'interval_s': interval,
+            'range_days': range_days,
+            'records': records,
+            'ssid_length': ssid_length,
+        },
+        'record': {
+            'serialized_bytes': round(profile['serialized_bytes'], 1),
+            'json_document_bytes': round(document_bytes(1000, profile) / 1000, 1),
+        },
+        'heap_peak': {name: int(value) for name, value in paths.items()},
+        'largest_block': {name: int(value) for name, value in largest_block.items()},
+        'littlefs': littlefs,
+    }
+
+    if model_path:
+        try:
+            result['model'] = model_memory(model_path)
+        except (OSError, ValueError) as e:
+            result['model'] = {'error': str(e)}
+        else:
+            result['model']['arena_configured'] = arena_size
+
+    return result
+
+
+def max_retention_hours(budget, interval=KPI_INTERVAL, ssid_length=11):
+    """Longest /history.json retention (hours) whose worst heap path still fits in `budget` bytes"""
+    def worst(hours):
+        peaks = estimate(hours / 24, interval, ssid_length=ssid_length,
+                         model_path=None, history='json')['heap_peak']
+        return max(peaks.values())
+
+    low, high = 0, 24 * 365
+    if worst(interval / 3600) > budget:
+        return 0
+    while low < high:
+        mid = (low + high + 1) // 2
+        if worst(mid) <= budget:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def format_bytes(value):
+    if value >= 1024 * 1024:
+        return f"{value / (1024 * 1024):.2f} MB"
+    if value >= 1024:
+        return f"{value / 1024:.1f} KB"
+    return f"{value} B"
+
+
+def print_report(result, free_heap, max_alloc):
+    config = result['config']
+    if config['history'] == 'tiered':
+        print(f"📐 Configuration: tiered history, {config['interval_s']} s interval")
+    else:
+        print(f"📐 Configuration: {config['retention_days']} day retention, {config['interval_s']} s "
+              f"interval -> {config['records']} records")
+    print(f"📝 Record: {result['record']['serialized_bytes']} B as JSON text, "
+          f"{result['record']['json_document_bytes']} B in a JsonDocument")
+
+    print(f"\n🧠 Peak heap per path (free heap budget {format_bytes(free_heap)}):")
+    for name, value in sorted(result['heap_peak'].items(), key=lambda kv: -kv[1]):
+        marker = "❌" if value > free_heap else "⚠️ " if value > free_heap * 0.7 else "✅"
+        print(f"   {marker} {name:<22} {format_bytes(value):>10}")
+    for name, value in result['largest_block'].items():
+        if value > max_alloc:
+            print(f"   ❌ {name} needs a {format_bytes(value)} contiguous block "
+                  f"(largest free block ~{format_bytes(max_alloc)})")
+
+    fs = result['littlefs']
+    print("\n💾 LittleFS:")
+    if 'tiers' in fs:
+        for tier in fs['tiers']:
+            print(f"   {tier['tier']:<7} {format_bytes(tier['file_bytes']):>10}  "
+                  f"{tier['retention_s'] / 86400:g} days")
+        marker = "❌" if fs['required_bytes'] > fs['available_bytes'] else "✅"
+        print(f"   {marker} rings need {format_bytes(fs['required_bytes'])} of "
+              f"{format_bytes(fs['available_bytes'])} left beside the web UI")
+        print(f"   flash writes: {format_bytes(fs['flash_writes_per_day'])}/day "
+              f"(a segment block and the index per append)")
+    else:
+        print(f"   {format_bytes(fs['bytes_per_day'])}/day, history file {format_bytes(fs['file_bytes'])}")
+        marker = "❌" if fs['required_bytes'] > fs['partition_bytes'] else "✅"
+        print(f"   {marker} needs {format_bytes(fs['required_bytes'])} (old + new copy while "
+              f"rewriting) of {format_bytes(fs['partition_bytes'])}")
+        print(f"   flash writes: {format_bytes(fs['flash_writes_per_day'])}/day "
+              f"(whole file rewritten every sample)")
+
+    model = result.get('model')
+    if model and 'error' not in model:
+        print("\n🤖 Model:")
+        print(f"   {model['tensors']} tensors, {model['operators']} ops, "
+              f"{format_bytes(model['weight_bytes'])} weights")
+        print(f"   activations {format_bytes(model['activation_bytes'])}, arena needed "
+              f"~{format_bytes(model['arena_required'])}")
+        if model['float16_weights']:
+            print("   ⚠️  float16 weights are dequantized at runtime into float32 arena tensors")
+        if model['arena_configured'] is not None:
+            marker = "❌" if model['arena_required'] > model['arena_configured'] else "✅"
+            print(f"   {marker} TENSOR_ARENA_SIZE = {format_bytes(model['arena_configured'])} "
+                  f"(one static arena, reused by the model swap)")
+    elif model:
+        print(f"\n🤖 Model: {model['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate ESP32 heap and flash usage")
+    parser.add_argument('--history', choices=HISTORY_LAYOUTS, default='tiered',
+                        help='tiered: ring files (firmware); json: the old single /history.json')
+    parser.add_argument('--retention-days', type=float, default=RETENTION_DAYS,
+                        help='json history only')
+    parser.add_argument('--interval', type=float, default=KPI_INTERVAL, help='seconds')
+    parser.add_argument('--range', type=int, default=None, dest='range_days',
+                        help='/history range to evaluate (default: full retention)')
+    parser.add_argument('--ssid-length', type=int, default=11)
+    parser.add_argument('--ap-count', type=int, default=12)
+    parser.add_argument('--model', default='model.tflite')
+    parser.add_argument('--free-heap', type=int, default=DEFAULT_FREE_HEAP)
+    parser.add_argument('--max-alloc', type=int, default=DEFAULT_MAX_ALLOC)
+    parser.add_argument('--fs-size', type=int, default=DEFAULT_FS_SIZE)
+    parser.add_argument('--json', help='write the estimate as JSON')
+    args = parser.parse_args()
+
+    result = estimate(args.retention_days, args.interval, args.range_days, args.ssid_length,
+                      args.ap_count, args.model, parse_arena_size(), args.fs_size, args.history)
+    print_report(result, args.free_heap, args.max_alloc)
+
+    if args.history == 'tiered':
+        print(f"\n🎯 Tiered history: {result['littlefs']['retention_s'] / 86400:g} days retained; heap "
+              f"per path does not depend on retention (python tiered_history.py compares with JSON)")
+    else:
+        hours = max_retention_hours(args.free_heap, args.interval, args.ssid_length)
+        print(f"\n🎯 Longest retention keeping every path within the heap budget at "
+              f"{args.interval:g} s sampling: {hours} hour(s) ({hours * 3600 / args.interval:.0f} records)")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+        print(f"📄 Estimate saved to: {args.json}")
+
+    over = [v for v in result['heap_peak'].values() if v > args.free_heap]
+    model = result.get('model') or {}
+    arena_short = (model.get('arena_configured') is not None
+                   and model['arena_required'] > model['arena_configured'])
+    return 1 if over or arena_short else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared WiFi scan results: host mirror of include/scan_cache.h
+
+The KPI task is the only code that scans. The result set (SSID, RSSI,
+channel, encryption) is kept for SCAN_CACHE_TTL_MS; /scan is served from it
+and saveKPI() takes its AP count and channel utilization estimate from it.
+simulate_scan() produces neighbourhoods for the host simulator and the
+synthetic history.
+"""
+
+SCAN_CACHE_TTL_MS = 30000
+SCAN_MAX_RESULTS = 32
+SCAN_CHANNELS = 14
+CHANNEL_SPAN = 5
+CHANNEL_BASE_UTIL = 5.0
+CHANNEL_UTIL_PER_AP = 12.0
+HOME_CHANNEL = 6              # channel of the simulated home network
+NEIGHBOUR_CHANNELS = (1, 1, 6, 6, 11, 11, 3, 9)   # neighbours mostly sit on 1/6/11
+
+
+def simulate_scan(rng, ap_count, ssid='HomeNetwork', rssi=-62.0, channel=HOME_CHANNEL):
+    """Home network plus `ap_count - 1` neighbours, strongest first like the driver"""
+    entries = [{'ssid': ssid, 'rssi': int(round(rssi)), 'channel': channel, 'open': False}]
+    for i in range(max(0, ap_count - 1)):
+        entries.append({
+            'ssid': f'Neighbour{i + 1}',
+            'rssi': rng.randint(-92, -55),
+            'channel': rng.choice(NEIGHBOUR_CHANNELS),
+            'open': rng.random() < 0.1,
+        })
+    entries.sort(key=lambda e: e['rssi'], reverse=True)
+    return entries[:SCAN_MAX_RESULTS]
+
+
+def channel_load(entries):
+    """The channel_load table: per channel 0-14, each AP weighted by loudness (-95 dBm: 0, -55 dBm: 1)"""
+    load = [0.0] * (SCAN_CHANNELS + 1)
+    for entry in entries:
+        channel = entry['channel'] if entry['channel'] <= SCAN_CHANNELS else 0
+        load[channel] += min(1.0, max(0.0, (entry['rssi'] + 95) / 40.0))
+    return load
+
+
+def load_utilization(load, channel):
+    """channelUtilization(): overlapping channels' load, channel 0 counts every channel"""
+    total = 0.0
+    for c, value in enumerate(load):
+        distance = abs(c - channel) if channel else 0
+        if distance < CHANNEL_SPAN:
+            total += (1.0 - distance / CHANNEL_SPAN) * value
+    return min(100.0, CHANNEL_BASE_UTIL + CHANNEL_UTIL_PER_AP * total)
+
+
+def channel_utilization(entries, channel):
+    return load_utilization(channel_load(entries), channel)
+
+
+class ScanResults:
+    """One published scan; taken_ms is on the caller's millisecond clock"""
+
+    def __init__(self, entries=(), taken_ms=None, scans=0):
+        self.entries = list(entries)[:SCAN_MAX_RESULTS]
+        self.taken_ms = taken_ms
+        self.scans = scans
+        self.channel_load = channel_load(self.entries)
+
+    def fresh(self, now_ms):
+        return self.taken_ms is not None and now_ms - self.taken_ms < SCAN_CACHE_TTL_MS
+
+    def channel_utilization(self, channel):
+        return load_utilization(self.channel_load, channel)
+
+    def to_json(self):
+        """handleScan() payload"""
+        return [{'ssid': e['ssid'], 'rssi': e['rssi'], 'channel': e['channel'],
+                 'encryption': 'Open' if e['open'] else 'Secured'} for e in self.entries]
@@ -4,21 +4,52 @@
 #include <WebServer.h>
 #include <ArduinoJson.h>
 #include <time.h>
-#include <Ticker.h>
-#include <EloquentTinyML.h>
-#include "model.h"
+#ifdef USE_MODEL_LUT
+#include "model_lut.h"  // Precomputed table from export_lut.py, no TFLite runtime
+#else
+#include <EloquentTinyML.h>  // 2.4.4, for the TensorFlow Lite Micro tree it bundles
+#include "tensorflow/lite/micro/micro_mutable_op_resolver.h"
+#include <esp_partition.h>
+#include <new>
+#include "model.h"  // fallback when the model partition holds no valid upload
+#endif
 #include "advanced_ai.h"
-
-#define MAX_RECORDS 43200 // 5 days of 10s intervals (5*24*60*6)
-#define HISTORY_FILE "/history.json"
+#include "adaptive_scheduler.h"
+#include "kpi_exchange.h"
+#include "alert_log.h"
+#include "scan_cache.h"
+#include "history_tiers.h"
+#include "kpi_codec.h"
+#include "model_store.h"
+
+// History lives in the tier rings of include/history_tiers.h (raw 24 h, 1-minute
+// rollups for 30 days, hourly for a year); the single JSON file is gone
+#define LEGACY_HISTORY_FILE "/history.json" // removed at boot to free its space
+static const char* const LEGACY_RING_FILES[] = {"/history_raw.bin", "/history_1m.bin", "/history_1h.bin"};
+#define HISTORY_CHUNK_BYTES 2048            // /history streams JSON in chunks of about this size
 #define CONFIG_FILE "/config.json"
-const unsigned long kpiInterval = 10000; // 10 seconds
+#define ALERT_LOG_FILE "/alerts.bin"
+#define ALERT_LOG_TMP_FILE "/alerts.tmp"
+#define ASSET_MANIFEST "/assets.json" // written by build_assets.py
+
+// Task layout: the KPI task (core 0, next to the WiFi stack) scans, predicts and
+// writes history; loop() (core 1) only serves HTTP and reads published samples
+#define KPI_TASK_CORE 0
+#define KPI_TASK_STACK 12288
+#define KPI_TASK_PRIORITY 1
+#define KPI_TASK_POLL_MS SAMPLE_INTERVAL_MIN_MS // scheduler granularity
 
 WebServer server(80);
-bool apMode = true;
-bool isConnected = false;
+volatile bool apMode = true;
+volatile bool isConnected = false;
+volatile bool kpiEnabled = false; // set once the station is connected
+// Written by setup() before the KPI task starts, then by the KPI task only (it owns
+// WiFi); handlers on the web server core read KpiSnapshot.ssid instead
 String connectedSSID = "";
-Ticker ticker;
+
+// POST /connect progress for GET /connect; the KPI task sets the outcome
+enum ConnectState : uint8_t { CONNECT_IDLE, CONNECT_PENDING, CONNECT_OK, CONNECT_FAILED };
+volatile ConnectState connectState = CONNECT_IDLE;
 
 // Current KPI values
 float currentRSSI = 0;
@@ -33,12 +64,74 @@ AdvancedWiFiAI advancedAI;
 // Current advanced prediction results
 AdvancedWiFiAI::PredictionResult currentPrediction;
 
-// TensorFlow Lite ML object
+// Adaptive sampling: 2 s while degrading, up to 60 s while stable
+AdaptiveScheduler sampler;
+unsigned long lastSampleMs = 0;
+
+// Cross-core exchange (include/kpi_exchange.h)
+TaskHandle_t kpiTaskHandle = nullptr;
+SnapshotBuffer<KpiSnapshot> latestSample; // KPI task -> /status, /advanced-ai, /events
+SpscQueue<KpiSnapshot, 8> eventQueue;     // KPI task -> SSE broadcast in loop()
+SpscQueue<KpiCommand, 4> commandQueue;    // web handlers -> KPI task
+
+// Scan cache: only the KPI task scans; /scan and saveKPI() share one result set
+#define SCAN_RETRY_AFTER_S 2              // /scan on a cold cache: 202, retry after this long
+ScanResults scanResults;                  // owned by the KPI task
+SnapshotBuffer<ScanResults> publishedScan; // KPI task -> /scan
+
+// Rollups of the samples since the current minute/hour bucket opened (KPI task only)
+RollupAccumulator minuteRollup(HISTORY_TIERS[TIER_MINUTE].period_s);
+RollupAccumulator hourRollup(HISTORY_TIERS[TIER_HOUR].period_s);
+
+// Ring headers, loaded by initHistoryTiers() and advanced by the KPI task only; handlers read
+// the index files, which are written after the record they count
+RingHeader historyRings[TIER_COUNT];
+bool historyReady[TIER_COUNT] = {false};
+using HistoryReader = RingReader<fs::LittleFSFS>;
+
+// Alert episodes: updated by the KPI task on alert transitions only
+AlertLog alertLog;
+SnapshotBuffer<AlertLog> publishedAlerts;  // KPI task -> /alerts
+
+// URL -> {file, type, etag, cache} for the pre-compressed web UI
+JsonDocument assetManifest;
+
+// Server-Sent Events subscribers (/events), one push per KPI sample
+#define MAX_EVENT_CLIENTS 4
+#define EVENT_KEEPALIVE_MS 15000
+WiFiClient eventClients[MAX_EVENT_CLIENTS];
+unsigned long lastEventMs = 0;
+
+#ifndef USE_MODEL_LUT
+// TensorFlow Lite Micro interpreter
 #define NUMBER_OF_INPUTS 4
 #define NUMBER_OF_OUTPUTS 1
-#define TENSOR_ARENA_SIZE 2*1024
-
-Eloquent::TinyML::TfLite<NUMBER_OF_INPUTS, NUMBER_OF_OUTPUTS, TENSOR_ARENA_SIZE> ml;
+// ~4.9 KB planned for model.tflite (python memory_budget.py), the rest is room for uploaded models
+#define TENSOR_ARENA_SIZE 8*1024
+
+// The interpreter, built in place in static storage, with its arena and the flash mapping
+// of the model it runs. There is one arena: a new model is first checked against the
+// flatbuffer alone (ops, input/output shapes), and only then is the old interpreter torn
+// down and the new one built in its place. If its tensors do not fit, the old one is rebuilt.
+struct ModelRunner {
+  alignas(16) uint8_t arena[TENSOR_ARENA_SIZE];
+  alignas(tflite::MicroInterpreter) uint8_t storage[sizeof(tflite::MicroInterpreter)];
+  tflite::MicroInterpreter* interpreter = nullptr;
+  const uint8_t* model = nullptr;
+  spi_flash_mmap_handle_t map = 0;  // 0 for the compiled-in model.h array
+};
+ModelRunner modelRunner;                // KPI task only (and setup() before it starts)
+// Only the ops of model.tflite (tflite_reader.py lists them), not AllOpsResolver's full table
+#define MODEL_OP_COUNT 3
+tflite::MicroMutableOpResolver<MODEL_OP_COUNT> modelOps;
+tflite::MicroErrorReporter modelErrors;
+
+// Model partition (include/model_store.h): the interpreter runs from a mapped slot
+const esp_partition_t* modelPartition = nullptr;
+volatile int8_t activeModelSlot = -1;      // -1: the compiled-in model.h array
+volatile int8_t pendingModelSlot = -1;     // set by POST /model, cleared by the KPI task
+SnapshotBuffer<ModelInfo> publishedModel;  // KPI task -> GET /model
+#endif
 
 // WiFi Configuration Management
 void saveWiFiConfig(const String& ssid, const String& password) {
@@ -64,15 +157,184 @@ bool loadWiFiConfig(String& ssid, String& password) {
   return !ssid.isEmpty();
 }
 
+#ifndef USE_MODEL_LUT
+// Maps a model slot and validates it; on success the mapping stays until spi_flash_munmap()
+ModelBlobStatus mapModelSlot(int slot, const uint8_t*& data, spi_flash_mmap_handle_t& handle,
+                             ModelBlobHeader& header) {
+  const void* mapped;
+  if (!modelPartition ||
+      esp_partition_mmap(modelPartition, slot * MODEL_SLOT_BYTES, MODEL_SLOT_BYTES,
+                         ESP_PARTITION_MMAP_DATA, &mapped, &handle) != ESP_OK) {
+    return MODEL_BLOB_BAD_HEADER;
+  }
+  data = (const uint8_t*)mapped;
+  ModelBlobStatus status = checkModelBlob(data, MODEL_SLOT_BYTES, &header);
+  if (status != MODEL_BLOB_OK) spi_flash_munmap(handle);
+  return status;
+}
+
+void publishModelInfo(const ModelBlobHeader& header, uint32_t length) {
+  ModelInfo info = publishedModel.read();
+  info.slot = activeModelSlot;
+  info.loads++;
+  info.generation = activeModelSlot < 0 ? 0 : header.generation;
+  info.length = length;
+  info.crc32 = activeModelSlot < 0 ? modelCrc32(wifi_model_tflite, wifi_model_tflite_len) : header.crc32;
+  info.loaded_ms = millis();
+  publishedModel.publish(info);
+}
+
+// Elements of a float32 tensor, 0 for any other type
+size_t floatTensorSize(const tflite::SubGraph* graph, int index) {
+  const tflite::Tensor* tensor = graph->tensors()->Get(index);
+  if (tensor->type() != tflite::TensorType_FLOAT32 || !tensor->shape()) return 0;
+  size_t size = 1;
+  for (int32_t dim : *tensor->shape()) size *= dim;
+  return size;
+}
+
+// Checks a model against the flatbuffer alone, without touching the arena: schema version,
+// every op registered in modelOps, and float inputs/outputs of the expected size
+bool checkModelGraph(const uint8_t* model) {
+  const tflite::Model* parsed = tflite::GetModel(model);
+  if (parsed->version() != TFLITE_SCHEMA_VERSION || !parsed->subgraphs() || parsed->subgraphs()->size() != 1 ||
+      !parsed->operator_codes()) {
+    return false;
+  }
+  for (const tflite::OperatorCode* code : *parsed->operator_codes()) {
+    const TfLiteRegistration* registration = nullptr;
+    if (tflite::GetRegistrationFromOpCode(code, modelOps, &modelErrors, &registration) != kTfLiteOk) return false;
+  }
+  const tflite::SubGraph* graph = parsed->subgraphs()->Get(0);
+  return graph->tensors() && graph->inputs() && graph->outputs() && graph->inputs()->size() == 1 &&
+         graph->outputs()->size() == 1 && floatTensorSize(graph, graph->inputs()->Get(0)) == NUMBER_OF_INPUTS &&
+         floatTensorSize(graph, graph->outputs()->Get(0)) == NUMBER_OF_OUTPUTS;
+}
+
+void destroyInterpreter() {
+  if (modelRunner.interpreter) {
+    modelRunner.interpreter->~MicroInterpreter();
+    modelRunner.interpreter = nullptr;
+  }
+}
+
+// Builds the interpreter for `model` in the arena; false leaves no interpreter
+bool buildInterpreter(const uint8_t* model) {
+  modelRunner.interpreter = new (modelRunner.storage) tflite::MicroInterpreter(
+      tflite::GetModel(model), modelOps, modelRunner.arena, TENSOR_ARENA_SIZE, &modelErrors);
+  if (modelRunner.interpreter->AllocateTensors() != kTfLiteOk) {
+    destroyInterpreter();
+    return false;
+  }
+  return true;
+}
+
+// Replaces the running model with `model` (checked by checkModelGraph()), mapped by `map`.
+// If its tensors do not fit the arena, the previous model is rebuilt and `map` is released.
+bool loadModel(const uint8_t* model, spi_flash_mmap_handle_t map) {
+  destroyInterpreter();
+  if (!buildInterpreter(model)) {
+    if (map) spi_flash_munmap(map);
+    if (modelRunner.model && !buildInterpreter(modelRunner.model)) {
+      Serial.println("❌ Previous model no longer builds, using the advanced AI only");
+    }
+    return false;
+  }
+  if (modelRunner.map) spi_flash_munmap(modelRunner.map);
+  modelRunner.model = model;
+  modelRunner.map = map;
+  return true;
+}
+
+// Stability from the active model, NaN when there is none or inference fails
+float runModel(const float* input) {
+  tflite::MicroInterpreter* interpreter = modelRunner.interpreter;
+  if (!interpreter) return NAN;
+  memcpy(interpreter->input(0)->data.f, input, NUMBER_OF_INPUTS * sizeof(float));
+  if (interpreter->Invoke() != kTfLiteOk) return NAN;
+  return interpreter->output(0)->data.f[0];
+}
+
+// Points the interpreter at a slot, straight from flash. Runs in setup() or on the KPI
+// task between ticks. On any failure the slot is unmapped again and the previous model
+// keeps running.
+bool activateModelSlot(int slot) {
+  const uint8_t* data;
+  spi_flash_mmap_handle_t map;
+  ModelBlobHeader header;
+  ModelBlobStatus status = mapModelSlot(slot, data, map, header);
+  if (status != MODEL_BLOB_OK) {
+    Serial.printf("❌ Model slot %d: %s\n", slot, modelBlobStatusName(status));
+    return false;
+  }
+  if (!checkModelGraph(data + header.header_size)) {
+    Serial.printf("❌ Model slot %d: unsupported ops or input/output shapes\n", slot);
+    spi_flash_munmap(map);
+    return false;
+  }
+  if (!loadModel(data + header.header_size, map)) {
+    Serial.printf("❌ Model slot %d does not fit TENSOR_ARENA_SIZE\n", slot);
+    return false;
+  }
+  activeModelSlot = slot;
+  publishModelInfo(header, header.length);
+  Serial.printf("✅ Model generation %u from slot %d (%u bytes, mapped from flash)\n",
+                header.generation, slot, header.length);
+  return true;
+}
+
+// KPI task: swap in an uploaded model between ticks
+void loadPendingModel() {
+  int8_t slot = pendingModelSlot;
+  if (slot < 0) return;
+  if (!activateModelSlot(slot)) Serial.println("⚠️ Keeping the current model");
+  pendingModelSlot = -1;
+}
+#endif
+
 // AI Stability Prediction using REAL trained TensorFlow Lite model
 void setupTFLite() {
+#ifdef USE_MODEL_LUT
+  Serial.printf("🧮 Using precomputed model lookup table (%d bytes)\n", wifi_model_lut_len);
+#else
   Serial.println("🤖 Initializing REAL TensorFlow Lite Model...");
-  Serial.printf("Model size: %d bytes\n", wifi_model_tflite_len);
 
-  // Initialize the trained model
-  ml.begin(wifi_model_tflite);
+  modelOps.AddDequantize();
+  modelOps.AddFullyConnected();
+  modelOps.AddLogistic();
+
+  // Newest upload in the model partition that the interpreter accepts, else the compiled-in array
+  modelPartition = esp_partition_find_first(ESP_PARTITION_TYPE_DATA,
+                                            (esp_partition_subtype_t)MODEL_PARTITION_SUBTYPE,
+                                            MODEL_PARTITION_LABEL);
+  if (modelPartition) {
+    ModelBlobHeader headers[MODEL_SLOT_COUNT];
+    bool valid[MODEL_SLOT_COUNT];
+    for (int slot = 0; slot < MODEL_SLOT_COUNT; slot++) {
+      const uint8_t* data;
+      spi_flash_mmap_handle_t handle;
+      valid[slot] = mapModelSlot(slot, data, handle, headers[slot]) == MODEL_BLOB_OK;
+      if (valid[slot]) spi_flash_munmap(handle);
+    }
+    int order[MODEL_SLOT_COUNT];
+    int count = orderModelSlots(headers, valid, order);
+    for (int i = 0; i < count; i++) {
+      if (activateModelSlot(order[i])) return;
+    }
+  } else {
+    Serial.println("⚠️ No model partition, uploads via /model are disabled");
+  }
+
+  Serial.printf("Model size: %d bytes (model.h)\n", wifi_model_tflite_len);
+  if (!checkModelGraph(wifi_model_tflite) || !loadModel(wifi_model_tflite, 0)) {
+    Serial.println("❌ model.h rejected by the interpreter, using the advanced AI only");
+    return;
+  }
+  activeModelSlot = -1;
+  publishModelInfo(ModelBlobHeader{}, wifi_model_tflite_len);
   Serial.println("✅ TensorFlow Lite Model loaded successfully!");
   Serial.println("🎯 Using 99.9% accuracy trained neural network");
+#endif
 }
 
 // Advanced AI stability prediction with enhanced features
@@ -111,8 +373,13 @@ float predictStability(float rssi, float noise, float snr, float channel_util) {
         Serial.println("⚠️ Normalized input is NaN/Inf, skipping ML prediction");
         ml_prediction = currentPrediction.stability; // Fallback to advanced AI
     } else {
+#ifdef USE_MODEL_LUT
+        // Table lookup over raw KPIs (the table already applies the normalization)
+        ml_prediction = wifi_model_lut_predict(rssi, noise, channel_util);
+#else
         // Run inference using the trained model
-        ml_prediction = ml.predict(input);
+        ml_prediction = runModel(input);
+#endif
     }
   } catch (...) {
     // Fallback to advanced AI if TensorFlow Lite fails
@@ -140,28 +407,120 @@ float predictStability(float rssi, float noise, float snr, float channel_util) {
     Serial.printf("🧠 Advanced AI: Stability=%.3f, Confidence=%.3f, Trend=%.3f\n",
                   currentPrediction.stability, currentPrediction.confidence, currentPrediction.trend_score);
     Serial.printf("🤖 ML Model: %.3f | Combined: %.3f\n", ml_prediction, combined_prediction);
-    Serial.printf("🚨 Alert: %s - %s\n",
-                  currentPrediction.alert_type.c_str(),
-                  currentPrediction.alert_message.c_str());
+    const AlertInfo& alert = alertInfo(currentPrediction.alert);
+    Serial.printf("🚨 Alert: %s - %s\n", alert.type, alert.message);
   }
 
   return combined_prediction;
 }
 
-// Data Management - Clean old records (keep only last 5 days)
-void cleanOldRecords(JsonArray& records) {
-  time_t threshold = time(nullptr) - (5 * 86400); // 5 days ago
+// Data Management - tier rings, one segment block and the index written per append
+bool appendHistory(uint8_t tier, const void* record) {
+  return historyReady[tier] && ringAppend(LittleFS, historyRings[tier], record);
+}
 
-  for (int i = records.size() - 1; i >= 0; i--) {
-    JsonObject record = records[i];
-    time_t recordTime = record["t"].as<time_t>();
-    if (recordTime < threshold) {
-      records.remove(i);
+// Creates missing or unreadable rings; runs before the KPI task starts
+void initHistoryTiers() {
+  if (LittleFS.exists(LEGACY_HISTORY_FILE)) {
+    LittleFS.remove(LEGACY_HISTORY_FILE);
+    Serial.println("🧹 Removed the old /history.json, history now lives in tier rings");
+  }
+  for (const char* legacy : LEGACY_RING_FILES) {
+    if (LittleFS.exists(legacy)) LittleFS.remove(legacy); // single-file rings, version 1
+  }
+  for (uint8_t tier = 0; tier < TIER_COUNT; tier++) {
+    RingHeader& header = historyRings[tier];
+    historyReady[tier] = ringLoad(LittleFS, tier, header) || ringInit(LittleFS, tier, header);
+    if (historyReady[tier]) {
+      Serial.printf("📚 %s history: %u records\n", HISTORY_TIERS[tier].name, ringCount(header));
+    } else {
+      Serial.printf("❌ Could not create %s\n", HISTORY_TIERS[tier].dir);
     }
   }
 }
 
+// One sample into the raw ring and the rollups; a rollup is written when its bucket closes
+void recordHistory(uint32_t t, float rssi, float noise, float channel_util, float stability,
+                   uint32_t dt) {
+  RawRecord raw = makeRawRecord(t, rssi, noise, channel_util, stability, dt);
+  if (!appendHistory(TIER_RAW, &raw)) {
+    Serial.println("❌ Failed to append to the raw history ring");
+  }
+  RollupRecord rollup;
+  if (minuteRollup.add(t, rssi, noise, channel_util, stability, rollup)) {
+    appendHistory(TIER_MINUTE, &rollup);
+  }
+  if (hourRollup.add(t, rssi, noise, channel_util, stability, rollup)) {
+    appendHistory(TIER_HOUR, &rollup);
+  }
+}
+
+// Alert log persistence: rewritten only when an episode opens, changes or closes
+void saveAlertLog() {
+  static uint8_t image[ALERT_LOG_BYTES];
+  size_t length = alertLog.serialize(image, sizeof(image));
+  File file = LittleFS.open(ALERT_LOG_TMP_FILE, "w");
+  if (!file) {
+    Serial.println("❌ Failed to open alert log for writing");
+    return;
+  }
+  file.write(image, length);
+  file.close();
+  LittleFS.rename(ALERT_LOG_TMP_FILE, ALERT_LOG_FILE);
+}
+
+void loadAlertLog() {
+  static uint8_t image[ALERT_LOG_BYTES];
+  File file = LittleFS.open(ALERT_LOG_FILE, "r");
+  if (!file) return;
+  size_t length = file.read(image, sizeof(image));
+  file.close();
+  if (alertLog.restore(image, length)) {
+    Serial.printf("🚨 Restored %u alert episodes\n", (unsigned)alertLog.count());
+  } else {
+    Serial.println("⚠️ Alert log unreadable, starting a new one");
+  }
+  publishedAlerts.publish(alertLog);
+}
+
+void recordAlertTransition(uint32_t t, AlertType alert) {
+  if (alertLog.update(t, alert, alertInfo(alert).severity)) {
+    publishedAlerts.publish(alertLog);
+    saveAlertLog();
+  }
+}
+
 // KPI Collection and Storage
+// Scan now and publish; KPI task only (the radio is never driven from two cores)
+void refreshScan() {
+  int n = WiFi.scanNetworks(false, false, false, 300); // Quick scan
+  if (n < 0) n = 0; // Handle scan errors
+  scanResults.count = min(n, SCAN_MAX_RESULTS);
+  for (int i = 0; i < scanResults.count; i++) {
+    ScanEntry& entry = scanResults.entries[i];
+    copyField(entry.ssid, sizeof(entry.ssid), WiFi.SSID(i).c_str());
+    entry.rssi = WiFi.RSSI(i);
+    entry.channel = WiFi.channel(i);
+    entry.open = WiFi.encryptionType(i) == WIFI_AUTH_OPEN;
+  }
+  WiFi.scanDelete();
+  scanResults.summarize();
+  scanResults.scans++;
+  scanResults.taken_ms = millis() | 1; // 0 means "never scanned"
+  publishedScan.publish(scanResults);
+}
+
+// Noise floor from the AP count of the scan cache, without the jitter of estimateNoise();
+// the step check between samples compares this one, so the jitter cannot trigger a sample
+float noiseFloor() {
+  return -98 + (scanResults.count * 1.5);
+}
+
+// Realistic noise floor calculation based on environment and AP count (from the scan cache)
+float estimateNoise() {
+  return noiseFloor() + (random(0, 8)); // More realistic: -98 to -82 dBm
+}
+
 void saveKPI() {
   if (apMode || !isConnected) {
     Serial.println("⏸️ Skipping KPI collection - not connected to WiFi");
@@ -172,16 +531,16 @@ void saveKPI() {
 
   // Collect WiFi metrics
   currentRSSI = WiFi.RSSI();
-  int ap_count = WiFi.scanNetworks(false, false, false, 300); // Quick scan
-  if (ap_count < 0) ap_count = 0; // Handle scan errors
+  if (!scanResults.fresh(millis())) {
+    refreshScan(); // at most one scan per SCAN_CACHE_TTL_MS, shared with /scan
+  }
 
   // Ensure valid RSSI
   if (isnan(currentRSSI) || currentRSSI == 0) { // RSSI can be 0 if disconnected or error
       currentRSSI = -100.0f; // Default to a very low signal if invalid
   }
 
-  // Realistic noise floor calculation based on environment and AP count
-  currentNoise = -98 + (ap_count * 1.5) + (random(0, 8)); // More realistic: -98 to -82 dBm
+  currentNoise = estimateNoise();
   // Ensure valid Noise
   if (isnan(currentNoise)) {
       currentNoise = -95.0f; // Default to a reasonable noise floor if invalid
@@ -193,37 +552,15 @@ void saveKPI() {
       currentSNR = 0.0f; // Default to 0 if invalid
   }
 
-  currentChannelUtil = min(100.0f, max(0.0f, (ap_count * 8.0f) + random(0, 20))); // More realistic utilization
+  // Airtime estimate from the APs heard on and next to our channel
+  currentChannelUtil = scanResults.channelUtilization(WiFi.channel());
   // Ensure valid Channel Utilization
   if (isnan(currentChannelUtil)) {
       currentChannelUtil = 0.0f; // Default to 0 if invalid
   }
 
   currentStability = predictStability(currentRSSI, currentNoise, currentSNR, currentChannelUtil);
-
-  // Load existing history or create new
-  JsonDocument history;
-  JsonArray records;
-
-  if (LittleFS.exists(HISTORY_FILE)) {
-    File file = LittleFS.open(HISTORY_FILE, "r");
-    if (file) {
-      DeserializationError error = deserializeJson(history, file);
-      file.close();
-      if (error) {
-        Serial.printf("❌ JSON parse error: %s\n", error.c_str());
-        records = history.to<JsonArray>(); // Create new array
-      } else {
-        records = history.as<JsonArray>();
-      }
-    } else {
-      Serial.println("❌ Could not open history file for reading");
-      records = history.to<JsonArray>();
-    }
-  } else {
-    Serial.println("📝 Creating new history file");
-    records = history.to<JsonArray>();
-  }
+  unsigned long nextInterval = sampler.next(currentPrediction, currentRSSI, noiseFloor());
 
   // Add new record with unique timestamp
   static unsigned long lastTimestamp = 0;
@@ -231,53 +568,79 @@ void saveKPI() {
   if (currentTime <= lastTimestamp) {
     currentTime = lastTimestamp + 1; // Ensure unique timestamps
   }
+  // Seconds since the previous sample; intervals vary with the adaptive scheduler
+  unsigned long sampleGap = lastTimestamp ? currentTime - lastTimestamp : SAMPLE_INTERVAL_DEFAULT_MS / 1000;
   lastTimestamp = currentTime;
+  recordAlertTransition(currentTime, currentPrediction.alert);
 
-  JsonObject newRecord = records.add<JsonObject>();
-  newRecord["t"] = currentTime;
-  newRecord["rssi"] = currentRSSI;
-  newRecord["noise"] = currentNoise;
-  newRecord["snr"] = currentSNR;
-  newRecord["channel_util"] = currentChannelUtil;
-  newRecord["stability"] = currentStability;
-  newRecord["ssid"] = connectedSSID;
-
+  recordHistory(currentTime, currentRSSI, currentNoise, currentChannelUtil, currentStability, sampleGap);
   Serial.printf("📝 Added record: t=%ld, rssi=%.1f, snr=%.1f, util=%.1f%%, stability=%.2f\n",
                 time(nullptr), currentRSSI, currentSNR, currentChannelUtil, currentStability);
 
-  // Clean old records to prevent memory overflow
-  cleanOldRecords(records);
-  Serial.printf("📚 Total records after cleanup: %d\n", records.size());
-
-  // Save updated history
-  File outFile = LittleFS.open(HISTORY_FILE, "w");
-  if (outFile) {
-    size_t bytesWritten = serializeJson(history, outFile);
-    outFile.close();
-    Serial.printf("💾 Saved %d bytes to history file\n", bytesWritten);
-  } else {
-    Serial.println("❌ Failed to open history file for writing");
-  }
-
   Serial.printf("📊 KPI: RSSI=%.1f, Noise=%.1f, SNR=%.1f, Util=%.1f%%, 🤖 AI-Stability=%.2f (%.1f%%)\n",
                 currentRSSI, currentNoise, currentSNR, currentChannelUtil, currentStability, currentStability*100);
+  Serial.printf("⏱️ Next sample in %lu ms\n", nextInterval);
+
+  // Hand the sample to the web server core: latest value plus one SSE event
+  KpiSnapshot snapshot;
+  snapshot.t = currentTime;
+  snapshot.sample_interval_ms = nextInterval;
+  snapshot.rssi = currentRSSI;
+  snapshot.noise = currentNoise;
+  snapshot.snr = currentSNR;
+  snapshot.channel_util = currentChannelUtil;
+  snapshot.stability = currentStability;
+  snapshot.ai_stability = currentPrediction.stability;
+  snapshot.confidence = currentPrediction.confidence;
+  snapshot.trend_score = currentPrediction.trend_score;
+  snapshot.connected = isConnected;
+  copyField(snapshot.ssid, sizeof(snapshot.ssid), connectedSSID.c_str());
+  snapshot.alert = currentPrediction.alert;
+  latestSample.publish(snapshot);
+  if (!eventQueue.push(snapshot)) {
+    Serial.println("⚠️ Event queue full, dropping SSE event");
+  }
+}
+
+// Ask the KPI task to run a command and wake it instead of waiting for its next poll
+void queueKpiCommand(KpiCommand command) {
+  commandQueue.push(command);
+  if (kpiTaskHandle) {
+    xTaskNotifyGive(kpiTaskHandle);
+  }
 }
 
 // Web Server Handlers
+// Served from the scan cache; a stale cache is refreshed by the KPI task in the background.
+// Never waits for the radio: before the first scan the reply is 202 with Retry-After.
 void handleScan() {
-  int n = WiFi.scanNetworks();
+  static ScanResults scan; // ~1.2 KB, kept off the loop() stack
+  uint32_t version = publishedScan.version();
+  scan = publishedScan.read();
+  if (!scan.fresh(millis())) {
+    queueKpiCommand(KPI_COMMAND_SCAN);
+  }
+  server.sendHeader("X-Scan-Version", String(version));
+  if (scan.taken_ms == 0) {
+    server.sendHeader("Retry-After", String(SCAN_RETRY_AFTER_S));
+    server.send(202, "application/json", "[]");
+    return;
+  }
+
   JsonDocument networks;
   JsonArray array = networks.to<JsonArray>();
 
-  for (int i = 0; i < n; i++) {
+  for (int i = 0; i < scan.count; i++) {
     JsonObject network = array.add<JsonObject>();
-    network["ssid"] = WiFi.SSID(i);
-    network["rssi"] = WiFi.RSSI(i);
-    network["encryption"] = (WiFi.encryptionType(i) == WIFI_AUTH_OPEN) ? "Open" : "Secured";
+    network["ssid"] = scan.entries[i].ssid;
+    network["rssi"] = scan.entries[i].rssi;
+    network["channel"] = scan.entries[i].channel;
+    network["encryption"] = scan.entries[i].open ? "Open" : "Secured";
   }
 
   String json;
   serializeJson(networks, json);
+  server.sendHeader("Age", String((millis() - scan.taken_ms) / 1000));
   server.send(200, "application/json", json);
 }
 
@@ -290,40 +653,57 @@ void handleConnect() {
     return;
   }
 
-  // Save configuration
+  // Save configuration; the KPI task reads it back and joins (see connectWiFi())
   saveWiFiConfig(ssid, password);
+  connectState = CONNECT_PENDING;
+  queueKpiCommand(KPI_COMMAND_CONNECT);
 
-  // Attempt connection
-  WiFi.begin(ssid.c_str(), password.c_str());
-
-  // Wait for connection (timeout after 10 seconds)
-  int attempts = 0;
-  while (WiFi.status() != WL_CONNECTED && attempts < 20) {
-    delay(500);
-    attempts++;
-  }
-
-  if (WiFi.status() == WL_CONNECTED) {
-    isConnected = true;
-    connectedSSID = ssid;
-    apMode = false; // Connected to WiFi, but AP still running
+  server.sendHeader("Retry-After", "1");
+  server.send(202, "text/plain", "Connecting to " + ssid);
+}
 
-    // Configure time
-    configTime(0, 0, "pool.ntp.org");
+// GET /connect: outcome of the last POST /connect
+void handleConnectStatus() {
+  static const char* const states[] = {"idle", "connecting", "connected", "failed"};
+  KpiSnapshot sample = latestSample.read();
+  JsonDocument status;
+  status["state"] = states[connectState];
+  status["ssid"] = sample.ssid;
 
-    // Start KPI collection immediately after connection
-    ticker.attach_ms(kpiInterval, saveKPI);
-    Serial.println("📊 KPI collection started after WiFi connection");
-    Serial.println("📡 AP still available for future configuration");
+  String json;
+  serializeJson(status, json);
+  server.send(200, "application/json", json);
+}
 
-    server.send(200, "text/plain", "Connected successfully. AP still available.");
-  } else {
-    server.send(400, "text/plain", "Connection failed");
+// /history?format=packed: raw samples from `first` as KPI_BLOCK_BYTES codec blocks
+void streamPackedHistory(HistoryReader& ring, uint32_t first, time_t threshold, uint32_t newest) {
+  server.setContentLength(CONTENT_LENGTH_UNKNOWN);
+  server.send(200, "application/octet-stream", "");
+  KpiBlockEncoder encoder;
+  int blocks = 0;
+  for (uint32_t i = first; i < ring.count(); i++) {
+    RawRecord raw;
+    if (!ring.read(i, &raw)) break;
+    if (raw.t < threshold || raw.t > newest) continue; // slot overwritten while streaming
+    if (!encoder.add(raw)) {
+      server.sendContent((const char*)encoder.finish(), KPI_BLOCK_BYTES);
+      blocks++;
+      encoder.reset();
+      encoder.add(raw);
+    }
   }
+  if (encoder.count()) {
+    server.sendContent((const char*)encoder.finish(), KPI_BLOCK_BYTES);
+    blocks++;
+  }
+  server.sendContent("");
+  Serial.printf("📤 Streamed %d packed blocks\n", blocks);
 }
 
 void handleHistory() {
+  KpiSnapshot sample = latestSample.read(); // for the SSID, which rings do not store
   String range = server.arg("range");
+  bool packed = server.arg("format") == "packed";
   Serial.printf("📈 History request for range: %s\n", range.c_str());
 
   time_t threshold;
@@ -343,67 +723,200 @@ void handleHistory() {
     Serial.printf("📅 Last %s days threshold: %ld\n", range.c_str(), threshold);
   }
 
-  if (!LittleFS.exists(HISTORY_FILE)) {
-    Serial.println("📂 No history file exists, returning empty array");
-    server.send(200, "application/json", "[]");
-    return;
+  // Oldest record of every tier decides which one covers the range
+  RingHeader headers[TIER_COUNT];
+  uint32_t oldest[TIER_COUNT] = {0};
+  for (uint8_t tier = 0; tier < TIER_COUNT; tier++) {
+    if (ringLoad(LittleFS, tier, headers[tier]) && ringCount(headers[tier]) > 0) {
+      oldest[tier] = HistoryReader(LittleFS, headers[tier]).time(0);
+    }
   }
+  time_t now = time(nullptr);
+  // Packed blocks carry raw samples only
+  uint8_t tier = packed ? TIER_RAW : selectTier(now > threshold ? now - threshold : 0, threshold, oldest);
+  Serial.printf("📚 Serving the %s tier\n", HISTORY_TIERS[tier].name);
 
-  File file = LittleFS.open(HISTORY_FILE, "r");
-  if (!file) {
-    Serial.println("❌ Could not open history file");
-    server.send(200, "application/json", "[]");
+  // Add CORS headers
+  server.sendHeader("Access-Control-Allow-Origin", "*");
+  server.sendHeader("Access-Control-Allow-Methods", "GET, POST, OPTIONS");
+  server.sendHeader("Access-Control-Allow-Headers", "Content-Type");
+  server.sendHeader("X-History-Tier", HISTORY_TIERS[tier].name);
+
+  if (!oldest[tier]) {
+    if (packed) {
+      server.send(200, "application/octet-stream", "");
+    } else {
+      server.send(200, "application/json", "[]");
+    }
     return;
   }
 
-  JsonDocument doc;
-  DeserializationError error = deserializeJson(doc, file);
-  file.close();
-
-  if (error) {
-    Serial.printf("❌ JSON parse error in history: %s\n", error.c_str());
-    server.send(200, "application/json", "[]");
+  // Stream the records from the first one in range; heap use does not grow with the range
+  HistoryReader ring(LittleFS, headers[tier]);
+  uint32_t count = ring.count();
+  uint32_t newest = ring.time(count - 1);
+  if (packed) {
+    streamPackedHistory(ring, ring.lowerBound(threshold), threshold, newest);
     return;
   }
-
-  JsonArray allRecords = doc.as<JsonArray>();
-  Serial.printf("📚 Total records in file: %d\n", allRecords.size());
-
-  JsonDocument filtered;
-  JsonArray filteredArray = filtered.to<JsonArray>();
-
-  // Filter records based on time range
-  int filteredCount = 0;
-  for (JsonObject record : allRecords) {
-    time_t recordTime = record["t"].as<time_t>();
-    if (recordTime >= threshold) {
-      filteredArray.add(record);
-      filteredCount++;
+  server.setContentLength(CONTENT_LENGTH_UNKNOWN);
+  server.send(200, "application/json", "");
+  String chunk = "[";
+  chunk.reserve(HISTORY_CHUNK_BYTES + 384);
+  char line[384];
+  JsonDocument record;
+  int sent = 0;
+  for (uint32_t i = ring.lowerBound(threshold); i < count; i++) {
+    RawRecord raw;
+    RollupRecord rollup;
+    if (!ring.read(i, tier == TIER_RAW ? (void*)&raw : (void*)&rollup)) break;
+    uint32_t t = tier == TIER_RAW ? raw.t : rollup.t;
+    if (t < threshold || t > newest) continue; // slot overwritten while streaming
+    record.clear();
+    record["t"] = t;
+    if (tier == TIER_RAW) {
+      record["rssi"] = raw.rssi / DB_SCALE;
+      record["noise"] = raw.noise / DB_SCALE;
+      record["snr"] = (raw.rssi - raw.noise) / DB_SCALE;
+      record["channel_util"] = raw.channel_util / UTIL_SCALE;
+      record["stability"] = raw.stability / STABILITY_SCALE;
+      record["ssid"] = sample.ssid;
+      record["dt"] = raw.dt;
+    } else {
+      record["rssi"] = rollup.rssi_mean / DB_SCALE;
+      record["noise"] = rollup.noise_mean / DB_SCALE;
+      record["snr"] = (rollup.rssi_mean - rollup.noise_mean) / DB_SCALE;
+      record["channel_util"] = rollup.util_mean / UTIL_SCALE;
+      record["stability"] = rollup.stability_mean / STABILITY_SCALE;
+      record["ssid"] = sample.ssid;
+      record["dt"] = HISTORY_TIERS[tier].period_s;
+      record["n"] = rollup.samples;
+      record["rssi_min"] = rollup.rssi_min;
+      record["rssi_max"] = rollup.rssi_max;
+      record["snr_min"] = rollup.snr_min;
+      record["snr_max"] = rollup.snr_max;
+      record["channel_util_min"] = rollup.util_min / UTIL_SCALE;
+      record["channel_util_max"] = rollup.util_max / UTIL_SCALE;
+      record["stability_min"] = rollup.stability_min / STABILITY_SCALE;
+      record["stability_max"] = rollup.stability_max / STABILITY_SCALE;
+    }
+    serializeJson(record, line, sizeof(line));
+    if (sent++) chunk += ',';
+    chunk += line;
+    if (chunk.length() >= HISTORY_CHUNK_BYTES) {
+      server.sendContent(chunk);
+      chunk = "";
     }
   }
+  chunk += ']';
+  server.sendContent(chunk);
+  server.sendContent(""); // end of the chunked response
+  Serial.printf("📤 Streamed %d %s records\n", sent, HISTORY_TIERS[tier].name);
+}
 
-  Serial.printf("📊 Filtered records: %d\n", filteredCount);
+#ifndef USE_MODEL_LUT
+// POST /model: the upload_model.py blob goes to the idle slot as it arrives
+size_t modelUploadBytes = 0;
+int8_t modelUploadSlot = -1;
+const char* modelUploadError = nullptr;
+
+void handleModelUpload() {
+  HTTPUpload& upload = server.upload();
+  if (upload.status == UPLOAD_FILE_START) {
+    modelUploadBytes = 0;
+    modelUploadError = nullptr;
+    modelUploadSlot = activeModelSlot == 0 ? 1 : 0;
+    if (!modelPartition) {
+      modelUploadError = "no model partition";
+    } else if (pendingModelSlot >= 0) {
+      modelUploadError = "a model swap is pending";
+    } else if (esp_partition_erase_range(modelPartition, modelUploadSlot * MODEL_SLOT_BYTES,
+                                         MODEL_SLOT_BYTES) != ESP_OK) {
+      modelUploadError = "erase failed";
+    }
+  } else if (upload.status == UPLOAD_FILE_WRITE && !modelUploadError) {
+    if (modelUploadBytes + upload.currentSize > MODEL_SLOT_BYTES) {
+      modelUploadError = modelBlobStatusName(MODEL_BLOB_TOO_LARGE);
+    } else if (esp_partition_write(modelPartition, modelUploadSlot * MODEL_SLOT_BYTES + modelUploadBytes,
+                                   upload.buf, upload.currentSize) != ESP_OK) {
+      modelUploadError = "write failed";
+    } else {
+      modelUploadBytes += upload.currentSize;
+    }
+  } else if (upload.status == UPLOAD_FILE_ABORTED) {
+    modelUploadError = "upload aborted";
+  }
+}
 
-  String json;
-  serializeJson(filteredArray, json);
-  Serial.printf("📤 Sending JSON response (%d bytes)\n", json.length());
+// Validates what landed on flash, then leaves the swap to the KPI task
+void handleModelUploaded() {
+  ModelBlobHeader header = {};
+  if (!modelUploadError) {
+    const uint8_t* data;
+    spi_flash_mmap_handle_t handle;
+    ModelBlobStatus status = mapModelSlot(modelUploadSlot, data, handle, header);
+    if (status == MODEL_BLOB_OK) {
+      spi_flash_munmap(handle);
+    } else {
+      modelUploadError = modelBlobStatusName(status);
+    }
+  }
 
-  // Add CORS headers
+  JsonDocument response;
+  int code = 202;
+  if (modelUploadError) {
+    code = strcmp(modelUploadError, "a model swap is pending") == 0 ? 409 : 400;
+    response["error"] = modelUploadError;
+  } else {
+    pendingModelSlot = modelUploadSlot;
+    queueKpiCommand(KPI_COMMAND_LOAD_MODEL);
+    response["slot"] = modelUploadSlot;
+    response["generation"] = header.generation;
+    response["length"] = header.length;
+    response["crc32"] = header.crc32;
+  }
+  String body;
+  serializeJson(response, body);
+  server.send(code, "application/json", body);
+}
+#endif
+
+// GET /model: which model the interpreter runs
+void handleModelInfo() {
+#ifdef USE_MODEL_LUT
+  server.send(501, "application/json", "{\"error\":\"built with USE_MODEL_LUT\"}");
+#else
+  ModelInfo info = publishedModel.read();
+  JsonDocument doc;
+  doc["source"] = info.slot < 0 ? "built-in" : "partition";
+  doc["slot"] = info.slot;
+  doc["generation"] = info.generation;
+  doc["length"] = info.length;
+  doc["crc32"] = info.crc32;
+  doc["loads"] = info.loads;
+  doc["age_s"] = (millis() - info.loaded_ms) / 1000;
+  doc["pending"] = pendingModelSlot >= 0;
+  doc["partition"] = modelPartition != nullptr;
+  doc["slot_bytes"] = MODEL_SLOT_BYTES;
+  String body;
+  serializeJson(doc, body);
   server.sendHeader("Access-Control-Allow-Origin", "*");
-  server.sendHeader("Access-Control-Allow-Methods", "GET, POST, OPTIONS");
-  server.sendHeader("Access-Control-Allow-Headers", "Content-Type");
-  server.send(200, "application/json", json);
+  server.send(200, "application/json", body);
+#endif
 }
 
+// Served from the published snapshot: never waits for a scan or a flash write
 void handleStatus() {
+  KpiSnapshot sample = latestSample.read();
   JsonDocument status;
   status["connected"] = isConnected;
-  status["ssid"] = connectedSSID;
-  status["rssi"] = currentRSSI;
-  status["noise"] = currentNoise;
-  status["snr"] = currentSNR;
-  status["channel_util"] = currentChannelUtil;
-  status["stability"] = currentStability;
+  status["ssid"] = sample.ssid;
+  status["rssi"] = sample.rssi;
+  status["noise"] = sample.noise;
+  status["snr"] = sample.snr;
+  status["channel_util"] = sample.channel_util;
+  status["stability"] = sample.stability;
+  status["sample_interval"] = sample.sample_interval_ms / 1000;
   status["ip"] = WiFi.localIP().toString();
   status["timestamp"] = time(nullptr);
 
@@ -415,35 +928,34 @@ void handleStatus() {
   server.send(200, "application/json", json);
 }
 
+String stabilityClass(float stability) {
+  if (stability > 0.8f) return "excellent";
+  if (stability > 0.6f) return "good";
+  if (stability > 0.4f) return "fair";
+  return "poor";
+}
+
 // Advanced AI endpoint for enhanced dashboard features
 void handleAdvancedAI() {
+  KpiSnapshot sample = latestSample.read();
   JsonDocument aiData;
 
   // Basic metrics
-  aiData["rssi"] = currentRSSI;
-  aiData["noise"] = currentNoise;
-  aiData["snr"] = currentSNR;
-  aiData["channel_util"] = currentChannelUtil;
+  aiData["rssi"] = sample.rssi;
+  aiData["noise"] = sample.noise;
+  aiData["snr"] = sample.snr;
+  aiData["channel_util"] = sample.channel_util;
 
   // Advanced AI predictions
-  aiData["stability"] = currentPrediction.stability;
-  aiData["confidence"] = currentPrediction.confidence;
-  aiData["trend_score"] = currentPrediction.trend_score;
-  aiData["alert_type"] = currentPrediction.alert_type;
-  aiData["alert_message"] = currentPrediction.alert_message;
+  aiData["stability"] = sample.ai_stability;
+  aiData["confidence"] = sample.confidence;
+  aiData["trend_score"] = sample.trend_score;
+  const AlertInfo& alert = alertInfo(sample.alert);
+  aiData["alert_type"] = alert.type;        // constants: stored by pointer, not copied
+  aiData["alert_message"] = alert.message;
 
   // Stability classification
-  String stability_class = "unknown";
-  if (currentPrediction.stability > 0.8f) {
-    stability_class = "excellent";
-  } else if (currentPrediction.stability > 0.6f) {
-    stability_class = "good";
-  } else if (currentPrediction.stability > 0.4f) {
-    stability_class = "fair";
-  } else {
-    stability_class = "poor";
-  }
-  aiData["stability_class"] = stability_class;
+  aiData["stability_class"] = stabilityClass(sample.ai_stability);
 
   // Timestamp
   aiData["timestamp"] = time(nullptr);
@@ -456,6 +968,291 @@ void handleAdvancedAI() {
   server.send(200, "application/json", json);
 }
 
+// One compact SSE message per KPI sample: /status fields plus the AI alert
+String buildKpiEvent(const KpiSnapshot& sample) {
+  JsonDocument event;
+  event["t"] = sample.t;
+  event["connected"] = sample.connected;
+  event["ssid"] = sample.ssid;
+  event["rssi"] = sample.rssi;
+  event["noise"] = sample.noise;
+  event["snr"] = sample.snr;
+  event["channel_util"] = sample.channel_util;
+  event["stability"] = sample.stability;
+  event["sample_interval"] = sample.sample_interval_ms / 1000;
+  event["confidence"] = sample.confidence;
+  event["trend_score"] = sample.trend_score;
+  const AlertInfo& alert = alertInfo(sample.alert);
+  event["alert_type"] = alert.type;
+  event["alert_message"] = alert.message;
+  event["stability_class"] = stabilityClass(sample.ai_stability);
+
+  String message = "id: " + String((unsigned long)sample.t) + "\ndata: ";
+  serializeJson(event, message);
+  message += "\n\n";
+  return message;
+}
+
+// Alert episodes as the binary log image (decode with alert_log.py); no history scan
+void handleAlerts() {
+  static uint8_t image[ALERT_LOG_BYTES];
+  AlertLog episodes = publishedAlerts.read();
+  size_t length = episodes.serialize(image, sizeof(image));
+  server.sendHeader("Access-Control-Allow-Origin", "*");
+  server.send_P(200, "application/octet-stream", (const char*)image, length);
+}
+
+// Server-Sent Events stream: the client is kept open and fed from loop()
+void handleEvents() {
+  int slot = -1;
+  for (int i = 0; i < MAX_EVENT_CLIENTS; i++) {
+    if (!eventClients[i].connected()) {
+      slot = i;
+      break;
+    }
+  }
+  if (slot < 0) {
+    server.send(503, "text/plain", "Too many event subscribers");
+    return;
+  }
+
+  WiFiClient client = server.client();
+  client.print("HTTP/1.1 200 OK\r\n"
+               "Content-Type: text/event-stream\r\n"
+               "Cache-Control: no-cache\r\n"
+               "Connection: keep-alive\r\n"
+               "Access-Control-Allow-Origin: *\r\n\r\n"
+               "retry: 5000\n\n");
+  client.print(buildKpiEvent(latestSample.read())); // current state, so the dashboard fills in immediately
+  eventClients[slot] = client;   // holding a copy keeps the socket open after the handler returns
+  Serial.printf("📡 Event subscriber %d connected\n", slot);
+}
+
+// Write one message to every open subscriber
+void broadcastEvent(const String& message) {
+  lastEventMs = millis();
+  for (int i = 0; i < MAX_EVENT_CLIENTS; i++) {
+    if (!eventClients[i].connected()) {
+      continue; // free slot, or the viewer went away; handleEvents() reuses it
+    }
+    if (eventClients[i].print(message) != message.length()) {
+      eventClients[i].stop();
+      Serial.printf("📡 Event subscriber %d dropped\n", i);
+    }
+  }
+}
+
+// Drain samples queued by the KPI task; keep idle streams alive
+void serviceEventClients() {
+  KpiSnapshot sample;
+  while (eventQueue.pop(sample)) {
+    broadcastEvent(buildKpiEvent(sample));
+  }
+  if (millis() - lastEventMs >= EVENT_KEEPALIVE_MS) {
+    broadcastEvent(": keepalive\n\n");
+  }
+}
+
+// Demo history for testing without a station connection: replaces the tier rings
+void generateDemoData() {
+  Serial.println("🎭 Generating demo data...");
+
+  for (uint8_t tier = 0; tier < TIER_COUNT; tier++) {
+    historyReady[tier] = ringInit(LittleFS, tier, historyRings[tier]);
+  }
+  minuteRollup = RollupAccumulator(HISTORY_TIERS[TIER_MINUTE].period_s);
+  hourRollup = RollupAccumulator(HISTORY_TIERS[TIER_HOUR].period_s);
+
+  // Generate 50 demo records over the last 24 hours
+  time_t now = time(nullptr);
+  if (now < 1000000) now = 1755000000; // Use fixed time if NTP not working
+
+  for (int i = 0; i < 50; i++) {
+    time_t recordTime = now - (24 * 3600) + (i * 1800); // Every 30 minutes
+
+    // Generate realistic WiFi data
+    float rssi = -45 - (rand() % 40); // -45 to -85 dBm
+    float noise = -98 + (rand() % 15); // -98 to -83 dBm (realistic noise floor)
+    float snr = rssi - noise;
+    float channel_util = rand() % 80; // 0-80%
+    float stability = (rssi > -70 && snr > 20 && channel_util < 50) ? 0.8 + (rand() % 20) / 100.0 : 0.3 + (rand() % 50) / 100.0;
+
+    recordHistory(recordTime, rssi, noise, channel_util, stability, 1800);
+  }
+  Serial.println("✅ Demo data generated successfully");
+}
+
+// POST /connect, on the KPI task: join the network handleConnect() saved. Its
+// 10 s wait blocks sampling only; HTTP keeps running on the other core.
+void connectWiFi() {
+  String ssid, password;
+  if (!loadWiFiConfig(ssid, password)) {
+    connectState = CONNECT_FAILED;
+    return;
+  }
+
+  WiFi.begin(ssid.c_str(), password.c_str());
+
+  // Wait for connection (timeout after 10 seconds)
+  int attempts = 0;
+  while (WiFi.status() != WL_CONNECTED && attempts < 20) {
+    delay(500);
+    attempts++;
+  }
+
+  if (WiFi.status() != WL_CONNECTED) {
+    Serial.printf("❌ Could not connect to %s\n", ssid.c_str());
+    connectState = CONNECT_FAILED;
+    return;
+  }
+
+  isConnected = true;
+  connectedSSID = ssid;
+  apMode = false; // Connected to WiFi, but AP still running
+
+  // Configure time
+  configTime(0, 0, "pool.ntp.org");
+
+  // Start KPI collection immediately; the sample publishes the new SSID before
+  // GET /connect reports success
+  kpiEnabled = true;
+  lastSampleMs = millis();
+  saveKPI();
+  connectState = CONNECT_OK;
+  Serial.println("📊 KPI collection started after WiFi connection");
+  Serial.println("📡 AP still available for future configuration");
+}
+
+// Reconnect a dropped station link; runs on the KPI task so its delays never stall HTTP
+void maintainWiFi() {
+  if (apMode || WiFi.status() == WL_CONNECTED) {
+    return;
+  }
+
+  Serial.println("WiFi disconnected, attempting reconnection...");
+  isConnected = false;
+
+  // Try to reconnect
+  String savedSSID, savedPassword;
+  if (loadWiFiConfig(savedSSID, savedPassword)) {
+    WiFi.begin(savedSSID.c_str(), savedPassword.c_str());
+
+    int attempts = 0;
+    while (WiFi.status() != WL_CONNECTED && attempts < 10) {
+      delay(500);
+      attempts++;
+    }
+
+    if (WiFi.status() == WL_CONNECTED) {
+      isConnected = true;
+      connectedSSID = savedSSID;
+      kpiEnabled = true;
+      Serial.println("Reconnected to WiFi!");
+      Serial.println("📊 KPI collection restarted after reconnection");
+    }
+  }
+}
+
+// KPI task: commands from the web handlers, reconnects and adaptive sampling
+void kpiTask(void* parameter) {
+  KpiCommand command;
+  for (;;) {
+    while (commandQueue.pop(command)) {
+      if (command == KPI_COMMAND_COLLECT) {
+        lastSampleMs = millis();
+        saveKPI();
+      } else if (command == KPI_COMMAND_DEMO) {
+        generateDemoData();
+      } else if (command == KPI_COMMAND_SCAN) {
+        if (!scanResults.fresh(millis())) refreshScan();
+      } else if (command == KPI_COMMAND_CONNECT) {
+        connectWiFi();
+      } else if (command == KPI_COMMAND_LOAD_MODEL) {
+#ifndef USE_MODEL_LUT
+        loadPendingModel();
+#endif
+      }
+    }
+
+    maintainWiFi();
+
+    // Between samples, an RSSI or noise step (no scan needed) triggers one right away
+    bool due = lastSampleMs == 0 || millis() - lastSampleMs >= sampler.currentInterval();
+    bool step = kpiEnabled && !due && isConnected && !apMode && sampler.stepDetected(WiFi.RSSI(), noiseFloor());
+    if (kpiEnabled && (due || step)) {
+      lastSampleMs = millis();
+      saveKPI();
+    }
+
+    // Sleep until the next scheduler tick, or until queueKpiCommand() wakes us
+    ulTaskNotifyTake(pdTRUE, pdMS_TO_TICKS(KPI_TASK_POLL_MS));
+  }
+}
+
+void loadAssetManifest() {
+  File file = LittleFS.open(ASSET_MANIFEST, "r");
+  if (!file) {
+    Serial.println("⚠️ No asset manifest, serving data/ files as-is");
+    return;
+  }
+  DeserializationError error = deserializeJson(assetManifest, file);
+  file.close();
+  if (error) {
+    Serial.printf("❌ Asset manifest parse error: %s\n", error.c_str());
+    assetManifest.clear();
+  } else {
+    Serial.printf("📦 Loaded %d pre-compressed assets\n", assetManifest.as<JsonObject>().size());
+  }
+}
+
+String contentTypeFor(String path) {
+  if (path.endsWith(".gz")) path = path.substring(0, path.length() - 3);
+  if (path.endsWith(".html")) return "text/html";
+  if (path.endsWith(".css")) return "text/css";
+  if (path.endsWith(".js")) return "application/javascript";
+  if (path.endsWith(".json")) return "application/json";
+  if (path.endsWith(".png")) return "image/png";
+  if (path.endsWith(".ico")) return "image/x-icon";
+  if (path.endsWith(".svg")) return "image/svg+xml";
+  return "text/plain";
+}
+
+// Serve web UI files: gzip from the manifest with ETag/Cache-Control, else the plain file
+void handleStaticAsset() {
+  String path = server.uri();
+  if (path.endsWith("/")) {
+    path += "index.html";
+  }
+
+  JsonObject asset = assetManifest[path];
+  if (!asset.isNull()) {
+    const char* etag = asset["etag"];
+    server.sendHeader("ETag", etag);
+    server.sendHeader("Cache-Control", asset["cache"].as<const char*>());
+    if (server.header("If-None-Match") == etag) {
+      server.send(304);
+      return;
+    }
+    File file = LittleFS.open(asset["file"].as<const char*>(), "r");
+    if (file) {
+      server.streamFile(file, asset["type"].as<const char*>()); // adds Content-Encoding: gzip for .gz
+      file.close();
+      return;
+    }
+  }
+
+  if (!LittleFS.exists(path) && LittleFS.exists(path + ".gz")) {
+    path += ".gz";
+  }
+  if (LittleFS.exists(path)) {
+    File file = LittleFS.open(path, "r");
+    server.streamFile(file, contentTypeFor(path));
+    file.close();
+    return;
+  }
+  server.send(404, "text/plain", "Not found");
+}
+
 void setup() {
   Serial.begin(115200);
   Serial.println("WiFi Monitor Starting...");
@@ -515,7 +1312,6 @@ void setup() {
 
       // Configure time
       configTime(0, 0, "pool.ntp.org");
-      setupTFLite();
     } else {
       Serial.println("\n❌ Failed to connect to saved WiFi");
       Serial.println("📡 AP mode available for configuration");
@@ -538,12 +1334,21 @@ void setup() {
 
   server.on("/scan", HTTP_GET, handleScan);
   server.on("/connect", HTTP_POST, handleConnect);
+  server.on("/connect", HTTP_GET, handleConnectStatus);
   server.on("/history", HTTP_GET, handleHistory);
   server.on("/status", HTTP_GET, handleStatus);
   server.on("/advanced-ai", HTTP_GET, handleAdvancedAI);
+  server.on("/events", HTTP_GET, handleEvents);
+  server.on("/alerts", HTTP_GET, handleAlerts);
+  server.on("/model", HTTP_GET, handleModelInfo);
+#ifdef USE_MODEL_LUT
+  server.on("/model", HTTP_POST, handleModelInfo);
+#else
+  server.on("/model", HTTP_POST, handleModelUploaded, handleModelUpload);
+#endif
   server.on("/collect", HTTP_GET, []() {
-    saveKPI();
-    server.send(200, "text/plain", "KPI collected manually");
+    queueKpiCommand(KPI_COMMAND_COLLECT);
+    server.send(200, "text/plain", "KPI collection queued");
   });
 
   // Debug endpoint to check file contents
@@ -553,36 +1358,39 @@ void setup() {
     response += "AP IP: " + WiFi.softAPIP().toString() + "\n";
     response += "Station IP: " + WiFi.localIP().toString() + "\n";
     response += "Connected: " + String(isConnected ? "YES" : "NO") + "\n";
-    response += "SSID: " + connectedSSID + "\n";
+    response += "SSID: " + String(latestSample.read().ssid) + "\n";
     response += "LittleFS mounted: " + String(LittleFS.begin() ? "YES" : "NO") + "\n";
-    response += "History file exists: " + String(LittleFS.exists(HISTORY_FILE) ? "YES" : "NO") + "\n";
-
-    if (LittleFS.exists(HISTORY_FILE)) {
-      File file = LittleFS.open(HISTORY_FILE, "r");
-      if (file) {
-        response += "File size: " + String(file.size()) + " bytes\n";
-        response += "File contents (last 500 chars):\n";
-        String content = file.readString();
-        if (content.length() > 500) {
-          response += "..." + content.substring(content.length() - 500);
-        } else {
-          response += content;
+    for (uint8_t tier = 0; tier < TIER_COUNT; tier++) {
+      RingHeader header;
+      if (ringLoad(LittleFS, tier, header)) {
+        HistoryReader ring(LittleFS, header);
+        uint32_t count = ring.count();
+        response += String(HISTORY_TIERS[tier].name) + " history: " + String(count) + "/" +
+                    String(header.capacity) + " records in " +
+                    String((count + ringSegmentRecords(header) - 1) / ringSegmentRecords(header)) +
+                    " segments";
+        if (count) {
+          response += ", " + String(ring.time(0)) + " to " + String(ring.time(count - 1));
         }
-        file.close();
+        response += "\n";
       } else {
-        response += "Could not open file\n";
+        response += String(HISTORY_TIERS[tier].name) + " history: unreadable\n";
       }
     }
+    response += "LittleFS: " + String(LittleFS.usedBytes()) + "/" + String(LittleFS.totalBytes()) +
+                " bytes used\n";
 
     server.send(200, "text/plain", response);
   });
 
   // Simple test endpoint that works from any device
   server.on("/simple", HTTP_GET, []() {
+    RingHeader raw;
+    uint32_t records = ringLoad(LittleFS, TIER_RAW, raw) ? ringCount(raw) : 0;
     String html = "<!DOCTYPE html><html><head><title>Simple Test</title></head><body>";
     html += "<h1>WiFi Monitor Simple Test</h1>";
     html += "<p>Connected: " + String(isConnected ? "YES" : "NO") + "</p>";
-    html += "<p>Records: " + String(LittleFS.exists(HISTORY_FILE) ? "File exists" : "No file") + "</p>";
+    html += "<p>Records: " + String(records) + "</p>";
     html += "<button onclick=\"fetch('/collect').then(r=>r.text()).then(t=>alert(t))\">Collect KPI</button>";
     html += "<button onclick=\"fetch('/history?range=0').then(r=>r.json()).then(d=>alert('Records: '+d.length))\">Check Data</button>";
     html += "<button onclick=\"window.location.href='/dashboard.html'\">Dashboard</button>";
@@ -614,61 +1422,34 @@ void setup() {
     server.send(200, "application/json", json);
   });
 
-  // Demo data generation for testing
+  // Demo data generation for testing (runs on the KPI task, the only history writer)
   server.on("/demo", HTTP_GET, []() {
-    Serial.println("🎭 Generating demo data...");
-
-    JsonDocument history;
-    JsonArray records = history.to<JsonArray>();
-
-    // Generate 50 demo records over the last 24 hours
-    time_t now = time(nullptr);
-    if (now < 1000000) now = 1755000000; // Use fixed time if NTP not working
-
-    for (int i = 0; i < 50; i++) {
-      JsonObject record = records.add<JsonObject>();
-      time_t recordTime = now - (24 * 3600) + (i * 1800); // Every 30 minutes
-
-      // Generate realistic WiFi data
-      float rssi = -45 - (rand() % 40); // -45 to -85 dBm
-      float noise = -98 + (rand() % 15); // -98 to -83 dBm (realistic noise floor)
-      float snr = rssi - noise;
-      float channel_util = rand() % 80; // 0-80%
-      float stability = (rssi > -70 && snr > 20 && channel_util < 50) ? 0.8 + (rand() % 20) / 100.0 : 0.3 + (rand() % 50) / 100.0;
-
-      record["t"] = recordTime;
-      record["rssi"] = rssi;
-      record["noise"] = noise;
-      record["snr"] = snr;
-      record["channel_util"] = channel_util;
-      record["stability"] = stability;
-      record["ssid"] = "DemoNetwork";
-    }
-
-    // Save demo data
-    File file = LittleFS.open(HISTORY_FILE, "w");
-    if (file) {
-      serializeJson(history, file);
-      file.close();
-      Serial.println("✅ Demo data generated successfully");
-      server.send(200, "text/plain", "Demo data generated! Check dashboard.");
-    } else {
-      Serial.println("❌ Failed to save demo data");
-      server.send(500, "text/plain", "Failed to generate demo data");
-    }
+    queueKpiCommand(KPI_COMMAND_DEMO);
+    server.send(200, "text/plain", "Demo data queued! Check dashboard in a moment.");
   });
 
-  // Serve static files
-  server.serveStatic("/", LittleFS, "/");
+  // Serve static files (pre-compressed and cached when built with build_assets.py)
+  loadAssetManifest();
+  const char* assetHeaders[] = {"If-None-Match"};
+  server.collectHeaders(assetHeaders, 1);
+  server.onNotFound(handleStaticAsset);
 
   // Start web server
   server.begin();
   Serial.println("Web server started");
 
-  // Start KPI collection (only when connected) or demo mode
+  // The model is loaded even in AP mode: sampling may start after a later /connect,
+  // and /model needs the partition
+  setupTFLite();
+
+  // Start the KPI task on its own core; it samples only when connected
+  loadAlertLog();
+  initHistoryTiers();
+  xTaskCreatePinnedToCore(kpiTask, "kpi", KPI_TASK_STACK, nullptr, KPI_TASK_PRIORITY,
+                          &kpiTaskHandle, KPI_TASK_CORE);
   if (!apMode && isConnected) {
-    ticker.attach_ms(kpiInterval, saveKPI);
-    Serial.println("📊 KPI collection started - collecting every 10 seconds");
+    kpiEnabled = true;
+    Serial.println("📊 KPI collection started - adaptive 2-60 s sampling on core 0");
   } else {
     Serial.println("⏳ KPI collection will start after WiFi connection");
     Serial.println("💡 Tip: Use /demo endpoint to generate test data");
@@ -676,35 +1457,8 @@ void setup() {
 }
 
 void loop() {
+  // Web server core: HTTP and SSE only; scans, inference and flash writes run in kpiTask()
   server.handleClient();
-
-  // Handle WiFi reconnection
-  if (!apMode && WiFi.status() != WL_CONNECTED) {
-    Serial.println("WiFi disconnected, attempting reconnection...");
-    isConnected = false;
-
-    // Try to reconnect
-    String savedSSID, savedPassword;
-    if (loadWiFiConfig(savedSSID, savedPassword)) {
-      WiFi.begin(savedSSID.c_str(), savedPassword.c_str());
-
-      int attempts = 0;
-      while (WiFi.status() != WL_CONNECTED && attempts < 10) {
-        delay(500);
-        attempts++;
-      }
-
-      if (WiFi.status() == WL_CONNECTED) {
-        isConnected = true;
-        connectedSSID = savedSSID;
-        Serial.println("Reconnected to WiFi!");
-
-        // Restart KPI collection
-        ticker.attach_ms(kpiInterval, saveKPI);
-        Serial.println("📊 KPI collection restarted after reconnection");
-      }
-    }
-  }
-
-  delay(100);
-}
\ No newline at end of file
+  serviceEventClients();
+  delay(2);
+}
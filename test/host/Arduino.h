@@ -0,0 +1,23 @@
+// Minimal Arduino API shim for compiling firmware headers on the host.
+// Used by test_compile.py (host syntax/unit stage), not by the ESP32 build.
+
+#ifndef HOST_ARDUINO_SHIM_H
+#define HOST_ARDUINO_SHIM_H
+
+#include <cmath>
+#include <cstdint>
+#include <cstdlib>
+#include <string>
+
+using std::abs;
+
+class String : public std::string {
+public:
+  String() = default;
+  String(const char* s) : std::string(s) {}
+  String(const std::string& s) : std::string(s) {}
+};
+
+#define constrain(amt, low, high) ((amt) < (low) ? (low) : ((amt) > (high) ? (high) : (amt)))
+
+#endif // HOST_ARDUINO_SHIM_H
@@ -0,0 +1,371 @@
+// Host unit compile of the firmware headers (see test_compile.py)
+#include <cstdio>
+#include <cstring>
+#include <map>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "Arduino.h"
+#include "advanced_ai.h"
+#include "adaptive_scheduler.h"
+#include "alert_log.h"
+#include "kpi_exchange.h"
+#include "model.h"
+#include "model_lut.h"
+#include "scan_cache.h"
+#include "history_tiers.h"
+#include "kpi_codec.h"
+#include "model_store.h"
+
+static int failures = 0;
+static SnapshotBuffer<KpiSnapshot> snapshots;
+static SpscQueue<uint32_t, 8> sequence_queue;
+
+// In-memory stand-ins for LittleFS and its File, enough for the tier rings
+struct MemFile {
+  std::vector<uint8_t>* data = nullptr;
+  size_t position = 0;
+  explicit operator bool() const { return data != nullptr; }
+  size_t size() const { return data->size(); }
+  bool seek(size_t pos) { position = pos; return pos <= data->size(); }
+  size_t read(uint8_t* out, size_t n) {
+    n = position + n > data->size() ? data->size() - position : n;
+    memcpy(out, data->data() + position, n);
+    position += n;
+    return n;
+  }
+  size_t write(const uint8_t* in, size_t n) {
+    if (position + n > data->size()) data->resize(position + n);
+    memcpy(data->data() + position, in, n);
+    position += n;
+    return n;
+  }
+  void close() {}
+};
+struct MemFS {
+  std::map<std::string, std::vector<uint8_t>> files;
+  bool mkdir(const char*) { return true; }
+  MemFile open(const char* path, const char* mode) {
+    MemFile file;
+    if (mode[0] == 'w') files[path].clear();
+    auto it = files.find(path);
+    if (it != files.end()) file.data = &it->second;
+    return file;
+  }
+};
+static MemFS ringFS;
+
+static void check(bool condition, const char* message) {
+  if (!condition) {
+    printf("FAIL: %s\n", message);
+    failures++;
+  }
+}
+
+// Parity modes for the Python mirrors (host_unit() in test_compile.py): inputs on stdin,
+// results on stdout, compared by the test_*.py of each header
+
+// anomaly: "rssi snr channel_util" lines -> one detector score per line
+static int parityAnomaly() {
+  AnomalyDetectorState state;
+  anomaly_detector_init(&state);
+  float rssi, snr, util;
+  while (scanf("%f %f %f", &rssi, &snr, &util) == 3) {
+    printf("%u\n", (unsigned)anomaly_detector_update(&state, rssi, snr, util));
+  }
+  return 0;
+}
+
+// alerts: "t alert severity" lines -> the serialized log as hex
+static int parityAlerts() {
+  static AlertLog log;
+  unsigned t, alert, severity;
+  while (scanf("%u %u %u", &t, &alert, &severity) == 3) log.update(t, alert, severity);
+  static uint8_t image[ALERT_LOG_BYTES];
+  size_t length = log.serialize(image, sizeof(image));
+  for (size_t i = 0; i < length; i++) printf("%02x", image[i]);
+  return 0;
+}
+
+// scan: "count channel" then count "rssi channel open" lines -> utilization on that channel
+static int parityScan() {
+  static ScanResults scan;
+  unsigned count, channel;
+  while (scanf("%u %u", &count, &channel) == 2) {
+    scan.count = count < SCAN_MAX_RESULTS ? count : SCAN_MAX_RESULTS;
+    for (unsigned i = 0; i < count; i++) {
+      int rssi;
+      unsigned ap_channel, open;
+      if (scanf("%d %u %u", &rssi, &ap_channel, &open) != 3) return 1;
+      if (i < scan.count) scan.entries[i] = {"", (int8_t)rssi, (uint8_t)ap_channel, open != 0};
+    }
+    scan.summarize();
+    printf("%.4f\n", scan.channelUtilization(channel));
+  }
+  return 0;
+}
+
+// rings <root>: "t rssi noise util stability" lines -> the ring files of every tier under root
+static int parityRings(const char* root) {
+  static MemFS fs;
+  RingHeader headers[TIER_COUNT];
+  for (int tier = 0; tier < TIER_COUNT; tier++) ringInit(fs, tier, headers[tier]);
+  RollupAccumulator minute(60), hour(3600);
+  RollupRecord closed;
+  unsigned t;
+  float rssi, noise, util, stability;
+  while (scanf("%u %f %f %f %f", &t, &rssi, &noise, &util, &stability) == 5) {
+    RawRecord raw = makeRawRecord(t, rssi, noise, util, stability, 10);
+    ringAppend(fs, headers[TIER_RAW], &raw);
+    if (minute.add(t, rssi, noise, util, stability, closed)) ringAppend(fs, headers[TIER_MINUTE], &closed);
+    if (hour.add(t, rssi, noise, util, stability, closed)) ringAppend(fs, headers[TIER_HOUR], &closed);
+  }
+  for (const auto& file : fs.files) {
+    FILE* out = fopen((std::string(root) + file.first).c_str(), "wb");
+    if (out == nullptr) return 1;
+    fwrite(file.second.data(), 1, file.second.size(), out);
+    fclose(out);
+  }
+  return 0;
+}
+
+// codec <c_out> <python_in> <samples_out>: "t rssi noise util stability dt" lines -> packed blocks
+// in c_out; the blocks in python_in decoded to raw records in samples_out
+static int parityCodec(const char* c_out, const char* python_in, const char* samples_out) {
+  FILE* out = fopen(c_out, "wb");
+  if (out == nullptr) return 1;
+  KpiBlockEncoder encoder;
+  unsigned t, util, stability, dt;
+  int rssi, noise;
+  while (scanf("%u %d %d %u %u %u", &t, &rssi, &noise, &util, &stability, &dt) == 6) {
+    RawRecord r = {t, (int16_t)rssi, (int16_t)noise, (uint8_t)util, (uint8_t)stability, (uint16_t)dt};
+    if (!encoder.add(r)) {
+      fwrite(encoder.finish(), 1, KPI_BLOCK_BYTES, out);
+      encoder.reset();
+      encoder.add(r);
+    }
+  }
+  fwrite(encoder.finish(), 1, KPI_BLOCK_BYTES, out);
+  fclose(out);
+
+  FILE* in = fopen(python_in, "rb");
+  FILE* samples = fopen(samples_out, "wb");
+  if (in == nullptr || samples == nullptr) return 1;
+  static RawRecord decoded[4096];
+  uint8_t block[KPI_BLOCK_BYTES];
+  while (fread(block, 1, KPI_BLOCK_BYTES, in) == KPI_BLOCK_BYTES) {
+    uint16_t n = kpiBlockDecode(block, decoded, 4096);
+    if (!n) return 1;
+    fwrite(decoded, sizeof(RawRecord), n, samples);
+  }
+  fclose(in);
+  fclose(samples);
+  return 0;
+}
+
+// model-store <blob>...: each file as a slot image -> "status|crc32 of the bytes after the header"
+static int parityModelStore(int argc, char** argv) {
+  static uint8_t slot[MODEL_SLOT_BYTES];
+  for (int i = 0; i < argc; i++) {
+    FILE* f = fopen(argv[i], "rb");
+    if (f == nullptr) return 1;
+    memset(slot, 0xFF, sizeof(slot));
+    size_t n = fread(slot, 1, sizeof(slot), f);
+    fclose(f);
+    ModelBlobStatus status = checkModelBlob(slot, sizeof(slot));
+    printf("%s|%u\n", modelBlobStatusName(status), n > 32 ? (unsigned)modelCrc32(slot + 32, n - 32) : 0u);
+  }
+  return 0;
+}
+
+static int parity(int argc, char** argv) {
+  if (strcmp(argv[0], "anomaly") == 0) return parityAnomaly();
+  if (strcmp(argv[0], "alerts") == 0) return parityAlerts();
+  if (strcmp(argv[0], "scan") == 0) return parityScan();
+  if (strcmp(argv[0], "rings") == 0 && argc == 2) return parityRings(argv[1]);
+  if (strcmp(argv[0], "codec") == 0 && argc == 4) return parityCodec(argv[1], argv[2], argv[3]);
+  if (strcmp(argv[0], "model-store") == 0) return parityModelStore(argc - 1, argv + 1);
+  fprintf(stderr, "unknown parity mode %s\n", argv[0]);
+  return 2;
+}
+
+int main(int argc, char** argv) {
+  if (argc > 1) return parity(argc - 1, argv + 1);
+
+  check(sizeof(wifi_model_tflite) == wifi_model_tflite_len, "model.h length matches array");
+  check(memcmp(wifi_model_tflite + 4, "TFL3", 4) == 0, "model.h holds a TFLite flatbuffer");
+  check(sizeof(wifi_model_lut) == wifi_model_lut_len, "model_lut.h length matches array");
+
+  AdvancedWiFiAI ai;
+  AdvancedWiFiAI::PredictionResult result;
+  for (int i = 0; i < 20; i++) {
+    float rssi = -60.0f - (i % 5);
+    float noise = -92.0f;
+    result = ai.predictAdvancedStability(rssi, noise, rssi - noise, 25.0f);
+    check(result.stability >= 0.0f && result.stability <= 1.0f, "stability in [0, 1]");
+    check(result.confidence >= 0.0f && result.confidence <= 1.0f, "confidence in [0, 1]");
+    check(result.alert < ALERT_TYPE_COUNT, "alert type set");
+  }
+
+  AdaptiveScheduler scheduler;
+  AdvancedWiFiAI::PredictionResult degraded = result;
+  degraded.alert = ALERT_DEGRADING;
+  check(scheduler.next(degraded) == SAMPLE_INTERVAL_MIN_MS, "scheduler speeds up on degradation");
+  AdvancedWiFiAI::PredictionResult stable = result;
+  stable.alert = ALERT_EXCELLENT;
+  stable.trend_score = 0.0f;
+  stable.rssi_variance = 1.0f;
+  stable.noise_variance = 1.0f;
+  unsigned long interval = 0;
+  for (int i = 0; i < 10; i++) interval = scheduler.next(stable);
+  check(interval == SAMPLE_INTERVAL_MAX_MS, "scheduler backs off while stable");
+  scheduler.next(stable, -50.0f, -92.0f);
+  check(!scheduler.stepDetected(-53.0f, -90.0f), "small KPI changes keep the stable interval");
+  check(scheduler.stepDetected(-58.0f, -92.0f), "RSSI step re-arms fast sampling");
+  check(scheduler.next(stable, -58.0f, -92.0f) == SAMPLE_INTERVAL_MIN_MS, "fast sampling after a step");
+
+  // Writer and reader on separate threads, as on the two cores
+  const uint32_t samples = 20000;
+  std::thread writer([&]() {
+    KpiSnapshot s = {};
+    for (uint32_t i = 1; i <= samples; i++) {
+      s.t = i;
+      s.rssi = -(float)(i % 1000);
+      s.snr = (float)(i % 1000);
+      snprintf(s.ssid, sizeof(s.ssid), "sample %u", i);
+      snapshots.publish(s);
+      while (!sequence_queue.push(i)) std::this_thread::yield();
+    }
+  });
+  bool torn = false, ordered = true;
+  uint32_t expected = 1;
+  while (expected <= samples) {
+    KpiSnapshot s = snapshots.read();
+    char ssid[sizeof(s.ssid)];
+    snprintf(ssid, sizeof(ssid), "sample %u", s.t);
+    if (s.t && (s.rssi != -s.snr || strcmp(ssid, s.ssid) != 0)) torn = true;
+    uint32_t value;
+    while (sequence_queue.pop(value)) ordered = ordered && value == expected++;
+    std::this_thread::yield();
+  }
+  writer.join();
+  check(!torn, "snapshot reads are never torn");
+  check(ordered, "SPSC queue preserves order without loss");
+  check(snapshots.read().t == samples, "snapshot holds the latest sample");
+  check(snapshots.version() == samples, "version counts completed publishes");
+
+  // Alert log: one episode per stretch of warnings, survives a serialize/restore cycle
+  AlertLog log;
+  check(!log.update(1, ALERT_GOOD, alertInfo(ALERT_GOOD).severity), "status alerts open no episode");
+  check(log.update(2, ALERT_DEGRADING, alertInfo(ALERT_DEGRADING).severity), "warning opens an episode");
+  check(!log.update(3, ALERT_DEGRADING, alertInfo(ALERT_DEGRADING).severity), "repeated alert is not a transition");
+  check(log.update(4, ALERT_WEAK_SIGNAL, alertInfo(ALERT_WEAK_SIGNAL).severity), "type change is recorded");
+  check(!log.update(5, ALERT_EXCELLENT, 0), "one status sample does not close the episode");
+  check(log.update(5 + ALERT_CLEAR_S, ALERT_GOOD, 0), "status held for ALERT_CLEAR_S closes it");
+  uint32_t t = 1000;
+  for (uint32_t i = 0; i < ALERT_LOG_SIZE + 3; i++, t += 2 * ALERT_CLEAR_S) {
+    log.update(t, ALERT_CONGESTION, 2);
+    log.update(t + 1, ALERT_GOOD, 0);
+    log.update(t + 1 + ALERT_CLEAR_S, ALERT_GOOD, 0);
+  }
+  check(log.count() == ALERT_LOG_SIZE && log.totalEvents() == ALERT_LOG_SIZE + 4, "log wraps");
+  uint8_t image[ALERT_LOG_BYTES];
+  size_t length = log.serialize(image, sizeof(image));
+  AlertLog restored;
+  check(length == ALERT_LOG_BYTES && restored.restore(image, length), "log image restores");
+  check(memcmp(&restored.at(0), &log.at(0), sizeof(AlertEvent)) == 0 &&
+        restored.totalEvents() == log.totalEvents() && !restored.isOpen(), "restored log matches");
+  image[0] ^= 1;
+  check(!restored.restore(image, length), "bad magic rejected");
+
+  // Scan cache: TTL and channel utilization from overlapping, audible neighbours
+  ScanResults scan;
+  check(!scan.fresh(1000), "empty cache is stale");
+  scan.taken_ms = 1000;
+  check(scan.fresh(1000 + SCAN_CACHE_TTL_MS - 1) && !scan.fresh(1000 + SCAN_CACHE_TTL_MS),
+        "cache expires after SCAN_CACHE_TTL_MS");
+  scan.count = 3;
+  scan.entries[0] = {"home", -55, 6, false};
+  scan.entries[1] = {"near", -55, 8, true};
+  scan.entries[2] = {"far", -40, 1, false};
+  check(scan.channelUtilization(6) == CHANNEL_BASE_UTIL, "no load before summarize()");
+  scan.summarize();
+  check(scan.channel_load[6] == 1.0f && scan.channel_load[8] == 1.0f && scan.channel_load[1] == 1.0f &&
+        scan.channel_load[7] == 0.0f, "per-channel load");
+  check(fabsf(scan.channelUtilization(6) - (CHANNEL_BASE_UTIL + CHANNEL_UTIL_PER_AP * 1.6f)) < 1e-4f,
+        "co-channel and overlapping APs count, distant channels do not");
+
+  // History tiers: rollups close on bucket change, rings wrap and stay time-ordered
+  RollupAccumulator minute(60);
+  RollupRecord rollup;
+  check(!minute.add(120, -60.0f, -90.0f, 20.0f, 0.8f, rollup), "first sample opens a bucket");
+  check(!minute.add(150, -70.0f, -90.0f, 40.0f, 0.6f, rollup), "same bucket");
+  check(minute.add(185, -50.0f, -90.0f, 10.0f, 1.0f, rollup), "new bucket closes the old one");
+  check(rollup.t == 120 && rollup.samples == 2 && rollup.rssi_mean == -650 && rollup.rssi_min == -70 &&
+        rollup.rssi_max == -60 && rollup.snr_min == 20 && rollup.util_mean == 60 &&
+        rollup.stability_mean == 175, "rollup min/mean/max");
+  RingHeader ring;
+  check(!ringLoad(ringFS, TIER_HOUR, ring) && ringInit(ringFS, TIER_HOUR, ring), "empty ring created");
+  for (uint32_t i = 0; i < HISTORY_TIERS[TIER_HOUR].capacity + 5; i++) {
+    rollup.t = 3600 * (i + 1);
+    ringAppend(ringFS, ring, &rollup);
+  }
+  RingHeader loaded;
+  check(ringLoad(ringFS, TIER_HOUR, loaded) && loaded.total == ring.total, "ring index persisted");
+  check(ringFS.files["/history_1h/index"].size() == sizeof(RingHeader) &&
+        ringFS.files["/history_1h/0"].size() == ringSegmentRecords(ring) * sizeof(RollupRecord),
+        "index holds the header, segments only records");
+  RingReader<MemFS> reader(ringFS, loaded);
+  check(reader.count() == HISTORY_TIERS[TIER_HOUR].capacity && reader.time(0) == 3600 * 6,
+        "ring wraps, oldest first");
+  check(reader.lowerBound(3600 * 100 + 1) == 95, "lower bound over a wrapped ring");
+  ringFS.files.erase("/history_1h/0");  // holds the 5 records past the wrap
+  check(!ringLoad(ringFS, TIER_HOUR, loaded), "lost segment of the newest record");
+  uint32_t oldest[TIER_COUNT] = {86400 * 10 - 3600, 86400 * 2, 86400};
+  check(selectTier(1800, 86400 * 10 - 1800, oldest) == TIER_RAW, "short range reads raw samples");
+  check(selectTier(86400, 86400 * 9, oldest) == TIER_MINUTE, "raw ring too short, minute tier reaches back");
+  check(selectTier(86400 * 60, 86400 * 9, oldest) == TIER_HOUR, "long range reads hourly rollups");
+  uint32_t fresh[TIER_COUNT] = {86400 * 10 - 600, 0, 0};
+  check(selectTier(86400 * 5, 86400 * 5, fresh) == TIER_RAW, "empty rollup tiers fall back to raw");
+
+  // Packed history: a block fills up, then decodes to the same samples
+  static RawRecord packedSamples[200], decoded[200];
+  for (uint32_t i = 0; i < 200; i++) {
+    packedSamples[i] = makeRawRecord(1000 + 10 * i, -60.0f - (i % 7), -92.0f, 20.0f, 0.8f, i == 50 ? 0 : 10);
+  }
+  KpiBlockEncoder encoder;
+  uint32_t packed = 0;
+  while (packed < 200 && encoder.add(packedSamples[packed])) packed++;
+  check(packed > 20 && packed < 200, "block holds tens of samples");
+  uint16_t n = kpiBlockDecode(encoder.finish(), decoded, 200);
+  check(n == packed && memcmp(decoded, packedSamples, n * sizeof(RawRecord)) == 0, "block decodes losslessly");
+  check(zigzag(-1) == 1 && unzigzag(zigzag(-12345)) == -12345, "zigzag round trip");
+
+  // Model slots: header + CRC over the model.h flatbuffer, newest valid generation wins
+  check(modelCrc32((const uint8_t*)"123456789", 9) == 0xCBF43926u, "CRC-32 check value");
+  static uint8_t slotImage[MODEL_SLOT_BYTES];
+  memset(slotImage, 0xFF, sizeof(slotImage));
+  check(checkModelBlob(slotImage, sizeof(slotImage)) == MODEL_BLOB_EMPTY, "erased slot is empty");
+  ModelBlobHeader blob = {MODEL_BLOB_MAGIC, MODEL_BLOB_VERSION, sizeof(ModelBlobHeader),
+                          wifi_model_tflite_len, modelCrc32(wifi_model_tflite, wifi_model_tflite_len), 7, {}};
+  memcpy(slotImage, &blob, sizeof(blob));
+  memcpy(slotImage + sizeof(blob), wifi_model_tflite, wifi_model_tflite_len);
+  check(checkModelBlob(slotImage, sizeof(slotImage)) == MODEL_BLOB_OK, "model.h blob validates");
+  slotImage[sizeof(blob) + 100] ^= 1;
+  check(checkModelBlob(slotImage, sizeof(slotImage)) == MODEL_BLOB_BAD_CRC, "flipped bit fails the CRC");
+  ModelBlobHeader slots[MODEL_SLOT_COUNT] = {blob, blob};
+  slots[1].generation = 8;
+  bool validSlots[MODEL_SLOT_COUNT] = {true, true};
+  int order[MODEL_SLOT_COUNT];
+  check(orderModelSlots(slots, validSlots, order) == 2 && order[0] == 1 && order[1] == 0,
+        "newest generation first, the other valid slot next");
+  validSlots[1] = false;
+  check(orderModelSlots(slots, validSlots, order) == 1 && order[0] == 0, "invalid slot skipped");
+
+  float lut = wifi_model_lut_predict(-60.0f, -92.0f, 25.0f);
+  check(lut >= 0.0f && lut <= 1.0f, "LUT prediction in [0, 1]");
+
+  printf("%s (%d failures)\n", failures ? "FAILED" : "OK", failures);
+  return failures ? 1 : 0;
+}
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the adaptive sampling scheduler mirror and trace replay
+"""
+
+import json
+import pathlib
+import tempfile
+
+from adaptive_sampling import (SAMPLE_INTERVAL_MAX_MS, SAMPLE_INTERVAL_MIN_MS, SAMPLES_AFTER_STEP,
+                               AdaptiveScheduler, FixedScheduler, compare, ground_truth_trace,
+                               load_trace, percentile, replay)
+from history_store import generate_history, save_history
+
+
+def prediction(alert_type='excellent', trend=0.0, rssi_var=1.0, noise_var=1.0):
+    return {'alert_type': alert_type, 'trend_score': trend,
+            'rssi_variance': rssi_var, 'noise_variance': noise_var}
+
+
+def test_scheduler_bounds():
+    scheduler = AdaptiveScheduler()
+    intervals = [scheduler.next(prediction()) for _ in range(10)]
+    assert intervals[-1] == SAMPLE_INTERVAL_MAX_MS
+    assert intervals == sorted(intervals)
+
+    assert scheduler.next(prediction('degrading', trend=-1.0)) == SAMPLE_INTERVAL_MIN_MS
+    assert scheduler.next(prediction(rssi_var=20.0)) == SAMPLE_INTERVAL_MIN_MS
+    assert scheduler.next(prediction('poor')) == 10000
+
+
+def test_step_rearms_fast_sampling():
+    scheduler = AdaptiveScheduler()
+    assert not scheduler.step_detected(-50.0, -92.0)       # no sample yet
+    for _ in range(10):
+        scheduler.next(prediction(), -50.0, -92.0)
+    assert scheduler.interval_ms == SAMPLE_INTERVAL_MAX_MS
+    assert not scheduler.step_detected(-53.0, -85.0)       # within the KPI jitter
+    assert scheduler.step_detected(-57.0, -92.0)           # RSSI step
+    assert [scheduler.next(prediction(), -57.0, -92.0)
+            for _ in range(SAMPLES_AFTER_STEP + 1)][-2:] == [SAMPLE_INTERVAL_MIN_MS, 10000]
+    assert scheduler.step_detected(-57.0, -80.0)           # noise step
+
+
+def test_steps_follow_the_noise_floor():
+    # A quiet hour; the floor moves by 12 dB every 5 minutes (a /scan refresh saw new APs)
+    samples = [{'t': t, 'rssi': -50.0, 'noise': -95.0, 'noise_floor': -95.0 + 12 * (t // 300 % 2),
+                'snr': 45.0, 'channel_util': 10.0} for t in range(3600)]
+    stepped = replay(samples, [], AdaptiveScheduler())['samples']
+    for s in samples:
+        del s['noise_floor']                       # recorded traces: the estimate itself
+    quiet = replay(samples, [], AdaptiveScheduler())['samples']
+    assert quiet < 3600 / 30 and stepped >= quiet + 11 * SAMPLES_AFTER_STEP  # 11 floor steps
+
+
+def test_adaptive_detects_no_later_than_fixed():
+    fixed, adaptive, count = [], [], 0
+    for seed in range(3):
+        samples, episodes = ground_truth_trace(hours=6, seed=seed)
+        fixed += replay(samples, episodes, FixedScheduler())['latencies']
+        adaptive += replay(samples, episodes, AdaptiveScheduler())['latencies']
+        count += len(episodes)
+    assert len(adaptive) == len(fixed) == count
+    assert percentile(adaptive, 95) <= percentile(fixed, 95)
+    assert sum(adaptive) <= sum(fixed)
+
+
+def test_replay_tradeoff():
+    samples, episodes = ground_truth_trace(hours=3, seed=1)
+    report = compare(samples, episodes)
+    fixed, adaptive = report['fixed'], report['adaptive']
+    assert abs(fixed['samples'] - 3 * 360) <= 1
+    assert adaptive['samples'] < fixed['samples']
+    assert abs(fixed['scans'] - 3 * 120) <= 1         # one scan per 30 s cache lifetime
+    assert adaptive['scans'] < adaptive['samples']
+    assert adaptive['episode_samples'] >= fixed['episode_samples']
+    assert adaptive['missed'] == 0 and fixed['missed'] == 0
+
+
+def test_load_recorded_history(tmp_path):
+    records = generate_history(days=0.05, end=1755000000)
+    path = str(tmp_path / 'history.json')
+    save_history(records, path)
+    samples, episodes = load_trace(path)
+    assert samples[0]['t'] == 0 and len(samples) == len(records)
+    result = replay(samples, episodes, FixedScheduler())
+    assert result['samples'] == samples[-1]['t'] // 10 + 1
+    json.dumps(compare(samples, episodes))
+
+
+if __name__ == "__main__":
+    test_scheduler_bounds()
+    test_step_rearms_fast_sampling()
+    test_steps_follow_the_noise_floor()
+    test_adaptive_detects_no_later_than_fixed()
+    test_replay_tradeoff()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_load_recorded_history(pathlib.Path(tmp))
+    print("✅ Adaptive sampling tests passed")
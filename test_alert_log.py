@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the alert episode log (alert_log.py, include/alert_log.h) and the
+generated alert table
+"""
+
+import os
+import random
+from urllib.request import urlopen
+
+from advanced_ai_features import ALERT_INDEX, ALERTS, generate_esp32_advanced_ai_code
+from alert_log import ALERT_CLEAR_S, ALERT_LOG_SIZE, AlertLog, decode, replay_history
+from history_store import generate_history
+from host_simulator import Simulator
+from test_compile import host_unit
+
+HEADER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'include')
+
+
+def random_alerts(count=2000, seed=0):
+    """(t, alert) pairs with runs of each type and short status blips"""
+    rng = random.Random(seed)
+    t, samples = 1_700_000_000, []
+    while len(samples) < count:
+        alert = rng.randrange(len(ALERTS))
+        for _ in range(rng.choice((1, 2, 5, 20))):
+            samples.append((t, alert))
+            t += rng.choice((2, 10, 60))
+    return samples[:count]
+
+
+def test_episodes_and_debounce():
+    log = AlertLog()
+    good, degrading, weak = ALERT_INDEX['good'], ALERT_INDEX['degrading'], ALERT_INDEX['weak_signal']
+    assert not log.update(0, good)
+    assert log.update(10, degrading)
+    assert not log.update(20, degrading)
+    assert not log.update(30, good)                      # blip: the episode stays open
+    assert log.update(40, weak)                          # type change
+    assert not log.update(50, good)
+    assert log.update(50 + ALERT_CLEAR_S, good)          # status held long enough
+
+    timeline = decode(log.serialize())
+    assert timeline['total'] == 1 and timeline['dropped'] == 0
+    event = timeline['events'][0]
+    assert (event['start'], event['end'], event['duration']) == (10, 50, 40)
+    assert (event['first_alert'], event['peak_alert'], event['last_alert']) == \
+        ('degrading', 'weak_signal', 'weak_signal')
+    assert event['peak_severity'] == 2 and event['transitions'] == 1
+
+
+def test_wraps_and_keeps_open_episode():
+    log = AlertLog()
+    t = 0
+    for _ in range(ALERT_LOG_SIZE + 5):
+        log.update(t, ALERT_INDEX['congestion'])
+        log.update(t + 1, ALERT_INDEX['good'])
+        log.update(t + 1 + ALERT_CLEAR_S, ALERT_INDEX['good'])
+        t += 2 * ALERT_CLEAR_S
+    log.update(t, ALERT_INDEX['unstable'])
+
+    timeline = decode(log.serialize())
+    assert len(timeline['events']) == ALERT_LOG_SIZE
+    assert timeline['total'] == ALERT_LOG_SIZE + 6 and timeline['dropped'] == 6
+    assert timeline['events'][-1]['end'] == 0 and timeline['events'][-1]['duration'] is None
+
+
+def test_replay_matches_streaming():
+    records = generate_history(0.5, seed=3)
+    log = replay_history(records)
+    timeline = decode(log.serialize())
+    assert timeline['total'] > 0
+    assert all(e['start'] < e['end'] for e in timeline['events'] if e['end'])
+
+
+def test_generated_header_is_current():
+    with open(os.path.join(HEADER_DIR, 'advanced_ai.h')) as f:
+        assert f.read() == generate_esp32_advanced_ai_code()
+
+
+def test_simulator_serves_log():
+    with Simulator(fixed_interval=60) as sim:
+        timeline = decode(urlopen(sim.url + '/alerts').read())
+    assert timeline['capacity'] == ALERT_LOG_SIZE
+    assert len(timeline['events']) <= timeline['total']
+
+
+def test_c_log_matches_python():
+    samples = random_alerts()
+    log = AlertLog()
+    for t, alert in samples:
+        log.update(t, alert)
+    lines = ''.join(f'{t} {alert} {ALERTS[alert][1]}\n' for t, alert in samples)
+    assert bytes.fromhex(host_unit('alerts', stdin=lines)) == log.serialize()
+
+
+if __name__ == "__main__":
+    test_episodes_and_debounce()
+    test_wraps_and_keeps_open_episode()
+    test_replay_matches_streaming()
+    test_generated_header_is_current()
+    test_simulator_serves_log()
+    test_c_log_matches_python()
+    print("✅ Alert log tests passed")
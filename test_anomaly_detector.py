@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the half-space tree anomaly detector (anomaly_detector.py)
+"""
+
+import functools
+import os
+import tempfile
+
+import numpy as np
+
+from anomaly_detector import (StreamingDetector, create_detector_header, evaluate, load_model,
+                              save_model, score_stream, synthetic_stream, train)
+from test_compile import host_unit
+
+
+@functools.lru_cache(maxsize=1)
+def small_model():
+    columns, labels = synthetic_stream(hours=72, seed=1)
+    return train(columns, labels, trees=8, depth=8, seed=3)
+
+
+def test_detects_episodes_the_rule_misses():
+    model = small_model()
+    report = evaluate(model, *synthetic_stream(hours=24, seed=2))
+    detector, rule = report['detector'], report['threshold_rule']
+    assert detector['recall'] > 0.6 and detector['false_positive_rate'] < 0.05
+    assert detector['episodes_detected'] >= 0.9 * detector['episodes']
+    assert detector['f1'] > rule['f1']
+
+
+def test_streaming_matches_vectorized():
+    model = small_model()
+    columns, _ = synthetic_stream(hours=2, seed=4)
+    expected = score_stream(model, columns['rssi'], columns['snr'], columns['channel_util'])
+
+    detector = StreamingDetector(model)
+    scores = [detector.update(float(r), float(s), float(u))
+              for r, s, u in zip(columns['rssi'], columns['snr'], columns['channel_util'])]
+    assert np.array_equal(np.array(scores), expected)
+
+
+def test_model_round_trip():
+    model = small_model()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'anomaly_model.json')
+        save_model(model, path)
+        loaded = load_model(path)
+    columns, _ = synthetic_stream(hours=1, seed=5)
+    assert np.array_equal(score_stream(model, columns['rssi'], columns['snr'], columns['channel_util']),
+                          score_stream(loaded, columns['rssi'], columns['snr'], columns['channel_util']))
+    assert loaded['threshold'] == model['threshold']
+
+
+def test_c_header_matches_python():
+    # include/anomaly_detector.h, as exported from anomaly_model.json, in the host unit
+    model = load_model()
+    columns, _ = synthetic_stream(hours=1, seed=6)
+    rssi, snr, util = columns['rssi'][:200], columns['snr'][:200], columns['channel_util'][:200]
+    expected = score_stream(model, rssi, snr, util)
+    lines = ''.join(f'{r!r} {s!r} {u!r}\n' for r, s, u in zip(rssi.tolist(), snr.tolist(), util.tolist()))
+    output = host_unit('anomaly', stdin=lines)
+    assert np.array_equal(np.array([int(v) for v in output.split()]), expected)
+
+
+if __name__ == "__main__":
+    test_detects_episodes_the_rule_misses()
+    test_streaming_matches_vectorized()
+    test_model_round_trip()
+    test_c_header_matches_python()
+    print("✅ Anomaly detector tests passed")
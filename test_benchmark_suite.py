@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for benchmark_suite.py: shared fixtures and the baseline flow
+"""
+
+import contextlib
+import io
+import json
+import pathlib
+import tempfile
+
+import benchmark_suite
+from benchmark_suite import FIXTURES, FixtureContext, fixture
+
+# Pure Python, well under a second with --quick
+QUICK = ['-k', 'history_decode_1d', '--quick']
+
+
+def run_suite(*argv):
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        status = benchmark_suite.main([*QUICK, *argv])
+    return status, out.getvalue()
+
+
+def test_fixtures_are_built_once():
+    calls = []
+
+    @fixture
+    def counted(ctx):
+        calls.append(1)
+        return len(ctx['history_1d'])
+
+    try:
+        ctx = FixtureContext()
+        assert ctx['counted'] == ctx['counted'] == len(ctx['history_1d'])
+        assert len(calls) == 1
+        assert FixtureContext()['counted'] and len(calls) == 2   # one cache per run
+    finally:
+        del FIXTURES['counted']
+
+
+def test_baseline_flow(tmp_path):
+    results, baseline = tmp_path / 'results.json', tmp_path / 'baseline.json'
+    files = ['--json', str(results), '--baseline', str(baseline)]
+
+    # First run on a machine: no baseline yet, nothing to compare is not a pass
+    status, out = run_suite(*files)
+    assert status == 2 and 'No baseline' in out and not baseline.exists()
+    assert json.loads(results.read_text())['benchmarks'][0]['name'] == 'history_decode_1d'
+
+    status, out = run_suite(*files, '--save-baseline')
+    assert status == 0 and 'Baseline saved' in out
+    saved = json.loads(baseline.read_text())
+    assert [b['name'] for b in saved['benchmarks']] == ['history_decode_1d']
+
+    # Later runs compare against it
+    status, out = run_suite(*files, '--threshold', '10')
+    assert status == 0 and 'Comparison against baseline' in out
+    assert json.loads(baseline.read_text()) == saved
+
+    # A baseline 1000x faster than this machine is a regression
+    saved['benchmarks'][0]['stats']['median'] /= 1000
+    baseline.write_text(json.dumps(saved))
+    status, out = run_suite(*files)
+    assert status == 1 and 'history_decode_1d' in out
+
+    # --save-baseline replaces it
+    status, _ = run_suite(*files, '--save-baseline')
+    assert status == 0
+    assert json.loads(baseline.read_text())['benchmarks'][0]['stats']['median'] > \
+        saved['benchmarks'][0]['stats']['median']
+
+
+if __name__ == "__main__":
+    test_fixtures_are_built_once()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_baseline_flow(pathlib.Path(tmp))
+    print("✅ Benchmark suite tests passed")
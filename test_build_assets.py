@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the web asset build and the cold/warm page-load measurement
+"""
+
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+from build_assets import build, minify_css, minify_js
+from host_simulator import Simulator
+from load_test import measure_page_load
+
+
+def test_minifiers_keep_strings():
+    assert minify_css('a {\n  content: "a  b";  /* note */\n}\n') == 'a{content:"a  b"}'
+    js = "// comment\nconst s = 'x // y';\n\n    foo();\n"
+    assert minify_js(js) == "const s = 'x // y';\nfoo();\n"
+
+
+def test_build_manifest_and_references():
+    output = tempfile.mkdtemp()
+    manifest = build('data', output, verbose=False)
+    with open(os.path.join(output, 'assets.json')) as f:
+        assert json.load(f) == manifest
+
+    page = manifest['/dashboard.html']
+    assert page['cache'] == 'no-cache' and page['file'].endswith('.gz')
+    with gzip.open(os.path.join(output, page['file'].lstrip('/'))) as f:
+        html = f.read().decode()
+    scripts = [url for url, asset in manifest.items() if url.endswith('.js')]
+    assert any(url.lstrip('/') in html for url in scripts)
+    # dashboard.js starts the worker from its <script> tag, so it must carry the hashed name too
+    assert any(url.startswith('/history_worker.') and url.lstrip('/') in html for url in scripts)
+    for url in scripts:
+        assert 'immutable' in manifest[url]['cache']
+        assert manifest[url]['etag'].strip('"') in url
+
+    if shutil.which('node'):
+        dashboard = next(url for url in scripts if url.startswith('/dashboard.'))
+        path = os.path.join(output, 'check.js')
+        with gzip.open(os.path.join(output, manifest[dashboard]['file'].lstrip('/'))) as src, \
+                open(path, 'wb') as dst:
+            dst.write(src.read())
+        subprocess.run(['node', '--check', path], check=True)
+
+
+def test_warm_load_uses_cache():
+    output = tempfile.mkdtemp()
+    build('data', output, verbose=False)
+    with Simulator(asset_dir=output, fixed_interval=60) as sim:
+        built = measure_page_load(sim.url)
+    with Simulator(fixed_interval=60) as sim:
+        plain = measure_page_load(sim.url)
+
+    assert built['cold']['bytes'] < plain['cold']['bytes'] / 2
+    assert built['warm']['requests'] == 1 and built['warm']['not_modified'] == 1
+    assert plain['warm']['bytes'] == plain['cold']['bytes']
+
+
+if __name__ == "__main__":
+    test_minifiers_keep_strings()
+    test_build_manifest_and_references()
+    test_warm_load_uses_cache()
+    print("✅ Asset build tests passed")
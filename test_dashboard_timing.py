@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard's history worker (data/history_worker.js) and the
+headless timing harness (dashboard_timing.py)
+"""
+
+import json
+import shutil
+import subprocess
+from urllib.request import urlopen
+
+import pytest
+
+from dashboard_timing import WORKER_SCRIPT, time_in_browser, time_in_node
+from host_simulator import Simulator
+
+# field, scale, default: as HISTORY_SERIES in history_worker.js
+SERIES = [('rssi', 1, 0), ('noise', 1, -95), ('snr', 1, 0), ('channel_util', 1, 0), ('stability', 100, 0)]
+
+
+def run_worker_script(script):
+    """JSON printed by `script`, run in Node with the worker's path as process.argv[1]"""
+    if shutil.which('node') is None:
+        pytest.skip("node not found")
+    return json.loads(subprocess.run(['node', '-e', script, WORKER_SCRIPT], capture_output=True, text=True,
+                                     check=True).stdout)
+
+
+def test_push_and_decimate():
+    script = '''
+const { HistoryColumns, decimateHistory } = require(process.argv[1]);
+const columns = new HistoryColumns(4);
+for (let i = 0; i < 100; i++) {
+  columns.push({ t: 1000 + i, rssi: i === 37 ? -90 : i === 71 ? -30 : -60, snr: 30, channel_util: 10,
+                 stability: 0.5 });
+}
+const pushed = Array.from(columns.values, column => column[0]);
+const view = decimateHistory(columns, 10);
+const tail = decimateHistory(columns, 10, 95);
+console.log(JSON.stringify({
+  pushed, t0: columns.t[0],
+  points: view.map(s => s.x.length), rssi: Array.from(view[0].y), rssiX: Array.from(view[0].x),
+  tailX: Array.from(tail[0].x)
+}));
+'''
+    output = run_worker_script(script)
+    # ms timestamps, the missing noise defaults to -95 and stability is charted in %
+    assert output['t0'] == 1_000_000 and output['pushed'] == [-60, -95, 30, 10, 50]
+    # 5 buckets of 20 samples: at most a min and a max each, in time order
+    assert max(output['points']) <= 10
+    assert -90 in output['rssi'] and -30 in output['rssi']
+    assert 1_037_000 in output['rssiX'] and 1_071_000 in output['rssiX']
+    assert output['rssiX'] == sorted(output['rssiX'])
+    # few enough samples from `start` on are returned as they are
+    assert output['tailX'] == [1000 * (1000 + i) for i in range(95, 100)]
+
+
+def test_decimated_view_keeps_extrema():
+    if shutil.which('node') is None:
+        pytest.skip("node not found")
+    with Simulator(history_days=5, fixed_interval=60) as sim:
+        results = time_in_node(sim.url, ranges=(1, 5), max_points=400)
+        for result in results:
+            records = json.loads(urlopen(f"{sim.url}/history?range={result['range']}").read())
+            assert result['count'] == len(records) > 400
+            assert result['points'] <= 400
+            for (field, scale, missing), (low, high) in zip(SERIES, result['extrema']):
+                values = [(r[field] or missing) * scale for r in records]
+                assert abs(low - min(values)) < 1e-3 and abs(high - max(values)) < 1e-3, field
+
+
+def test_refresh_and_append_only_add_new_samples():
+    script = '''
+const { HistoryColumns, parseHistory, decimateHistory } = require(process.argv[1]);
+const records = Array.from({ length: 50 }, (_, i) => ({ t: 1000 + i * 10, rssi: -60 - (i % 7), noise: -92,
+                                                        snr: 32, channel_util: 20, stability: 0.9 }));
+const first = parseHistory(JSON.stringify(records.slice(0, 40)));
+const refresh = parseHistory(JSON.stringify(records.slice(20, 45)), first.columns);
+const tail = decimateHistory(refresh.columns, 100, refresh.start)[0].x.length;
+const appended = [records[45], records[44], records[46]].map(r => refresh.columns.push(r));
+const small = new HistoryColumns(2);
+records.forEach(r => small.push(r));
+const view = decimateHistory(small, 10);
+console.log(JSON.stringify({
+  start: refresh.start, length: refresh.columns.length, appended, smallLength: small.length,
+  viewPoints: view.map(s => s.x.length), viewSorted: view.every(s => s.x.every((x, i) => !i || x > s.x[i - 1])), tail
+}));
+'''
+    output = run_worker_script(script)
+    assert output['start'] == 40 and output['tail'] == 5        # only records 40..44 were new
+    assert output['appended'] == [True, False, True] and output['length'] == 47
+    assert output['smallLength'] == 50                          # grown from 2
+    assert max(output['viewPoints']) <= 10 and output['viewSorted']
+
+
+def test_browser_timings():
+    pytest.importorskip("playwright")
+    with Simulator(history_days=5, fixed_interval=60) as sim:
+        results = time_in_browser(sim.url, ranges=(1, 5), width=800)
+    for result in results:
+        assert result['worker'] and result['count'] > 0
+        assert result['points'] <= 800 and result['render_ms'] > 0
+
+
+if __name__ == "__main__":
+    test_push_and_decimate()
+    test_decimated_view_keeps_extrema()
+    test_refresh_and_append_only_add_new_samples()
+    test_browser_timings()
+    print("✅ Dashboard timing tests passed")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the windowed stability forecaster (forecast_model.py)
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from forecast_model import WindowDataset, build_dataset, export_forecast, synthetic_device, train_forecast
+
+
+def small_devices():
+    return {'a': synthetic_device(days=2, seed=1), 'b': synthetic_device(days=1, seed=2)}
+
+
+def test_windows_are_views():
+    devices = small_devices()
+    dataset = WindowDataset(devices, window=60, horizon_min=5)
+    for features, view in zip(dataset.features, dataset.views):
+        assert np.shares_memory(features, view)
+        assert view.shape == (len(features) - 59, 4, 60)
+    assert dataset.view_bytes() < dataset.materialized_bytes() / 10
+
+
+def test_window_contents_and_targets():
+    devices = small_devices()
+    dataset = WindowDataset(devices, window=60, horizon_min=5)
+    rows = np.array([0, 1000, len(dataset) - 1])
+    x, y = dataset.batch(rows)
+    assert x.shape == (3, 60, 4)
+
+    for (d, i, label), window, target in zip(dataset.index[rows], x, y):
+        columns = devices[dataset.names[d]]
+        end = i + 59
+        assert np.isclose(window[-1, 0], (columns['rssi'][end] + 90) / 30.0)
+        assert np.isclose(window[0, 3], columns['channel_util'][i] / 100.0)
+        # 10 s samples: 5 minutes ahead is 30 samples past the window end
+        assert label == (columns['stability'][end + 30] > 0.5) == target
+
+    # No window's target falls past the end of its own device
+    last = dataset.index[dataset.index[:, 0] == 1, 1].max()
+    assert last + 59 + 30 < len(devices[dataset.names[1]]['t'])
+
+
+def test_split_is_time_ordered():
+    dataset = WindowDataset(small_devices(), window=60, horizon_min=5)
+    train, test = dataset.split()
+    for d in range(2):
+        train_windows = dataset.index[train][dataset.index[train, 0] == d, 1]
+        test_windows = dataset.index[test][dataset.index[test, 0] == d, 1]
+        assert train_windows.max() + 60 < test_windows.min()
+
+
+def test_build_report():
+    _, report = build_dataset(small_devices(), window=60, horizon_min=5)
+    assert report['devices'] == 2 and report['windows'] > 0
+    assert report['materialized_bytes'] == report['windows'] * 60 * 4 * 4
+    assert report['peak_rss_mb'] > 0
+
+
+def test_export_fits_arena():
+    dataset = WindowDataset(small_devices(), window=60, horizon_min=5)
+    train, _ = dataset.split()
+    model = train_forecast(dataset, train, epochs=1, max_windows=2000, verbose=0)
+    with tempfile.TemporaryDirectory() as tmp:
+        header = os.path.join(tmp, 'forecast_model.h')
+        memory = export_forecast(model, dataset, os.path.join(tmp, 'forecast.tflite'), header)
+        with open(header) as f:
+            source = f.read()
+    assert memory['fits'] and memory['arena_size'] >= memory['arena_required']
+    assert '#define FORECAST_WINDOW 60' in source
+    assert f"#define FORECAST_ARENA_SIZE {memory['arena_size']}" in source
+
+
+if __name__ == "__main__":
+    test_windows_are_views()
+    test_window_contents_and_targets()
+    test_split_is_time_ordered()
+    test_build_report()
+    test_export_fits_arena()
+    print("✅ Forecast model tests passed")
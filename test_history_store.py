@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the host-side history mirror and the Python port of the advanced AI
+"""
+
+from advanced_ai_features import AdvancedWiFiAI
+from history_store import (clean_old_records, decode_history, encode_history,
+                           filter_history, generate_history, make_record)
+
+NOW = 1755000000
+
+
+def test_generated_history_spacing():
+    records = generate_history(days=0.5, end=NOW)
+    assert len(records) == 0.5 * 86400 // 10
+    assert all(b['t'] - a['t'] == 10 for a, b in zip(records, records[1:]))
+    assert all(0.0 <= r['stability'] <= 1.0 for r in records)
+
+
+def test_encode_decode_roundtrip():
+    records = generate_history(days=0.1, end=NOW)
+    text = encode_history(records)
+    assert ' ' not in text.replace('"HomeNetwork"', '')
+    assert decode_history(text) == records
+    assert decode_history('') == []
+
+
+def test_filter_and_clean_thresholds():
+    records = [make_record(NOW - age, -60, -90, 30, 20, 0.9) for age in
+               (6 * 86400, 2 * 86400, 3600, 0)]
+    assert len(filter_history(records, 1, now=NOW)) == 2
+    assert len(filter_history(records, 3, now=NOW)) == 3
+    assert len(clean_old_records(records, now=NOW)) == 3
+
+
+def test_advanced_ai_alerts():
+    ai = AdvancedWiFiAI()
+    for step in range(8):  # improving strong signal
+        rssi = -48 + step * 0.2
+        result = ai.predict_advanced_stability(rssi, -95, rssi + 95, 10)
+    assert result['alert_type'] == 'excellent'
+    assert result['stability'] > 0.8
+
+    ai = AdvancedWiFiAI()
+    result = ai.predict_advanced_stability(-89, -70, -19, 20)
+    assert result['alert_type'] == 'weak_signal'
+
+
+if __name__ == "__main__":
+    test_generated_history_spacing()
+    test_encode_decode_roundtrip()
+    test_filter_and_clean_thresholds()
+    test_advanced_ai_alerts()
+    print("✅ History store tests passed")
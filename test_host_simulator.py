@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for the host simulator endpoints, the /events stream and the load tester
+"""
+
+import json
+import socket
+import time
+from urllib.request import Request, urlopen
+
+from host_simulator import SimulatedDevice, Simulator, SnapshotBuffer, SpscQueue
+from load_test import compare_layouts, run_load
+
+
+def read_events(url, count):
+    """Open /events and return the first `count` data payloads"""
+    host, port = url.replace('http://', '').split(':')
+    sock = socket.create_connection((host, int(port)), timeout=5)
+    sock.sendall(b"GET /events HTTP/1.1\r\nHost: x\r\n\r\n")
+    buffer = b''
+    while buffer.count(b'data: ') < count or not buffer.endswith(b'\n\n'):
+        buffer += sock.recv(4096)
+    sock.close()
+    head, body = buffer.split(b'\r\n\r\n', 1)
+    assert b'text/event-stream' in head
+    return [json.loads(line[6:]) for line in body.split(b'\n') if line.startswith(b'data: ')]
+
+
+def test_status_and_events():
+    with Simulator(fixed_interval=60) as sim:
+        status = json.load(urlopen(sim.url + '/status'))
+        ai = json.load(urlopen(sim.url + '/advanced-ai'))
+        assert {'rssi', 'noise', 'snr', 'channel_util', 'stability', 'sample_interval'} <= set(status)
+        assert ai['alert_type'] and 0.0 <= ai['confidence'] <= 1.0
+
+        event = read_events(sim.url, 1)[0]
+        assert event['rssi'] == status['rssi']
+        assert event['alert_type'] == ai['alert_type']
+        assert json.load(urlopen(sim.url + '/history?range=0'))[-1]['t'] == event['t']
+
+
+def test_subscriber_limit_and_load():
+    with Simulator(fixed_interval=10, time_scale=50, max_event_clients=2) as sim:
+        sse = run_load(sim.url, 'sse', viewers=3, duration=30, time_scale=50, stagger=False)
+        poll = run_load(sim.url, 'poll', viewers=3, duration=30, time_scale=50, stagger=False)
+
+    assert sse['fallbacks'] == 1
+    assert sse['server']['peak_event_clients'] == 2
+    assert sse['messages_per_viewer'] > 0
+    assert poll['requests'] > sse['requests']
+
+
+def test_exchange_mirrors():
+    queue = SpscQueue(4)
+    assert all(queue.push(i) for i in range(4))
+    assert not queue.push(4) and len(queue) == 4
+    assert [queue.pop() for _ in range(5)] == [0, 1, 2, 3, None]
+
+    snapshot = SnapshotBuffer()
+    for value in range(3):
+        snapshot.publish({'t': value})
+        assert snapshot.read() == {'t': value} and snapshot.version() == value + 1
+
+
+def test_collect_is_queued_for_kpi_thread():
+    device = SimulatedDevice(fixed_interval=60)
+    device.collect()
+    assert device.stats()['samples'] == 1 and len(device.commands) == 1
+
+    with Simulator(fixed_interval=60) as sim:
+        before = sim.device.stats()['samples']
+        assert urlopen(sim.url + '/collect').read() == b'KPI collection queued'
+        for _ in range(100):
+            if sim.device.stats()['samples'] > before:
+                break
+            time.sleep(0.02)
+        assert sim.device.stats()['samples'] == before + 1
+
+
+def wait_for_connect(url):
+    for _ in range(100):
+        status = json.load(urlopen(url + '/connect'))
+        if status['state'] != 'connecting':
+            return status
+        time.sleep(0.02)
+    return status
+
+
+def test_connect_is_queued_for_kpi_thread():
+    device = SimulatedDevice(fixed_interval=60)
+    device.connect('Office', 'secret123')
+    assert device.connect_state == 'connecting' and device.ssid == 'HomeNetwork'
+    assert len(device.commands) == 1
+
+    with Simulator(fixed_interval=60) as sim:
+        response = urlopen(Request(sim.url + '/connect', data=b'ssid=Office&password=secret123'))
+        assert response.status == 202 and response.headers['Retry-After']
+        assert wait_for_connect(sim.url) == {'state': 'connected', 'ssid': 'Office'}
+        assert json.load(urlopen(sim.url + '/status'))['ssid'] == 'Office'
+        assert json.load(urlopen(sim.url + '/history?range=0'))[-1]['ssid'] == 'Office'
+
+        urlopen(Request(sim.url + '/connect', data=b'ssid=Cafe&password=short'))
+        assert wait_for_connect(sim.url) == {'state': 'failed', 'ssid': 'Office'}
+
+
+def test_dual_core_keeps_status_responsive():
+    results = compare_layouts(duration=3, interval=1, scan_ms=300, commit_ms=100, clients=1)
+    single, dual = results['single'], results['dual']
+    assert single['samples'] >= 2 and dual['samples'] >= 2
+    assert single['max_ms'] > 200 and single['stalled'] > 0
+    assert dual['max_ms'] < single['max_ms'] and dual['stalled'] < single['stalled']
+
+
+if __name__ == "__main__":
+    test_status_and_events()
+    test_subscriber_limit_and_load()
+    test_exchange_mirrors()
+    test_collect_is_queued_for_kpi_thread()
+    test_connect_is_queued_for_kpi_thread()
+    test_dual_core_keeps_status_responsive()
+    print("✅ Host simulator tests passed")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the packed history codec (kpi_codec.py, include/kpi_codec.h) and
+/history?format=packed on the host simulator
+"""
+
+import os
+import random
+import tempfile
+from urllib.request import urlopen
+
+from history_store import generate_history
+from host_simulator import Simulator
+from kpi_codec import (KPI_BLOCK_BYTES, RAW_DTYPE, benchmark, decode_blocks, decode_blocks_np,
+                       encode_blocks)
+from test_compile import host_unit
+from tiered_history import raw_record
+
+
+def irregular_records(count=3000, seed=3):
+    """Raw ring tuples with jitter, dt exceptions, clock steps and large jumps"""
+    rng = random.Random(seed)
+    t, rssi, noise, records = 1_700_000_000, -600, -920, []
+    for i in range(count):
+        step = rng.choice((10, 10, 10, 10, 2, 60, 11, 9))
+        if i % 500 == 250:
+            step = -3600                       # NTP moved the clock back
+        t += step
+        rssi = max(-1200, min(-100, rssi + rng.randint(-40, 40) + (500 if i % 700 == 3 else 0)))
+        noise = max(-1000, min(-800, noise + rng.randint(-5, 5)))
+        dt = step if step > 0 and i % 97 else rng.randint(0, 70000 // 2)
+        records.append((t, rssi, noise, rng.randint(0, 200), rng.randint(0, 250), dt))
+    return records
+
+
+def test_round_trip():
+    for records in (irregular_records(), [raw_record(r['t'], r['rssi'], r['noise'], r['channel_util'],
+                                                    r['stability'], r['dt'])
+                                         for r in generate_history(0.5)]):
+        packed = encode_blocks(records)
+        assert len(packed) % KPI_BLOCK_BYTES == 0
+        assert decode_blocks(packed) == records
+        assert decode_blocks_np(packed).tolist() == records
+
+    assert encode_blocks([]) == b'' and len(decode_blocks_np(b'')) == 0
+    single = [(5, -700, -900, 10, 200, 0)]
+    assert decode_blocks_np(encode_blocks(single)).tolist() == single
+
+
+def test_rejects_bad_blocks():
+    packed = bytearray(encode_blocks(irregular_records(200)))
+    for damaged in (bytes(packed[:-1]), bytes([packed[0] ^ 1]) + bytes(packed[1:])):
+        for decode in (decode_blocks, decode_blocks_np):
+            try:
+                decode(damaged)
+                assert False, "damaged block accepted"
+            except ValueError:
+                pass
+
+
+def test_compression():
+    r = benchmark(days=1, repeat=1)
+    assert r['packed_bytes'] / r['samples'] < 8
+    assert r['json_bytes'] / r['packed_bytes'] > 15
+    assert r['raw_bytes'] / r['packed_bytes'] > 1.5
+
+
+def test_simulator_packed_history():
+    with Simulator(history_days=1, fixed_interval=60) as sim:
+        response = urlopen(sim.url + '/history?range=1&format=packed')
+        assert response.headers['Content-Type'] == 'application/octet-stream'
+        samples = decode_blocks_np(response.read())
+    assert samples.dtype == RAW_DTYPE and len(samples) > 8000
+    assert (samples['t'][1:] > samples['t'][:-1]).all()
+
+
+def test_c_codec_matches_python():
+    records = irregular_records(2000)
+    packed = encode_blocks(records)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, name) for name in ('c.bin', 'python.bin', 'samples.bin')]
+        with open(paths[1], 'wb') as f:
+            f.write(packed)
+        host_unit('codec', *paths, stdin=''.join('%d %d %d %d %d %d\n' % r for r in records))
+        with open(paths[0], 'rb') as f:
+            c_packed = f.read()
+        with open(paths[2], 'rb') as f:
+            c_samples = f.read()
+
+    assert c_packed == packed
+    assert c_samples == decode_blocks_np(packed).tobytes()
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_rejects_bad_blocks()
+    test_compression()
+    test_simulator_packed_history()
+    test_c_codec_matches_python()
+    print("✅ KPI codec tests passed")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the TFLite flatbuffer reader and the memory budget estimator
+"""
+
+from memory_budget import estimate, parse_arena_size
+from tflite_reader import load_model, plan_arena, tensor_data
+
+
+def test_reader_parses_model():
+    model = load_model('model.tflite')
+    subgraph = model['subgraphs'][0]
+    tensors = subgraph['tensors']
+
+    assert tensors[subgraph['inputs'][0]]['shape'] == [1, 4]
+    assert tensors[subgraph['outputs'][0]]['shape'] == [1, 1]
+    assert [op['opcode'] for op in subgraph['operators']].count('FULLY_CONNECTED') == 4
+    assert subgraph['operators'][-1]['opcode'] == 'LOGISTIC'
+
+    weights = [t for t in tensors if t['constant']]
+    assert all(tensor_data(model, t).shape == tuple(t['shape']) for t in weights)
+    assert plan_arena(subgraph) >= max(t['bytes'] for t in tensors if not t['constant'])
+
+
+def test_estimate_scales_with_retention():
+    short = estimate(1, model_path=None, history='json')
+    long = estimate(5, model_path=None, history='json')
+
+    assert long['config']['records'] == 5 * short['config']['records']
+    assert long['heap_peak']['tick (saveKPI)'] > short['heap_peak']['tick (saveKPI)']
+    assert long['littlefs']['file_bytes'] > 4 * short['littlefs']['file_bytes']
+    assert long['heap_peak']['/status'] == short['heap_peak']['/status']
+
+
+def test_tiered_history_heap_is_flat():
+    short = estimate(1, model_path=None)
+    long = estimate(5, model_path=None)
+
+    assert long['heap_peak']['tick (saveKPI)'] == short['heap_peak']['tick (saveKPI)']
+    assert long['heap_peak']['/history?range=5'] == short['heap_peak']['/history?range=1']
+    assert long['littlefs']['required_bytes'] <= long['littlefs']['available_bytes']
+    assert long['littlefs']['retention_s'] == 365 * 86400
+
+
+def test_model_arena_estimate():
+    result = estimate(1, model_path='model.tflite', arena_size=parse_arena_size())
+    model = result['model']
+    assert model['arena_configured'] == 8 * 1024
+    assert model['arena_required'] > model['activation_bytes'] > 0
+    assert model['arena_required'] <= model['arena_configured'], \
+        f"TENSOR_ARENA_SIZE {model['arena_configured']} < {model['arena_required']} bytes needed"
+
+
+if __name__ == "__main__":
+    test_reader_parses_model()
+    test_estimate_scales_with_retention()
+    test_tiered_history_heap_is_flat()
+    test_model_arena_estimate()
+    print("✅ Memory budget tests passed")
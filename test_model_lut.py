@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the quantized lookup-table export (export_lut.py)
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+import pytest
+
+from export_lut import NOISE_RANGE, build_lut, create_lut_header, lut_predict, lut_predict_scalar
+from history_store import noise_floor
+from scan_cache import SCAN_MAX_RESULTS
+
+
+def linear_model(rssi, noise, channel_util):
+    """Stand-in model that trilinear interpolation reproduces exactly"""
+    rssi = np.asarray(rssi, dtype=np.float32)
+    noise = np.asarray(noise, dtype=np.float32)
+    channel_util = np.asarray(channel_util, dtype=np.float32)
+    return (rssi + 100) / 160.0 + (noise + 100) / 240.0 + channel_util / 400.0
+
+
+def sample_points(n=500):
+    rng = np.random.default_rng(1)
+    return (rng.uniform(-110, -10, n), rng.uniform(-105, -35, n), rng.uniform(-5, 105, n))
+
+
+def test_lut_matches_linear_model():
+    lut = build_lut(linear_model, steps=(3, 4, 7))
+    rssi, noise, util = sample_points()
+    expected = linear_model(np.clip(rssi, -100, -20), np.clip(noise, *NOISE_RANGE),
+                            np.clip(util, 0, 100))
+    approx = lut_predict(lut, rssi, noise, util)
+    # Only the uint8 quantization of the node values remains
+    assert np.max(np.abs(approx - expected)) <= 0.5 / 255 + 1e-5
+
+
+def test_noise_axis_covers_the_estimate():
+    # estimateNoise(): noiseFloor() plus random(0, 8) jitter, with a full scan cache at most
+    assert NOISE_RANGE[0] <= noise_floor(0) and noise_floor(SCAN_MAX_RESULTS) + 7 <= NOISE_RANGE[1]
+
+
+def test_scalar_lookup_matches_vectorized():
+    lut = build_lut(linear_model)
+    rssi, noise, util = sample_points(100)
+    vectorized = lut_predict(lut, rssi, noise, util)
+    for i in range(len(rssi)):
+        scalar = lut_predict_scalar(lut, float(rssi[i]), float(noise[i]), float(util[i]))
+        assert abs(scalar - vectorized[i]) < 1e-5
+
+
+def test_c_header_matches_python():
+    compiler = shutil.which('g++')
+    if compiler is None:
+        pytest.skip("g++ not available")
+
+    lut = build_lut(linear_model, steps=(3, 4, 7))
+    rssi, noise, util = sample_points(50)
+    expected = lut_predict(lut, rssi, noise, util)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        create_lut_header(lut, os.path.join(tmp, 'model_lut.h'))
+        calls = '\n'.join(
+            f'  printf("%.6f\\n", wifi_model_lut_predict({r:.3f}f, {n:.3f}f, {u:.3f}f));'
+            for r, n, u in zip(rssi, noise, util))
+        with open(os.path.join(tmp, 'main.cpp'), 'w') as f:
+            f.write(f'#include <cstdio>\n#include "model_lut.h"\nint main() {{\n{calls}\n}}\n')
+        binary = os.path.join(tmp, 'lut_test')
+        subprocess.run([compiler, '-Wall', '-Werror', os.path.join(tmp, 'main.cpp'),
+                        '-o', binary], check=True)
+        output = subprocess.run([binary], capture_output=True, text=True, check=True).stdout
+
+    c_values = np.array([float(v) for v in output.split()])
+    assert np.max(np.abs(c_values - expected)) < 1e-4
+
+
+if __name__ == "__main__":
+    test_lut_matches_linear_model()
+    test_noise_axis_covers_the_estimate()
+    test_scalar_lookup_matches_vectorized()
+    test_c_header_matches_python()
+    print("✅ Lookup table tests passed")
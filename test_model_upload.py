@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for model uploads (upload_model.py, include/model_store.h) and the
+hot swap on the host simulator
+"""
+
+import os
+import shutil
+import tempfile
+import zlib
+
+import pytest
+
+from host_simulator import Simulator
+from upload_model import HEADER, MODEL_SLOT_BYTES, check_blob, model_status, pack_model, post_blob, \
+    rebuild_cost, upload
+from test_compile import host_unit
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(ROOT, 'model.tflite')
+
+
+def load_model():
+    with open(MODEL_PATH, 'rb') as f:
+        return f.read()
+
+
+def corrupted_blobs(model):
+    blob = pack_model(model, 3)
+    flipped = bytearray(blob)
+    flipped[HEADER.size + 100] ^= 1
+    return {
+        'ok': blob,
+        'empty': b'\xff' * 64,
+        'bad header': b'XXXX' + blob[4:],
+        'bad crc': bytes(flipped),
+        'not tflite': pack_model(b'\x00' * 64, 1),
+        'too large': pack_model(model * 8, 1),
+    }
+
+
+def test_pack_and_check():
+    model = load_model()
+    for expected, blob in corrupted_blobs(model).items():
+        assert check_blob(blob)[0] == expected, expected
+    status, header = check_blob(pack_model(model, 5))
+    assert header == {'generation': 5, 'length': len(model), 'crc32': zlib.crc32(model),
+                      'header_size': 32}
+    assert len(pack_model(model, 0)) <= MODEL_SLOT_BYTES
+
+
+def test_simulator_hot_swap():
+    model = load_model()
+    with Simulator(fixed_interval=60) as sim:
+        before = model_status(sim.url)
+        assert before['source'] == 'built-in' and before['crc32'] == zlib.crc32(model)
+
+        first = upload(sim.url, model)
+        second = upload(sim.url, model)
+        assert first['status'] == second['status'] == 202
+        assert first['active']['slot'] == 0 and second['active']['slot'] == 1
+        assert second['active']['generation'] == before['generation'] + 2
+        assert second['active']['loads'] == before['loads'] + 2
+
+        assert post_blob(sim.url, corrupted_blobs(model)['bad crc'])[0] == 400
+        sim.device.pending_model = 0              # a swap the KPI task has not run yet
+        status, response = post_blob(sim.url, pack_model(model, 99))
+        assert status == 409 and 'pending' in response['error']
+        sim.device.pending_model = None
+        assert model_status(sim.url)['generation'] == second['generation']
+
+
+def test_turnaround_beats_rebuild():
+    with Simulator(fixed_interval=60) as sim:
+        result = upload(sim.url, load_model())
+    assert 'active' in result and result['turnaround_s'] < 2.0
+
+    if shutil.which('g++') is None:
+        pytest.skip("g++ not found")
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        cost = rebuild_cost(MODEL_PATH, build='host')
+    finally:
+        os.chdir(cwd)
+    print(f"upload {result['turnaround_s'] * 1000:.1f} ms vs host compile alone {cost['build_s']:.2f} s")
+    assert cost['build_s'] > 10 * result['turnaround_s']
+
+
+def test_c_check_matches_python():
+    blobs = corrupted_blobs(load_model())
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i, blob in enumerate(blobs.values()):
+            paths.append(os.path.join(tmp, f'blob{i}.bin'))
+            with open(paths[-1], 'wb') as f:
+                f.write(blob[:MODEL_SLOT_BYTES])
+        output = host_unit('model-store', *paths)
+
+    for (expected, blob), line in zip(blobs.items(), output.splitlines()):
+        status, crc = line.split('|')
+        assert status == expected, (expected, status)
+        body = blob[:MODEL_SLOT_BYTES]
+        assert int(crc) == (zlib.crc32(body[32:]) if len(body) > 32 else 0)
+
+
+if __name__ == "__main__":
+    test_pack_and_check()
+    test_simulator_hot_swap()
+    test_turnaround_beats_rebuild()
+    test_c_check_matches_python()
+    print("✅ Model upload tests passed")
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """
-Test script to compare rule-based prediction with trained TensorFlow model
+Test script to compare rule-based prediction with the trained model
+(run through tflite-runtime or NumPy, see wifimon.py; no TensorFlow import)
 """
 
 import pandas as pd
-import numpy as np
-import tensorflow as tf
+
+from wifimon import load_predictor
 
 def rule_based_prediction(rssi, noise, snr, channel_util):
     """
@@ -28,15 +29,8 @@ def test_predictions():
     """
     # Load the trained model
     try:
-        interpreter = tf.lite.Interpreter(model_path='model.tflite')
-        interpreter.allocate_tensors()
-
-        input_details = interpreter.get_input_details()
-        output_details = interpreter.get_output_details()
-
-        print("🤖 TensorFlow Lite model loaded successfully!")
-        print(f"📊 Model input shape: {input_details[0]['shape']}")
-        print(f"📈 Model output shape: {output_details[0]['shape']}")
+        backend, predict = load_predictor('model.tflite')
+        print(f"🤖 TensorFlow Lite model loaded successfully ({backend})!")
         ml_available = True
     except Exception as e:
         print(f"❌ TensorFlow Lite model not available: {e}")
@@ -72,17 +66,8 @@ def test_predictions():
         
         # ML prediction
         if ml_available:
-            # Normalize inputs (same as training)
-            input_data = np.array([[
-                (rssi + 90) / 30.0,
-                noise / 50.0,
-                (snr + 40) / 60.0,
-                channel_util / 100.0
-            ]], dtype=np.float32)
-            
-            interpreter.set_tensor(input_details[0]['index'], input_data)
-            interpreter.invoke()
-            ml_pred = interpreter.get_tensor(output_details[0]['index'])[0][0]
+            # Normalized like the firmware (SNR is derived from RSSI and noise)
+            ml_pred = predict([rssi], [noise], [channel_util])[0]
             ml_binary = 1 if ml_pred > 0.5 else 0
         else:
             ml_pred = 0
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared scan cache (scan_cache.py, include/scan_cache.h) and its
+use by the host simulator
+"""
+
+import json
+import random
+import time
+from urllib.request import urlopen
+
+from host_simulator import SimulatedDevice, Simulator
+from load_test import compare_scan_cache
+from scan_cache import (CHANNEL_BASE_UTIL, CHANNEL_UTIL_PER_AP, SCAN_CACHE_TTL_MS, SCAN_MAX_RESULTS,
+                        ScanResults, channel_load, channel_utilization, simulate_scan)
+from test_compile import host_unit
+
+
+def entry(channel, rssi, ssid='ap'):
+    return {'ssid': ssid, 'rssi': rssi, 'channel': channel, 'open': False}
+
+
+def test_channel_utilization():
+    assert channel_utilization([], 6) == CHANNEL_BASE_UTIL
+    # Full weight co-channel, 60% two channels away, nothing five away or inaudible
+    scan = [entry(6, -50), entry(8, -55), entry(1, -40), entry(6, -95)]
+    assert abs(channel_utilization(scan, 6) - (CHANNEL_BASE_UTIL + 1.6 * CHANNEL_UTIL_PER_AP)) < 1e-9
+    assert channel_utilization(scan, 0) == CHANNEL_BASE_UTIL + 3 * CHANNEL_UTIL_PER_AP
+    assert channel_utilization([entry(6, -40)] * 20, 6) == 100.0
+
+    load = channel_load(scan)
+    assert load[6] == 1.0 and load[8] == 1.0 and load[1] == 1.0 and load[7] == 0.0
+    assert ScanResults(scan).channel_utilization(6) == channel_utilization(scan, 6)
+
+
+def test_ttl_and_simulated_scan():
+    results = ScanResults(simulate_scan(random.Random(0), 50), taken_ms=1000)
+    assert len(results.entries) == SCAN_MAX_RESULTS
+    assert [e['rssi'] for e in results.entries] == sorted((e['rssi'] for e in results.entries),
+                                                          reverse=True)
+    assert results.fresh(1000 + SCAN_CACHE_TTL_MS - 1) and not results.fresh(1000 + SCAN_CACHE_TTL_MS)
+    assert not ScanResults().fresh(0)
+    assert set(results.to_json()[0]) == {'ssid', 'rssi', 'channel', 'encryption'}
+
+
+def test_simulator_serves_cached_scan():
+    with Simulator(fixed_interval=60, scan_ms=50) as sim:
+        for _ in range(5):
+            response = urlopen(sim.url + '/scan')
+            networks = json.loads(response.read())
+            assert networks and int(response.headers['Age']) >= 0
+        assert sim.device.stats()['scans'] == 1       # the sample at start-up, shared by /scan
+
+    with Simulator(fixed_interval=60, scan_ms=50, scan_ttl=0) as sim:
+        for _ in range(5):
+            assert json.loads(urlopen(sim.url + '/scan').read())
+        assert sim.device.stats()['scans'] == 6
+
+
+def test_cold_scan_does_not_wait():
+    device = SimulatedDevice(fixed_interval=60)
+    device.published_scan.publish(ScanResults())        # as at boot, before the first scan
+    version = device.published_scan.sequence
+    start = time.monotonic()
+    # No KPI thread runs here, so waiting for the scan would time out
+    assert device.scan_json() == (None, None, version)
+    assert time.monotonic() - start < 0.1
+    assert len(device.commands) == 1
+
+
+def test_cache_cuts_scans_and_latency():
+    results = compare_scan_cache(duration=3, interval=10, scan_ms=200, clients=1, time_scale=20)
+    uncached, cached = results['uncached'], results['cached']
+    assert cached['scans'] < uncached['scans']
+    assert cached['p95_ms'] < uncached['p95_ms']
+
+
+def test_c_utilization_matches_python():
+    rng = random.Random(4)
+    scans = [simulate_scan(rng, rng.randint(0, 40), rssi=rng.randint(-90, -40),
+                           channel=rng.randint(1, 13)) for _ in range(50)]
+    lines = []
+    for scan in scans:
+        lines.append(f'{len(scan)} {scan[0]["channel"]}')
+        lines += [f'{e["rssi"]} {e["channel"]} {int(e["open"])}' for e in scan]
+    output = host_unit('scan', stdin='\n'.join(lines) + '\n').split()
+
+    assert len(output) == len(scans)
+    for scan, value in zip(scans, output):
+        assert abs(float(value) - channel_utilization(scan, scan[0]['channel'])) < 1e-3
+
+
+if __name__ == "__main__":
+    test_channel_utilization()
+    test_ttl_and_simulated_scan()
+    test_simulator_serves_cached_scan()
+    test_cold_scan_does_not_wait()
+    test_cache_cuts_scans_and_latency()
+    test_c_utilization_matches_python()
+    print("✅ Scan cache tests passed")
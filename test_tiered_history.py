@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for the tiered history rings (tiered_history.py, include/history_tiers.h)
+and the tier selection behind /history
+"""
+
+import json
+import os
+import random
+import tempfile
+from urllib.request import urlopen
+
+from history_store import generate_history
+from host_simulator import Simulator
+from memory_budget import DEFAULT_FS_SIZE
+from test_compile import host_unit
+from tiered_history import (RAW, ROLLUP, SEGMENT_BYTES, TIER_HOUR, TIER_MINUTE, TIER_RAW, TIERS, RECORD,
+                            RollupAccumulator, Ring, TieredHistory, decode_ring, footprint, record_json,
+                            select_tier)
+
+DAY = 86400
+
+
+def test_record_sizes():
+    assert RAW.size == 12 and ROLLUP.size == 20
+
+
+def test_accumulator_rolls_buckets():
+    acc = RollupAccumulator(60)
+    assert acc.add(120, -60.0, -90.0, 20.0, 0.8) is None
+    assert acc.add(150, -70.4, -92.0, 30.0, 0.4) is None
+    closed = acc.add(180, -65.0, -90.0, 25.0, 0.6)
+    record = record_json(TIER_MINUTE, closed, 'net')
+    assert closed[0] == 120 and record['n'] == 2
+    assert record['rssi'] == -65.2 and record['rssi_min'] == -71 and record['rssi_max'] == -60
+    assert record['snr_min'] == 21 and record['snr_max'] == 30
+    assert record['channel_util_min'] == 20.0 and record['channel_util_max'] == 30.0
+    assert record['stability'] == 0.6 and record['dt'] == 60
+
+
+def test_ring_wraps_and_round_trips():
+    ring = Ring(TIER_HOUR)
+    capacity = TIERS[TIER_HOUR][3]
+    acc = RollupAccumulator(3600)
+    for hour in range(capacity + 5):
+        closed = acc.add(hour * 3600, -60.0, -90.0, 10.0, 0.9)
+        if closed:
+            ring.append(closed)
+    records = ring.records()
+    assert len(records) == capacity and ring.total == capacity + 4
+    assert records[0][0] == 4 * 3600 and records[-1][0] == (capacity + 3) * 3600
+    index, segments = ring.serialize()
+    assert all(len(segment) <= SEGMENT_BYTES for segment in segments)
+    assert decode_ring(index, segments) == (TIER_HOUR, records)
+
+    try:
+        decode_ring(index, segments[:-1] + [segments[-1][:-1]])
+        assert False, "truncated ring accepted"
+    except ValueError:
+        pass
+
+
+def test_append_rewrites_one_block():
+    # LittleFS copies a file from the written block to its end; a wrapped ring still costs one block
+    for tier in range(len(TIERS)):
+        ring = Ring(tier)
+        blank = RECORD[tier].unpack(bytes(RECORD[tier].size))
+        for _ in range(ring.capacity):
+            ring.append(blank)
+        for slot in (0, ring.segment_records - 1):
+            ring.total, ring.flash_bytes = ring.capacity + slot, 0
+            ring.append(blank)
+            assert SEGMENT_BYTES < ring.flash_bytes < SEGMENT_BYTES + 256
+
+
+def test_select_tier():
+    now = 400 * DAY
+    full = [now - DAY, now - 30 * DAY, now - 365 * DAY]
+    assert select_tier(3600, now - 3600, full) == TIER_RAW
+    assert select_tier(DAY, now - DAY, full) == TIER_RAW
+    assert select_tier(5 * DAY, now - 5 * DAY, full) == TIER_MINUTE
+    assert select_tier(100 * DAY, now - 100 * DAY, full) == TIER_HOUR
+    # Adaptive sampling filled the raw ring with only 5 hours: minute reaches further back
+    short_raw = [now - 5 * 3600, now - 30 * DAY, now - 365 * DAY]
+    assert select_tier(DAY, now - DAY, short_raw) == TIER_MINUTE
+    # A fresh device has only raw data
+    assert select_tier(5 * DAY, now - 5 * DAY, [now - 600, 0, 0]) == TIER_RAW
+
+
+def test_history_query_picks_tier():
+    history = TieredHistory('net')
+    records = generate_history(3, ssid='net')
+    history.add_records(records)
+    now = records[-1]['t']
+
+    tier, rows = history.query(1, now)
+    assert tier == 'raw' and abs(len(rows) - DAY / 10) <= 2
+    assert set(rows[0]) == set(records[0])
+    tier, rows = history.query(5, now)
+    assert tier == 'minute' and rows[0]['t'] < now - 2 * DAY
+    assert all('rssi_min' in r and r['rssi_min'] <= r['rssi'] <= r['rssi_max'] for r in rows)
+
+
+def test_simulator_history_tier_header():
+    with Simulator(history_days=2, fixed_interval=60) as sim:
+        response = urlopen(sim.url + '/history?range=1')
+        assert response.headers['X-History-Tier'] == 'raw'
+        assert json.loads(response.read())
+        response = urlopen(sim.url + '/history?range=30')
+        assert response.headers['X-History-Tier'] == 'minute'
+        # the oldest minute may be partial, depending on where the preload starts
+        assert max(row['n'] for row in json.loads(response.read())) > 1
+
+
+def test_footprint_fits_and_extends_retention():
+    result = footprint(DEFAULT_FS_SIZE)
+    assert result['fits']
+    assert result['tiered_retention_s'] == 365 * DAY and result['raw_retention_s'] == DAY
+    assert result['tiered_retention_s'] > 100 * result['json_retention_s']
+    for tier in result['tiers']:
+        assert tier['flash_bytes_per_day'] < tier['writes_per_day'] * (SEGMENT_BYTES + 256)
+    assert result['tiered_flash_writes_per_day'] < result['json_flash_writes_per_day'] / 100
+
+
+def test_c_rings_match_python():
+    rng = random.Random(7)
+    samples = [(1_000_000 + i * 10, round(rng.uniform(-85, -45), 1), round(rng.uniform(-97, -88), 1),
+                round(rng.uniform(0, 80), 1), round(rng.random(), 3)) for i in range(1500)]
+    history = TieredHistory()
+    for t, rssi, noise, util, stability in samples:
+        history.add(t, rssi, noise, util, stability, 10)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, 'fs')
+        for tier in TIERS:
+            os.makedirs(root + tier[1])
+        host_unit('rings', root, stdin=''.join(f'{t} {r} {n} {u} {s}\n' for t, r, n, u, s in samples))
+        images = []
+        for tier in TIERS:
+            directory = root + tier[1]
+            names = sorted((name for name in os.listdir(directory) if name != 'index'), key=int)
+            with open(os.path.join(directory, 'index'), 'rb') as f:
+                index = f.read()
+            segments = []
+            for name in names:
+                with open(os.path.join(directory, name), 'rb') as f:
+                    segments.append(f.read())
+            images.append((index, segments))
+
+    for tier, (index, segments) in enumerate(images):
+        decoded_tier, records = decode_ring(index, segments)
+        expected = history.rings[tier].records()
+        assert decoded_tier == tier and len(records) == len(expected) > 0
+        for c_record, py_record in zip(records, expected):
+            # float32 sums on the device: means may differ by one LSB
+            assert c_record[0] == py_record[0]
+            assert all(abs(a - b) <= 1 for a, b in zip(c_record, py_record))
+
+
+if __name__ == "__main__":
+    test_record_sizes()
+    test_accumulator_rolls_buckets()
+    test_ring_wraps_and_round_trips()
+    test_append_rewrites_one_block()
+    test_select_tier()
+    test_history_query_picks_tier()
+    test_simulator_history_tier_header()
+    test_footprint_fits_and_extends_retention()
+    test_c_rings_match_python()
+    print("✅ Tiered history tests passed")
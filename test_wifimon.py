@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the wifimon CLI (wifimon.py) and the NumPy TFLite evaluator in
+tflite_reader.py
+"""
+
+import csv
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pytest
+
+from tflite_reader import NumpyInterpreter, load_model
+from wifimon import load_predictor, write_kpi_csv
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(ROOT, 'model.tflite')
+
+
+def kpi_grid(count=5000, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-100, -20, count), rng.uniform(-100, -50, count), rng.uniform(0, 100, count)
+
+
+def test_numpy_backend_matches_tensorflow():
+    backend, predict = load_predictor(MODEL_PATH, 'numpy')
+    assert backend == 'numpy'
+    ours = predict(*kpi_grid())
+    assert ours.dtype == np.float32 and ((ours >= 0) & (ours <= 1)).all()
+    pytest.importorskip("tensorflow")
+    _, reference = load_predictor(MODEL_PATH, 'tensorflow')
+    assert np.abs(ours - reference(*kpi_grid())).max() < 1e-5
+
+
+def test_numpy_interpreter_rejects_unsupported_ops():
+    try:
+        NumpyInterpreter(load_model(os.path.join(ROOT, 'forecast_model.tflite')))
+    except ValueError as error:
+        assert 'CONV_2D' in str(error)
+    else:
+        raise AssertionError("the convolutional forecast model needs operators the evaluator lacks")
+
+
+def test_predict_and_export_skip_tensorflow():
+    with tempfile.TemporaryDirectory() as tmp:
+        kpis, scored = os.path.join(tmp, 'kpis.csv'), os.path.join(tmp, 'scored.csv')
+        header, lut = os.path.join(tmp, 'model.h'), os.path.join(tmp, 'model_lut.h')
+        write_kpi_csv(kpis, 200)
+        script = (
+            "import json, sys, wifimon\n"
+            f"wifimon.main(['predict', {kpis!r}, '--model', {MODEL_PATH!r}, '--output', {scored!r}])\n"
+            f"wifimon.main(['export', '--model', {MODEL_PATH!r}, '--header', {header!r}, '--lut', {lut!r}])\n"
+            "print(json.dumps([m for m in ('tensorflow', 'pandas', 'sklearn') if m in sys.modules]))\n")
+        result = subprocess.run([sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True,
+                                check=True)
+        assert json.loads(result.stdout.splitlines()[-1]) == []
+
+        with open(scored, newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 200 and all(0 <= float(row['prediction']) <= 1 for row in rows)
+
+        with open(header) as f:
+            array = bytes(int(b, 16) for b in re.findall(r'0x([0-9a-f]{2})', f.read()))
+        with open(MODEL_PATH, 'rb') as f:
+            assert array == f.read()
+        assert os.path.getsize(lut) > 0
+
+
+def test_bench_cold_start():
+    # From the CLI: the child's peak RSS would include this process's if it spawned them
+    output = subprocess.run([sys.executable, 'wifimon.py', 'bench', '--model', MODEL_PATH, '--rows', '2000',
+                             '--repeat', '1', '--json'], cwd=ROOT, capture_output=True, text=True, check=True)
+    report = json.loads(output.stdout)
+    results = {r['name']: r for r in report['results']}
+    numpy_predict = results['predict (numpy)']
+    assert numpy_predict['seconds'] > results['python startup']['seconds']
+    print(f"predict (numpy): {numpy_predict['seconds']:.2f} s, {numpy_predict['peak_rss_mb']:.0f} MB")
+    if 'predict (tensorflow)' in results:
+        tensorflow_predict = results['predict (tensorflow)']
+        print(f"predict (tensorflow): {tensorflow_predict['seconds']:.2f} s, "
+              f"{tensorflow_predict['peak_rss_mb']:.0f} MB")
+        assert tensorflow_predict['seconds'] > 3 * numpy_predict['seconds']
+        assert tensorflow_predict['peak_rss_mb'] > 3 * numpy_predict['peak_rss_mb']
+
+
+if __name__ == "__main__":
+    test_numpy_backend_matches_tensorflow()
+    test_numpy_interpreter_rejects_unsupported_ops()
+    test_predict_and_export_skip_tensorflow()
+    test_bench_cold_start()
+    print("✅ wifimon tests passed")
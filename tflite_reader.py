@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Minimal TensorFlow Lite flatbuffer reader
+
+Reads the parts of a .tflite file the host tools need (tensors, operators,
+buffers) without importing TensorFlow. Only the schema fields used by this
+project are decoded.
+"""
+
+import struct
+
+# TensorType enum from the TFLite schema
+TENSOR_TYPES = {
+    0: ('FLOAT32', 4), 1: ('FLOAT16', 2), 2: ('INT32', 4), 3: ('UINT8', 1),
+    4: ('INT64', 8), 5: ('STRING', 1), 6: ('BOOL', 1), 7: ('INT16', 2),
+    8: ('COMPLEX64', 8), 9: ('INT8', 1), 10: ('FLOAT64', 8),
+}
+
+# BuiltinOperator codes used by small dense and 1-D convolutional models
+BUILTIN_OPERATORS = {
+    0: 'ADD', 3: 'CONV_2D', 6: 'DEQUANTIZE', 9: 'FULLY_CONNECTED', 14: 'LOGISTIC',
+    18: 'MUL', 19: 'RELU', 21: 'RELU6', 22: 'RESHAPE', 25: 'SOFTMAX', 28: 'TANH',
+    40: 'MEAN', 41: 'SUB', 43: 'SQUEEZE', 70: 'EXPAND_DIMS', 114: 'QUANTIZE',
+}
+
+# ActivationFunctionType enum
+ACTIVATIONS = {0: 'NONE', 1: 'RELU', 2: 'RELU_N1_TO_1', 3: 'RELU6', 4: 'TANH', 5: 'SIGN_BIT'}
+
+
+class _Table:
+    """A flatbuffer table: field accessors resolved through its vtable"""
+
+    def __init__(self, buf, pos):
+        self.buf = buf
+        self.pos = pos
+        vtable = pos - struct.unpack_from('<i', buf, pos)[0]
+        vtable_size = struct.unpack_from('<H', buf, vtable)[0]
+        self.fields = struct.unpack_from(f'<{(vtable_size - 4) // 2}H', buf, vtable + 4)
+
+    def _offset(self, index):
+        if index < len(self.fields) and self.fields[index]:
+            return self.pos + self.fields[index]
+        return None
+
+    def scalar(self, index, fmt, default=0):
+        offset = self._offset(index)
+        return struct.unpack_from('<' + fmt, self.buf, offset)[0] if offset is not None else default
+
+    def _indirect(self, index):
+        offset = self._offset(index)
+        if offset is None:
+            return None
+        return offset + struct.unpack_from('<I', self.buf, offset)[0]
+
+    def table(self, index):
+        pos = self._indirect(index)
+        return _Table(self.buf, pos) if pos is not None else None
+
+    def string(self, index):
+        pos = self._indirect(index)
+        if pos is None:
+            return None
+        length = struct.unpack_from('<I', self.buf, pos)[0]
+        return bytes(self.buf[pos + 4:pos + 4 + length]).decode('utf-8', 'replace')
+
+    def vector(self, index, fmt):
+        pos = self._indirect(index)
+        if pos is None:
+            return []
+        length = struct.unpack_from('<I', self.buf, pos)[0]
+        return list(struct.unpack_from(f'<{length}{fmt}', self.buf, pos + 4))
+
+    def bytes_vector(self, index):
+        pos = self._indirect(index)
+        if pos is None:
+            return b''
+        length = struct.unpack_from('<I', self.buf, pos)[0]
+        return self.buf[pos + 4:pos + 4 + length]
+
+    def tables(self, index):
+        pos = self._indirect(index)
+        if pos is None:
+            return []
+        length = struct.unpack_from('<I', self.buf, pos)[0]
+        result = []
+        for i in range(length):
+            element = pos + 4 + i * 4
+            result.append(_Table(self.buf, element + struct.unpack_from('<I', self.buf, element)[0]))
+        return result
+
+
+def parse_model(data):
+    """Decode a TFLite flatbuffer into plain dicts"""
+    buf = memoryview(bytes(data))
+    if bytes(buf[4:8]) != b'TFL3':
+        raise ValueError("not a TFLite flatbuffer (missing TFL3 identifier)")
+
+    root = _Table(buf, struct.unpack_from('<I', buf, 0)[0])
+
+    opcodes = []
+    for code in root.tables(1):
+        builtin = max(code.scalar(0, 'b'), code.scalar(3, 'i'))
+        opcodes.append(BUILTIN_OPERATORS.get(builtin, f'BUILTIN_{builtin}'))
+
+    buffers = [b.bytes_vector(0) for b in root.tables(4)]
+
+    subgraphs = []
+    for sg in root.tables(2):
+        tensors = []
+        for t in sg.tables(0):
+            type_name, itemsize = TENSOR_TYPES.get(t.scalar(1, 'b'), ('UNKNOWN', 1))
+            shape = t.vector(0, 'i')
+            count = 1
+            for dim in shape:
+                count *= max(dim, 1)
+            buffer_index = t.scalar(2, 'I')
+            tensors.append({
+                'name': t.string(3) or '',
+                'shape': shape,
+                'type': type_name,
+                'itemsize': itemsize,
+                'bytes': count * itemsize,
+                'buffer': buffer_index,
+                'constant': buffer_index < len(buffers) and len(buffers[buffer_index]) > 0,
+            })
+
+        operators = []
+        for op in sg.tables(3):
+            opcode = opcodes[op.scalar(0, 'I')]
+            operator = {
+                'opcode': opcode,
+                'inputs': op.vector(1, 'i'),
+                'outputs': op.vector(2, 'i'),
+            }
+            options = op.table(4)
+            if options is not None and opcode == 'FULLY_CONNECTED':
+                operator['activation'] = ACTIVATIONS.get(options.scalar(0, 'b'), 'NONE')
+            operators.append(operator)
+
+        subgraphs.append({
+            'tensors': tensors,
+            'inputs': sg.vector(1, 'i'),
+            'outputs': sg.vector(2, 'i'),
+            'operators': operators,
+        })
+
+    return {
+        'version': root.scalar(0, 'I'),
+        'description': root.string(3),
+        'opcodes': opcodes,
+        'buffers': buffers,
+        'subgraphs': subgraphs,
+    }
+
+
+def load_model(path):
+    with open(path, 'rb') as f:
+        return parse_model(f.read())
+
+
+def tensor_data(model, tensor):
+    """Constant tensor contents as a NumPy array (None for activations)"""
+    import numpy as np
+
+    if not tensor['constant']:
+        return None
+    dtypes = {'FLOAT32': np.float32, 'FLOAT16': np.float16, 'INT32': np.int32,
+              'UINT8': np.uint8, 'INT8': np.int8, 'INT16': np.int16, 'INT64': np.int64}
+    raw = np.frombuffer(model['buffers'][tensor['buffer']], dtype=dtypes[tensor['type']])
+    return raw.reshape(tensor['shape']) if tensor['shape'] else raw
+
+
+def plan_arena(subgraph):
+    """
+    Bytes needed for non-constant tensors with a greedy lifetime-aware
+    placement, close to what TFLite Micro's GreedyMemoryPlanner produces
+    """
+    operators = subgraph['operators']
+    lifetimes = {}
+    for index in subgraph['inputs']:
+        lifetimes[index] = [0, 0]
+    for step, op in enumerate(operators):
+        for index in op['inputs'] + op['outputs']:
+            if index < 0 or subgraph['tensors'][index]['constant']:
+                continue
+            first, last = lifetimes.get(index, [step, step])
+            lifetimes[index] = [min(first, step), max(last, step)]
+    for index in subgraph['outputs']:
+        if index in lifetimes:
+            lifetimes[index][1] = len(operators)
+
+    def aligned(size):
+        return (size + 15) // 16 * 16
+
+    placed = []  # (offset, size, first, last)
+    for index in sorted(lifetimes, key=lambda i: -subgraph['tensors'][i]['bytes']):
+        size = aligned(subgraph['tensors'][index]['bytes'])
+        first, last = lifetimes[index]
+        overlapping = sorted((o, s) for o, s, f, l in placed if f <= last and first <= l)
+        offset = 0
+        for other_offset, other_size in overlapping:
+            if offset + size <= other_offset:
+                break
+            offset = max(offset, other_offset + other_size)
+        placed.append((offset, size, first, last))
+
+    return max((o + s for o, s, _, _ in placed), default=0)
+
+
+def _fully_connected(op, x, weights, bias):
+    out = x.reshape(-1, weights.shape[1]) @ weights.T
+    if bias is not None:
+        out += bias
+    return _ACTIVATION_FUNCTIONS[op.get('activation', 'NONE')](out)
+
+
+def _relu(x):
+    return x.clip(0, None)
+
+
+def _relu6(x):
+    return x.clip(0, 6)
+
+
+def _logistic(x):
+    import numpy as np
+    return 1 / (1 + np.exp(-x))
+
+
+def _tanh(x):
+    import numpy as np
+    return np.tanh(x)
+
+
+_ACTIVATION_FUNCTIONS = {'NONE': lambda x: x, 'RELU': _relu, 'RELU6': _relu6, 'TANH': _tanh}
+
+# Operators NumpyInterpreter can run: opcode -> fn(op, *input arrays)
+NUMPY_OPERATORS = {
+    'DEQUANTIZE': lambda op, x: x.astype('float32'),
+    'FULLY_CONNECTED': _fully_connected,
+    'LOGISTIC': lambda op, x: _logistic(x),
+    'RELU': lambda op, x: _relu(x),
+    'RELU6': lambda op, x: _relu6(x),
+    'TANH': lambda op, x: _tanh(x),
+}
+
+
+class NumpyInterpreter:
+    """
+    Runs a float TFLite graph made of NUMPY_OPERATORS with NumPy, batched
+    over the first input dimension. Operators whose inputs are all constant
+    (the float16 weight DEQUANTIZEs) are folded once at construction.
+    """
+
+    def __init__(self, model, subgraph=0):
+        self.subgraph = model['subgraphs'][subgraph]
+        unsupported = {op['opcode'] for op in self.subgraph['operators']} - set(NUMPY_OPERATORS)
+        if unsupported:
+            raise ValueError(f"operators not supported by NumpyInterpreter: {sorted(unsupported)}")
+        if len(self.subgraph['inputs']) != 1 or len(self.subgraph['outputs']) != 1:
+            raise ValueError("NumpyInterpreter needs a single-input, single-output graph")
+
+        self.constants = {index: tensor_data(model, tensor)
+                          for index, tensor in enumerate(self.subgraph['tensors']) if tensor['constant']}
+        self.operators = []
+        for op in self.subgraph['operators']:
+            if all(index < 0 or index in self.constants for index in op['inputs']):
+                self.constants[op['outputs'][0]] = self._run(op, self.constants)
+            else:
+                self.operators.append(op)
+
+    @staticmethod
+    def _run(op, values):
+        inputs = [values[index] if index >= 0 else None for index in op['inputs']]
+        return NUMPY_OPERATORS[op['opcode']](op, *inputs)
+
+    def __call__(self, inputs):
+        import numpy as np
+
+        values = dict(self.constants)
+        values[self.subgraph['inputs'][0]] = np.asarray(inputs, dtype=np.float32)
+        for op in self.operators:
+            values[op['outputs'][0]] = self._run(op, values)
+        return values[self.subgraph['outputs'][0]]
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Tiered KPI history: host mirror of include/history_tiers.h and a flash
+footprint calculator
+
+The firmware keeps three rings instead of one /history.json:
+
+    raw     one 12-byte record per sample, 8640 slots (24 h at 10 s)
+    minute  20-byte min/mean/max rollups per minute, 30 days
+    hour    20-byte min/mean/max rollups per hour, 1 year
+
+Rollups are accumulated as samples arrive and written when their bucket
+closes. /history?range=N picks the finest tier covering N days and streams
+it as the usual JSON records; rollup records add *_min/*_max fields and `n`.
+
+Each ring is a LittleFS directory: `index` holds the header, and the slots
+are split across one-block segment files `0`, `1`, ... (little-endian):
+
+    index   <IBBHII  magic "WKHR", version, tier, record size, capacity, total
+    raw     <IhhBBH  t, rssi, noise (0.1 dB), util (0.5 %), stability (1/250), dt
+    rollup  <IHhhbbbbBBBBBB  t, samples, rssi/noise mean, rssi/snr min/max (1 dB),
+                             util min/mean/max, stability min/mean/max
+
+Usage:
+    python tiered_history.py                      # footprint vs /history.json
+    python tiered_history.py --fs-size 1441792 --interval 2
+    python tiered_history.py --days 3             # fill with synthetic samples, show /history tiers
+"""
+
+import argparse
+import json
+import math
+import struct
+import time
+
+from history_store import generate_history, range_threshold
+
+HISTORY_RING_MAGIC = 0x52484B57   # "WKHR"
+HISTORY_RING_VERSION = 2
+SEGMENT_BYTES = 4096              # HISTORY_SEGMENT_BYTES, the LittleFS block size
+TIER_RAW, TIER_MINUTE, TIER_HOUR = range(3)
+TIERS = (
+    # name, dir, period_s, capacity, span_s
+    ('raw', '/history_raw', 0, 8640, 86400),
+    ('minute', '/history_1m', 60, 43200, 30 * 86400),
+    ('hour', '/history_1h', 3600, 8760, 365 * 86400),
+)
+DB_SCALE = 10.0
+UTIL_SCALE = 2.0
+STABILITY_SCALE = 250.0
+HEADER = struct.Struct('<IBBHII')
+RAW = struct.Struct('<IhhBBH')
+ROLLUP = struct.Struct('<IHhhbbbbBBBBBB')
+RECORD = {TIER_RAW: RAW, TIER_MINUTE: ROLLUP, TIER_HOUR: ROLLUP}
+ASSET_BYTES = 150_000             # data_dist/ web UI image, also on LittleFS
+LITTLEFS_INLINE_MAX = 512         # files up to the cache size live in their directory entry
+LITTLEFS_ENTRY_BYTES = 48         # name, struct and CRC tags of one file in a directory commit
+
+
+def quantize(value, scale, low, high):
+    return min(high, max(low, math.floor(value * scale + 0.5)))
+
+
+def clamp_db(value):
+    return min(127, max(-128, value))
+
+
+def raw_record(t, rssi, noise, channel_util, stability, dt):
+    """makeRawRecord() as a packed tuple"""
+    return (int(t), quantize(rssi, DB_SCALE, -32768, 32767), quantize(noise, DB_SCALE, -32768, 32767),
+            quantize(channel_util, UTIL_SCALE, 0, 200), quantize(stability, STABILITY_SCALE, 0, 250),
+            min(int(dt), 0xFFFF))
+
+
+class RollupAccumulator:
+    """RollupAccumulator in include/history_tiers.h"""
+
+    def __init__(self, period):
+        self.period = period
+        self.samples = 0
+        self.start = 0
+
+    def add(self, t, rssi, noise, channel_util, stability):
+        """Fold one sample in; returns the closed bucket's record when t starts a new one"""
+        bucket = t - t % self.period
+        closed = self.finish() if self.samples and bucket != self.start else None
+        snr = rssi - noise
+        if not self.samples or closed:
+            self.start = bucket
+            self.samples = 0
+            self.sums = [0.0, 0.0, 0.0, 0.0]
+            self.low = [rssi, snr, channel_util, stability]
+            self.high = list(self.low)
+        self.samples = min(self.samples + 1, 0xFFFF)
+        for i, value in enumerate((rssi, noise, channel_util, stability)):
+            self.sums[i] += value
+        for i, value in enumerate((rssi, snr, channel_util, stability)):
+            self.low[i] = min(self.low[i], value)
+            self.high[i] = max(self.high[i], value)
+        return closed
+
+    def finish(self):
+        n = self.samples
+        return (self.start, n,
+                quantize(self.sums[0] / n, DB_SCALE, -32768, 32767),
+                quantize(self.sums[1] / n, DB_SCALE, -32768, 32767),
+                clamp_db(math.floor(self.low[0])), clamp_db(math.ceil(self.high[0])),
+                clamp_db(math.floor(self.low[1])), clamp_db(math.ceil(self.high[1])),
+                quantize(self.low[2], UTIL_SCALE, 0, 200),
+                quantize(self.sums[2] / n, UTIL_SCALE, 0, 200),
+                quantize(self.high[2], UTIL_SCALE, 0, 200),
+                quantize(self.low[3], STABILITY_SCALE, 0, 250),
+                quantize(self.sums[3] / n, STABILITY_SCALE, 0, 250),
+                quantize(self.high[3], STABILITY_SCALE, 0, 250))
+
+
+def littlefs_write_bytes(file_size, offset, length, block_size=SEGMENT_BYTES):
+    """
+    Bytes LittleFS programs to write `length` bytes at `offset` of a file and
+    close it. Small files are inline and committed whole. Larger ones are
+    copy-on-write block lists, so every block from the one holding `offset`
+    to the end of the file is written again. Each close commits the entry.
+    """
+    end = max(file_size, offset + length)
+    if end <= LITTLEFS_INLINE_MAX:
+        return end + LITTLEFS_ENTRY_BYTES
+    return ((end - 1) // block_size - offset // block_size + 1) * block_size + LITTLEFS_ENTRY_BYTES
+
+
+class Ring:
+    """One ring: the same slots, index and segment files as ringAppend(), and their flash cost"""
+
+    def __init__(self, tier):
+        self.tier = tier
+        self.capacity = TIERS[tier][3]
+        self.segment_records = SEGMENT_BYTES // RECORD[tier].size
+        self.slots = []
+        self.total = 0
+        self.flash_bytes = 0    # LittleFS bytes programmed by the appends
+
+    def append(self, record):
+        size = RECORD[self.tier].size
+        slot = self.total % self.capacity
+        first = slot - slot % self.segment_records
+        held = min(len(self.slots), first + self.segment_records) - first   # segment file before
+        # The record into its segment, then the 16-byte index rewritten ("w")
+        self.flash_bytes += (littlefs_write_bytes(held * size, (slot - first) * size, size)
+                             + littlefs_write_bytes(0, 0, HEADER.size))
+        if len(self.slots) < self.capacity:
+            self.slots.append(record)
+        else:
+            self.slots[self.total % self.capacity] = record
+        self.total += 1
+
+    def records(self):
+        """Oldest first"""
+        if self.total <= self.capacity:
+            return list(self.slots)
+        split = self.total % self.capacity
+        return self.slots[split:] + self.slots[:split]
+
+    def oldest(self):
+        return self.records()[0][0] if self.slots else 0
+
+    def serialize(self):
+        """(index, [segment, ...]): the file images ringAppend() leaves"""
+        record = RECORD[self.tier]
+        index = HEADER.pack(HISTORY_RING_MAGIC, HISTORY_RING_VERSION, self.tier, record.size,
+                            self.capacity, self.total)
+        per = self.segment_records
+        segments = [b''.join(record.pack(*r) for r in self.slots[first:first + per])
+                    for first in range(0, len(self.slots), per)]
+        return index, segments
+
+
+def decode_ring(index, segments):
+    """Index and segment file images, in segment order -> (tier, records oldest first)"""
+    if len(index) < HEADER.size:
+        raise ValueError("ring index too short")
+    magic, version, tier, size, capacity, total = HEADER.unpack_from(index)
+    if magic != HISTORY_RING_MAGIC or version != HISTORY_RING_VERSION or tier >= len(TIERS) \
+            or size != RECORD[tier].size:
+        raise ValueError("not a history ring (bad magic, version, tier or record size)")
+    count = min(total, capacity)
+    per = SEGMENT_BYTES // size
+    slots = []
+    for segment in segments:
+        slots += [RECORD[tier].unpack_from(segment, i * size) for i in range(min(len(segment) // size, per))]
+    if len(slots) < count:
+        raise ValueError("history ring truncated")
+    slots = slots[:count]
+    split = total % capacity if total > capacity else 0
+    return tier, slots[split:] + slots[:split]
+
+
+def record_json(tier, record, ssid):
+    """handleHistory() output for one record: the /history.json fields, plus ranges for rollups"""
+    if tier == TIER_RAW:
+        t, rssi, noise, util, stability, dt = record
+        rssi, noise = rssi / DB_SCALE, noise / DB_SCALE
+        return {'t': t, 'rssi': rssi, 'noise': noise, 'snr': round(rssi - noise, 1),
+                'channel_util': util / UTIL_SCALE, 'stability': stability / STABILITY_SCALE,
+                'ssid': ssid, 'dt': dt}
+    (t, n, rssi, noise, rssi_min, rssi_max, snr_min, snr_max,
+     util_min, util, util_max, stab_min, stab, stab_max) = record
+    rssi, noise = rssi / DB_SCALE, noise / DB_SCALE
+    return {'t': t, 'rssi': rssi, 'noise': noise, 'snr': round(rssi - noise, 1),
+            'channel_util': util / UTIL_SCALE, 'stability': stab / STABILITY_SCALE,
+            'ssid': ssid, 'dt': TIERS[tier][2], 'n': n,
+            'rssi_min': rssi_min, 'rssi_max': rssi_max, 'snr_min': snr_min, 'snr_max': snr_max,
+            'channel_util_min': util_min / UTIL_SCALE, 'channel_util_max': util_max / UTIL_SCALE,
+            'stability_min': stab_min / STABILITY_SCALE, 'stability_max': stab_max / STABILITY_SCALE}
+
+
+def select_tier(range_s, threshold, oldest):
+    """selectTier(): finest tier spanning the range, coarser if it reaches further back"""
+    tier = 0
+    while tier + 1 < len(TIERS) and TIERS[tier][4] < range_s:
+        tier += 1
+    while tier and not oldest[tier]:
+        tier -= 1    # no bucket closed yet
+    while tier + 1 < len(TIERS):
+        period, coarser = TIERS[tier + 1][2], oldest[tier + 1]
+        if oldest[tier] and oldest[tier] <= threshold + period:
+            break        # covers the range to within one coarser bucket
+        if not coarser or (oldest[tier] and coarser + period > oldest[tier]):
+            break        # nothing older one tier up
+        tier += 1
+    return tier
+
+
+class TieredHistory:
+    """saveKPI()'s history side: raw ring plus minute and hour rollups"""
+
+    def __init__(self, ssid='HomeNetwork'):
+        self.ssid = ssid
+        self.rings = [Ring(tier) for tier in range(len(TIERS))]
+        self.accumulators = {tier: RollupAccumulator(TIERS[tier][2]) for tier in (TIER_MINUTE, TIER_HOUR)}
+        self.writes = 0
+
+    def add(self, t, rssi, noise, channel_util, stability, dt):
+        self.rings[TIER_RAW].append(raw_record(t, rssi, noise, channel_util, stability, dt))
+        self.writes += 1
+        for tier, accumulator in self.accumulators.items():
+            closed = accumulator.add(t, rssi, noise, channel_util, stability)
+            if closed:
+                self.rings[tier].append(closed)
+                self.writes += 1
+
+    def add_records(self, records):
+        """Feed /history.json records (history_store format) in time order"""
+        for r in records:
+            self.add(r['t'], r['rssi'], r['noise'], r['channel_util'], r['stability'], r['dt'])
+
+    def query(self, range_days, now=None):
+        """/history?range=N -> (tier name, JSON records)"""
+        now = int(now if now is not None else time.time())
+        threshold = range_threshold(range_days, now)
+        range_s = now - threshold
+        tier = select_tier(range_s, threshold, [ring.oldest() for ring in self.rings])
+        records = [record_json(tier, r, self.ssid) for r in self.rings[tier].records() if r[0] >= threshold]
+        return TIERS[tier][0], records
+
+
+def measure_flash_writes(interval=10):
+    """LittleFS bytes programmed per tier by one day of samples, once every ring has wrapped"""
+    history = TieredHistory()
+    for ring in history.rings:
+        blank = RECORD[ring.tier].unpack(bytes(RECORD[ring.tier].size))
+        for _ in range(ring.capacity):
+            ring.append(blank)
+        ring.flash_bytes = 0
+    for i in range(int(86400 / interval)):
+        history.add(i * interval, -60.0, -92.0, 20.0, 0.8, interval)
+    return [ring.flash_bytes for ring in history.rings]
+
+
+def footprint(fs_size, interval=10, asset_bytes=ASSET_BYTES, json_record_bytes=None,
+              block_size=SEGMENT_BYTES):
+    """
+    Flash use of the tier layout against the single /history.json it replaces,
+    within the same LittleFS partition
+    """
+    if json_record_bytes is None:
+        from memory_budget import record_profile
+        json_record_bytes = record_profile()['serialized_bytes']
+
+    available = fs_size - asset_bytes
+    tiers = []
+    for tier, ((name, _, period, capacity, _), flash_bytes) in enumerate(zip(TIERS, measure_flash_writes(interval))):
+        size = RECORD[tier].size
+        segments = math.ceil(capacity / (block_size // size))
+        # Segment blocks, plus the directory's metadata pairs (compacted at half full)
+        pairs = math.ceil((segments + 1) * LITTLEFS_ENTRY_BYTES / (block_size / 2))
+        step = period or interval
+        tiers.append({'tier': name, 'record_bytes': size, 'records': capacity, 'segments': segments,
+                      'file_bytes': (segments + 2 * pairs) * block_size,
+                      'retention_s': capacity * step, 'writes_per_day': 86400 / step,
+                      'flash_bytes_per_day': flash_bytes})
+    used = sum(t['file_bytes'] for t in tiers)
+    # saveKPI() rewrote /history.json through /history.tmp: old and new copy on flash at once
+    json_records = int(available / 2 / json_record_bytes)
+    return {
+        'fs_size': fs_size,
+        'available_bytes': available,
+        'tiers': tiers,
+        'tiered_bytes': used,
+        'fits': used <= available,
+        'tiered_retention_s': max(t['retention_s'] for t in tiers),
+        'raw_retention_s': tiers[TIER_RAW]['retention_s'],
+        'json_records': json_records,
+        'json_retention_s': json_records * interval,
+        # Measured on Ring: a segment block and the index per append; the JSON file was rewritten
+        'tiered_flash_writes_per_day': sum(t['flash_bytes_per_day'] for t in tiers),
+        'json_flash_writes_per_day': int(86400 / interval * json_records * json_record_bytes),
+    }
+
+
+def format_duration(seconds):
+    if seconds >= 2 * 86400:
+        return f"{seconds / 86400:.0f} days"
+    return f"{seconds / 3600:.1f} h"
+
+
+def print_footprint(r, interval):
+    from memory_budget import format_bytes
+
+    print(f"💾 LittleFS {format_bytes(r['fs_size'])}, {format_bytes(r['available_bytes'])} after the "
+          f"web UI, {interval:g} s sampling")
+    print(f"{'tier':<8}{'record':>8}{'slots':>8}{'file':>11}{'retention':>11}")
+    for t in r['tiers']:
+        print(f"{t['tier']:<8}{t['record_bytes']:>7}B{t['records']:>8}{format_bytes(t['file_bytes']):>11}"
+              f"{format_duration(t['retention_s']):>11}")
+    marker = "✅" if r['fits'] else "❌"
+    print(f"   {marker} tiers use {format_bytes(r['tiered_bytes'])} of {format_bytes(r['available_bytes'])}")
+    print(f"📜 /history.json in the same space: {r['json_records']} records, "
+          f"{format_duration(r['json_retention_s'])} (old + new copy while rewriting)")
+    print(f"📈 Retention {format_duration(r['json_retention_s'])} -> {format_duration(r['tiered_retention_s'])} "
+          f"({r['tiered_retention_s'] / max(r['json_retention_s'], 1):.0f}x), raw samples for "
+          f"{format_duration(r['raw_retention_s'])}")
+    print(f"✍️  Flash writes {format_bytes(r['json_flash_writes_per_day'])}/day -> "
+          f"{format_bytes(r['tiered_flash_writes_per_day'])}/day")
+
+
+def main():
+    from memory_budget import DEFAULT_FS_SIZE
+
+    parser = argparse.ArgumentParser(description="Tiered history footprint and /history tier selection")
+    parser.add_argument('--fs-size', type=int, default=DEFAULT_FS_SIZE)
+    parser.add_argument('--interval', type=float, default=10, help='raw sampling interval, seconds')
+    parser.add_argument('--assets', type=int, default=ASSET_BYTES, help='web UI bytes on LittleFS')
+    parser.add_argument('--days', type=float, help='fill with synthetic history and query each range')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    result = footprint(args.fs_size, args.interval, args.assets)
+    if args.days:
+        history = TieredHistory()
+        records = generate_history(args.days, interval=args.interval)
+        history.add_records(records)
+        now = records[-1]['t'] if records else int(time.time())
+        result['queries'] = {}
+        for range_days in (0, 1, 5, 30, 365):
+            tier, rows = history.query(range_days, now)
+            result['queries'][range_days] = {'tier': tier, 'records': len(rows),
+                                             'bytes': len(json.dumps(rows, separators=(',', ':')))}
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print_footprint(result, args.interval)
+    for range_days, q in result.get('queries', {}).items():
+        print(f"   /history?range={range_days:<4} {q['tier']:<7} {q['records']:>6} records "
+              f"{q['bytes'] / 1024:>8.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,54 @@
-import tensorflow as tf
-import pandas as pd
-import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, RobustScaler
-from sklearn.ensemble import IsolationForest
-from sklearn.metrics import classification_report, confusion_matrix
-import matplotlib.pyplot as plt
-import seaborn as sns
+# TensorFlow, pandas and scikit-learn are imported by the functions that use them,
+# so create_c_header() and `wifimon export` don't pay for them
+import os
 
-print("🚀 Advanced AI WiFi Stability Model Training")
-print("=" * 50)
+FEATURES = ['rssi', 'noise', 'snr', 'channel_util']
 
-# Load and prepare data
-print("📊 Loading training data...")
-df = pd.read_csv('wifi_data.csv')
-print(f"Dataset size: {len(df)} samples")
 
-# Keep ONLY the 4 basic features as requested
-print("🔧 Using ONLY the 4 basic features (RSSI, Noise, SNR, Channel Utilization)...")
+def load_dataset(csv_path='wifi_data.csv'):
+    import pandas as pd
 
-# Original 4 features ONLY - no additional feature engineering
-X_base = df[['rssi', 'noise', 'snr', 'channel_util']].copy()
+    print("📊 Loading training data...")
+    df = pd.read_csv(csv_path)
+    print(f"Dataset size: {len(df)} samples")
+    return df
 
-print(f"Using exactly 4 features as requested: {list(X_base.columns)}")
 
-y = df['stability']
+def prepare_features(df):
+    """Scale the 4 basic features and return a stratified train/test split"""
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import RobustScaler
 
-# Advanced Normalization (this is where we make it advanced)
-print("📏 Applying advanced robust normalization...")
-scaler = RobustScaler()  # More robust to outliers than StandardScaler
-X_scaled = scaler.fit_transform(X_base)
+    # Keep ONLY the 4 basic features as requested
+    print("🔧 Using ONLY the 4 basic features (RSSI, Noise, SNR, Channel Utilization)...")
 
-# Split data with stratification
-X_train, X_test, y_train, y_test = train_test_split(
-    X_scaled, y, test_size=0.2, random_state=42, stratify=y
-)
+    # Original 4 features ONLY - no additional feature engineering
+    X_base = df[FEATURES].copy()
 
-print(f"Training set: {len(X_train)} samples")
-print(f"Test set: {len(X_test)} samples")
+    print(f"Using exactly 4 features as requested: {list(X_base.columns)}")
+
+    y = df['stability']
+
+    # Advanced Normalization (this is where we make it advanced)
+    print("📏 Applying advanced robust normalization...")
+    scaler = RobustScaler()  # More robust to outliers than StandardScaler
+    X_scaled = scaler.fit_transform(X_base)
+
+    # Split data with stratification
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_scaled, y, test_size=0.2, random_state=42, stratify=y
+    )
+
+    print(f"Training set: {len(X_train)} samples")
+    print(f"Test set: {len(X_test)} samples")
+
+    return scaler, X_train, X_test, y_train, y_test
 
-# Advanced Neural Network Architecture (using ONLY 4 features but with sophisticated architecture)
-print("🧠 Building advanced neural network with sophisticated architecture...")
-print("📊 Input: ONLY 4 features (RSSI, Noise, SNR, Channel Utilization)")
 
 # Create an efficient but advanced model with 4 layers (perfect for ESP32)
 def create_advanced_model(input_dim):
+    import tensorflow as tf
+
     model = tf.keras.Sequential([
         # Layer 1: Input Processing (32 neurons)
         tf.keras.layers.Dense(32, activation='relu', input_shape=(input_dim,)),
@@ -64,90 +68,68 @@ def create_advanced_model(input_dim):
         tf.keras.layers.Dense(1, activation='sigmoid')
     ])
 
+    # Advanced compilation with custom metrics
+    model.compile(
+        optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
+        loss='binary_crossentropy',
+        metrics=['accuracy', 'precision', 'recall']
+    )
+
     return model
 
-model = create_advanced_model(X_scaled.shape[1])
-
-# Advanced compilation with custom metrics
-model.compile(
-    optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
-    loss='binary_crossentropy',
-    metrics=['accuracy', 'precision', 'recall']
-)
-
-print("📋 Model Architecture:")
-model.summary()
-
-# Advanced training with callbacks
-print("🏋️ Training advanced model...")
-
-callbacks = [
-    tf.keras.callbacks.EarlyStopping(
-        monitor='val_loss',
-        patience=10,
-        restore_best_weights=True
-    ),
-    tf.keras.callbacks.ReduceLROnPlateau(
-        monitor='val_loss',
-        factor=0.5,
-        patience=5,
-        min_lr=1e-6
+
+def train_model(model, X_train, y_train, X_test, y_test, epochs=100, verbose=1):
+    import tensorflow as tf
+
+    # Advanced training with callbacks
+    callbacks = [
+        tf.keras.callbacks.EarlyStopping(
+            monitor='val_loss',
+            patience=10,
+            restore_best_weights=True
+        ),
+        tf.keras.callbacks.ReduceLROnPlateau(
+            monitor='val_loss',
+            factor=0.5,
+            patience=5,
+            min_lr=1e-6
+        )
+    ]
+
+    return model.fit(
+        X_train, y_train,
+        epochs=epochs,
+        batch_size=32,
+        validation_data=(X_test, y_test),
+        callbacks=callbacks,
+        verbose=verbose
     )
-]
-
-history = model.fit(
-    X_train, y_train,
-    epochs=100,
-    batch_size=32,
-    validation_data=(X_test, y_test),
-    callbacks=callbacks,
-    verbose=1
-)
-
-# Evaluate model
-print("\n📊 Model Evaluation:")
-test_loss, test_accuracy, test_precision, test_recall = model.evaluate(X_test, y_test, verbose=0)
-print(f"Test Accuracy: {test_accuracy:.4f}")
-print(f"Test Precision: {test_precision:.4f}")
-print(f"Test Recall: {test_recall:.4f}")
-
-# Detailed predictions analysis
-y_pred_proba = model.predict(X_test)
-y_pred = (y_pred_proba > 0.5).astype(int)
-
-print("\n📈 Classification Report:")
-print(classification_report(y_test, y_pred))
-
-# Convert to TensorFlow Lite with optimization
-print("🔄 Converting to TensorFlow Lite...")
-converter = tf.lite.TFLiteConverter.from_keras_model(model)
-converter.optimizations = [tf.lite.Optimize.DEFAULT]
-converter.target_spec.supported_types = [tf.float16]  # Use float16 for smaller model
-tflite_model = converter.convert()
-
-# Save the optimized model
-with open('model.tflite', 'wb') as f:
-    f.write(tflite_model)
-
-print(f"✅ Advanced model saved! Size: {len(tflite_model)} bytes")
-
-# Save the scaler for use in ESP32
-import pickle
-with open('scaler.pkl', 'wb') as f:
-    pickle.dump(scaler, f)
-
-print("✅ Scaler saved for ESP32 integration")
-print("🎯 Advanced AI model training complete!")
+
+
+def convert_to_tflite(model):
+    """Convert a Keras model to TensorFlow Lite with float16 weights"""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_types = [tf.float16]  # Use float16 for smaller model
+    return converter.convert()
+
 
 # Convert to C header (Windows compatible)
-def create_c_header(tflite_file, header_file):
+def create_c_header(tflite_file, header_file, array_name='wifi_model_tflite', guard='MODEL_H',
+                    defines=None):
     with open(tflite_file, 'rb') as f:
         data = f.read()
 
     with open(header_file, 'w') as f:
-        f.write('#ifndef MODEL_H\n')
-        f.write('#define MODEL_H\n\n')
-        f.write('const unsigned char wifi_model_tflite[] = {\n')
+        f.write(f'#ifndef {guard}\n')
+        f.write(f'#define {guard}\n\n')
+        for name, value in (defines or {}).items():
+            f.write(f'#define {name} {value}\n')
+        if defines:
+            f.write('\n')
+        f.write(f'const unsigned char {array_name}[] = {{\n')
 
         for i, byte in enumerate(data):
             if i % 12 == 0:
@@ -162,8 +144,75 @@ def create_c_header(tflite_file, header_file):
             f.write('\n')
 
         f.write('};\n')
-        f.write(f'const unsigned int wifi_model_tflite_len = {len(data)};\n\n')
-        f.write('#endif // MODEL_H\n')
+        f.write(f'const unsigned int {array_name}_len = {len(data)};\n\n')
+        f.write(f'#endif // {guard}\n')
+
+
+def main(csv_path='wifi_data.csv', epochs=100, output_dir='.'):
+    from sklearn.metrics import classification_report
+
+    print("🚀 Advanced AI WiFi Stability Model Training")
+    print("=" * 50)
+
+    model_path = os.path.join(output_dir, 'model.tflite')
+    os.makedirs(os.path.join(output_dir, 'include'), exist_ok=True)
+
+    df = load_dataset(csv_path)
+    scaler, X_train, X_test, y_train, y_test = prepare_features(df)
+
+    # Advanced Neural Network Architecture (using ONLY 4 features but with sophisticated architecture)
+    print("🧠 Building advanced neural network with sophisticated architecture...")
+    print("📊 Input: ONLY 4 features (RSSI, Noise, SNR, Channel Utilization)")
+
+    model = create_advanced_model(X_train.shape[1])
+
+    print("📋 Model Architecture:")
+    model.summary()
+
+    print("🏋️ Training advanced model...")
+    train_model(model, X_train, y_train, X_test, y_test, epochs=epochs)
+
+    # Evaluate model
+    print("\n📊 Model Evaluation:")
+    test_loss, test_accuracy, test_precision, test_recall = model.evaluate(X_test, y_test, verbose=0)
+    print(f"Test Accuracy: {test_accuracy:.4f}")
+    print(f"Test Precision: {test_precision:.4f}")
+    print(f"Test Recall: {test_recall:.4f}")
+
+    # Detailed predictions analysis
+    y_pred_proba = model.predict(X_test)
+    y_pred = (y_pred_proba > 0.5).astype(int)
+
+    print("\n📈 Classification Report:")
+    print(classification_report(y_test, y_pred))
+
+    # Convert to TensorFlow Lite with optimization
+    print("🔄 Converting to TensorFlow Lite...")
+    tflite_model = convert_to_tflite(model)
+
+    # Save the optimized model
+    with open(model_path, 'wb') as f:
+        f.write(tflite_model)
+
+    print(f"✅ Advanced model saved! Size: {len(tflite_model)} bytes")
+
+    # Save the scaler for use in ESP32
+    import pickle
+    with open(os.path.join(output_dir, 'scaler.pkl'), 'wb') as f:
+        pickle.dump(scaler, f)
+
+    print("✅ Scaler saved for ESP32 integration")
+    print("🎯 Advanced AI model training complete!")
+
+    create_c_header(model_path, os.path.join(output_dir, 'include', 'model.h'))
+    print("Model trained and converted to include/model.h")
+
+    # Precomputed lookup table for TFLite-free inference (build with -D USE_MODEL_LUT)
+    from export_lut import export_model_lut
+    _, lut_report = export_model_lut(model_path, os.path.join(output_dir, 'include', 'model_lut.h'))
+    print(f"Lookup table written to include/model_lut.h "
+          f"(max abs error {lut_report['max_abs_error']:.4f})")
+
 
-create_c_header('model.tflite', 'include/model.h')
-print("Model trained and converted to include/model.h")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Push a retrained model.tflite to the device without rebuilding the firmware
+
+The blob is the model behind a 32-byte header (include/model_store.h):
+
+    <IHHIII12x  magic "WMDL", version, header size, model length,
+                CRC-32 (zlib) of the model, generation
+
+POST /model writes it to the idle slot of the "model" partition; the KPI task
+validates it and swaps it in between ticks. GET /model reports the active
+model, so the upload is confirmed once the new generation shows up there.
+
+Usage:
+    python upload_model.py http://192.168.4.1                  # model.tflite, active generation + 1
+    python upload_model.py http://192.168.4.1 --model other.tflite --generation 42
+    python upload_model.py http://127.0.0.1:8080 --compare     # vs regenerating model.h and rebuilding
+"""
+
+import argparse
+import json
+import struct
+import time
+import urllib.error
+import urllib.request
+import uuid
+import zlib
+
+MODEL_BLOB_MAGIC = 0x4C444D57   # "WMDL"
+MODEL_BLOB_VERSION = 1
+MODEL_SLOT_COUNT = 2
+MODEL_SLOT_BYTES = 0x8000
+HEADER = struct.Struct('<IHHIII12x')
+
+
+def pack_model(model, generation):
+    """ModelBlobHeader + model bytes, as written to a slot"""
+    return HEADER.pack(MODEL_BLOB_MAGIC, MODEL_BLOB_VERSION, HEADER.size, len(model),
+                       zlib.crc32(model), generation) + model
+
+
+def check_blob(blob, size=MODEL_SLOT_BYTES):
+    """checkModelBlob(): (status name, header dict or None)"""
+    if len(blob) < HEADER.size:
+        return 'bad header', None
+    magic, version, header_size, length, crc, generation = HEADER.unpack_from(blob)
+    header = {'generation': generation, 'length': length, 'crc32': crc, 'header_size': header_size}
+    if magic == 0xFFFFFFFF:
+        return 'empty', header
+    if magic != MODEL_BLOB_MAGIC or version != MODEL_BLOB_VERSION or header_size < HEADER.size \
+            or header_size % 16:
+        return 'bad header', header
+    if header_size + length > min(size, len(blob)):
+        return 'too large', header
+    model = blob[header_size:header_size + length]
+    if zlib.crc32(model) != crc:
+        return 'bad crc', header
+    if length < 8 or model[4:8] != b'TFL3':
+        return 'not tflite', header
+    return 'ok', header
+
+
+def model_status(url, timeout=10):
+    with urllib.request.urlopen(url.rstrip('/') + '/model', timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+def post_blob(url, blob, timeout=30):
+    """multipart/form-data POST, the form WebServer's upload handler streams"""
+    boundary = uuid.uuid4().hex
+    body = (f'--{boundary}\r\nContent-Disposition: form-data; name="model"; filename="model.bin"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n').encode() + blob + \
+        f'\r\n--{boundary}--\r\n'.encode()
+    request = urllib.request.Request(url.rstrip('/') + '/model', data=body, method='POST', headers={
+        'Content-Type': f'multipart/form-data; boundary={boundary}'})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read() or b'{}')
+
+
+def upload(url, model, generation=None, wait=True, timeout=30.0, poll=0.05):
+    """Upload and, with wait, block until GET /model reports the new generation"""
+    start = time.perf_counter()
+    if generation is None:
+        generation = model_status(url)['generation'] + 1
+    blob = pack_model(model, generation)
+    status, response = post_blob(url, blob)
+    result = {'status': status, 'response': response, 'generation': generation, 'bytes': len(blob),
+              'upload_s': time.perf_counter() - start}
+    if status != 202 or not wait:
+        return result
+    deadline = start + timeout
+    while time.perf_counter() < deadline:
+        active = model_status(url)
+        if active['generation'] == generation and not active['pending']:
+            result['active'] = active
+            break
+        time.sleep(poll)
+    result['turnaround_s'] = time.perf_counter() - start
+    return result
+
+
+def rebuild_cost(model_path, build=None):
+    """
+    The path /model replaces: regenerate include/model.h, rebuild, flash over serial.
+    build='pio' runs the firmware build, build='host' only the host g++ compile of the
+    headers (a lower bound); otherwise the last test_compile.py build time is used.
+    """
+    from test_compile import find_pio, load_cache, run_host_compile, run_pio_build
+
+    with open(model_path, 'rb') as f:
+        model = f.read()
+    start = time.perf_counter()
+    # Same output as train_model.create_c_header(), without importing TensorFlow
+    lines = [', '.join(f'0x{b:02x}' for b in model[i:i + 12]) for i in range(0, len(model), 12)]
+    header = ('#ifndef MODEL_H\n#define MODEL_H\n\nconst unsigned char wifi_model_tflite[] = {\n  '
+              + ',\n  '.join(lines) + '\n};\n'
+              f'const unsigned int wifi_model_tflite_len = {len(model)};\n\n#endif // MODEL_H\n')
+    result = {'header_s': time.perf_counter() - start, 'header_bytes': len(header),
+              'build_s': None, 'build_source': None}
+
+    cache = load_cache()
+    if build == 'pio':
+        pio = find_pio(cache)
+        if pio:
+            outcome = run_pio_build(pio)
+            if outcome['ok']:
+                result['build_s'], result['build_source'] = outcome['seconds'], 'measured'
+    elif build == 'host':
+        outcome = run_host_compile()
+        if outcome['ok']:
+            result['build_s'], result['build_source'] = outcome['seconds'], 'host g++ compile, lower bound'
+    if result['build_s'] is None and cache.get('last_build', {}).get('seconds'):
+        result['build_s'], result['build_source'] = cache['last_build']['seconds'], 'last test_compile.py build'
+    flash = cache.get('last_build', {}).get('sizes', {}).get('flash')
+    if flash:
+        # esptool at 460800 baud moves ~40 KB/s after compression, plus ~5 s of sync and reset
+        result['flash_s'] = flash / 40_000 + 5
+    return result
+
+
+def print_result(result):
+    if result['status'] != 202:
+        print(f"❌ Upload rejected ({result['status']}): {result['response'].get('error', result['response'])}")
+        return
+    response = result['response']
+    print(f"📤 {result['bytes']} bytes to slot {response['slot']}, generation {result['generation']}, "
+          f"crc32 {response['crc32']:08x} ({result['upload_s'] * 1000:.0f} ms)")
+    if 'active' in result:
+        print(f"✅ Active after {result['turnaround_s'] * 1000:.0f} ms")
+    elif 'turnaround_s' in result:
+        print(f"⚠️  Generation {result['generation']} not active after {result['turnaround_s']:.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upload model.tflite to the device's model partition")
+    parser.add_argument('url', help='device base URL, e.g. http://192.168.4.1')
+    parser.add_argument('--model', default='model.tflite')
+    parser.add_argument('--generation', type=int, help='default: the active generation + 1')
+    parser.add_argument('--no-wait', action='store_true', help="don't wait for the swap")
+    parser.add_argument('--compare', action='store_true',
+                        help='also time the model.h regeneration + firmware rebuild path')
+    parser.add_argument('--build', choices=('pio', 'host'),
+                        help='with --compare: run the PlatformIO build, or only the host compile')
+    args = parser.parse_args()
+
+    with open(args.model, 'rb') as f:
+        model = f.read()
+    status, _ = check_blob(pack_model(model, 0))
+    if status != 'ok':
+        parser.error(f"{args.model}: {status}")
+
+    result = upload(args.url, model, args.generation, wait=not args.no_wait)
+    print_result(result)
+    if args.compare and 'turnaround_s' in result:
+        cost = rebuild_cost(args.model, args.build)
+        print("\n⏱️  Model update turnaround")
+        print(f"   /model upload + swap  {result['turnaround_s']:8.2f} s")
+        print(f"   model.h regeneration  {cost['header_s']:8.3f} s")
+        if cost['build_s'] is None:
+            print("   firmware build        unknown (use --build, or run test_compile.py once)")
+            return 0 if result['status'] == 202 else 1
+        total = cost['header_s'] + cost['build_s'] + cost.get('flash_s', 0)
+        print(f"   firmware build        {cost['build_s']:8.2f} s ({cost['build_source']})")
+        if 'flash_s' in cost:
+            print(f"   serial flash (est.)   {cost['flash_s']:8.2f} s")
+        print(f"   rebuild path total    {total:8.2f} s ({total / result['turnaround_s']:.0f}x slower)")
+    return 0 if result['status'] == 202 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+wifimon: one command for the host-side model tools
+
+    train    train model.tflite and regenerate the headers (TensorFlow, scikit-learn, pandas)
+    export   include/model.h and include/model_lut.h from model.tflite (NumPy only)
+    predict  score KPI rows with model.tflite through tflite-runtime or NumPy
+    bench    cold start and peak RSS of each subcommand, each in a fresh interpreter
+
+Only the standard library is imported up front. Each subcommand imports what
+it needs when it runs, so `predict` and `export` never load TensorFlow.
+
+Usage:
+    python wifimon.py predict --rssi -65 --noise -92 --util 30
+    python wifimon.py predict wifi_data.csv --output scored.csv    # - reads stdin
+    python wifimon.py export
+    python wifimon.py train --epochs 50
+    python wifimon.py bench --rows 100000 --train
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKENDS = ('auto', 'tflite-runtime', 'numpy', 'tensorflow')
+SCRIPT = os.path.abspath(__file__)
+
+
+def tflite_runtime_interpreter():
+    """Interpreter class of tflite-runtime (or its successor ai-edge-litert), None if not installed"""
+    for module in ('tflite_runtime.interpreter', 'ai_edge_litert.interpreter'):
+        if importlib.util.find_spec(module.split('.')[0]) is not None:
+            return importlib.import_module(module).Interpreter
+    return None
+
+
+def backend_available(backend):
+    if backend == 'tflite-runtime':
+        return any(importlib.util.find_spec(m) for m in ('tflite_runtime', 'ai_edge_litert'))
+    if backend == 'tensorflow':
+        return importlib.util.find_spec('tensorflow') is not None
+    return True
+
+
+def _interpreter_runner(interpreter):
+    input_index = interpreter.get_input_details()[0]['index']
+    output_index = interpreter.get_output_details()[0]['index']
+
+    def run(inputs):
+        interpreter.resize_tensor_input(input_index, inputs.shape)
+        interpreter.allocate_tensors()
+        interpreter.set_tensor(input_index, inputs)
+        interpreter.invoke()
+        return interpreter.get_tensor(output_index)[:, 0]
+
+    return run
+
+
+def load_predictor(model_path='model.tflite', backend='auto'):
+    """
+    (backend used, predict(rssi, noise, channel_util) -> float32 stability).
+    auto takes tflite-runtime when it is installed and the NumPy evaluator
+    otherwise; tensorflow is only there to compare against.
+    """
+    from export_lut import normalize_inputs
+
+    if backend in ('auto', 'tflite-runtime'):
+        interpreter_class = tflite_runtime_interpreter()
+        if interpreter_class is not None:
+            backend = 'tflite-runtime'
+            run = _interpreter_runner(interpreter_class(model_path=model_path))
+        elif backend == 'tflite-runtime':
+            raise RuntimeError("tflite-runtime is not installed (pip install tflite-runtime or ai-edge-litert)")
+        else:
+            backend = 'numpy'
+    if backend == 'numpy':
+        from tflite_reader import NumpyInterpreter, load_model
+
+        interpreter = NumpyInterpreter(load_model(model_path))
+
+        def run(inputs):
+            return interpreter(inputs)[:, 0]
+    elif backend == 'tensorflow':
+        import tensorflow as tf
+
+        run = _interpreter_runner(tf.lite.Interpreter(model_path=model_path))
+
+    def predict(rssi, noise, channel_util):
+        return run(normalize_inputs(rssi, noise, channel_util)).astype('float32')
+
+    return backend, predict
+
+
+def read_kpi_rows(path):
+    """Rows of a CSV with rssi, noise and channel_util columns (wifi_data.csv, /history exports)"""
+    f = sys.stdin if path == '-' else open(path, newline='')
+    try:
+        reader = csv.DictReader(f)
+        missing = {'rssi', 'noise', 'channel_util'} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {', '.join(sorted(missing))}")
+        return reader.fieldnames, list(reader)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def cmd_predict(args):
+    import numpy as np
+
+    start = time.perf_counter()
+    backend, predict = load_predictor(args.model, args.backend)
+    if args.file is None:
+        if None in (args.rssi, args.noise, args.util):
+            raise SystemExit("predict: give a CSV file, or all of --rssi, --noise and --util")
+        stability = float(predict([args.rssi], [args.noise], [args.util])[0])
+        if args.json:
+            print(json.dumps({'stability': round(stability, 4), 'stable': stability > 0.5, 'backend': backend}))
+        else:
+            print(f"{'✅ stable' if stability > 0.5 else '⚠️  unstable'} ({stability:.4f}, {backend})")
+        return 0
+
+    fieldnames, rows = read_kpi_rows(args.file)
+    columns = {name: np.array([float(row[name]) for row in rows], dtype=np.float32)
+               for name in ('rssi', 'noise', 'channel_util')}
+    stability = predict(columns['rssi'], columns['noise'], columns['channel_util'])
+
+    f = sys.stdout if args.output in (None, '-') else open(args.output, 'w', newline='')
+    try:
+        writer = csv.DictWriter(f, fieldnames=[*fieldnames, 'prediction'])
+        writer.writeheader()
+        for row, value in zip(rows, stability.tolist()):
+            row['prediction'] = f'{value:.4f}'
+            writer.writerow(row)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    elapsed = time.perf_counter() - start
+    print(f"✅ Scored {len(rows)} rows with {backend} in {elapsed * 1000:.0f} ms "
+          f"({float((stability > 0.5).mean()) * 100 if len(rows) else 0:.1f}% stable)", file=sys.stderr)
+    return 0
+
+
+def cmd_export(args):
+    from train_model import create_c_header
+
+    create_c_header(args.model, args.header)
+    print(f"✅ {args.model} -> {args.header} ({os.path.getsize(args.model)} bytes of model)")
+    if args.lut:
+        from export_lut import export_model_lut
+
+        backend, predict = load_predictor(args.model, args.backend)
+        _, report = export_model_lut(args.model, args.lut, predict_fn=predict)
+        print(f"✅ Lookup table -> {args.lut} ({report['table_bytes']} bytes, "
+              f"max abs error {report['max_abs_error']:.4f} vs {backend})")
+    return 0
+
+
+def cmd_train(args):
+    from train_model import main as train
+
+    train(args.data, args.epochs, args.output_dir)
+    return 0
+
+
+def measure(argv, cwd=None):
+    """(seconds, peak RSS in MB) of `python argv` in a fresh interpreter"""
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, *argv], cwd=cwd, stdin=subprocess.DEVNULL,
+                                   stdout=subprocess.DEVNULL, stderr=stderr)
+        # wait4() gives the rusage of this child alone, RUSAGE_CHILDREN would be the max over all.
+        # Linux carries the parent's RSS at spawn into ru_maxrss, so run bench from a small
+        # process (the CLI), not from one that already holds TensorFlow.
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if process.returncode:
+            stderr.seek(0)
+            tail = stderr.read().decode(errors='replace').strip().splitlines()[-1:]
+            raise RuntimeError(f"{' '.join(argv)} exited with {process.returncode}: {''.join(tail)}")
+    return elapsed, usage.ru_maxrss / 1024
+
+
+def write_kpi_csv(path, rows, seed=0):
+    rng = random.Random(seed)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['rssi', 'noise', 'channel_util'])
+        for _ in range(rows):
+            writer.writerow([round(rng.uniform(-90, -40), 1), round(rng.uniform(-97, -85), 1),
+                             round(rng.uniform(0, 100), 1)])
+
+
+def bench(model_path='model.tflite', rows=10_000, repeat=3, train=False, data='wifi_data.csv'):
+    """Best-of-`repeat` cold start and peak RSS per subcommand"""
+    model_path = os.path.abspath(model_path)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        kpis = os.path.join(tmp, 'kpis.csv')
+        write_kpi_csv(kpis, rows)
+        cases = [('python startup', ['-c', 'pass'])]
+        for backend in ('numpy', 'tflite-runtime', 'tensorflow'):
+            if backend_available(backend):
+                cases.append((f'predict ({backend})', [SCRIPT, 'predict', kpis, '--model', model_path,
+                                                       '--backend', backend, '--output', os.devnull]))
+        cases.append(('export (numpy)', [SCRIPT, 'export', '--model', model_path, '--backend', 'numpy',
+                                         '--header', os.path.join(tmp, 'model.h'),
+                                         '--lut', os.path.join(tmp, 'model_lut.h')]))
+        if train and backend_available('tensorflow'):
+            cases.append(('train (1 epoch)', [SCRIPT, 'train', '--epochs', '1', '--output-dir', tmp,
+                                              '--data', os.path.abspath(data)]))
+        for name, argv in cases:
+            runs = [measure(argv, cwd=tmp) for _ in range(1 if name.startswith('train') else repeat)]
+            results.append({'name': name, 'seconds': min(r[0] for r in runs),
+                            'peak_rss_mb': max(r[1] for r in runs)})
+    return {'rows': rows, 'repeat': repeat, 'results': results}
+
+
+def print_bench(report):
+    print(f"⏱️  Cold start per subcommand, fresh interpreter, best of {report['repeat']} "
+          f"({report['rows']} rows to score)")
+    baseline = next((r for r in report['results'] if r['name'] == 'predict (numpy)'), None)
+    for result in report['results']:
+        line = f"   {result['name']:24} {result['seconds']:7.2f} s  {result['peak_rss_mb']:7.1f} MB peak RSS"
+        if baseline and result is not baseline and result['name'].startswith('predict'):
+            line += f"  ({result['seconds'] / baseline['seconds']:.1f}x the NumPy time)"
+        print(line)
+
+
+def cmd_bench(args):
+    report = bench(args.model, args.rows, args.repeat, args.train)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_bench(report)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='wifimon', description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    predict = commands.add_parser('predict', help='score KPIs with model.tflite, without TensorFlow')
+    predict.add_argument('file', nargs='?', help='CSV with rssi, noise and channel_util columns, - for stdin')
+    predict.add_argument('--rssi', type=float)
+    predict.add_argument('--noise', type=float)
+    predict.add_argument('--util', type=float, help='channel utilization in %%')
+    predict.add_argument('--model', default='model.tflite')
+    predict.add_argument('--backend', choices=BACKENDS, default='auto')
+    predict.add_argument('--output', help='scored CSV (default: stdout)')
+    predict.add_argument('--json', action='store_true', help='single prediction as JSON')
+    predict.set_defaults(func=cmd_predict)
+
+    export = commands.add_parser('export', help='C headers from model.tflite')
+    export.add_argument('--model', default='model.tflite')
+    export.add_argument('--header', default='include/model.h')
+    export.add_argument('--lut', default='include/model_lut.h', help='lookup table header')
+    export.add_argument('--no-lut', dest='lut', action='store_const', const=None)
+    export.add_argument('--backend', choices=BACKENDS, default='auto', help='model evaluator for the table')
+    export.set_defaults(func=cmd_export)
+
+    train = commands.add_parser('train', help='train model.tflite (imports TensorFlow)')
+    train.add_argument('--data', default='wifi_data.csv')
+    train.add_argument('--epochs', type=int, default=100)
+    train.add_argument('--output-dir', default='.', help='model.tflite, scaler.pkl and include/ go here')
+    train.set_defaults(func=cmd_train)
+
+    bench_parser = commands.add_parser('bench', help='cold start and peak RSS of each subcommand')
+    bench_parser.add_argument('--model', default='model.tflite')
+    bench_parser.add_argument('--rows', type=int, default=10_000)
+    bench_parser.add_argument('--repeat', type=int, default=3)
+    bench_parser.add_argument('--train', action='store_true', help='also time a 1-epoch training run')
+    bench_parser.add_argument('--json', action='store_true')
+    bench_parser.set_defaults(func=cmd_bench)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())